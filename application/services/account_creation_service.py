@@ -1,15 +1,23 @@
 from uuid import UUID
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
 
 from domain.entities.account import Account, AccountType
-from domain.exceptions.domain_exceptions import InvalidAmountError
+from domain.entities.money import Cents
+from domain.exceptions.domain_exceptions import InvalidAmountError, BulkValidationError
 from infrastructure.repositories.account_repository import AccountRepository
 from domain.services.interest_strategy import CheckingInterestStrategy, SavingsInterestStrategy
 
 class AccountCreationService:
     def __init__(self, account_repository: AccountRepository):
         self.account_repository = account_repository
+        # Strategies hold no per-account state, so every account of a type can share one
+        self.interest_strategies = {
+            AccountType.CHECKING: CheckingInterestStrategy(),
+            AccountType.SAVINGS: SavingsInterestStrategy(),
+        }
 
-    def create_account(self, account_type: str, initial_deposit: float = 0.0) -> UUID:
+    def _build_account(self, account_type: str, initial_deposit: Cents, now: Optional[datetime] = None) -> Account:
         try:
             account_type_enum = AccountType(account_type.upper())
         except ValueError:
@@ -18,11 +26,28 @@ class AccountCreationService:
         if initial_deposit < 0:
             raise InvalidAmountError("Initial deposit cannot be negative")
 
-        interest_strategy = (
-            SavingsInterestStrategy() if account_type_enum == AccountType.SAVINGS
-            else CheckingInterestStrategy()
-        )
-        account = Account.create(account_type_enum, initial_deposit)
-        account.interest_strategy = interest_strategy
+        account = Account.create(account_type_enum, initial_deposit, now)
+        account.interest_strategy = self.interest_strategies[account_type_enum]
+        return account
+
+    def create_account(self, account_type: str, initial_deposit: Cents = 0) -> UUID:
+        account = self._build_account(account_type, initial_deposit)
         self.account_repository.create_account(account)
-        return account.account_id
\ No newline at end of file
+        return account.account_id
+
+    def create_accounts(self, rows: Sequence[Tuple[str, Cents]]) -> List[UUID]:
+        # All rows are validated before anything is stored, so a bad row never leaves half a batch behind
+        accounts = []
+        errors = {}
+        # One opening time for the whole batch
+        now = datetime.utcnow()
+        for index, (account_type, initial_deposit) in enumerate(rows):
+            try:
+                accounts.append(self._build_account(account_type, initial_deposit, now))
+            except (ValueError, InvalidAmountError) as e:
+                errors[index] = str(e)
+        if errors:
+            raise BulkValidationError(errors)
+
+        self.account_repository.create_accounts(accounts)
+        return [account.account_id for account in accounts]
@@ -0,0 +1,42 @@
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from domain.entities.account import Account
+from infrastructure.repositories.account_repository import AccountRepository, AccountFilter
+
+MAX_PAGE_SIZE = 1000
+
+class AccountListingService:
+    def __init__(self, account_repository: AccountRepository):
+        self.account_repository = account_repository
+
+    def _encode_cursor(self, account_filter: AccountFilter, account: Account) -> str:
+        if account_filter.by_balance:
+            return f"{account.balance}:{account.account_id}"
+        return str(account.account_id)
+
+    def _decode_cursor(self, account_filter: AccountFilter, cursor: str) -> tuple:
+        # Cursors are the sort key of the last row served, so they stay valid while rows change
+        try:
+            if account_filter.by_balance:
+                balance, account_id = cursor.split(":", 1)
+                return (int(balance), UUID(account_id))
+            return (UUID(cursor),)
+        except ValueError:
+            raise ValueError(f"Invalid cursor: {cursor}")
+
+    def list_accounts(
+        self,
+        account_filter: AccountFilter,
+        cursor: Optional[str] = None,
+        limit: int = 100
+    ) -> Tuple[List[Account], Optional[str]]:
+        if not 1 <= limit <= MAX_PAGE_SIZE:
+            raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+        after = self._decode_cursor(account_filter, cursor) if cursor else None
+        # One extra row tells whether another page exists without a second query
+        accounts = self.account_repository.find_accounts(account_filter, after, limit + 1)
+        if len(accounts) <= limit:
+            return accounts, None
+        page = accounts[:limit]
+        return page, self._encode_cursor(account_filter, page[-1])
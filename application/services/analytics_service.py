@@ -0,0 +1,244 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from time import monotonic
+from typing import Dict, List, Optional, Sequence
+from uuid import UUID
+
+import numpy as np
+
+from domain.entities.account import Account, AccountType, AccountStatus
+from domain.entities.money import Cents
+from domain.entities.transaction import TransactionType
+from infrastructure.repositories.account_repository import AccountRepository
+from infrastructure.repositories.transaction_repository import TransactionRepository
+
+TRANSACTION_TYPES: List[TransactionType] = list(TransactionType)
+ACCOUNT_TYPES: List[AccountType] = list(AccountType)
+ACCOUNT_STATUSES: List[AccountStatus] = list(AccountStatus)
+TRANSACTION_TYPE_CODES = {value: code for code, value in enumerate(TRANSACTION_TYPES)}
+ACCOUNT_TYPE_CODES = {value: code for code, value in enumerate(ACCOUNT_TYPES)}
+ACCOUNT_STATUS_CODES = {value: code for code, value in enumerate(ACCOUNT_STATUSES)}
+# Code -1 (an account that no longer exists) indexes the trailing None
+DIMENSION_LABELS = {
+    "transaction_type": [value.value for value in TRANSACTION_TYPES],
+    "account_type": [value.value for value in ACCOUNT_TYPES] + [None],
+    "account_status": [value.value for value in ACCOUNT_STATUSES] + [None],
+}
+
+TIME_BUCKETS = {
+    "hour": np.int64(3600 * 1_000_000),
+    "day": np.int64(86400 * 1_000_000),
+}
+TRANSACTION_DIMENSIONS = ("transaction_type", "account_type", "account_status", *TIME_BUCKETS)
+ACCOUNT_DIMENSIONS = ("account_type", "account_status")
+EPOCH = datetime(1970, 1, 1)
+
+@dataclass
+class AggregateRow:
+    key: Dict[str, object]
+    count: int
+    total: Cents
+
+def _to_micros(value: datetime) -> int:
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (value - EPOCH) // timedelta(microseconds=1)
+
+class _GrowableColumn:
+    # Amortised doubling keeps appends of a refresh batch to one copy into the spare capacity
+    def __init__(self, dtype, capacity: int = 1024):
+        self._values = np.empty(capacity, dtype=dtype)
+        self.size = 0
+
+    def extend(self, values: np.ndarray) -> None:
+        needed = self.size + len(values)
+        if needed > len(self._values):
+            grown = np.empty(max(needed, 2 * len(self._values)), dtype=self._values.dtype)
+            grown[:self.size] = self._values[:self.size]
+            self._values = grown
+        self._values[self.size:needed] = values
+        self.size = needed
+
+    def set(self, values: np.ndarray) -> None:
+        self.size = 0
+        self.extend(values)
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._values[:self.size]
+
+class AnalyticsService:
+    # The ledger is mirrored into NumPy columns once and then only extended with transactions
+    # saved since the last refresh. Aggregates are a lexsort over the key columns plus a
+    # reduceat over the amounts, so no Python code runs per transaction at query time.
+
+    def __init__(
+        self,
+        account_repository: AccountRepository,
+        transaction_repository: TransactionRepository,
+        account_refresh_interval: float = 5.0,
+        clock=monotonic
+    ):
+        self.account_repository = account_repository
+        self.transaction_repository = transaction_repository
+        self.account_refresh_interval = account_refresh_interval
+        self.clock = clock
+
+        self.position = 0
+        self._amount = _GrowableColumn(np.int64)
+        self._timestamp = _GrowableColumn(np.int64)
+        self._transaction_type = _GrowableColumn(np.int8)
+        self._account_index = _GrowableColumn(np.int32)
+
+        self._account_indexes: Dict[UUID, int] = {}
+        self._account_type = _GrowableColumn(np.int8)
+        self._account_status = _GrowableColumn(np.int8)
+        self._balance = _GrowableColumn(np.int64)
+        self._accounts_refreshed_at: Optional[float] = None
+        self._account_position = 0
+
+    def refresh(self, force_accounts: bool = False) -> None:
+        now = self.clock()
+        # Account status and balance change in place; changed accounts are re-read on an interval,
+        # or on every query that needs them current
+        if (
+            force_accounts
+            or self._accounts_refreshed_at is None
+            or now - self._accounts_refreshed_at >= self.account_refresh_interval
+        ):
+            self._refresh_accounts()
+            self._accounts_refreshed_at = now
+
+        transactions = self.transaction_repository.get_transactions_since(self.position)
+        if not transactions:
+            return
+        unknown = {t.account_id for t in transactions if t.account_id not in self._account_indexes}
+        if unknown:
+            self._add_accounts(unknown)
+
+        count = len(transactions)
+        indexes = self._account_indexes
+        self._amount.extend(np.fromiter((t.amount for t in transactions), dtype=np.int64, count=count))
+        self._timestamp.extend(
+            np.array([t.timestamp.replace(tzinfo=None) for t in transactions], dtype="datetime64[us]").astype(np.int64)
+        )
+        self._transaction_type.extend(np.fromiter(
+            (TRANSACTION_TYPE_CODES[t.transaction_type] for t in transactions), dtype=np.int8, count=count
+        ))
+        # Transactions of accounts that no longer exist are kept under index -1 ("unknown")
+        self._account_index.extend(np.fromiter(
+            (indexes.get(t.account_id, -1) for t in transactions), dtype=np.int32, count=count
+        ))
+        self.position += count
+
+    def _add_accounts(self, account_ids) -> None:
+        accounts = [self.account_repository.get_account_by_id(account_id) for account_id in account_ids]
+        self._add_accounts_rows([account for account in accounts if account is not None])
+
+    def _add_accounts_rows(self, accounts: List[Account]) -> None:
+        for account in accounts:
+            self._account_indexes[account.account_id] = len(self._account_indexes)
+        self._account_type.extend(np.array([ACCOUNT_TYPE_CODES[a.account_type] for a in accounts], dtype=np.int8))
+        self._account_status.extend(np.array([ACCOUNT_STATUS_CODES[a.status] for a in accounts], dtype=np.int8))
+        self._balance.extend(np.array([a.balance for a in accounts], dtype=np.int64))
+
+    def _refresh_accounts(self) -> None:
+        # Only accounts written since the last refresh, when the repository keeps a change log
+        self._account_position, accounts = self.account_repository.get_accounts_changed_since(self._account_position)
+        indexes = self._account_indexes
+        new_accounts = [account for account in accounts if account.account_id not in indexes]
+        if new_accounts:
+            self._add_accounts_rows(new_accounts)
+        if len(new_accounts) == len(accounts):
+            return
+        positions = np.fromiter((indexes[a.account_id] for a in accounts), dtype=np.int64, count=len(accounts))
+        self._account_type.values[positions] = np.fromiter(
+            (ACCOUNT_TYPE_CODES[a.account_type] for a in accounts), dtype=np.int8, count=len(accounts)
+        )
+        self._account_status.values[positions] = np.fromiter(
+            (ACCOUNT_STATUS_CODES[a.status] for a in accounts), dtype=np.int8, count=len(accounts)
+        )
+        self._balance.values[positions] = np.fromiter((a.balance for a in accounts), dtype=np.int64, count=len(accounts))
+
+    def _account_column(self, column: _GrowableColumn, account_index: np.ndarray) -> np.ndarray:
+        # Index -1 picks up the trailing "unknown" sentinel rather than wrapping to the last account
+        values = np.append(column.values, np.int8(-1))
+        return values[account_index]
+
+    def aggregate_transactions(
+        self,
+        group_by: Sequence[str],
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> List[AggregateRow]:
+        for dimension in group_by:
+            if dimension not in TRANSACTION_DIMENSIONS:
+                raise ValueError(f"Cannot group transactions by {dimension}")
+        if len(set(group_by)) != len(group_by):
+            raise ValueError("Group by dimensions must not repeat")
+        self.refresh()
+
+        amount = self._amount.values
+        timestamp = self._timestamp.values
+        mask = np.ones(len(amount), dtype=bool)
+        if start is not None:
+            mask &= timestamp >= _to_micros(start)
+        if end is not None:
+            mask &= timestamp <= _to_micros(end)
+        amount = amount[mask]
+        account_index = self._account_index.values[mask]
+
+        keys = []
+        for dimension in group_by:
+            if dimension == "transaction_type":
+                keys.append(self._transaction_type.values[mask])
+            elif dimension == "account_type":
+                keys.append(self._account_column(self._account_type, account_index))
+            elif dimension == "account_status":
+                keys.append(self._account_column(self._account_status, account_index))
+            else:
+                width = TIME_BUCKETS[dimension]
+                keys.append(timestamp[mask] // width * width)
+        return self._group(list(group_by), keys, amount)
+
+    def aggregate_accounts(self, group_by: Sequence[str]) -> List[AggregateRow]:
+        for dimension in group_by:
+            if dimension not in ACCOUNT_DIMENSIONS:
+                raise ValueError(f"Cannot group accounts by {dimension}")
+        if len(set(group_by)) != len(group_by):
+            raise ValueError("Group by dimensions must not repeat")
+        # Balances must be current here; with a change log this only reads accounts written since
+        self.refresh(force_accounts=True)
+
+        columns = {"account_type": self._account_type.values, "account_status": self._account_status.values}
+        keys = [columns[dimension] for dimension in group_by]
+        return self._group(list(group_by), keys, self._balance.values)
+
+    def _group(self, dimensions: List[str], keys: List[np.ndarray], amount: np.ndarray) -> List[AggregateRow]:
+        if len(amount) == 0:
+            return []
+        if not keys:
+            return [AggregateRow(key={}, count=len(amount), total=int(amount.sum()))]
+
+        # lexsort treats its last key as the primary one
+        order = np.lexsort(keys[::-1])
+        sorted_keys = [key[order] for key in keys]
+        changed = np.zeros(len(order), dtype=bool)
+        changed[0] = True
+        for key in sorted_keys:
+            changed[1:] |= key[1:] != key[:-1]
+        starts = np.flatnonzero(changed)
+        totals = np.add.reduceat(amount[order], starts)
+        counts = np.diff(np.append(starts, len(order)))
+
+        columns = [self._decode(dimension, key[starts]) for dimension, key in zip(dimensions, sorted_keys)]
+        return [
+            AggregateRow(key=dict(zip(dimensions, values)), count=count, total=total)
+            for values, count, total in zip(zip(*columns), counts.tolist(), totals.tolist())
+        ]
+
+    def _decode(self, dimension: str, codes: np.ndarray) -> List[object]:
+        if dimension in TIME_BUCKETS:
+            return codes.astype("datetime64[us]").tolist()
+        labels = DIMENSION_LABELS[dimension]
+        return [labels[code] for code in codes.tolist()]
@@ -0,0 +1,36 @@
+import threading
+from datetime import datetime, timedelta
+from typing import Optional
+
+from infrastructure.repositories.transaction_repository import TransactionRepository
+from infrastructure.adapters.metrics_adapter import banking_metrics
+
+ARCHIVE_AFTER = timedelta(days=90)
+ARCHIVE_INTERVAL = timedelta(hours=1)
+
+class ArchivalService:
+    # Scheduled job that moves transactions past the retention window to cold storage, once an
+    # interval, a batch (one segment file) at a time
+
+    def __init__(
+        self,
+        transaction_repository: TransactionRepository,
+        archive_after: timedelta = ARCHIVE_AFTER,
+        interval: timedelta = ARCHIVE_INTERVAL,
+    ):
+        self.transaction_repository = transaction_repository
+        self.archive_after = archive_after
+        self.interval = interval
+        self.schedule_changed = threading.Event()
+        self._next_run: Optional[datetime] = datetime.utcnow()
+
+    def next_due_time(self) -> Optional[datetime]:
+        return self._next_run
+
+    def run_due(self, now: Optional[datetime] = None, batch_size: int = 100_000) -> int:
+        now = now or datetime.utcnow()
+        archived = self.transaction_repository.archive_before(now - self.archive_after, batch_size)
+        banking_metrics.archived_transactions.inc(archived)
+        if archived < batch_size:
+            self._next_run = now + self.interval
+        return archived
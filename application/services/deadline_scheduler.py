@@ -0,0 +1,67 @@
+import logging
+import threading
+from datetime import datetime
+from typing import Callable, Optional, Protocol
+
+logger = logging.getLogger(__name__)
+
+RETRY_SECONDS = 1.0
+
+class ScheduledJob(Protocol):
+    # Set whenever the earliest deadline may have moved earlier
+    schedule_changed: threading.Event
+
+    def run_due(self, now: datetime, batch_size: int) -> int: ...
+
+    def next_due_time(self) -> Optional[datetime]: ...
+
+class DeadlineScheduler:
+    # One background thread per job that sleeps until the job's earliest deadline (or until
+    # the job signals an earlier one), then drains everything due in batches. It never polls
+    # on an interval.
+
+    def __init__(
+        self,
+        job: ScheduledJob,
+        name: str,
+        batch_size: int = 500,
+        clock: Callable[[], datetime] = datetime.utcnow,
+    ):
+        self.job = job
+        self.name = name
+        self.batch_size = batch_size
+        self.clock = clock
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stopping.set()
+        self.job.schedule_changed.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        schedule_changed = self.job.schedule_changed
+        while not self._stopping.is_set():
+            # Cleared before reading the schedule, so anything scheduled meanwhile still wakes us
+            schedule_changed.clear()
+            try:
+                if self.job.run_due(self.clock(), self.batch_size) == self.batch_size:
+                    continue
+                next_due = self.job.next_due_time()
+            except Exception:
+                logger.exception("Scheduled run failed")
+                schedule_changed.wait(RETRY_SECONDS)
+                continue
+            timeout = None
+            if next_due is not None:
+                timeout = min(max(0.0, (next_due - self.clock()).total_seconds()), threading.TIMEOUT_MAX)
+            schedule_changed.wait(timeout)
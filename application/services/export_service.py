@@ -0,0 +1,40 @@
+from dataclasses import dataclass
+from typing import Iterator, Optional, Tuple
+
+from domain.entities.transaction import Transaction
+from infrastructure.repositories.transaction_repository import TransactionRepository
+
+@dataclass
+class LedgerExport:
+    watermark: int
+    # Watermark for the next export: every row before it is included in this one
+    cursor: int
+    rows: Iterator[Tuple[int, Transaction]]
+
+class ExportService:
+    # Exports the ledger in commit order from a watermark (a ledger position). The end is
+    # fixed when the export starts, so the cursor is known up front and rows committed while
+    # streaming go to the next export. Rows are read a page at a time, never all at once.
+
+    def __init__(self, transaction_repository: TransactionRepository, page_size: int = 5000):
+        self.transaction_repository = transaction_repository
+        self.page_size = page_size
+
+    def export_since(self, watermark: int = 0, limit: Optional[int] = None) -> LedgerExport:
+        end = self.transaction_repository.get_ledger_position()
+        if watermark < 0 or watermark > end:
+            raise ValueError(f"Watermark must be between 0 and {end}")
+        if limit is not None:
+            if limit <= 0:
+                raise ValueError("Limit must be positive")
+            end = min(end, watermark + limit)
+        return LedgerExport(watermark=watermark, cursor=end, rows=self._rows(watermark, end))
+
+    def _rows(self, position: int, end: int) -> Iterator[Tuple[int, Transaction]]:
+        while position < end:
+            page = self.transaction_repository.get_transactions_since(position, min(self.page_size, end - position))
+            if not page:
+                return
+            for transaction in page:
+                yield position, transaction
+                position += 1
@@ -1,10 +1,18 @@
 from uuid import UUID
+from typing import Optional
 from datetime import datetime
 
+from domain.entities.money import Cents
 from domain.entities.transaction import Transaction
-from domain.exceptions.domain_exceptions import AccountNotFoundError
+from domain.services.risk_check import RiskCheck, RiskDecision, NoRiskCheck
+from domain.exceptions.domain_exceptions import (
+    AccountNotFoundError,
+    InsufficientFundsError,
+    TransactionLimitExceededError,
+)
 from infrastructure.repositories.account_repository import AccountRepository
 from infrastructure.repositories.transaction_repository import TransactionRepository
+from infrastructure.adapters.metrics_adapter import banking_metrics
 from application.services.notification_service import NotificationService
 
 class FundTransferService:
@@ -13,31 +21,54 @@ class FundTransferService:
         account_repository: AccountRepository,
         transaction_repository: TransactionRepository,
         notification_service: NotificationService,
+        risk_check: Optional[RiskCheck] = None,
     ):
         self.account_repository = account_repository
         self.transaction_repository = transaction_repository
         self.notification_service = notification_service
+        self.risk_check = risk_check or NoRiskCheck()
 
     def transfer_funds(
         self,
         source_account_id: UUID,
         destination_account_id: UUID,
-        amount: float
+        amount: Cents
     ) -> Transaction:
-        source_account = self.account_repository.get_account_by_id(source_account_id)
-        destination_account = self.account_repository.get_account_by_id(destination_account_id)
-        if not source_account:
-            raise AccountNotFoundError(f"Source account {source_account_id} not found")
-        if not destination_account:
-            raise AccountNotFoundError(f"Destination account {destination_account_id} not found")
+        # Both balances change together, so hold both accounts for the whole read-modify-write
+        with self.account_repository.lock_accounts(source_account_id, destination_account_id):
+            source_account = self.account_repository.get_account_by_id(source_account_id)
+            destination_account = self.account_repository.get_account_by_id(destination_account_id)
+            if not source_account:
+                raise AccountNotFoundError(f"Source account {source_account_id} not found")
+            if not destination_account:
+                raise AccountNotFoundError(f"Destination account {destination_account_id} not found")
 
-        source_account.reset_limits(datetime.utcnow())
-        destination_account.reset_limits(datetime.utcnow())
-        source_account.withdraw(amount)
-        destination_account.deposit(amount)
-        transaction = Transaction.create_transfer(source_account_id, destination_account_id, amount)
-        self.account_repository.update_account(source_account)
-        self.account_repository.update_account(destination_account)
-        self.transaction_repository.save_transaction(transaction)
+            # A rollover is saved straight away, so a transfer refused below cannot leave it
+            # applied to the stored account without a new version
+            now = datetime.utcnow()
+            for account in (source_account, destination_account):
+                if account.reset_limits(now):
+                    self.account_repository.update_account(account)
+            decision = self.risk_check.assess(source_account_id, amount, destination_account_id)
+            if decision != RiskDecision.ALLOW:
+                banking_metrics.risk_rejections.labels(decision.value).inc()
+                try:
+                    source_account.reject_risky_transaction(
+                        lock=decision == RiskDecision.LOCK, count_attempt=decision != RiskDecision.THROTTLE
+                    )
+                finally:
+                    self.account_repository.update_account(source_account)
+            try:
+                source_account.withdraw(amount)
+            except (InsufficientFundsError, TransactionLimitExceededError) as e:
+                banking_metrics.record_withdrawal_rejection(e)
+                raise
+            destination_account.deposit(amount)
+            transaction = Transaction.create_transfer(source_account_id, destination_account_id, amount)
+            self.account_repository.update_account(source_account)
+            self.account_repository.update_account(destination_account)
+            self.transaction_repository.save_transaction(transaction)
+            self.risk_check.record(source_account_id, amount, destination_account_id)
         self.notification_service.notify(transaction)
+        banking_metrics.transfers.inc()
         return transaction
\ No newline at end of file
@@ -0,0 +1,154 @@
+import threading
+from datetime import datetime, timedelta
+from typing import List, Optional
+from uuid import UUID
+
+from domain.entities.hold import Hold, HoldStatus, DEFAULT_HOLD_TTL, MAX_HOLD_TTL
+from domain.entities.money import Cents
+from domain.entities.transaction import Transaction
+from domain.services.risk_check import RiskCheck, RiskDecision, NoRiskCheck
+from domain.exceptions.domain_exceptions import (
+    AccountNotFoundError,
+    HoldNotFoundError,
+    HoldNotPendingError,
+    InsufficientFundsError,
+    TransactionLimitExceededError,
+)
+from infrastructure.repositories.account_repository import AccountRepository
+from infrastructure.repositories.hold_repository import HoldRepository
+from infrastructure.repositories.transaction_repository import TransactionRepository
+from infrastructure.adapters.metrics_adapter import banking_metrics
+from application.services.notification_service import NotificationService
+
+class HoldService:
+    # Authorization holds reserve funds without moving them. Placing and releasing a hold
+    # record no transaction and send no notification; only a capture becomes a WITHDRAW.
+
+    def __init__(
+        self,
+        account_repository: AccountRepository,
+        hold_repository: HoldRepository,
+        transaction_repository: TransactionRepository,
+        notification_service: NotificationService,
+        risk_check: Optional[RiskCheck] = None,
+    ):
+        self.account_repository = account_repository
+        self.hold_repository = hold_repository
+        self.transaction_repository = transaction_repository
+        self.notification_service = notification_service
+        self.risk_check = risk_check or NoRiskCheck()
+        # Set whenever a new hold may expire before the ones already scheduled
+        self.schedule_changed = threading.Event()
+
+    def place_hold(self, account_id: UUID, amount: Cents, ttl: timedelta = DEFAULT_HOLD_TTL) -> Hold:
+        if not timedelta(0) < ttl <= MAX_HOLD_TTL:
+            raise ValueError(f"Hold lifetime must be positive and at most {MAX_HOLD_TTL.days} days")
+        with self.account_repository.lock_accounts(account_id):
+            account = self.account_repository.get_account_by_id(account_id)
+            if not account:
+                raise AccountNotFoundError(f"Account {account_id} not found")
+
+            now = datetime.utcnow()
+            if account.reset_limits(now):
+                self.account_repository.update_account(account)
+            # Funds first, so a hold that could never be placed is not judged or counted as risky
+            try:
+                account.place_hold(amount)
+            except InsufficientFundsError as e:
+                banking_metrics.record_withdrawal_rejection(e)
+                raise
+            decision = self.risk_check.assess(account_id, amount)
+            if decision != RiskDecision.ALLOW:
+                banking_metrics.risk_rejections.labels(decision.value).inc()
+                account.release_hold(amount)
+                try:
+                    account.reject_risky_transaction(
+                        lock=decision == RiskDecision.LOCK, count_attempt=decision != RiskDecision.THROTTLE
+                    )
+                finally:
+                    self.account_repository.update_account(account)
+            hold = Hold.create(account_id, amount, ttl, now)
+            self.account_repository.update_account(account)
+            self.hold_repository.save_hold(hold)
+            self.risk_check.record(account_id, amount)
+        self.schedule_changed.set()
+        return hold
+
+    def get_hold(self, hold_id: UUID) -> Hold:
+        hold = self.hold_repository.get_hold(hold_id)
+        if not hold:
+            raise HoldNotFoundError(f"Hold {hold_id} not found")
+        return hold
+
+    def get_holds_for_account(self, account_id: UUID) -> List[Hold]:
+        return self.hold_repository.get_holds_for_account(account_id)
+
+    def _check_pending(self, hold: Hold, now: datetime) -> None:
+        if not hold.is_pending:
+            raise HoldNotPendingError(f"Hold {hold.hold_id} is {hold.status.value.lower()}")
+        # Past its expiry the hold is as good as gone, even if the sweep has not reached it yet
+        if now >= hold.expires_at:
+            raise HoldNotPendingError(f"Hold {hold.hold_id} has expired")
+
+    def capture_hold(self, hold_id: UUID, amount: Optional[Cents] = None) -> Transaction:
+        hold = self.get_hold(hold_id)
+        with self.account_repository.lock_accounts(hold.account_id):
+            # Re-read under the lock: another worker may have settled the hold meanwhile
+            hold = self.get_hold(hold_id)
+            now = datetime.utcnow()
+            self._check_pending(hold, now)
+            account = self.account_repository.get_account_by_id(hold.account_id)
+            if not account:
+                raise AccountNotFoundError(f"Account {hold.account_id} not found")
+
+            amount = hold.amount if amount is None else amount
+            if account.reset_limits(now):
+                self.account_repository.update_account(account)
+            try:
+                account.capture_hold(hold.amount, amount)
+            except (InsufficientFundsError, TransactionLimitExceededError) as e:
+                banking_metrics.record_withdrawal_rejection(e)
+                raise
+            transaction = Transaction.create_withdrawal(hold.account_id, amount)
+            hold.status = HoldStatus.CAPTURED
+            hold.captured_amount = amount
+            hold.transaction_id = transaction.transaction_id
+            self.account_repository.update_account(account)
+            self.transaction_repository.save_transaction(transaction)
+            self.hold_repository.save_hold(hold)
+        self.notification_service.notify(transaction)
+        banking_metrics.withdrawals.inc()
+        return transaction
+
+    def release_hold(self, hold_id: UUID) -> Hold:
+        hold = self.get_hold(hold_id)
+        with self.account_repository.lock_accounts(hold.account_id):
+            hold = self.get_hold(hold_id)
+            self._check_pending(hold, datetime.utcnow())
+            self._release(hold, HoldStatus.RELEASED)
+        return hold
+
+    def _release(self, hold: Hold, status: HoldStatus) -> None:
+        account = self.account_repository.get_account_by_id(hold.account_id)
+        if account:
+            account.release_hold(hold.amount)
+            self.account_repository.update_account(account)
+        hold.status = status
+        self.hold_repository.save_hold(hold)
+
+    def next_due_time(self) -> Optional[datetime]:
+        return self.hold_repository.next_expiry()
+
+    def run_due(self, now: Optional[datetime] = None, batch_size: int = 500) -> int:
+        # Expiry sweep: releases every pending hold past its expiry, a batch at a time
+        now = now or datetime.utcnow()
+        holds = self.hold_repository.pop_expired(now, batch_size)
+        for hold in holds:
+            with self.account_repository.lock_accounts(hold.account_id):
+                # A capture or release, here or in another worker, may have won the race for the
+                # account lock
+                hold = self.hold_repository.get_hold(hold.hold_id)
+                if hold.is_pending:
+                    self._release(hold, HoldStatus.EXPIRED)
+        banking_metrics.expired_holds.inc(len(holds))
+        return len(holds)
@@ -1,36 +1,47 @@
-from uuid import UUID, uuid4
+from uuid import UUID
 from datetime import datetime
+from typing import Optional
 
 from domain.exceptions.domain_exceptions import AccountNotFoundError
 from domain.entities.transaction import Transaction, TransactionType
+from domain.entities.identifiers import uuid7
+from domain.entities.money import Cents
 from infrastructure.repositories.account_repository import AccountRepository
+from infrastructure.repositories.transaction_repository import TransactionRepository
 from application.services.notification_service import NotificationService
 
 class InterestService:
     def __init__(
         self,
         account_repository: AccountRepository,
-        notification_service: NotificationService
+        notification_service: NotificationService,
+        transaction_repository: Optional[TransactionRepository] = None,
     ):
         self.account_repository = account_repository
         self.notification_service = notification_service
+        self.transaction_repository = transaction_repository
 
-    def apply_interest_to_account(self, account_id: UUID) -> float:
-        account = self.account_repository.get_account_by_id(account_id)
-        if not account:
-            raise AccountNotFoundError(f"Account {account_id} not found")
+    def apply_interest_to_account(self, account_id: UUID) -> Cents:
+        with self.account_repository.lock_accounts(account_id):
+            account = self.account_repository.get_account_by_id(account_id)
+            if not account:
+                raise AccountNotFoundError(f"Account {account_id} not found")
 
-        interest = account.apply_interest()
+            interest = account.apply_interest()
+            if interest > 0:
+                # Create a transaction for interest
+                transaction = Transaction(
+                    transaction_id=uuid7(),
+                    account_id=account_id,
+                    transaction_type=TransactionType.DEPOSIT,
+                    amount=interest,
+                    timestamp=datetime.utcnow(),
+                    destination_account_id=None
+                )
+                self.account_repository.update_account(account)
+                # Saved with the balance change so the ledger accounts for every posting
+                if self.transaction_repository is not None:
+                    self.transaction_repository.save_transaction(transaction)
         if interest > 0:
-            self.account_repository.update_account(account)
-            # Create a transaction for interest
-            transaction = Transaction(
-                transaction_id=uuid4(),
-                account_id=account_id,
-                transaction_type=TransactionType.DEPOSIT,
-                amount=interest,
-                timestamp=datetime.utcnow(),
-                destination_account_id=None
-            )
             self.notification_service.notify(transaction)
         return interest
\ No newline at end of file
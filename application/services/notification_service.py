@@ -1,3 +1,4 @@
+from domain.entities.money import format_currency
 from domain.entities.transaction import Transaction
 from infrastructure.adapters.notification_adapter import NotificationAdapter
 
@@ -7,7 +8,7 @@ class NotificationService:
 
     def notify(self, transaction: Transaction) -> None:
         message = (
-            f"Transaction {transaction.transaction_type.value} of {transaction.amount} "
+            f"Transaction {transaction.transaction_type.value} of {format_currency(transaction.amount)} "
             f"on account {transaction.account_id}"
         )
         if transaction.destination_account_id:
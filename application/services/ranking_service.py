@@ -0,0 +1,25 @@
+from datetime import datetime
+from typing import List
+
+from domain.entities.account import Account
+from infrastructure.repositories.account_repository import AccountRepository
+from infrastructure.repositories.transaction_repository import TransactionRepository, AccountActivity
+
+MAX_RANKING_SIZE = 1000
+
+class RankingService:
+    def __init__(self, account_repository: AccountRepository, transaction_repository: TransactionRepository):
+        self.account_repository = account_repository
+        self.transaction_repository = transaction_repository
+
+    def _check_limit(self, limit: int) -> None:
+        if not 1 <= limit <= MAX_RANKING_SIZE:
+            raise ValueError(f"limit must be between 1 and {MAX_RANKING_SIZE}")
+
+    def top_by_balance(self, limit: int = 100) -> List[Account]:
+        self._check_limit(limit)
+        return self.account_repository.top_accounts_by_balance(limit)
+
+    def top_by_volume_today(self, limit: int = 100) -> List[AccountActivity]:
+        self._check_limit(limit)
+        return self.transaction_repository.top_accounts_by_volume(datetime.utcnow().date(), limit)
@@ -0,0 +1,136 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from domain.entities.account import Account
+from domain.entities.money import Cents
+from domain.services.ledger_checksum import MASK_64, posting_checksum, posting_effect
+from infrastructure.repositories.account_repository import AccountRepository
+from infrastructure.repositories.transaction_repository import SEGMENT_SIZE, SegmentDigest, TransactionRepository
+
+# (transaction id, transaction type, amount, paying side) for one posting
+PostingRow = Tuple[int, str, Cents, bool]
+
+@dataclass
+class _Checkpoint:
+    # Postings the account had when balance and ledger last agreed
+    count: int
+
+@dataclass
+class AccountDiscrepancy:
+    account_id: UUID
+    balance: Cents
+    # Balance implied by the ledger digest and by replaying the history
+    expected_balance: Cents
+    replayed_balance: Cents
+    # Segments whose stored digest no longer matches the transactions they cover
+    corrupt_segments: List[int] = field(default_factory=list)
+
+@dataclass
+class ReconciliationReport:
+    accounts_checked: int = 0
+    segments_replayed: int = 0
+    discrepancies: List[AccountDiscrepancy] = field(default_factory=list)
+
+def replay_segments(segments: List[List[PostingRow]]) -> List[SegmentDigest]:
+    # Runs in a worker process: recomputes each segment's digest from the raw postings
+    digests = []
+    for rows in segments:
+        net = 0
+        checksum = 0
+        for transaction_id, transaction_type, amount, outgoing in rows:
+            effect = posting_effect(transaction_type, amount, outgoing)
+            net += effect
+            checksum = (checksum + posting_checksum(transaction_id, effect)) & MASK_64
+        digests.append(SegmentDigest(count=len(rows), net=net, checksum=checksum))
+    return digests
+
+class ReconciliationService:
+    # Proves each balance against its transaction history without replaying it all. The
+    # transaction repository keeps a running digest per account, so the common case is an
+    # O(1) comparison of balance against opening balance + ledger net. Only segments sealed since an
+    # account last reconciled, or written since if it now disagrees, are replayed, and
+    # replays are spread across a process pool. full=True replays every segment.
+
+    def __init__(
+        self,
+        account_repository: AccountRepository,
+        transaction_repository: TransactionRepository,
+        max_workers: Optional[int] = None,
+        parallel_threshold: int = 8,
+    ):
+        self.account_repository = account_repository
+        self.transaction_repository = transaction_repository
+        self.max_workers = max_workers
+        # Fewer segments than this are replayed in-process; a pool costs more than it saves
+        self.parallel_threshold = parallel_threshold
+        self._checkpoints: Dict[UUID, _Checkpoint] = {}
+
+    def _rows(self, account_id: UUID, first_segment: int, segment_count: int) -> List[List[PostingRow]]:
+        # All of an account's segments in one read, so archived history is decompressed once
+        return [
+            [
+                (transaction.transaction_id.int, transaction.transaction_type.value, transaction.amount, outgoing)
+                for transaction, outgoing in segment_postings
+            ]
+            for segment_postings in self.transaction_repository.get_postings_by_segment(account_id, first_segment, segment_count)
+        ]
+
+    def _replay(self, jobs: List[List[PostingRow]]) -> List[SegmentDigest]:
+        if len(jobs) < self.parallel_threshold:
+            return replay_segments(jobs)
+        workers = self.max_workers or os.cpu_count() or 1
+        # A few batches per worker keeps them busy without pickling every segment separately
+        size = max(1, len(jobs) // (4 * workers))
+        batches = [jobs[i:i + size] for i in range(0, len(jobs), size)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return [digest for digests in executor.map(replay_segments, batches) for digest in digests]
+
+    def reconcile(self, full: bool = False) -> ReconciliationReport:
+        report = ReconciliationReport()
+        pending: List[Tuple[Account, Cents, int, int, List[SegmentDigest]]] = []
+        jobs: List[List[PostingRow]] = []
+
+        for account in self.account_repository.list_accounts():
+            report.accounts_checked += 1
+            account_id = account.account_id
+            net, count = self.transaction_repository.get_ledger_digest(account_id)
+            checkpoint = self._checkpoints.get(account_id)
+            first_segment = 0
+            if checkpoint is not None and not full:
+                if account.balance == account.opening_balance + net and count // SEGMENT_SIZE == checkpoint.count // SEGMENT_SIZE:
+                    checkpoint.count = count
+                    continue
+                # Segments sealed before the checkpoint were verified then and are append-only
+                first_segment = checkpoint.count // SEGMENT_SIZE
+            stored = self.transaction_repository.get_segment_digests(account_id, first_segment)
+            pending.append((account, net, count, first_segment, stored))
+            jobs.extend(self._rows(account_id, first_segment, len(stored)))
+
+        replayed = iter(self._replay(jobs))
+        report.segments_replayed = len(jobs)
+        for account, net, count, first_segment, stored in pending:
+            corrupt = []
+            replayed_net = net
+            for segment, digest in enumerate(stored, start=first_segment):
+                actual = next(replayed)
+                replayed_net += actual.net - digest.net
+                if actual != digest:
+                    corrupt.append(segment)
+
+            # Checked from the opening balance on every run, so drift from before the first run or
+            # a restart is reported too
+            anchor = account.opening_balance
+            if corrupt or account.balance != anchor + net:
+                report.discrepancies.append(AccountDiscrepancy(
+                    account_id=account.account_id,
+                    balance=account.balance,
+                    expected_balance=anchor + net,
+                    replayed_balance=anchor + replayed_net,
+                    corrupt_segments=corrupt,
+                ))
+            else:
+                self._checkpoints[account.account_id] = _Checkpoint(count=count)
+        return report
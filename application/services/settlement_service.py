@@ -0,0 +1,241 @@
+import threading
+from copy import copy
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from domain.entities.account import Account, AccountStatus
+from domain.entities.identifiers import uuid7
+from domain.entities.money import Cents
+from domain.entities.transaction import Transaction
+from domain.services.risk_check import RiskCheck, RiskDecision, NoRiskCheck
+from domain.exceptions.domain_exceptions import (
+    AccountLockedError,
+    DomainError,
+    InsufficientFundsError,
+    InvalidAmountError,
+    TransactionLimitError,
+)
+from infrastructure.repositories.account_repository import AccountRepository
+from infrastructure.repositories.transaction_repository import TransactionRepository
+from infrastructure.adapters.metrics_adapter import banking_metrics
+from application.services.notification_service import NotificationService
+
+@dataclass(frozen=True)
+class QueuedTransfer:
+    # A transfer waiting for settlement. Its transaction is only created when it settles, so
+    # transaction ids and timestamps follow the order the ledger saves them in, which the
+    # archive cutoff and id-ordered reads rely on.
+    transfer_id: UUID
+    account_id: UUID
+    destination_account_id: UUID
+    amount: Cents
+    queued_at: datetime
+
+@dataclass
+class SettlementResult:
+    transactions: List[Transaction] = field(default_factory=list)
+    # Transfer id of each queued transfer that settled -> id of its transaction
+    settled: Dict[UUID, UUID] = field(default_factory=dict)
+    # Transfer id of each queued transfer that was dropped -> reason
+    rejected: Dict[UUID, str] = field(default_factory=dict)
+    # Balance change applied to each account
+    net_positions: Dict[UUID, Cents] = field(default_factory=dict)
+
+class SettlementService:
+    # Multilateral netting: transfers queued during a window are settled together. Each one is
+    # still admitted on its own gross amount (risk check, limits, daily count), but balances
+    # move once per account by the net of everything it sent and received, so A->B, B->C, C->A
+    # of equal amounts settles with no balance change at all.
+
+    def __init__(
+        self,
+        account_repository: AccountRepository,
+        transaction_repository: TransactionRepository,
+        notification_service: NotificationService,
+        risk_check: Optional[RiskCheck] = None,
+    ):
+        self.account_repository = account_repository
+        self.transaction_repository = transaction_repository
+        self.notification_service = notification_service
+        self.risk_check = risk_check or NoRiskCheck()
+        self._queue: List[QueuedTransfer] = []
+        self._queue_lock = threading.Lock()
+
+    def queue_transfer(self, source_account_id: UUID, destination_account_id: UUID, amount: Cents) -> QueuedTransfer:
+        if amount <= 0:
+            raise InvalidAmountError("Transfer amount must be positive")
+        transfer = QueuedTransfer(uuid7(), source_account_id, destination_account_id, amount, datetime.utcnow())
+        with self._queue_lock:
+            self._queue.append(transfer)
+        return transfer
+
+    def pending_count(self) -> int:
+        return len(self._queue)
+
+    def settle(self) -> SettlementResult:
+        with self._queue_lock:
+            batch, self._queue = self._queue, []
+        if not batch:
+            return SettlementResult()
+
+        account_ids = set()
+        for transfer in batch:
+            account_ids.add(transfer.account_id)
+            account_ids.add(transfer.destination_account_id)
+
+        result = SettlementResult()
+        with self.account_repository.lock_accounts(*account_ids):
+            accounts: Dict[UUID, Account] = {}
+            now = datetime.utcnow()
+            for account_id in account_ids:
+                account = self.account_repository.get_account_by_id(account_id)
+                if account is not None:
+                    account.reset_limits(now)
+                    accounts[account_id] = account
+
+            scratch: Dict[UUID, Account] = {}
+            accepted = self._admit(batch, accounts, scratch, result.rejected)
+            accepted = self._drop_unfunded(accepted, accounts, result.rejected)
+            accepted = self._assess(accepted, accounts, scratch, result.rejected)
+
+            net_positions: Dict[UUID, Cents] = {}
+            for transfer in accepted:
+                accounts[transfer.account_id].record_gross_debit(transfer.amount)
+                net_positions[transfer.account_id] = net_positions.get(transfer.account_id, 0) - transfer.amount
+                net_positions[transfer.destination_account_id] = (
+                    net_positions.get(transfer.destination_account_id, 0) + transfer.amount
+                )
+            for account_id, net in net_positions.items():
+                accounts[account_id].apply_net_position(net)
+            # Risk blocks and locks take effect after the transfers admitted before them
+            for account_id, source_scratch in scratch.items():
+                accounts[account_id].failed_attempts = source_scratch.failed_attempts
+                accounts[account_id].is_locked = source_scratch.is_locked
+
+            for account in accounts.values():
+                self.account_repository.update_account(account)
+            for transfer in accepted:
+                transaction = Transaction.create_transfer(transfer.account_id, transfer.destination_account_id, transfer.amount)
+                self.transaction_repository.save_transaction(transaction)
+                self.risk_check.record(transfer.account_id, transfer.amount, transfer.destination_account_id)
+                result.transactions.append(transaction)
+                result.settled[transfer.transfer_id] = transaction.transaction_id
+            result.net_positions = net_positions
+
+        for transaction in result.transactions:
+            self.notification_service.notify(transaction)
+        banking_metrics.transfers.inc(len(accepted))
+        return result
+
+    def _admit(
+        self,
+        batch: List[QueuedTransfer],
+        accounts: Dict[UUID, Account],
+        scratch: Dict[UUID, Account],
+        rejected: Dict[UUID, str],
+    ) -> List[QueuedTransfer]:
+        # Gross checks run in queue order against scratch copies, so a transfer that would have
+        # failed when sent on its own fails here too, and nothing real changes until settlement
+        accepted = []
+        for transfer in batch:
+            source = accounts.get(transfer.account_id)
+            destination = accounts.get(transfer.destination_account_id)
+            if source is None:
+                rejected[transfer.transfer_id] = f"Source account {transfer.account_id} not found"
+                continue
+            if destination is None:
+                rejected[transfer.transfer_id] = f"Destination account {transfer.destination_account_id} not found"
+                continue
+            if destination.status != AccountStatus.ACTIVE:
+                rejected[transfer.transfer_id] = "Cannot deposit to a closed account"
+                continue
+
+            source_scratch = scratch.get(transfer.account_id)
+            if source_scratch is None:
+                source_scratch = scratch[transfer.account_id] = copy(source)
+            try:
+                source_scratch.record_gross_debit(transfer.amount)
+            except (DomainError, AccountLockedError, TransactionLimitError) as e:
+                banking_metrics.record_withdrawal_rejection(e)
+                rejected[transfer.transfer_id] = str(e)
+                continue
+            accepted.append(transfer)
+        return accepted
+
+    def _assess(
+        self,
+        funded: List[QueuedTransfer],
+        accounts: Dict[UUID, Account],
+        scratch: Dict[UUID, Account],
+        rejected: Dict[UUID, str],
+    ) -> List[QueuedTransfer]:
+        # Risk is judged in queue order once a transfer is known to be funded, so a transfer
+        # dropped for funds never counts against its sender. Each cleared transfer is recorded on
+        # a scratch copy of the risk state, so the batch spends the same allowance as sending the
+        # transfers one by one. Refusing one can leave others unfunded; they are dropped before
+        # they are judged, and the scratch state is rebuilt from what is still cleared.
+        risk_check = self.risk_check.scratch()
+        cleared: List[QueuedTransfer] = []
+        pending = list(funded)
+        while pending:
+            transfer = pending.pop(0)
+            source_scratch = scratch[transfer.account_id]
+            try:
+                # A lock from an earlier transfer in the batch stops the rest
+                if source_scratch.is_locked:
+                    raise AccountLockedError("Account is temporarily locked")
+                decision = risk_check.assess(transfer.account_id, transfer.amount, transfer.destination_account_id)
+                if decision != RiskDecision.ALLOW:
+                    banking_metrics.risk_rejections.labels(decision.value).inc()
+                    source_scratch.reject_risky_transaction(
+                        lock=decision == RiskDecision.LOCK, count_attempt=decision != RiskDecision.THROTTLE
+                    )
+            except (DomainError, AccountLockedError) as e:
+                banking_metrics.record_withdrawal_rejection(e)
+                rejected[transfer.transfer_id] = str(e)
+                remaining = {t.transfer_id for t in self._drop_unfunded(cleared + pending, accounts, rejected)}
+                pending = [t for t in pending if t.transfer_id in remaining]
+                if any(t.transfer_id not in remaining for t in cleared):
+                    cleared = [t for t in cleared if t.transfer_id in remaining]
+                    risk_check = self.risk_check.scratch()
+                    for t in cleared:
+                        risk_check.record(t.account_id, t.amount, t.destination_account_id)
+                continue
+            risk_check.record(transfer.account_id, transfer.amount, transfer.destination_account_id)
+            cleared.append(transfer)
+        return cleared
+
+    def _drop_unfunded(
+        self, accepted: List[QueuedTransfer], accounts: Dict[UUID, Account], rejected: Dict[UUID, str]
+    ) -> List[QueuedTransfer]:
+        # Only a net debit has to be funded. An account that cannot fund its net debit loses its
+        # latest outgoing transfers until it can; each drop lowers what the receiver gets, so the
+        # receiver is rechecked in turn. Every round drops a transfer, so this always ends.
+        net: Dict[UUID, Cents] = {}
+        outgoing: Dict[UUID, List[QueuedTransfer]] = {}
+        for transfer in accepted:
+            net[transfer.account_id] = net.get(transfer.account_id, 0) - transfer.amount
+            net[transfer.destination_account_id] = net.get(transfer.destination_account_id, 0) + transfer.amount
+            outgoing.setdefault(transfer.account_id, []).append(transfer)
+
+        dropped = set()
+        pending = [account_id for account_id, position in net.items() if position < 0]
+        while pending:
+            account_id = pending.pop()
+            account = accounts[account_id]
+            while net[account_id] < 0:
+                try:
+                    account.check_funds(-net[account_id])
+                    break
+                except InsufficientFundsError as e:
+                    transfer = outgoing[account_id].pop()
+                    banking_metrics.record_withdrawal_rejection(e)
+                    rejected[transfer.transfer_id] = str(e)
+                    dropped.add(transfer.transfer_id)
+                    net[account_id] += transfer.amount
+                    net[transfer.destination_account_id] -= transfer.amount
+                    if net[transfer.destination_account_id] < 0:
+                        pending.append(transfer.destination_account_id)
+        return [transfer for transfer in accepted if transfer.transfer_id not in dropped]
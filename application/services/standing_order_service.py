@@ -0,0 +1,119 @@
+import threading
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from domain.entities.money import Cents
+from domain.entities.standing_order import Frequency, StandingOrder
+from domain.services.risk_check import RiskCheck, RiskDecision, NoRiskCheck
+from domain.exceptions.domain_exceptions import (
+    AccountLockedError,
+    AccountNotFoundError,
+    DomainError,
+    StandingOrderNotFoundError,
+    TransactionLimitError,
+)
+from infrastructure.repositories.account_repository import AccountRepository
+from infrastructure.repositories.standing_order_repository import StandingOrderRepository
+from infrastructure.adapters.metrics_adapter import banking_metrics
+from application.services.fund_transfer_service import FundTransferService
+
+class StandingOrderService:
+    def __init__(
+        self,
+        standing_order_repository: StandingOrderRepository,
+        account_repository: AccountRepository,
+        fund_transfer_service: FundTransferService,
+        risk_check: Optional[RiskCheck] = None,
+    ):
+        self.standing_order_repository = standing_order_repository
+        self.account_repository = account_repository
+        self.fund_transfer_service = fund_transfer_service
+        self.risk_check = risk_check or NoRiskCheck()
+        # Set whenever the schedule may have moved earlier, so a sleeping scheduler re-checks
+        self.schedule_changed = threading.Event()
+
+    def create_order(
+        self,
+        source_account_id: UUID,
+        destination_account_id: UUID,
+        amount: Cents,
+        frequency: str,
+        start_at: Optional[datetime] = None,
+        end_at: Optional[datetime] = None,
+    ) -> StandingOrder:
+        try:
+            frequency_enum = Frequency(frequency.upper())
+        except ValueError:
+            raise ValueError(f"Invalid frequency: {frequency}")
+        order = StandingOrder.create(source_account_id, destination_account_id, amount, frequency_enum, start_at, end_at)
+        # Runs are not judged again, so each new order is assessed and recorded as one debit
+        decision = self.risk_check.assess(source_account_id, amount, destination_account_id)
+        if decision != RiskDecision.ALLOW:
+            banking_metrics.risk_rejections.labels(decision.value).inc()
+            with self.account_repository.lock_accounts(source_account_id):
+                source_account = self.account_repository.get_account_by_id(source_account_id)
+                if not source_account:
+                    raise AccountNotFoundError(f"Source account {source_account_id} not found")
+                try:
+                    source_account.reject_risky_transaction(
+                        lock=decision == RiskDecision.LOCK, count_attempt=decision != RiskDecision.THROTTLE
+                    )
+                finally:
+                    self.account_repository.update_account(source_account)
+        self.standing_order_repository.save_order(order)
+        self.risk_check.record(source_account_id, amount, destination_account_id)
+        self.schedule_changed.set()
+        return order
+
+    def get_order(self, order_id: UUID) -> StandingOrder:
+        order = self.standing_order_repository.get_order(order_id)
+        if not order:
+            raise StandingOrderNotFoundError(f"Standing order {order_id} not found")
+        return order
+
+    def get_orders_for_account(self, account_id: UUID) -> List[StandingOrder]:
+        return self.standing_order_repository.get_orders_for_account(account_id)
+
+    def cancel_order(self, order_id: UUID) -> StandingOrder:
+        order = self.get_order(order_id)
+        order.cancel()
+        self.standing_order_repository.save_order(order)
+        return order
+
+    def next_due_time(self) -> Optional[datetime]:
+        return self.standing_order_repository.next_due_time()
+
+    def run_due(self, now: Optional[datetime] = None, batch_size: int = 500) -> int:
+        now = now or datetime.utcnow()
+        orders = self.standing_order_repository.pop_due(now, batch_size)
+        # Popped orders are off the schedule until saved, so an unexpected error must not strand
+        # them: the order that raised moves on to its next occurrence, the rest stay due
+        remaining = iter(orders)
+        try:
+            for order in remaining:
+                try:
+                    self._execute(order, now)
+                finally:
+                    order.advance(now)
+                    self.standing_order_repository.save_order(order)
+        finally:
+            for order in remaining:
+                self.standing_order_repository.save_order(order)
+        return len(orders)
+
+    def _execute(self, order: StandingOrder, now: datetime) -> None:
+        order.last_run_at = now
+        try:
+            transaction = self.fund_transfer_service.transfer_funds(
+                order.source_account_id, order.destination_account_id, order.amount
+            )
+        except (DomainError, AccountLockedError, TransactionLimitError) as e:
+            # A failed run is recorded on the order and retried at the next occurrence
+            order.last_error = str(e)
+            order.failure_count += 1
+            banking_metrics.standing_order_runs.labels("failed").inc()
+            return
+        order.last_transaction_id = transaction.transaction_id
+        order.last_error = None
+        banking_metrics.standing_order_runs.labels("succeeded").inc()
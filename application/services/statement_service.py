@@ -1,6 +1,6 @@
 from uuid import UUID
 from datetime import datetime
-from typing import List
+from typing import Iterator, List, Tuple
 
 from domain.entities.account import Account
 from domain.entities.transaction import Transaction
@@ -20,13 +20,11 @@ class StatementService:
         self.transaction_repository = transaction_repository
         self.statement_adapter = statement_adapter
 
-    def generate_statement(self, account_id: UUID, start_date: datetime, end_date: datetime) -> Statement:
+    def _load(self, account_id: UUID, start_date: datetime, end_date: datetime) -> Tuple[Account, List[Transaction], datetime, datetime]:
         account = self.account_repository.get_account_by_id(account_id)
         if not account:
             raise AccountNotFoundError(f"Account {account_id} not found")
 
-        transactions = self.transaction_repository.get_transactions_for_account(account_id)
-        
         # Convert timestamps to naive UTC if they're timezone-aware
         def normalize_timestamp(dt: datetime) -> datetime:
             if dt.tzinfo is not None:
@@ -36,15 +34,28 @@ class StatementService:
         # Ensure all timestamps are naive
         start_date = normalize_timestamp(start_date)
         end_date = normalize_timestamp(end_date)
-        
-        filtered_transactions = [
-            t for t in transactions
-            if start_date <= normalize_timestamp(t.timestamp) <= end_date
-        ]
-        
+
+        # The repository filters by range, reading only the archived segments that overlap it
+        filtered_transactions = self.transaction_repository.get_transactions_for_account(
+            account_id, start_date, end_date
+        )
+        return account, filtered_transactions, start_date, end_date
+
+    def generate_statement(
+        self, account_id: UUID, start_date: datetime, end_date: datetime, include_content: bool = True
+    ) -> Statement:
+        account, transactions, start_date, end_date = self._load(account_id, start_date, end_date)
+        if not include_content:
+            # Callers that only need the rows skip rendering the CSV/PDF body altogether
+            return Statement(account=account, transactions=transactions, start_date=start_date, end_date=end_date)
         return self.statement_adapter.generate(
             account=account,
-            transactions=filtered_transactions,
+            transactions=transactions,
             start_date=start_date,
             end_date=end_date
-        )
\ No newline at end of file
+        )
+
+    def stream_csv(self, account_id: UUID, start_date: datetime, end_date: datetime) -> Iterator[str]:
+        # The account is checked here, before the first chunk is requested
+        account, transactions, start_date, end_date = self._load(account_id, start_date, end_date)
+        return self.statement_adapter.stream_csv(account, transactions, start_date, end_date)
\ No newline at end of file
@@ -1,11 +1,19 @@
 from uuid import UUID
+from typing import Optional
 from datetime import datetime
 
 from domain.entities.account import Account
+from domain.entities.money import Cents
 from domain.entities.transaction import Transaction
-from domain.exceptions.domain_exceptions import AccountNotFoundError
+from domain.services.risk_check import RiskCheck, RiskDecision, NoRiskCheck
+from domain.exceptions.domain_exceptions import (
+    AccountNotFoundError,
+    InsufficientFundsError,
+    TransactionLimitExceededError,
+)
 from infrastructure.repositories.account_repository import AccountRepository
 from infrastructure.repositories.transaction_repository import TransactionRepository
+from infrastructure.adapters.metrics_adapter import banking_metrics
 from application.services.notification_service import NotificationService
 
 class TransactionService:
@@ -14,32 +22,55 @@ class TransactionService:
         account_repository: AccountRepository,
         transaction_repository: TransactionRepository,
         notification_service: NotificationService,
+        risk_check: Optional[RiskCheck] = None,
     ):
         self.account_repository = account_repository
         self.transaction_repository = transaction_repository
         self.notification_service = notification_service
+        self.risk_check = risk_check or NoRiskCheck()
 
-    def deposit(self, account_id: UUID, amount: float) -> Transaction:
-        account = self.account_repository.get_account_by_id(account_id)
-        if not account:
-            raise AccountNotFoundError(f"Account {account_id} not found")
+    def deposit(self, account_id: UUID, amount: Cents) -> Transaction:
+        with self.account_repository.lock_accounts(account_id):
+            account = self.account_repository.get_account_by_id(account_id)
+            if not account:
+                raise AccountNotFoundError(f"Account {account_id} not found")
 
-        account.deposit(amount)
-        transaction = Transaction.create_deposit(account_id, amount)
-        self.account_repository.update_account(account)
-        self.transaction_repository.save_transaction(transaction)
+            account.deposit(amount)
+            transaction = Transaction.create_deposit(account_id, amount)
+            self.account_repository.update_account(account)
+            self.transaction_repository.save_transaction(transaction)
         self.notification_service.notify(transaction)
+        banking_metrics.deposits.inc()
         return transaction
 
-    def withdraw(self, account_id: UUID, amount: float) -> Transaction:
-        account = self.account_repository.get_account_by_id(account_id)
-        if not account:
-            raise AccountNotFoundError(f"Account {account_id} not found")
+    def withdraw(self, account_id: UUID, amount: Cents) -> Transaction:
+        with self.account_repository.lock_accounts(account_id):
+            account = self.account_repository.get_account_by_id(account_id)
+            if not account:
+                raise AccountNotFoundError(f"Account {account_id} not found")
 
-        account.reset_limits(datetime.utcnow())
-        account.withdraw(amount)
-        transaction = Transaction.create_withdrawal(account_id, amount)
-        self.account_repository.update_account(account)
-        self.transaction_repository.save_transaction(transaction)
+            # A rollover is saved straight away, so a debit refused below cannot leave it applied
+            # to the stored account without a new version
+            if account.reset_limits(datetime.utcnow()):
+                self.account_repository.update_account(account)
+            decision = self.risk_check.assess(account_id, amount)
+            if decision != RiskDecision.ALLOW:
+                banking_metrics.risk_rejections.labels(decision.value).inc()
+                try:
+                    account.reject_risky_transaction(
+                        lock=decision == RiskDecision.LOCK, count_attempt=decision != RiskDecision.THROTTLE
+                    )
+                finally:
+                    self.account_repository.update_account(account)
+            try:
+                account.withdraw(amount)
+            except (InsufficientFundsError, TransactionLimitExceededError) as e:
+                banking_metrics.record_withdrawal_rejection(e)
+                raise
+            transaction = Transaction.create_withdrawal(account_id, amount)
+            self.account_repository.update_account(account)
+            self.transaction_repository.save_transaction(transaction)
+            self.risk_check.record(account_id, amount)
         self.notification_service.notify(transaction)
+        banking_metrics.withdrawals.inc()
         return transaction
\ No newline at end of file
@@ -0,0 +1,30 @@
+import argparse
+import sys
+
+from benchmarks.harness import load_run
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files")
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Allowed p50 slowdown before flagging (0.10 = 10%%)")
+    args = parser.parse_args()
+
+    baseline = {(r.name, r.size): r for r in load_run(args.baseline).results if not r.skipped}
+    candidate = {(r.name, r.size): r for r in load_run(args.candidate).results if not r.skipped}
+
+    regressions = 0
+    for key in sorted(baseline.keys() & candidate.keys(), key=lambda k: (k[0], k[1] or 0)):
+        old, new = baseline[key], candidate[key]
+        change = (new.p50_us - old.p50_us) / old.p50_us if old.p50_us else 0.0
+        flag = ""
+        if change > args.threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        size = "-" if key[1] is None else f"{key[1]:,}"
+        print(f"{key[0]:<45} {size:>12}  p50 {old.p50_us:>10,.1f}us -> {new.p50_us:>10,.1f}us ({change:+.1%}){flag}")
+
+    sys.exit(1 if regressions else 0)
+
+if __name__ == "__main__":
+    main()
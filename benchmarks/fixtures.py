@@ -0,0 +1,176 @@
+import argparse
+import hashlib
+import heapq
+import os
+import pickle
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from itertools import accumulate
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from domain.entities.account import Account, AccountType, AccountStatus
+from domain.entities.transaction import Transaction, TransactionType
+from domain.services.interest_strategy import CheckingInterestStrategy, SavingsInterestStrategy
+from domain.services.limit_constraint import LimitConstraint
+from infrastructure.repositories.account_repository import InMemoryAccountRepository
+from infrastructure.repositories.transaction_repository import InMemoryTransactionRepository
+
+CACHE_DIR = os.environ.get("FIXTURE_CACHE_DIR", ".fixture_cache")
+# Bump whenever generation logic changes so stale snapshots are never reused
+GENERATOR_VERSION = 2
+
+@dataclass(frozen=True)
+class PopulationSpec:
+    num_accounts: int
+    num_transactions: int
+    seed: int = 42
+    savings_ratio: float = 0.3
+    limited_ratio: float = 0.2
+    transfer_ratio: float = 0.15
+    zipf_exponent: float = 1.1
+    history_days: int = 365
+    as_of: datetime = datetime(2025, 1, 1)
+
+    def cache_key(self) -> str:
+        raw = repr((GENERATOR_VERSION, self))
+        return hashlib.sha256(raw.encode()).hexdigest()[:16]
+
+@dataclass
+class Population:
+    spec: PopulationSpec
+    accounts: Dict[UUID, Account]
+    transactions: Dict[UUID, List[Transaction]]
+
+    def account_ids(self) -> List[UUID]:
+        return list(self.accounts)
+
+def _uuid(rng: random.Random) -> UUID:
+    return UUID(int=rng.getrandbits(128), version=4)
+
+def generate_population(spec: PopulationSpec) -> Population:
+    rng = random.Random(spec.seed)
+    start = spec.as_of - timedelta(days=spec.history_days)
+    checking_strategy = CheckingInterestStrategy()
+    savings_strategy = SavingsInterestStrategy()
+
+    accounts: Dict[UUID, Account] = {}
+    account_list: List[Account] = []
+    for _ in range(spec.num_accounts):
+        is_savings = rng.random() < spec.savings_ratio
+        initial = rng.randint(10_000, 500_000)
+        account = Account(
+            account_id=_uuid(rng),
+            account_type=AccountType.SAVINGS if is_savings else AccountType.CHECKING,
+            balance=initial,
+            status=AccountStatus.ACTIVE,
+            creation_date=start,
+            interest_strategy=savings_strategy if is_savings else checking_strategy,
+            last_reset_date=spec.as_of,
+            last_interest_posting_date=start,
+            minimum_balance=10_000 if is_savings else 5_000,
+            overdraft_limit=0 if is_savings else 10_000,
+        )
+        if rng.random() < spec.limited_ratio:
+            daily = rng.choice((500, 1000, 2500, 5000)) * 100
+            account.limit_constraint = LimitConstraint(daily_limit=daily, monthly_limit=daily * 20)
+        accounts[account.account_id] = account
+        account_list.append(account)
+
+    # Zipf activity: a few accounts carry most of the traffic, ranks shuffled so it isn't tied to creation order
+    ranks = list(range(1, spec.num_accounts + 1))
+    rng.shuffle(ranks)
+    cum_weights = list(accumulate(1.0 / rank ** spec.zipf_exponent for rank in ranks))
+    actors = rng.choices(account_list, cum_weights=cum_weights, k=spec.num_transactions)
+    counterparties = rng.choices(account_list, cum_weights=cum_weights, k=spec.num_transactions)
+
+    transactions: Dict[UUID, List[Transaction]] = {account_id: [] for account_id in accounts}
+    step = timedelta(days=spec.history_days) / max(spec.num_transactions, 1)
+    for i in range(spec.num_transactions):
+        account = actors[i]
+        timestamp = start + step * i
+        amount = max(1, round(rng.lognormvariate(3.5, 1.0) * 100))
+        roll = rng.random()
+        spendable = account.balance - account.minimum_balance
+        destination = counterparties[i]
+
+        if roll < spec.transfer_ratio and destination is not account and amount <= spendable:
+            account.balance -= amount
+            destination.balance += amount
+            transaction_type, destination_id = TransactionType.TRANSFER, destination.account_id
+        elif roll < 0.5 and amount <= spendable:
+            account.balance -= amount
+            transaction_type, destination_id = TransactionType.WITHDRAW, None
+        else:
+            account.balance += amount
+            transaction_type, destination_id = TransactionType.DEPOSIT, None
+
+        transactions[account.account_id].append(Transaction(
+            transaction_id=_uuid(rng),
+            account_id=account.account_id,
+            transaction_type=transaction_type,
+            amount=amount,
+            timestamp=timestamp,
+            destination_account_id=destination_id,
+        ))
+
+    return Population(spec=spec, accounts=accounts, transactions=transactions)
+
+def load_population(spec: PopulationSpec, cache_dir: Optional[str] = CACHE_DIR) -> Population:
+    if cache_dir is None:
+        return generate_population(spec)
+
+    path = os.path.join(cache_dir, f"population_{spec.cache_key()}.pkl")
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            return pickle.load(f)
+
+    population = generate_population(spec)
+    os.makedirs(cache_dir, exist_ok=True)
+    # Write then rename so an interrupted run never leaves a truncated snapshot behind
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(population, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+    return population
+
+def populate_repositories(
+    population: Population,
+    account_repository: InMemoryAccountRepository,
+    transaction_repository: InMemoryTransactionRepository
+) -> None:
+    # Batch inserts instead of one create/save call per row
+    account_repository.create_accounts(list(population.accounts.values()))
+    transaction_repository.save_transactions(list(
+        heapq.merge(*population.transactions.values(), key=lambda transaction: transaction.timestamp)
+    ))
+
+def build_repositories(spec: PopulationSpec, cache_dir: Optional[str] = CACHE_DIR) -> Tuple[
+    InMemoryAccountRepository, InMemoryTransactionRepository, Population
+]:
+    population = load_population(spec, cache_dir)
+    account_repository = InMemoryAccountRepository()
+    transaction_repository = InMemoryTransactionRepository()
+    populate_repositories(population, account_repository, transaction_repository)
+    return account_repository, transaction_repository, population
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate and cache a synthetic account population")
+    parser.add_argument("--accounts", type=int, default=10_000)
+    parser.add_argument("--transactions", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--cache-dir", default=CACHE_DIR)
+    args = parser.parse_args()
+
+    spec = PopulationSpec(num_accounts=args.accounts, num_transactions=args.transactions, seed=args.seed)
+    start = datetime.utcnow()
+    population = load_population(spec, args.cache_dir)
+    elapsed = (datetime.utcnow() - start).total_seconds()
+    print(
+        f"{len(population.accounts):,} accounts, {args.transactions:,} transactions "
+        f"ready in {elapsed:.1f}s (cache key {spec.cache_key()})"
+    )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+import json
+import platform
+import subprocess
+import sys
+from dataclasses import dataclass, asdict, field
+from datetime import datetime
+from time import perf_counter_ns
+from typing import Callable, List, Optional
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    size: Optional[int]
+    iterations: int
+    ops_per_sec: float
+    mean_us: float
+    p50_us: float
+    p95_us: float
+    p99_us: float
+    skipped: Optional[str] = None
+
+@dataclass
+class BenchmarkRun:
+    started_at: str
+    python_version: str
+    platform: str
+    git_commit: Optional[str]
+    results: List[BenchmarkResult] = field(default_factory=list)
+
+def percentile(sorted_samples: List[int], fraction: float) -> float:
+    if not sorted_samples:
+        return 0.0
+    index = min(len(sorted_samples) - 1, int(round(fraction * (len(sorted_samples) - 1))))
+    return float(sorted_samples[index])
+
+def run_benchmark(
+    name: str,
+    func: Callable[[], object],
+    size: Optional[int] = None,
+    min_time: float = 0.5,
+    min_iterations: int = 5,
+    max_iterations: int = 100_000
+) -> BenchmarkResult:
+    # Warm up caches and lazily created state before timing
+    func()
+
+    samples: List[int] = []
+    budget_ns = int(min_time * 1e9)
+    elapsed_ns = 0
+    while (elapsed_ns < budget_ns or len(samples) < min_iterations) and len(samples) < max_iterations:
+        start = perf_counter_ns()
+        func()
+        duration = perf_counter_ns() - start
+        samples.append(duration)
+        elapsed_ns += duration
+
+    samples.sort()
+    total_ns = sum(samples)
+    return BenchmarkResult(
+        name=name,
+        size=size,
+        iterations=len(samples),
+        ops_per_sec=len(samples) / (total_ns / 1e9) if total_ns else 0.0,
+        mean_us=total_ns / len(samples) / 1000,
+        p50_us=percentile(samples, 0.50) / 1000,
+        p95_us=percentile(samples, 0.95) / 1000,
+        p99_us=percentile(samples, 0.99) / 1000,
+    )
+
+def skipped_result(name: str, size: Optional[int], reason: str) -> BenchmarkResult:
+    return BenchmarkResult(
+        name=name, size=size, iterations=0, ops_per_sec=0.0,
+        mean_us=0.0, p50_us=0.0, p95_us=0.0, p99_us=0.0, skipped=reason
+    )
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def new_run() -> BenchmarkRun:
+    return BenchmarkRun(
+        started_at=datetime.utcnow().isoformat(),
+        python_version=sys.version.split()[0],
+        platform=platform.platform(),
+        git_commit=_git_commit(),
+    )
+
+def save_run(run: BenchmarkRun, path: str) -> None:
+    with open(path, "w") as f:
+        json.dump(asdict(run), f, indent=2)
+
+def load_run(path: str) -> BenchmarkRun:
+    with open(path) as f:
+        data = json.load(f)
+    results = [BenchmarkResult(**result) for result in data.pop("results")]
+    return BenchmarkRun(results=results, **data)
+
+def format_result(result: BenchmarkResult) -> str:
+    size = "-" if result.size is None else f"{result.size:,}"
+    if result.skipped:
+        return f"{result.name:<45} {size:>12}  skipped: {result.skipped}"
+    return (
+        f"{result.name:<45} {size:>12} {result.ops_per_sec:>14,.1f} ops/s"
+        f"  p50={result.p50_us:,.1f}us p95={result.p95_us:,.1f}us p99={result.p99_us:,.1f}us"
+    )
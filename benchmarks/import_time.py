@@ -0,0 +1,51 @@
+import argparse
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+def measure_import(module: str) -> Tuple[float, Dict[str, int]]:
+    # A fresh interpreter per run so nothing is already cached in sys.modules
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True
+    )
+    cumulative: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative_us, name = line[len("import time:"):].split("|")
+        if cumulative_us.strip().isdigit():
+            cumulative[name.strip()] = int(cumulative_us)
+    return cumulative.get(module, 0) / 1000, cumulative
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure cold import time of the application")
+    parser.add_argument("--module", default="main")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="Slowest first-party modules to list")
+    parser.add_argument("--max-ms", type=float, help="Fail if the median import time exceeds this")
+    args = parser.parse_args()
+
+    timings: List[float] = []
+    last: Dict[str, int] = {}
+    for _ in range(args.runs):
+        elapsed_ms, last = measure_import(args.module)
+        timings.append(elapsed_ms)
+
+    median = statistics.median(timings)
+    print(f"import {args.module}: median {median:.1f}ms, min {min(timings):.1f}ms over {args.runs} runs")
+    first_party = ("main", "presentation", "application", "domain", "infrastructure")
+    slowest = sorted(
+        ((name, us) for name, us in last.items() if name.split(".")[0] in first_party),
+        key=lambda item: item[1], reverse=True
+    )
+    for name, us in slowest[:args.top]:
+        print(f"  {us / 1000:>8.1f}ms  {name}")
+
+    if args.max_ms is not None and median > args.max_ms:
+        print(f"Import time regression: {median:.1f}ms > {args.max_ms:.1f}ms")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+import argparse
+import asyncio
+import json
+import logging
+import random
+from collections import defaultdict
+from dataclasses import dataclass, asdict
+from time import perf_counter
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from benchmarks.harness import percentile
+
+@dataclass
+class ReplayRequest:
+    method: str
+    path: str
+    body: Optional[dict] = None
+
+@dataclass
+class RouteReport:
+    route: str
+    requests: int
+    errors: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+async def asgi_request(app, method: str, path: str, body: Optional[dict] = None) -> Tuple[int, bytes, str]:
+    payload = json.dumps(body).encode() if body is not None else b""
+    path, _, query = path.partition("?")
+    headers = [(b"host", b"replay")]
+    if payload:
+        headers += [(b"content-type", b"application/json"), (b"content-length", str(len(payload)).encode())]
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query.encode(),
+        "headers": headers,
+        "client": ("replay", 0),
+        "server": ("replay", 80),
+    }
+    sent = False
+
+    async def receive():
+        nonlocal sent
+        if sent:
+            return {"type": "http.disconnect"}
+        sent = True
+        return {"type": "http.request", "body": payload, "more_body": False}
+
+    status = 500
+    chunks: List[bytes] = []
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    try:
+        await app(scope, receive, send)
+    except Exception:
+        # Starlette re-raises after sending its 500 response; count it as a failed request
+        status = 500
+    route = scope.get("route")
+    return status, b"".join(chunks), route.path if route is not None else path
+
+def load_request_log(path: str) -> List[ReplayRequest]:
+    requests = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            entry = json.loads(line)
+            # Skip lines that aren't HTTP requests so mixed logs can be replayed as-is
+            if "method" not in entry or "path" not in entry:
+                continue
+            requests.append(ReplayRequest(entry["method"].upper(), entry["path"], entry.get("json")))
+    return requests
+
+async def seed_accounts(app, count: int) -> List[str]:
+    account_ids = []
+    for i in range(count):
+        account_type = "SAVINGS" if i % 4 == 0 else "CHECKING"
+        status, body, _ = await asgi_request(
+            app, "POST", "/accounts/", {"account_type": account_type, "initial_deposit": 1_000_000.0}
+        )
+        if status != 201:
+            raise RuntimeError(f"Failed to seed account: {status} {body!r}")
+        account_ids.append(json.loads(body)["account_id"])
+    return account_ids
+
+def synthetic_mix(account_ids: List[str], count: int, seed: int = 42) -> Iterator[ReplayRequest]:
+    rng = random.Random(seed)
+    mix = [
+        ("get_account", 30), ("get_transactions", 15), ("get_limits", 10),
+        ("deposit", 20), ("withdraw", 15), ("transfer", 10),
+    ]
+    kinds, weights = zip(*mix)
+    for kind in rng.choices(kinds, weights=weights, k=count):
+        account_id = rng.choice(account_ids)
+        if kind == "get_account":
+            yield ReplayRequest("GET", f"/accounts/{account_id}")
+        elif kind == "get_transactions":
+            yield ReplayRequest("GET", f"/accounts/{account_id}/transactions")
+        elif kind == "get_limits":
+            yield ReplayRequest("GET", f"/accounts/{account_id}/limits")
+        elif kind == "deposit":
+            yield ReplayRequest("POST", f"/accounts/{account_id}/deposit", {"amount": rng.randint(1, 100)})
+        elif kind == "withdraw":
+            yield ReplayRequest("POST", f"/accounts/{account_id}/withdraw", {"amount": rng.randint(1, 20)})
+        else:
+            yield ReplayRequest("POST", "/accounts/transfer", {
+                "source_account_id": account_id,
+                "destination_account_id": rng.choice(account_ids),
+                "amount": rng.randint(1, 20),
+            })
+
+def resolve_placeholders(requests: List[ReplayRequest], account_ids: List[str], seed: int = 42) -> List[ReplayRequest]:
+    # Logs may use {account_id} so they can be replayed against freshly seeded state
+    rng = random.Random(seed)
+    resolved = []
+    for request in requests:
+        path = request.path.replace("{account_id}", rng.choice(account_ids))
+        body = request.body
+        if body is not None:
+            body = json.loads(json.dumps(body).replace("{account_id}", rng.choice(account_ids)))
+        resolved.append(ReplayRequest(request.method, path, body))
+    return resolved
+
+async def replay(app, requests: List[ReplayRequest], concurrency: int) -> Tuple[float, List[RouteReport]]:
+    queue: asyncio.Queue = asyncio.Queue()
+    for request in requests:
+        queue.put_nowait(request)
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    errors: Dict[str, int] = defaultdict(int)
+
+    async def worker():
+        while True:
+            try:
+                request = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            start = perf_counter()
+            status, _, route = await asgi_request(app, request.method, request.path, request.body)
+            key = f"{request.method} {route}"
+            latencies[key].append((perf_counter() - start) * 1000)
+            if status >= 400:
+                errors[key] += 1
+
+    start = perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = perf_counter() - start
+
+    reports = []
+    for route, samples in sorted(latencies.items()):
+        samples.sort()
+        reports.append(RouteReport(
+            route=route,
+            requests=len(samples),
+            errors=errors[route],
+            p50_ms=percentile(samples, 0.50),
+            p95_ms=percentile(samples, 0.95),
+            p99_ms=percentile(samples, 0.99),
+        ))
+    return elapsed, reports
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Replay requests against the ASGI app in-process")
+    parser.add_argument("--log", help="JSONL file of {method, path, json} requests; synthetic mix if omitted")
+    parser.add_argument("--requests", type=int, default=10_000, help="Number of synthetic requests")
+    parser.add_argument("--accounts", type=int, default=100, help="Accounts to seed before replaying")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--output", help="Optional JSON file for the per-route report")
+    parser.add_argument(
+        "--risk-checks", action="store_true",
+        help="Keep velocity checks on; replayed traffic is far denser per account than real customers"
+    )
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    from main import app
+    if not args.risk_checks:
+        from domain.services.risk_check import NoRiskCheck
+        from presentation.container import services
+        services.risk_check = NoRiskCheck()
+
+    async def run() -> Tuple[float, List[RouteReport]]:
+        account_ids = await seed_accounts(app, args.accounts)
+        if args.log:
+            requests = resolve_placeholders(load_request_log(args.log), account_ids)
+        else:
+            requests = list(synthetic_mix(account_ids, args.requests))
+        return await replay(app, requests, args.concurrency)
+
+    elapsed, reports = asyncio.run(run())
+    total = sum(report.requests for report in reports)
+    print(f"{total:,} requests in {elapsed:.2f}s ({total / elapsed:,.1f} req/s, concurrency {args.concurrency})")
+    for report in reports:
+        print(
+            f"{report.route:<50} {report.requests:>8,} req {report.errors:>6,} err"
+            f"  p50={report.p50_ms:.2f}ms p95={report.p95_ms:.2f}ms p99={report.p99_ms:.2f}ms"
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({
+                "elapsed_seconds": elapsed,
+                "requests_per_second": total / elapsed,
+                "concurrency": args.concurrency,
+                "routes": [asdict(report) for report in reports],
+            }, f, indent=2)
+
+if __name__ == "__main__":
+    main()
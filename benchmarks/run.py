@@ -0,0 +1,34 @@
+import argparse
+import logging
+
+from benchmarks.harness import new_run, save_run, format_result
+from benchmarks.suites import SUITES
+
+DEFAULT_SIZES = "1000,10000,100000"
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the banking hot-path benchmarks")
+    parser.add_argument("--suite", action="append", choices=sorted(SUITES), help="Suite to run (repeatable, default all)")
+    parser.add_argument(
+        "--sizes",
+        default=DEFAULT_SIZES,
+        help="Comma separated transactions per account, e.g. 1000,1000000,10000000"
+    )
+    parser.add_argument("--output", default="bench_results.json", help="Where to write machine-readable results")
+    args = parser.parse_args()
+
+    # Notification logging would otherwise dominate the measurements
+    logging.disable(logging.INFO)
+
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    run = new_run()
+    for suite in args.suite or sorted(SUITES):
+        for result in SUITES[suite](sizes):
+            print(format_result(result), flush=True)
+            run.results.append(result)
+
+    save_run(run, args.output)
+    print(f"Results written to {args.output}")
+
+if __name__ == "__main__":
+    main()
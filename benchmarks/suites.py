@@ -0,0 +1,243 @@
+import json
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Tuple
+from uuid import UUID, uuid4
+
+from domain.entities.account import Account, AccountType, AccountStatus
+from domain.entities.transaction import Transaction, TransactionType
+from application.services.transaction_service import TransactionService
+from application.services.fund_transfer_service import FundTransferService
+from application.services.statement_service import StatementService
+from application.services.notification_service import NotificationService
+from infrastructure.adapters.notification_adapter import MockNotificationAdapter
+from infrastructure.adapters.statement_adapter import (
+    MockStatementAdapter,
+    CSVStatementAdapter,
+    EnhancedCSVStatementAdapter,
+    PDFStatementAdapter,
+)
+from infrastructure.repositories.account_repository import InMemoryAccountRepository
+from infrastructure.repositories.transaction_repository import InMemoryTransactionRepository
+from benchmarks.harness import BenchmarkResult, run_benchmark, skipped_result
+from benchmarks.fixtures import PopulationSpec, build_repositories
+
+# fpdf lays out every row as a cell; beyond this the PDF benchmark measures nothing useful
+PDF_MAX_TRANSACTIONS = 10_000
+
+def bench_account(balance: int = 10 ** 17) -> Account:
+    return Account(
+        account_id=uuid4(),
+        account_type=AccountType.CHECKING,
+        balance=balance,
+        status=AccountStatus.ACTIVE,
+        creation_date=datetime.utcnow(),
+        last_reset_date=datetime.utcnow(),
+        max_daily_transactions=10 ** 15,
+    )
+
+def build_ledger(size: int) -> Tuple[InMemoryAccountRepository, InMemoryTransactionRepository, Account]:
+    account_repository = InMemoryAccountRepository()
+    transaction_repository = InMemoryTransactionRepository()
+    account = bench_account()
+    account_repository.create_account(account)
+
+    start = datetime.utcnow() - timedelta(days=365)
+    step = timedelta(days=365) / max(size, 1)
+    types = (TransactionType.DEPOSIT, TransactionType.WITHDRAW)
+    transaction_repository.transactions[account.account_id] = [
+        Transaction(
+            transaction_id=uuid4(),
+            account_id=account.account_id,
+            transaction_type=types[i % 2],
+            amount=(i % 500 + 1) * 100,
+            timestamp=start + step * i,
+        )
+        for i in range(size)
+    ]
+    return account_repository, transaction_repository, account
+
+def domain_benchmarks() -> List[BenchmarkResult]:
+    from domain.entities.identifiers import uuid7
+    from domain.services.risk_check import VelocityRiskCheck, VelocityConfig
+
+    account = bench_account()
+    # Unbounded rate so every call walks the full ALLOW path; a first record gives the account
+    # a profile for assess to judge against
+    risk_check = VelocityRiskCheck(VelocityConfig(rate_per_second=1e9))
+    counterparty_id = uuid4()
+    risk_check.record(account.account_id, 1000, counterparty_id)
+    return [
+        run_benchmark("Account.deposit", lambda: account.deposit(1000)),
+        run_benchmark("Account.withdraw", lambda: account.withdraw(1000)),
+        run_benchmark("uuid4", uuid4),
+        run_benchmark("uuid7", uuid7),
+        run_benchmark(
+            "VelocityRiskCheck.assess",
+            lambda: risk_check.assess(account.account_id, 1000, counterparty_id)
+        ),
+        run_benchmark(
+            "VelocityRiskCheck.record",
+            lambda: risk_check.record(account.account_id, 1000, counterparty_id)
+        ),
+    ]
+
+def service_benchmarks(size: int) -> List[BenchmarkResult]:
+    account_repository, transaction_repository, account = build_ledger(size)
+    destination = bench_account()
+    account_repository.create_account(destination)
+    notification_service = NotificationService(MockNotificationAdapter())
+    transaction_service = TransactionService(account_repository, transaction_repository, notification_service)
+    transfer_service = FundTransferService(account_repository, transaction_repository, notification_service)
+    account_id, destination_id = account.account_id, destination.account_id
+
+    return [
+        run_benchmark("TransactionService.deposit", lambda: transaction_service.deposit(account_id, 1000), size),
+        run_benchmark("TransactionService.withdraw", lambda: transaction_service.withdraw(account_id, 1000), size),
+        run_benchmark(
+            "FundTransferService.transfer_funds",
+            lambda: transfer_service.transfer_funds(account_id, destination_id, 1000),
+            size
+        ),
+    ]
+
+def account_opening_benchmarks(size: int) -> List[BenchmarkResult]:
+    from application.services.account_creation_service import AccountCreationService
+
+    rows = [("CHECKING" if i % 2 else "SAVINGS", 20000) for i in range(size)]
+
+    def one_by_one() -> None:
+        service = AccountCreationService(InMemoryAccountRepository())
+        for account_type, initial_deposit in rows:
+            service.create_account(account_type, initial_deposit)
+
+    def bulk() -> None:
+        AccountCreationService(InMemoryAccountRepository()).create_accounts(rows)
+
+    return [
+        run_benchmark("account_opening.one_by_one", one_by_one, size),
+        run_benchmark("account_opening.bulk", bulk, size),
+    ]
+
+def statement_benchmarks(size: int) -> List[BenchmarkResult]:
+    account_repository, transaction_repository, account = build_ledger(size)
+    transactions = transaction_repository.get_transactions_for_account(account.account_id)
+    start_date = datetime.utcnow() - timedelta(days=400)
+    end_date = datetime.utcnow()
+    results = []
+
+    statement_service = StatementService(account_repository, transaction_repository, MockStatementAdapter())
+    results.append(run_benchmark(
+        "StatementService.generate_statement",
+        lambda: statement_service.generate_statement(account.account_id, start_date, end_date),
+        size
+    ))
+
+    adapters: Dict[str, Callable[[], object]] = {
+        "MockStatementAdapter": MockStatementAdapter,
+        "CSVStatementAdapter": CSVStatementAdapter,
+        "EnhancedCSVStatementAdapter": EnhancedCSVStatementAdapter,
+        "PDFStatementAdapter": PDFStatementAdapter,
+    }
+    for name, adapter_class in adapters.items():
+        if adapter_class is PDFStatementAdapter and size > PDF_MAX_TRANSACTIONS:
+            results.append(skipped_result(f"{name}.generate", size, f"above {PDF_MAX_TRANSACTIONS} transactions"))
+            continue
+        adapter = adapter_class()
+        results.append(run_benchmark(
+            f"{name}.generate",
+            lambda adapter=adapter: adapter.generate(account, transactions, start_date, end_date),
+            size
+        ))
+    return results
+
+def population_benchmarks(size: int) -> List[BenchmarkResult]:
+    # Zipf-skewed population so hot accounts carry long histories, as in production
+    spec = PopulationSpec(num_accounts=max(size // 10, 10), num_transactions=size)
+    account_repository, transaction_repository, population = build_repositories(spec)
+    notification_service = NotificationService(MockNotificationAdapter())
+    transaction_service = TransactionService(account_repository, transaction_repository, notification_service)
+    statement_service = StatementService(account_repository, transaction_repository, MockStatementAdapter())
+    hottest = max(population.transactions, key=lambda account_id: len(population.transactions[account_id]))
+    start_date = spec.as_of - timedelta(days=spec.history_days)
+
+    return [
+        run_benchmark("population.deposit_hottest", lambda: transaction_service.deposit(hottest, 1000), size),
+        run_benchmark(
+            "population.statement_hottest",
+            lambda: statement_service.generate_statement(hottest, start_date, spec.as_of),
+            size
+        ),
+    ]
+
+def serialization_benchmarks(size: int) -> List[BenchmarkResult]:
+    from pydantic import TypeAdapter
+    from domain.entities.money import from_cents
+    from presentation.api.accounts import TransactionResponse
+    from presentation.api.json_encoding import encode_transactions
+
+    _, transaction_repository, account = build_ledger(size)
+    transactions = transaction_repository.get_transactions_for_account(account.account_id)
+    response_adapter = TypeAdapter(List[TransactionResponse])
+
+    def model_path() -> bytes:
+        # Mirrors the previous endpoint: build models, let FastAPI validate, dump and encode them
+        models = [
+            TransactionResponse(
+                transaction_id=tx.transaction_id,
+                account_id=tx.account_id,
+                transaction_type=tx.transaction_type.value,
+                amount=from_cents(tx.amount),
+                timestamp=tx.timestamp.isoformat(),
+                destination_account_id=tx.destination_account_id,
+            )
+            for tx in transactions
+        ]
+        validated = response_adapter.validate_python(models)
+        return json.dumps(response_adapter.dump_python(validated, mode="json")).encode()
+
+    return [
+        run_benchmark("serialize_transactions.models", model_path, size),
+        run_benchmark("serialize_transactions.raw_json", lambda: encode_transactions(transactions), size),
+    ]
+
+def analytics_benchmarks(size: int) -> List[BenchmarkResult]:
+    from application.services.analytics_service import AnalyticsService
+
+    spec = PopulationSpec(num_accounts=max(size // 10, 10), num_transactions=size)
+    account_repository, transaction_repository, population = build_repositories(spec)
+    analytics_service = AnalyticsService(account_repository, transaction_repository)
+    analytics_service.refresh()
+
+    def python_scan() -> Dict:
+        # What answering the question looked like before: walk every account's list in Python
+        totals: Dict = {}
+        for transactions in transaction_repository.transactions.values():
+            for transaction in transactions:
+                key = (transaction.transaction_type, transaction.timestamp.replace(minute=0, second=0, microsecond=0))
+                count, total = totals.get(key, (0, 0))
+                totals[key] = (count + 1, total + transaction.amount)
+        return totals
+
+    return [
+        run_benchmark("analytics.type_by_hour.python_scan", python_scan, size),
+        run_benchmark(
+            "analytics.type_by_hour.columnar",
+            lambda: analytics_service.aggregate_transactions(["transaction_type", "hour"]),
+            size
+        ),
+        run_benchmark(
+            "analytics.cold_load",
+            lambda: AnalyticsService(account_repository, transaction_repository).refresh(),
+            size
+        ),
+    ]
+
+SUITES = {
+    "domain": lambda sizes: domain_benchmarks(),
+    "services": lambda sizes: [result for size in sizes for result in service_benchmarks(size)],
+    "statements": lambda sizes: [result for size in sizes for result in statement_benchmarks(size)],
+    "serialization": lambda sizes: [result for size in sizes for result in serialization_benchmarks(size)],
+    "account_opening": lambda sizes: [result for size in sizes for result in account_opening_benchmarks(size)],
+    "population": lambda sizes: [result for size in sizes for result in population_benchmarks(size)],
+    "analytics": lambda sizes: [result for size in sizes for result in analytics_benchmarks(size)],
+}
@@ -2,12 +2,17 @@ from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 
+from domain.entities.identifiers import uuid7
+from domain.entities.money import Cents, apply_compound_rate, format_currency
 from domain.exceptions.domain_exceptions import (
+    AccountLockedError,
     InsufficientFundsError,
     InvalidAmountError,
     InvalidAccountStatusError,
+    RiskCheckFailedError,
+    TransactionLimitError,
 )
 from domain.services.interest_strategy import InterestStrategy
 from domain.services.limit_constraint import LimitConstraint
@@ -24,55 +29,62 @@ class AccountStatus(Enum):
 class Account:
     account_id: UUID
     account_type: AccountType
-    balance: float
+    balance: Cents
     status: AccountStatus
     creation_date: datetime
     interest_strategy: Optional[InterestStrategy] = None
     limit_constraint: Optional[LimitConstraint] = None
-    daily_spent: float = 0.0
-    monthly_spent: float = 0.0
+    daily_spent: Cents = 0
+    monthly_spent: Cents = 0
     last_reset_date: Optional[datetime] = None
-    minimum_balance: float = 0.0
+    minimum_balance: Cents = 0
     last_interest_posting_date: Optional[datetime] = None
     failed_attempts: int = 0
     is_locked: bool = False
-    overdraft_limit: float = 0.0
+    overdraft_limit: Cents = 0
     transaction_count: int = 0
     max_daily_transactions: int = 1000
     last_statement_date: Optional[datetime] = None
+    # Sum of outstanding authorization holds, kept as a running total so the available
+    # balance costs the same however many holds are open
+    held_amount: Cents = 0
+    # The initial deposit, which is not a ledger posting: balance == opening_balance + ledger net
+    opening_balance: Cents = 0
 
     @staticmethod
-    def create(account_type: AccountType, initial_deposit: float = 0.0) -> "Account":
+    def create(account_type: AccountType, initial_deposit: Cents = 0, now: Optional[datetime] = None) -> "Account":
         if initial_deposit < 0:
             raise InvalidAmountError("Initial deposit cannot be negative")
         
         # Set account type specific rules
-        minimum_balance = 0.0
-        overdraft_limit = 0.0
+        minimum_balance = 0
+        overdraft_limit = 0
         max_daily_transactions = 1000
         
         if account_type == AccountType.SAVINGS:
-            minimum_balance = 100.0  # Minimum balance for savings
+            minimum_balance = 10000  # Minimum balance for savings ($100)
             if initial_deposit < minimum_balance:
-                raise InvalidAmountError(f"Savings account requires minimum initial deposit of ${minimum_balance}")
+                raise InvalidAmountError(f"Savings account requires minimum initial deposit of {format_currency(minimum_balance)}")
         elif account_type == AccountType.CHECKING:
-            minimum_balance = 50.0   # Minimum balance for checking
-            overdraft_limit = 100.0  # Overdraft limit for checking
+            minimum_balance = 5000   # Minimum balance for checking ($50)
+            overdraft_limit = 10000  # Overdraft limit for checking ($100)
         
+        now = now or datetime.utcnow()
         return Account(
-            account_id=uuid4(),
+            account_id=uuid7(),
             account_type=account_type,
             balance=initial_deposit,
+            opening_balance=initial_deposit,
             status=AccountStatus.ACTIVE,
-            creation_date=datetime.utcnow(),
-            last_reset_date=datetime.utcnow(),
-            last_interest_posting_date=datetime.utcnow(),
+            creation_date=now,
+            last_reset_date=now,
+            last_interest_posting_date=now,
             minimum_balance=minimum_balance,
             overdraft_limit=overdraft_limit,
             max_daily_transactions=max_daily_transactions
         )
 
-    def deposit(self, amount: float) -> None:
+    def deposit(self, amount: Cents) -> None:
         if amount <= 0:
             raise InvalidAmountError("Deposit amount must be positive")
         if self.status != AccountStatus.ACTIVE:
@@ -91,7 +103,7 @@ class Account:
         if self.status != AccountStatus.ACTIVE:
             raise InvalidAccountStatusError("Account is not active")
 
-    def withdraw(self, amount: float) -> None:
+    def withdraw(self, amount: Cents) -> None:
         # First validate basic conditions
         if amount <= 0:
             raise InvalidAmountError("Withdrawal amount must be positive")
@@ -99,54 +111,99 @@ class Account:
         # Validate account status and limits
         self.validate_transaction()
 
-        # Calculate available balance including overdraft if applicable
-        available_balance = self.balance
+        self.check_funds(amount)
+
+        # Check withdrawal limits if configured
+        if self.limit_constraint:
+            self.limit_constraint.check_withdrawal(self, amount)
+
+        # Process withdrawal
+        self.balance -= amount
+        self.daily_spent += amount
+        self.monthly_spent += amount
+        self.transaction_count += 1
+
+    def check_funds(self, amount: Cents) -> None:
+        # Calculate available balance including overdraft if applicable, less any holds
+        available_balance = self.balance - self.held_amount
         if self.account_type == AccountType.CHECKING:
             available_balance += self.overdraft_limit
 
         # Check if withdrawal would exceed available balance
         if amount > available_balance:
-            raise InsufficientFundsError(f"Insufficient funds. Available balance: ${available_balance}")
+            raise InsufficientFundsError(f"Insufficient funds. Available balance: {format_currency(available_balance)}")
 
         # For savings accounts, ensure minimum balance is maintained
-        if self.account_type == AccountType.SAVINGS and (self.balance - amount) < self.minimum_balance:
-            raise InsufficientFundsError(f"Cannot go below minimum balance of ${self.minimum_balance}")
+        if self.account_type == AccountType.SAVINGS and (self.balance - self.held_amount - amount) < self.minimum_balance:
+            raise InsufficientFundsError(f"Cannot go below minimum balance of {format_currency(self.minimum_balance)}")
 
-        # Check withdrawal limits if configured
+    @property
+    def available_balance(self) -> Cents:
+        return self.balance - self.held_amount
+
+    def place_hold(self, amount: Cents) -> None:
+        if amount <= 0:
+            raise InvalidAmountError("Hold amount must be positive")
+        self.validate_transaction()
+        self.check_funds(amount)
+        self.held_amount += amount
+
+    def release_hold(self, amount: Cents) -> None:
+        self.held_amount -= amount
+
+    def capture_hold(self, held: Cents, amount: Cents) -> None:
+        # Captures up to the held amount; the rest of the hold is released. The capture goes
+        # through withdraw, so limits and the daily count apply at capture, not at authorization
+        if amount > held:
+            raise InvalidAmountError("Cannot capture more than the held amount")
+        self.held_amount -= held
+        try:
+            self.withdraw(amount)
+        except Exception:
+            self.held_amount += held
+            raise
+
+    def record_gross_debit(self, amount: Cents) -> None:
+        # A netted transfer counts in full against limits and the daily count, but leaves the
+        # balance alone; the balance moves once per settlement by the net position
+        if amount <= 0:
+            raise InvalidAmountError("Withdrawal amount must be positive")
+        self.validate_transaction()
         if self.limit_constraint:
             self.limit_constraint.check_withdrawal(self, amount)
-
-        # Process withdrawal
-        self.balance -= amount
         self.daily_spent += amount
         self.monthly_spent += amount
         self.transaction_count += 1
 
-    def apply_interest(self) -> float:
+    def apply_net_position(self, net: Cents) -> None:
+        if net < 0:
+            self.check_funds(-net)
+        elif net > 0 and self.status != AccountStatus.ACTIVE:
+            raise InvalidAccountStatusError("Cannot deposit to a closed account")
+        self.balance += net
+
+    def apply_interest(self) -> Cents:
         if not self.interest_strategy or self.status != AccountStatus.ACTIVE:
-            return 0.0
+            return 0
         interest = self.interest_strategy.calculate_interest(self.balance)
         self.balance += interest
         return interest
 
-    def calculate_compound_interest(self) -> float:
+    def calculate_compound_interest(self) -> Cents:
         if not self.interest_strategy or self.status != AccountStatus.ACTIVE:
-            return 0.0
+            return 0
             
         if not self.last_interest_posting_date:
             self.last_interest_posting_date = datetime.utcnow()
-            return 0.0
+            return 0
             
         # Calculate days since last interest posting
         days = (datetime.utcnow() - self.last_interest_posting_date).days
-        if days < 1:
-            return 0.0
+        if days < 1 or self.balance <= 0:
+            return 0
             
-        # Calculate daily interest rate (APR/365)
-        daily_rate = self.interest_strategy.calculate_interest(1.0) / 365
-        
-        # Calculate compound interest
-        compound_interest = self.balance * ((1 + daily_rate) ** days - 1)
+        # Compounded daily (APR/365), rounded once to whole cents
+        compound_interest = apply_compound_rate(self.balance, self.interest_strategy.rate_bps(self.balance), days, 365)
         
         # Update balance and last posting date
         self.balance += compound_interest
@@ -154,26 +211,31 @@ class Account:
         
         return compound_interest
 
-    def reset_limits(self, current_date: datetime) -> None:
+    def reset_limits(self, current_date: datetime) -> bool:
+        # True when a day or month rollover cleared counters the caller should save
         if not self.last_reset_date:
             self.last_reset_date = current_date
-            return
+            return False
 
         # Get dates for comparison
         current = current_date.date()
         last = self.last_reset_date.date()
+        reset = False
 
         # Month change takes precedence - reset both monthly and daily
         if current.month != last.month or current.year != last.year:
-            self.monthly_spent = 0.0
-            self.daily_spent = 0.0
+            self.monthly_spent = 0
+            self.daily_spent = 0
             self.transaction_count = 0
+            reset = True
         # Day change - reset only daily
         elif current > last:
-            self.daily_spent = 0.0
+            self.daily_spent = 0
             self.transaction_count = 0
+            reset = True
 
         self.last_reset_date = current_date
+        return reset
 
     def increment_failed_attempts(self) -> None:
         self.failed_attempts += 1
@@ -181,6 +243,16 @@ class Account:
             self.is_locked = True
             raise AccountLockedError("Account locked due to multiple failed attempts")
 
+    def reject_risky_transaction(self, lock: bool, count_attempt: bool = True) -> None:
+        if lock:
+            self.is_locked = True
+            raise AccountLockedError("Account locked due to suspicious activity")
+        # Repeated blocks lock the account through the usual failed-attempt counter; a rate
+        # limit says nothing against the holder, so it is refused without counting
+        if count_attempt:
+            self.increment_failed_attempts()
+        raise RiskCheckFailedError("Transaction blocked by risk checks")
+
     def reset_security_status(self) -> None:
         self.failed_attempts = 0
         self.is_locked = False
\ No newline at end of file
@@ -0,0 +1,37 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Optional
+from uuid import UUID
+
+from domain.entities.identifiers import uuid7
+from domain.entities.money import Cents
+
+DEFAULT_HOLD_TTL = timedelta(days=7)
+MAX_HOLD_TTL = timedelta(days=30)
+
+class HoldStatus(Enum):
+    PENDING = "PENDING"
+    CAPTURED = "CAPTURED"
+    RELEASED = "RELEASED"
+    EXPIRED = "EXPIRED"
+
+@dataclass
+class Hold:
+    hold_id: UUID
+    account_id: UUID
+    amount: Cents
+    created_at: datetime
+    expires_at: datetime
+    status: HoldStatus = HoldStatus.PENDING
+    captured_amount: Cents = 0
+    transaction_id: Optional[UUID] = None
+
+    @staticmethod
+    def create(account_id: UUID, amount: Cents, ttl: timedelta, now: Optional[datetime] = None) -> "Hold":
+        now = now or datetime.utcnow()
+        return Hold(hold_id=uuid7(), account_id=account_id, amount=amount, created_at=now, expires_at=now + ttl)
+
+    @property
+    def is_pending(self) -> bool:
+        return self.status == HoldStatus.PENDING
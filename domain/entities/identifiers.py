@@ -0,0 +1,52 @@
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Tuple
+from uuid import UUID
+
+# UUIDv7 layout (RFC 9562): 48-bit Unix milliseconds, version, a 12-bit counter in rand_a,
+# variant, then 62 random bits. Ids from one process sort in creation order, and ids from
+# different processes sort by millisecond.
+VERSION_7 = 0x7 << 76
+VARIANT_RFC = 0b10 << 62
+COUNTER_BITS = 12
+COUNTER_MAX = (1 << COUNTER_BITS) - 1
+RANDOM_MASK = (1 << 62) - 1
+EPOCH = datetime(1970, 1, 1)
+ONE_MILLISECOND = timedelta(milliseconds=1)
+
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+def _next_timestamp_and_counter() -> Tuple[int, int]:
+    global _last_ms, _counter
+    now_ms = time.time_ns() // 1_000_000
+    with _lock:
+        if now_ms > _last_ms:
+            _last_ms = now_ms
+            _counter = 0
+        else:
+            # Same millisecond, or the clock stepped back: keep counting from the last id
+            _counter += 1
+            if _counter > COUNTER_MAX:
+                _last_ms += 1
+                _counter = 0
+        return _last_ms, _counter
+
+def uuid7() -> UUID:
+    timestamp_ms, counter = _next_timestamp_and_counter()
+    random_bits = int.from_bytes(os.urandom(8), "big") & RANDOM_MASK
+    return UUID(int=(timestamp_ms << 80) | VERSION_7 | (counter << 64) | VARIANT_RFC | random_bits)
+
+def uuid7_time(value: UUID) -> datetime:
+    # Naive UTC, like every other timestamp in the domain
+    return datetime.fromtimestamp((value.int >> 80) / 1000, tz=timezone.utc).replace(tzinfo=None)
+
+def uuid7_floor(moment: datetime) -> UUID:
+    # Smallest id that can be issued at or after moment, for use as a range or paging cursor
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    timestamp_ms = (moment - EPOCH) // ONE_MILLISECOND
+    return UUID(int=(timestamp_ms << 80) | VERSION_7 | VARIANT_RFC)
@@ -0,0 +1,50 @@
+from array import array
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Iterable, NewType, Union
+
+# Amounts are held as integer minor units (cents) so domain arithmetic is exact and fits in int64
+Cents = NewType("Cents", int)
+
+CENTS_PER_UNIT = 100
+BASIS_POINTS = 10_000
+INT64_MAX = 2 ** 63 - 1
+
+def to_cents(amount: Union[int, float, str, Decimal]) -> Cents:
+    # Go through str so 0.1 becomes exactly 10 cents rather than the nearest binary float
+    value = Decimal(str(amount)) * CENTS_PER_UNIT
+    # Checked before rounding: quantize cannot represent values beyond the decimal context precision
+    if not value.is_finite() or abs(value) > INT64_MAX:
+        raise ValueError(f"Amount {amount} is out of range")
+    return Cents(int(value.quantize(Decimal(1), rounding=ROUND_HALF_UP)))
+
+def from_cents(cents: int) -> float:
+    return cents / CENTS_PER_UNIT
+
+def format_cents(cents: int) -> str:
+    sign = "-" if cents < 0 else ""
+    units, remainder = divmod(abs(cents), CENTS_PER_UNIT)
+    return f"{sign}{units}.{remainder:02d}"
+
+def format_currency(cents: int) -> str:
+    if cents < 0:
+        return f"-${format_cents(-cents)}"
+    return f"${format_cents(cents)}"
+
+def apply_rate(cents: int, basis_points: int) -> Cents:
+    # Integer rate application, rounding half away from zero
+    product = cents * basis_points
+    half = BASIS_POINTS // 2
+    if product >= 0:
+        return Cents((product + half) // BASIS_POINTS)
+    return Cents(-((-product + half) // BASIS_POINTS))
+
+def apply_compound_rate(cents: int, basis_points: int, periods: int, periods_per_year: int) -> Cents:
+    # Growth of a non-negative amount over periods of an annual rate compounded periods_per_year
+    # times, exact in integers and rounded half up once at the end
+    denominator = BASIS_POINTS * periods_per_year
+    scale = denominator ** periods
+    growth = cents * ((denominator + basis_points) ** periods - scale)
+    return Cents((2 * growth + scale) // (2 * scale))
+
+def cents_array(values: Iterable[int]) -> array:
+    return array("q", values)
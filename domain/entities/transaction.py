@@ -1,9 +1,12 @@
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from uuid import UUID, uuid4
+from uuid import UUID
 from typing import Optional
 
+from domain.entities.identifiers import uuid7
+from domain.entities.money import Cents
+
 class TransactionType(Enum):
     DEPOSIT = "DEPOSIT"
     WITHDRAW = "WITHDRAW"
@@ -14,14 +17,14 @@ class Transaction:
     transaction_id: UUID
     account_id: UUID
     transaction_type: TransactionType
-    amount: float
+    amount: Cents
     timestamp: datetime
     destination_account_id: Optional[UUID] = None
 
     @staticmethod
-    def create_deposit(account_id: UUID, amount: float) -> "Transaction":
+    def create_deposit(account_id: UUID, amount: Cents) -> "Transaction":
         return Transaction(
-            transaction_id=uuid4(),
+            transaction_id=uuid7(),
             account_id=account_id,
             transaction_type=TransactionType.DEPOSIT,
             amount=amount,
@@ -29,9 +32,9 @@ class Transaction:
         )
 
     @staticmethod
-    def create_withdrawal(account_id: UUID, amount: float) -> "Transaction":
+    def create_withdrawal(account_id: UUID, amount: Cents) -> "Transaction":
         return Transaction(
-            transaction_id=uuid4(),
+            transaction_id=uuid7(),
             account_id=account_id,
             transaction_type=TransactionType.WITHDRAW,
             amount=amount,
@@ -42,10 +45,10 @@ class Transaction:
     def create_transfer(
         source_account_id: UUID,
         destination_account_id: UUID,
-        amount: float
+        amount: Cents
     ) -> "Transaction":
         return Transaction(
-            transaction_id=uuid4(),
+            transaction_id=uuid7(),
             account_id=source_account_id,
             transaction_type=TransactionType.TRANSFER,
             amount=amount,
@@ -16,6 +16,24 @@ class AccountNotFoundError(DomainError):
 class TransactionLimitExceededError(DomainError):
     pass
 
+class RiskCheckFailedError(DomainError):
+    pass
+
+class StandingOrderNotFoundError(DomainError):
+    pass
+
+class HoldNotFoundError(DomainError):
+    pass
+
+class HoldNotPendingError(DomainError):
+    pass
+
+class BulkValidationError(DomainError):
+    def __init__(self, errors: dict):
+        # Row index -> reason, so callers can report every bad row at once
+        self.errors = errors
+        super().__init__(f"{len(errors)} row(s) failed validation")
+
 class AccountLockedError(Exception):
     pass
 
@@ -2,44 +2,46 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Dict
 
+from domain.entities.money import Cents, apply_rate
+
 @dataclass
 class InterestConfig:
-    base_rate: float
-    minimum_balance_rate: float
-    minimum_balance_threshold: float
-    maximum_rate: float
+    base_rate_bps: int
+    minimum_balance_rate_bps: int
+    minimum_balance_threshold: Cents
+    maximum_rate_bps: int
 
 class InterestStrategy(ABC):
     @abstractmethod
-    def calculate_interest(self, balance: float) -> float:
+    def rate_bps(self, balance: Cents) -> int:
         pass
 
+    def calculate_interest(self, balance: Cents) -> Cents:
+        if balance <= 0:
+            return 0
+        return apply_rate(balance, self.rate_bps(balance))
+
 class ConfigurableInterestStrategy(InterestStrategy):
     def __init__(self, config: InterestConfig):
         self.config = config
 
-    def calculate_interest(self, balance: float) -> float:
-        if balance <= 0:
-            return 0.0
-            
+    def rate_bps(self, balance: Cents) -> int:
         # Start with base rate
-        rate = self.config.base_rate
+        rate = self.config.base_rate_bps
         
         # Add bonus rate for maintaining minimum balance
         if balance >= self.config.minimum_balance_threshold:
-            rate += self.config.minimum_balance_rate
+            rate += self.config.minimum_balance_rate_bps
             
         # Cap at maximum rate
-        rate = min(rate, self.config.maximum_rate)
-        
-        return balance * rate
+        return min(rate, self.config.maximum_rate_bps)
 
 class ConfigurableCheckingInterestStrategy(ConfigurableInterestStrategy):
     DEFAULT_CONFIG = InterestConfig(
-        base_rate=0.01,  # 1% base
-        minimum_balance_rate=0.005,  # 0.5% bonus
-        minimum_balance_threshold=1000.0,
-        maximum_rate=0.02  # 2% maximum
+        base_rate_bps=100,  # 1% base
+        minimum_balance_rate_bps=50,  # 0.5% bonus
+        minimum_balance_threshold=100000,  # $1,000
+        maximum_rate_bps=200  # 2% maximum
     )
 
     def __init__(self, config: InterestConfig = None):
@@ -47,25 +49,21 @@ class ConfigurableCheckingInterestStrategy(ConfigurableInterestStrategy):
 
 class ConfigurableSavingsInterestStrategy(ConfigurableInterestStrategy):
     DEFAULT_CONFIG = InterestConfig(
-        base_rate=0.02,  # 2% base
-        minimum_balance_rate=0.01,  # 1% bonus
-        minimum_balance_threshold=5000.0,
-        maximum_rate=0.04  # 4% maximum
+        base_rate_bps=200,  # 2% base
+        minimum_balance_rate_bps=100,  # 1% bonus
+        minimum_balance_threshold=500000,  # $5,000
+        maximum_rate_bps=400  # 4% maximum
     )
 
     def __init__(self, config: InterestConfig = None):
         super().__init__(config or self.DEFAULT_CONFIG)
 
 class CheckingInterestStrategy(InterestStrategy):
-    def calculate_interest(self, balance: float) -> float:
-        if balance <= 0:
-            return 0.0
+    def rate_bps(self, balance: Cents) -> int:
         # 1% APR for checking accounts
-        return balance * 0.01
+        return 100
 
 class SavingsInterestStrategy(InterestStrategy):
-    def calculate_interest(self, balance: float) -> float:
-        if balance <= 0:
-            return 0.0
+    def rate_bps(self, balance: Cents) -> int:
         # 3% APR for savings accounts
-        return balance * 0.03
\ No newline at end of file
+        return 300
@@ -0,0 +1,30 @@
+from typing import List, Tuple
+from uuid import UUID
+
+from domain.entities.money import Cents
+from domain.entities.transaction import Transaction, TransactionType
+
+MASK_64 = (1 << 64) - 1
+# Odd 64-bit constant (2^64 / golden ratio) used to spread posting bits across the word
+MULTIPLIER = 0x9E3779B97F4A7C15
+
+def posting_effect(transaction_type: str, amount: Cents, outgoing: bool) -> Cents:
+    # Signed change a transaction makes to one side's balance
+    if transaction_type == TransactionType.DEPOSIT.value:
+        return amount
+    if transaction_type == TransactionType.WITHDRAW.value:
+        return -amount
+    return -amount if outgoing else amount
+
+def postings(transaction: Transaction) -> List[Tuple[UUID, Cents]]:
+    # Every (account, signed effect) pair a transaction posts; a transfer posts to both sides
+    transaction_type = transaction.transaction_type.value
+    result = [(transaction.account_id, posting_effect(transaction_type, transaction.amount, True))]
+    if transaction.destination_account_id is not None:
+        result.append((transaction.destination_account_id, posting_effect(transaction_type, transaction.amount, False)))
+    return result
+
+def posting_checksum(transaction_id: int, effect: Cents) -> int:
+    # Summed mod 2^64 into segment checksums, so a checksum does not depend on summation order
+    # and is stable across processes (unlike hash(), which is salted per interpreter)
+    return (((transaction_id ^ (transaction_id >> 64)) ^ (effect & MASK_64)) * MULTIPLIER) & MASK_64
@@ -1,16 +1,17 @@
 from dataclasses import dataclass
 import domain
+from domain.entities.money import Cents
 from domain.exceptions.domain_exceptions import TransactionLimitExceededError
 
 @dataclass
 class LimitConstraint:
-    daily_limit: float
-    monthly_limit: float
+    daily_limit: Cents
+    monthly_limit: Cents
 
-    def check_deposit(self, account: "domain.entities.account.Account", amount: float) -> None:
+    def check_deposit(self, account: "domain.entities.account.Account", amount: Cents) -> None:
         pass
 
-    def check_withdrawal(self, account: "domain.entities.account.Account", amount: float) -> None:
+    def check_withdrawal(self, account: "domain.entities.account.Account", amount: Cents) -> None:
         new_daily_spent = account.daily_spent + amount
         new_monthly_spent = account.monthly_spent + amount
         if new_daily_spent > self.daily_limit:
@@ -0,0 +1,161 @@
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from enum import Enum
+from time import monotonic
+from typing import Dict, Optional
+from uuid import UUID
+
+from domain.entities.money import Cents
+
+class RiskDecision(Enum):
+    ALLOW = "ALLOW"
+    # Too many debits too quickly: refused, but it says nothing against the account holder
+    THROTTLE = "THROTTLE"
+    BLOCK = "BLOCK"
+    LOCK = "LOCK"
+
+class RiskCheck(ABC):
+    @abstractmethod
+    def assess(self, account_id: UUID, amount: Cents, counterparty_id: Optional[UUID] = None) -> RiskDecision:
+        # Judges a debit without changing any state
+        pass
+
+    def record(self, account_id: UUID, amount: Cents, counterparty_id: Optional[UUID] = None) -> None:
+        # Called once an allowed debit has gone through; only completed debits shape the profile
+        pass
+
+    def scratch(self) -> "RiskCheck":
+        # A copy to judge a batch with before any of it commits: record on the copy counts a
+        # cleared debit against the ones after it without touching this check
+        return self
+
+class NoRiskCheck(RiskCheck):
+    def assess(self, account_id: UUID, amount: Cents, counterparty_id: Optional[UUID] = None) -> RiskDecision:
+        return RiskDecision.ALLOW
+
+@dataclass
+class VelocityConfig:
+    # Weight of the newest amount in the running mean/variance
+    ewma_alpha: float = 0.1
+    # Amounts this many standard deviations above the running mean are outliers
+    outlier_deviations: float = 4.0
+    # Outliers are only judged once an account has this much history
+    warmup_transactions: int = 10
+    # Amounts below this are never treated as outliers
+    outlier_floor: Cents = 10000
+    # Token bucket: sustained debits per second and the burst allowed on top
+    rate_per_second: float = 1.0
+    burst: int = 20
+    counterparty_filter_bits: int = 256
+
+class _VelocityState:
+    # Constant size per account: no history lists, so memory and cost never grow with activity
+    __slots__ = ("count", "mean", "variance", "tokens", "updated_at", "counterparties")
+
+    def __init__(self, burst: int, now: float):
+        self.count = 0
+        self.mean = 0.0
+        self.variance = 0.0
+        self.tokens = float(burst)
+        self.updated_at = now
+        self.counterparties = 0
+
+    def copy(self) -> "_VelocityState":
+        state = _VelocityState.__new__(_VelocityState)
+        for name in self.__slots__:
+            setattr(state, name, getattr(self, name))
+        return state
+
+class VelocityRiskCheck(RiskCheck):
+    # Three signals per debit: a burst (token bucket empty), an outlier amount against the
+    # account's EWMA, and a counterparty not seen before (a fixed-size Bloom filter). A burst
+    # is throttled; an outlier to a new counterparty blocks; a burst of outliers locks the
+    # account. Tokens, EWMA and filter only change in record, after the debit has succeeded.
+
+    def __init__(self, config: Optional[VelocityConfig] = None, clock=monotonic):
+        self.config = config or VelocityConfig()
+        self.clock = clock
+        self._states: Dict[UUID, _VelocityState] = {}
+        # Services on request threads and schedulers share one instance
+        self._lock = threading.Lock()
+
+    def _counterparty_bits(self, counterparty_id: UUID) -> int:
+        # Two probes from the low 62 bits, which are random in both v4 and v7 ids
+        size = self.config.counterparty_filter_bits
+        value = counterparty_id.int
+        return (1 << (value % size)) | (1 << ((value >> 31) % size))
+
+    def _state(self, account_id: UUID) -> Optional[_VelocityState]:
+        return self._states.get(account_id)
+
+    def _tokens(self, state: _VelocityState, now: float) -> float:
+        return min(self.config.burst, state.tokens + (now - state.updated_at) * self.config.rate_per_second)
+
+    def assess(self, account_id: UUID, amount: Cents, counterparty_id: Optional[UUID] = None) -> RiskDecision:
+        config = self.config
+        now = self.clock()
+        with self._lock:
+            state = self._state(account_id)
+            if state is None:
+                return RiskDecision.ALLOW
+            burst = self._tokens(state, now) < 1.0
+            deviation = amount - state.mean
+            outlier = (
+                state.count >= config.warmup_transactions
+                and amount >= config.outlier_floor
+                and deviation * deviation > config.outlier_deviations * config.outlier_deviations * state.variance
+                and deviation > 0
+            )
+            new_counterparty = False
+            if counterparty_id is not None:
+                bits = self._counterparty_bits(counterparty_id)
+                new_counterparty = state.counterparties & bits != bits
+
+        if burst and outlier:
+            return RiskDecision.LOCK
+        if burst:
+            return RiskDecision.THROTTLE
+        if outlier and new_counterparty:
+            return RiskDecision.BLOCK
+        return RiskDecision.ALLOW
+
+    def record(self, account_id: UUID, amount: Cents, counterparty_id: Optional[UUID] = None) -> None:
+        config = self.config
+        now = self.clock()
+        with self._lock:
+            state = self._state(account_id)
+            if state is None:
+                state = self._states[account_id] = _VelocityState(config.burst, now)
+            state.tokens = self._tokens(state, now) - 1.0
+            state.updated_at = now
+            alpha = config.ewma_alpha
+            deviation = amount - state.mean
+            state.mean += alpha * deviation
+            state.variance = (1 - alpha) * (state.variance + alpha * deviation * deviation)
+            state.count += 1
+            if counterparty_id is not None:
+                state.counterparties |= self._counterparty_bits(counterparty_id)
+
+    def forget(self, account_id: UUID) -> None:
+        with self._lock:
+            self._states.pop(account_id, None)
+
+    def scratch(self) -> "VelocityRiskCheck":
+        return _VelocityScratch(self)
+
+class _VelocityScratch(VelocityRiskCheck):
+    # Copies an account's state from the live check on first use; records only touch the copy
+
+    def __init__(self, live: VelocityRiskCheck):
+        super().__init__(live.config, live.clock)
+        self._live = live
+
+    def _state(self, account_id: UUID) -> Optional[_VelocityState]:
+        state = self._states.get(account_id)
+        if state is None:
+            with self._live._lock:
+                live_state = self._live._state(account_id)
+                if live_state is not None:
+                    state = self._states[account_id] = live_state.copy()
+        return state
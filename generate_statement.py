@@ -12,7 +12,7 @@ def generate_sample_statement():
     transaction_repo = InMemoryTransactionRepository()
 
     # Create an account
-    account = Account.create(AccountType.CHECKING, initial_deposit=1000.0)
+    account = Account.create(AccountType.CHECKING, initial_deposit=100000)
     account_repo.create_account(account)
 
     # Create some sample transactions
@@ -21,14 +21,14 @@ def generate_sample_statement():
             transaction_id=uuid4(),
             account_id=account.account_id,
             transaction_type=TransactionType.DEPOSIT,
-            amount=500.0,
+            amount=50000,
             timestamp=datetime.utcnow() - timedelta(days=5)
         ),
         Transaction(
             transaction_id=uuid4(),
             account_id=account.account_id,
             transaction_type=TransactionType.WITHDRAW,
-            amount=200.0,
+            amount=20000,
             timestamp=datetime.utcnow() - timedelta(days=2)
         )
     ]
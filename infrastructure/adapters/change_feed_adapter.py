@@ -0,0 +1,186 @@
+import asyncio
+import threading
+from collections import deque
+from copy import copy
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional, Sequence, Set, Tuple, Union
+from uuid import UUID
+
+from domain.entities.account import Account
+from domain.entities.transaction import Transaction
+from infrastructure.adapters.metrics_adapter import banking_metrics
+
+TRANSACTION = "transaction"
+ACCOUNT = "account"
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    sequence: int
+    kind: str
+    # Accounts the change touches; a subscriber filtered to any of them receives it
+    account_ids: Tuple[UUID, ...]
+    # The saved transaction, or a snapshot of the account as it was written
+    data: Union[Transaction, Account]
+
+class CursorExpiredError(Exception):
+    pass
+
+class Subscription:
+    # Written by publishers on any thread, read by one coroutine. The buffer is bounded: a
+    # consumer that falls buffer_size events behind is dropped rather than slowing writers,
+    # and can reconnect from its last cursor while the history still covers it.
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, account_id: Optional[UUID], buffer_size: int):
+        self.account_id = account_id
+        self.buffer_size = buffer_size
+        self.dropped = False
+        self._events: Deque[ChangeEvent] = deque()
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+
+    def _offer(self, event: ChangeEvent) -> bool:
+        if len(self._events) >= self.buffer_size:
+            self.dropped = True
+        else:
+            self._events.append(event)
+        try:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+        except RuntimeError:
+            # The consumer's loop is gone
+            self.dropped = True
+        return not self.dropped
+
+    async def next_events(self, timeout: Optional[float] = None) -> List[ChangeEvent]:
+        # Everything buffered, waiting up to timeout for at least one event; empty on timeout
+        if not self._events and not self.dropped:
+            self._wakeup.clear()
+            if not self._events and not self.dropped:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    return []
+        events = []
+        while self._events:
+            events.append(self._events.popleft())
+        return events
+
+class ChangeBroadcaster:
+    # In-process fan-out of committed changes. Every change gets the next sequence number and
+    # stays in a bounded history, so a subscriber can resume from the last sequence it saw.
+    # Subscribers are indexed by the account they follow, so a write only visits the
+    # subscribers that want it. While nobody is subscribed, changes are neither numbered nor
+    # kept, and no cursor from before them can resume.
+
+    def __init__(self, history_size: int = 10_000, buffer_size: int = 1000):
+        self.history_size = history_size
+        self.buffer_size = buffer_size
+        self._sequence = 0
+        self._history: Deque[ChangeEvent] = deque(maxlen=history_size)
+        self._by_account: Dict[UUID, Set[Subscription]] = {}
+        self._all: Set[Subscription] = set()
+        # Set, without the lock, when a change went by unrecorded
+        self._gap = False
+        self._lock = threading.Lock()
+
+    @property
+    def sequence(self) -> int:
+        return self._sequence
+
+    def publish(self, kind: str, account_ids: Tuple[UUID, ...], data: Union[Transaction, Account]) -> ChangeEvent:
+        with self._lock:
+            self._close_gap()
+            self._sequence += 1
+            event = ChangeEvent(self._sequence, kind, account_ids, data)
+            self._history.append(event)
+            targets = set(self._all)
+            for account_id in account_ids:
+                targets.update(self._by_account.get(account_id, ()))
+            for subscription in targets:
+                if not subscription._offer(event):
+                    self._remove(subscription)
+                    banking_metrics.change_feed_drops.inc()
+        return event
+
+    def _unobserved(self) -> bool:
+        # Lock-free, so writers pay nothing while nobody listens. Checked again after marking
+        # the gap: a subscriber registered by then either sees the gap or gets the change.
+        if self._all or self._by_account:
+            return False
+        self._gap = True
+        return not (self._all or self._by_account)
+
+    def _close_gap(self) -> None:
+        # Caller holds the lock. The gap takes a sequence number of its own, so no cursor from
+        # before it can resume
+        if self._gap:
+            self._gap = False
+            self._history.clear()
+            self._sequence += 1
+
+    def publish_transaction(self, transaction: Transaction) -> None:
+        if self._unobserved():
+            return
+        account_ids = (transaction.account_id,)
+        if transaction.destination_account_id is not None and transaction.destination_account_id != transaction.account_id:
+            account_ids += (transaction.destination_account_id,)
+        self.publish(TRANSACTION, account_ids, transaction)
+
+    def publish_transactions(self, transactions: Sequence[Transaction]) -> None:
+        for transaction in transactions:
+            self.publish_transaction(transaction)
+
+    def publish_account(self, account: Account) -> None:
+        if self._unobserved():
+            return
+        # A copy, since the caller keeps mutating the live object after it is written
+        self.publish(ACCOUNT, (account.account_id,), copy(account))
+
+    def subscribe(self, account_id: Optional[UUID] = None, after: Optional[int] = None) -> Subscription:
+        subscription = Subscription(asyncio.get_running_loop(), account_id, self.buffer_size)
+        with self._lock:
+            # Registered before the gap is checked, so a writer that marks one later sees us
+            if account_id is None:
+                self._all.add(subscription)
+            else:
+                self._by_account.setdefault(account_id, set()).add(subscription)
+            self._close_gap()
+            if after is not None:
+                oldest = self._history[0].sequence if self._history else self._sequence + 1
+                # A cursor from before the retained history, or from a previous process, cannot
+                # be resumed without a gap; the caller has to resync instead
+                if after > self._sequence or after < oldest - 1:
+                    self._remove(subscription)
+                    raise CursorExpiredError(f"Cursor {after} is outside the retained history ({oldest - 1}..{self._sequence})")
+                backlog = [
+                    event for event in self._history
+                    if event.sequence > after and (account_id is None or account_id in event.account_ids)
+                ]
+                # Replay may exceed the live buffer bound; it is already in memory either way
+                subscription._events.extend(backlog)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._remove(subscription)
+
+    def _remove(self, subscription: Subscription) -> None:
+        if subscription.account_id is None:
+            self._all.discard(subscription)
+            return
+        subscribers = self._by_account.get(subscription.account_id)
+        if subscribers is not None:
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._by_account[subscription.account_id]
+
+    def subscriber_count(self) -> int:
+        return len(self._all) + sum(len(subscribers) for subscribers in self._by_account.values())
+
+    def attach(self, account_repository, transaction_repository) -> None:
+        # Publishes whatever the repositories commit, whichever service or endpoint wrote it.
+        # The repositories call back while still holding their write lock, so the feed
+        # follows commit order.
+        transaction_repository.add_save_listener(self.publish_transactions)
+        account_repository.add_update_listener(self.publish_account)
+
+change_broadcaster = ChangeBroadcaster()
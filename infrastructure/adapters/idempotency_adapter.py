@@ -0,0 +1,68 @@
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import List, Optional, Tuple
+
+@dataclass
+class StoredResponse:
+    status: int
+    headers: List[Tuple[bytes, bytes]]
+    body: bytes
+
+@dataclass
+class IdempotencyEntry:
+    fingerprint: str
+    created_at: float
+    done: asyncio.Event = field(default_factory=asyncio.Event)
+    response: Optional[StoredResponse] = None
+
+class IdempotencyKeyReusedError(Exception):
+    pass
+
+class IdempotencyCache:
+    def __init__(self, max_entries: int = 100_000, ttl_seconds: float = 24 * 3600, clock=monotonic):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        # Insertion order equals creation order, so the oldest entries are always at the front
+        self._entries: "OrderedDict[str, IdempotencyEntry]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict(self, now: float) -> None:
+        while self._entries:
+            _, oldest = next(iter(self._entries.items()))
+            if now - oldest.created_at < self.ttl_seconds and len(self._entries) < self.max_entries:
+                break
+            self._entries.popitem(last=False)
+
+    def begin(self, key: str, fingerprint: str) -> Tuple[IdempotencyEntry, bool]:
+        now = self.clock()
+        entry = self._entries.get(key)
+        if entry is not None and now - entry.created_at >= self.ttl_seconds:
+            del self._entries[key]
+            entry = None
+        if entry is not None:
+            if entry.fingerprint != fingerprint:
+                raise IdempotencyKeyReusedError(f"Idempotency key {key} was used with a different request")
+            return entry, False
+
+        self._evict(now)
+        entry = IdempotencyEntry(fingerprint=fingerprint, created_at=now)
+        self._entries[key] = entry
+        return entry, True
+
+    def complete(self, key: str, entry: IdempotencyEntry, response: StoredResponse) -> None:
+        entry.response = response
+        entry.done.set()
+
+    def abandon(self, key: str, entry: IdempotencyEntry) -> None:
+        # Failed attempts are forgotten so the client's retry (or a waiting duplicate) can run again
+        if self._entries.get(key) is entry:
+            del self._entries[key]
+        entry.done.set()
+
+# Shared across the application, like the in-memory repositories
+idempotency_cache = IdempotencyCache()
@@ -0,0 +1,214 @@
+import threading
+from bisect import bisect_left
+from typing import Dict, List, Sequence, Tuple
+
+from domain.exceptions.domain_exceptions import InsufficientFundsError, TransactionLimitExceededError
+
+# Latency buckets in seconds, tuned for in-process request handling
+DEFAULT_LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+LabelValues = Tuple[str, ...]
+
+def _format_labels(label_names: Sequence[str], label_values: LabelValues, extra: str = "") -> str:
+    pairs = [f'{name}="{value}"' for name, value in zip(label_names, label_values)]
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(pairs) + "}"
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+class Counter:
+    def __init__(self):
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+class Gauge:
+    def __init__(self):
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value -= amount
+
+    def set(self, value: float) -> None:
+        self._value = value
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+class Histogram:
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets))
+        # One slot per bucket plus the +Inf overflow slot, allocated up front
+        self._counts: List[int] = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+            self._count += 1
+
+    def snapshot(self) -> Tuple[List[int], float, int]:
+        with self._lock:
+            return list(self._counts), self._sum, self._count
+
+class MetricFamily:
+    def __init__(self, name: str, help_text: str, metric_type: str, label_names: Sequence[str] = (), factory=None):
+        self.name = name
+        self.help_text = help_text
+        self.metric_type = metric_type
+        self.label_names = tuple(label_names)
+        self._factory = factory
+        self._children: Dict[LabelValues, object] = {}
+        self._lock = threading.Lock()
+        if not self.label_names:
+            self._children[()] = factory()
+
+    def labels(self, *label_values: str):
+        child = self._children.get(label_values)
+        if child is None:
+            with self._lock:
+                child = self._children.get(label_values)
+                if child is None:
+                    child = self._factory()
+                    self._children[label_values] = child
+        return child
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._children[()].inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._children[()].dec(amount)
+
+    def observe(self, value: float) -> None:
+        self._children[()].observe(value)
+
+    @property
+    def value(self) -> float:
+        return self._children[()].value
+
+    def expose(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.metric_type}"]
+        for label_values, child in sorted(self._children.items()):
+            if isinstance(child, Histogram):
+                counts, total, count = child.snapshot()
+                cumulative = 0
+                for bound, bucket_count in zip(child.buckets + (float("inf"),), counts):
+                    cumulative += bucket_count
+                    le = f'le="{_format_value(bound)}"'
+                    lines.append(
+                        f"{self.name}_bucket{_format_labels(self.label_names, label_values, le)} {cumulative}"
+                    )
+                labels = _format_labels(self.label_names, label_values)
+                lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+                lines.append(f"{self.name}_count{labels} {count}")
+            else:
+                labels = _format_labels(self.label_names, label_values)
+                lines.append(f"{self.name}{labels} {_format_value(child.value)}")
+        return lines
+
+class MetricsRegistry:
+    def __init__(self):
+        self._families: Dict[str, MetricFamily] = {}
+
+    def _register(self, family: MetricFamily) -> MetricFamily:
+        if family.name in self._families:
+            raise ValueError(f"Metric {family.name} already registered")
+        self._families[family.name] = family
+        return family
+
+    def counter(self, name: str, help_text: str, label_names: Sequence[str] = ()) -> MetricFamily:
+        return self._register(MetricFamily(name, help_text, "counter", label_names, Counter))
+
+    def gauge(self, name: str, help_text: str, label_names: Sequence[str] = ()) -> MetricFamily:
+        return self._register(MetricFamily(name, help_text, "gauge", label_names, Gauge))
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS
+    ) -> MetricFamily:
+        return self._register(
+            MetricFamily(name, help_text, "histogram", label_names, lambda: Histogram(buckets))
+        )
+
+    def expose(self) -> str:
+        lines: List[str] = []
+        for family in self._families.values():
+            lines.extend(family.expose())
+        return "\n".join(lines) + "\n"
+
+class BankingMetrics:
+    def __init__(self, registry: MetricsRegistry):
+        self.registry = registry
+        self.request_latency = registry.histogram(
+            "http_request_duration_seconds",
+            "HTTP request latency by route and status",
+            ("method", "route", "status"),
+        )
+        self.requests_in_flight = registry.gauge(
+            "http_requests_in_flight",
+            "HTTP requests currently being served",
+            ("method",),
+        )
+        self.deposits = registry.counter("bank_deposits_total", "Successful deposits")
+        self.withdrawals = registry.counter("bank_withdrawals_total", "Successful withdrawals")
+        self.transfers = registry.counter("bank_transfers_total", "Successful transfers")
+        self.limit_rejections = registry.counter(
+            "bank_limit_rejections_total", "Operations rejected by a limit constraint"
+        )
+        self.insufficient_funds = registry.counter(
+            "bank_insufficient_funds_total", "Withdrawals rejected for insufficient funds"
+        )
+        self.risk_rejections = registry.counter(
+            "bank_risk_rejections_total", "Debits stopped by the risk check", ("decision",)
+        )
+        self.standing_order_runs = registry.counter(
+            "bank_standing_order_runs_total", "Standing order executions by outcome", ("outcome",)
+        )
+        self.expired_holds = registry.counter("bank_expired_holds_total", "Authorization holds released on expiry")
+        self.archived_transactions = registry.counter(
+            "bank_archived_transactions_total", "Transactions moved from memory to cold storage"
+        )
+        self.change_feed_drops = registry.counter(
+            "bank_change_feed_drops_total", "Change stream subscribers dropped for falling behind"
+        )
+
+    def record_withdrawal_rejection(self, error: Exception) -> None:
+        if isinstance(error, InsufficientFundsError):
+            self.insufficient_funds.inc()
+        elif isinstance(error, TransactionLimitExceededError):
+            self.limit_rejections.inc()
+
+# Single registry shared across the application
+metrics_registry = MetricsRegistry()
+banking_metrics = BankingMetrics(metrics_registry)
@@ -0,0 +1,136 @@
+import cProfile
+import hmac
+import os
+import pstats
+import random
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Deque, List, Optional
+from uuid import UUID, uuid4
+
+@dataclass
+class ProfileRecord:
+    profile_id: UUID
+    route: str
+    method: str
+    duration: float
+    captured_at: datetime
+    file_path: Optional[str]
+    hot_spots: List[dict] = field(default_factory=list)
+
+class ProfilingAdapter:
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        output_dir: Optional[str] = None,
+        max_profiles: int = 50,
+        top_n: int = 25
+    ):
+        self.token = token
+        self.output_dir = output_dir
+        self.top_n = top_n
+        self.enabled = False
+        self.sample_rate = 0.0
+        self.max_profiles = max_profiles
+        self._profiles: Deque[ProfileRecord] = deque()
+        self._lock = threading.Lock()
+        # cProfile hooks the whole interpreter, so only one request is profiled at a time
+        self._active = False
+        self._refresh_armed()
+
+    def _refresh_armed(self) -> None:
+        # Single flag checked per request so the disabled path costs one attribute read
+        self.armed = bool(self.token) or (self.enabled and self.sample_rate > 0)
+
+    def configure(self, enabled: bool, sample_rate: float) -> None:
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be between 0 and 1")
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+        self._refresh_armed()
+
+    def is_authorized(self, token: Optional[str]) -> bool:
+        return bool(self.token) and token is not None and hmac.compare_digest(token.encode(), self.token.encode())
+
+    def should_profile(self, token: Optional[str]) -> bool:
+        if token is not None and self.is_authorized(token):
+            return True
+        return self.enabled and random.random() < self.sample_rate
+
+    def start(self) -> Optional[cProfile.Profile]:
+        # None while another profile is running: a second one would take over its hook, and
+        # either would record every request in flight alongside its own
+        with self._lock:
+            if self._active:
+                return None
+            self._active = True
+        profiler = cProfile.Profile()
+        profiler.enable()
+        return profiler
+
+    def finish(self, profiler: cProfile.Profile, method: str, route: str, duration: float) -> ProfileRecord:
+        profiler.disable()
+        with self._lock:
+            self._active = False
+        profile_id = uuid4()
+        file_path = None
+        if self.output_dir:
+            os.makedirs(self.output_dir, exist_ok=True)
+            file_path = os.path.join(self.output_dir, f"{profile_id}.prof")
+            profiler.dump_stats(file_path)
+
+        record = ProfileRecord(
+            profile_id=profile_id,
+            route=route,
+            method=method,
+            duration=duration,
+            captured_at=datetime.utcnow(),
+            file_path=file_path,
+            hot_spots=self._hot_spots(profiler)
+        )
+        with self._lock:
+            self._profiles.append(record)
+            evicted = [self._profiles.popleft() for _ in range(len(self._profiles) - self.max_profiles)]
+        # Profile files go with their records, so disk use stays bounded by max_profiles
+        for old in evicted:
+            if old.file_path is not None:
+                try:
+                    os.unlink(old.file_path)
+                except FileNotFoundError:
+                    pass
+        return record
+
+    def _hot_spots(self, profiler: cProfile.Profile) -> List[dict]:
+        stats = pstats.Stats(profiler)
+        entries = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)
+        hot_spots = []
+        for (filename, line, function), (_, calls, total_time, cumulative_time, callers) in entries[:self.top_n]:
+            # Slowest caller first, so each entry reads as the dominant stack into this function
+            ordered_callers = sorted(callers.items(), key=lambda item: item[1][3], reverse=True)
+            hot_spots.append({
+                "function": f"{filename}:{line}({function})",
+                "calls": calls,
+                "total_time": total_time,
+                "cumulative_time": cumulative_time,
+                "callers": [f"{c_file}:{c_line}({c_function})" for (c_file, c_line, c_function), _ in ordered_callers[:3]]
+            })
+        return hot_spots
+
+    def list_profiles(self) -> List[ProfileRecord]:
+        with self._lock:
+            return sorted(self._profiles, key=lambda record: record.duration, reverse=True)
+
+    def get_profile(self, profile_id: UUID) -> Optional[ProfileRecord]:
+        with self._lock:
+            for record in self._profiles:
+                if record.profile_id == profile_id:
+                    return record
+        return None
+
+# Profiling is opt-in: a token enables per-request profiling via header, sampling is toggled at runtime
+profiling_adapter = ProfilingAdapter(
+    token=os.environ.get("PROFILING_TOKEN"),
+    output_dir=os.environ.get("PROFILING_OUTPUT_DIR", "profiles")
+)
@@ -1,11 +1,11 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional
+from typing import Iterator, List, Optional
 import csv
 from io import StringIO
-from fpdf import FPDF
 from domain.entities.account import Account
+from domain.entities.money import format_cents, format_currency
 from domain.entities.transaction import Transaction, TransactionType 
 
 @dataclass
@@ -29,7 +29,19 @@ class StatementAdapter(ABC):
     ) -> Statement:
         pass
 
+    def stream_csv(
+        self,
+        account: Account,
+        transactions: List[Transaction],
+        start_date: datetime,
+        end_date: datetime
+    ) -> Iterator[str]:
+        csv_content = self.generate(account, transactions, start_date, end_date).csv_content
+        if csv_content:
+            yield csv_content
+
     def _calculate_summary(self, transactions: List[Transaction]) -> dict:
+        # Integer cents, so totals are exact
         total_deposits = sum(t.amount for t in transactions if t.transaction_type == TransactionType.DEPOSIT)
         total_withdrawals = sum(t.amount for t in transactions if t.transaction_type == TransactionType.WITHDRAW)
         
@@ -56,6 +68,9 @@ class MockStatementAdapter(StatementAdapter):
         )
 
 class CSVStatementAdapter(StatementAdapter):
+    def __init__(self, chunk_rows: int = 1000):
+        self.chunk_rows = chunk_rows
+
     def generate(
         self,
         account: Account,
@@ -70,7 +85,18 @@ class CSVStatementAdapter(StatementAdapter):
             start_date=start_date,
             end_date=end_date
         )
-        # Generate CSV content as a string
+        # Store CSV content in the statement (for API to return)
+        statement.csv_content = "".join(self.stream_csv(account, transactions, start_date, end_date))
+        return statement
+
+    def stream_csv(
+        self,
+        account: Account,
+        transactions: List[Transaction],
+        start_date: datetime,
+        end_date: datetime
+    ) -> Iterator[str]:
+        # Yields the CSV chunk_rows rows at a time, so a download starts before the last row is written
         output = StringIO()
         writer = csv.writer(output)
         # Write header
@@ -84,22 +110,27 @@ class CSVStatementAdapter(StatementAdapter):
             "Timestamp",
             "Destination Account"
         ])
+        account_id = str(account.account_id)
+        account_type = account.account_type.value
+        balance = format_cents(account.balance)
         # Write transaction rows
-        for transaction in statement.transactions:
+        for row, transaction in enumerate(transactions, start=1):
             writer.writerow([
-                str(statement.account.account_id),
-                statement.account.account_type.value,
-                statement.account.balance,
+                account_id,
+                account_type,
+                balance,
                 str(transaction.transaction_id),
                 transaction.transaction_type.value,
-                transaction.amount,
+                format_cents(transaction.amount),
                 transaction.timestamp.isoformat(),
                 str(transaction.destination_account_id) if transaction.destination_account_id else ""
             ])
-        # Store CSV content in the statement (for API to return)
-        statement.csv_content = output.getvalue()
+            if row % self.chunk_rows == 0:
+                yield output.getvalue()
+                output.seek(0)
+                output.truncate()
+        yield output.getvalue()
         output.close()
-        return statement
 
 class EnhancedCSVStatementAdapter(StatementAdapter):
     def generate(
@@ -116,7 +147,7 @@ class EnhancedCSVStatementAdapter(StatementAdapter):
         writer.writerow(["Account Summary"])
         writer.writerow(["Account ID", str(account.account_id)])
         writer.writerow(["Account Type", account.account_type.value])
-        writer.writerow(["Current Balance", f"${account.balance:.2f}"])
+        writer.writerow(["Current Balance", format_currency(account.balance)])
         writer.writerow(["Statement Period", f"{start_date.date()} to {end_date.date()}"])
         writer.writerow([])
 
@@ -141,8 +172,8 @@ class EnhancedCSVStatementAdapter(StatementAdapter):
                 transaction.timestamp.strftime("%Y-%m-%d %H:%M"),
                 str(transaction.transaction_id),
                 transaction.transaction_type.value,
-                f"${transaction.amount:.2f}",
-                f"${running_balance:.2f}",
+                format_currency(transaction.amount),
+                format_currency(running_balance),
                 self._get_transaction_description(transaction)
             ])
 
@@ -151,9 +182,9 @@ class EnhancedCSVStatementAdapter(StatementAdapter):
         writer.writerow([])
         writer.writerow(["Transaction Summary"])
         writer.writerow(["Total Transactions", summary["total_transactions"]])
-        writer.writerow(["Total Deposits", f"${summary['total_deposits']:.2f}"])
-        writer.writerow(["Total Withdrawals", f"${summary['total_withdrawals']:.2f}"])
-        writer.writerow(["Net Change", f"${summary['net_change']:.2f}"])
+        writer.writerow(["Total Deposits", format_currency(summary["total_deposits"])])
+        writer.writerow(["Total Withdrawals", format_currency(summary["total_withdrawals"])])
+        writer.writerow(["Net Change", format_currency(summary["net_change"])])
 
         return Statement(
             account=account,
@@ -177,6 +208,8 @@ class PDFStatementAdapter(StatementAdapter):
         start_date: datetime,
         end_date: datetime
     ) -> Statement:
+        # fpdf is only needed for PDF output, so keep it off the import path of everything else
+        from fpdf import FPDF
         pdf = FPDF()
         pdf.add_page()
         
@@ -189,7 +222,7 @@ class PDFStatementAdapter(StatementAdapter):
         pdf.cell(0, 10, f'Account: {account.account_id}', 0, 1)
         pdf.cell(0, 10, f'Type: {account.account_type.value}', 0, 1)
         pdf.cell(0, 10, f'Period: {start_date.date()} to {end_date.date()}', 0, 1)
-        pdf.cell(0, 10, f'Current Balance: ${account.balance:.2f}', 0, 1)
+        pdf.cell(0, 10, f'Current Balance: {format_currency(account.balance)}', 0, 1)
         
         # Transactions Table
         pdf.set_font('Arial', 'B', 10)
@@ -210,8 +243,8 @@ class PDFStatementAdapter(StatementAdapter):
                 
             pdf.cell(30, 10, transaction.timestamp.strftime("%Y-%m-%d"), 1)
             pdf.cell(30, 10, transaction.transaction_type.value, 1)
-            pdf.cell(30, 10, f"${transaction.amount:.2f}", 1)
-            pdf.cell(40, 10, f"${running_balance:.2f}", 1)
+            pdf.cell(30, 10, format_currency(transaction.amount), 1)
+            pdf.cell(40, 10, format_currency(running_balance), 1)
             pdf.cell(0, 10, self._get_transaction_description(transaction), 1, 1)
 
         # Summary
@@ -220,9 +253,9 @@ class PDFStatementAdapter(StatementAdapter):
         pdf.cell(0, 10, 'Transaction Summary', 0, 1, 'L')
         pdf.set_font('Arial', '', 10)
         pdf.cell(0, 10, f"Total Transactions: {summary['total_transactions']}", 0, 1)
-        pdf.cell(0, 10, f"Total Deposits: ${summary['total_deposits']:.2f}", 0, 1)
-        pdf.cell(0, 10, f"Total Withdrawals: ${summary['total_withdrawals']:.2f}", 0, 1)
-        pdf.cell(0, 10, f"Net Change: ${summary['net_change']:.2f}", 0, 1)
+        pdf.cell(0, 10, f"Total Deposits: {format_currency(summary['total_deposits'])}", 0, 1)
+        pdf.cell(0, 10, f"Total Withdrawals: {format_currency(summary['total_withdrawals'])}", 0, 1)
+        pdf.cell(0, 10, f"Net Change: {format_currency(summary['net_change'])}", 0, 1)
 
         return Statement(
             account=account,
@@ -1,10 +1,60 @@
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Optional
+from collections import OrderedDict
+from contextlib import ExitStack, nullcontext
+from dataclasses import dataclass
+from heapq import merge
+from itertools import islice, product
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 from uuid import UUID
 
-from domain.entities.account import Account
+from domain.entities.account import Account, AccountType, AccountStatus
+from domain.entities.money import Cents
+from infrastructure.repositories.sorted_index import SortedIndex
+
+MAX_ID = (1 << 128) - 1
+
+@dataclass
+class AccountFilter:
+    account_type: Optional[AccountType] = None
+    status: Optional[AccountStatus] = None
+    is_locked: Optional[bool] = None
+    min_balance: Optional[Cents] = None
+    max_balance: Optional[Cents] = None
+    below_minimum_balance: bool = False
+
+    @property
+    def by_balance(self) -> bool:
+        # Balance ranges are answered from the balance index, so results come in balance order;
+        # below_minimum_balance is a range too, as the minimum is fixed per account type
+        return self.min_balance is not None or self.max_balance is not None or self.below_minimum_balance
+
+    def sort_key(self, account: Account) -> tuple:
+        if self.by_balance:
+            return (account.balance, account.account_id)
+        return (account.account_id,)
+
+    def matches(self, account: Account) -> bool:
+        return (
+            (self.account_type is None or account.account_type == self.account_type)
+            and (self.status is None or account.status == self.status)
+            and (self.is_locked is None or account.is_locked == self.is_locked)
+            and (self.min_balance is None or account.balance >= self.min_balance)
+            and (self.max_balance is None or account.balance <= self.max_balance)
+            and (not self.below_minimum_balance or account.balance < account.minimum_balance)
+        )
 
 class AccountRepository(ABC):
+    # Versions restart with the store; the epoch tells one lifetime of the counters from another
+    epoch: int = 0
+    # Called with every updated account while the update still holds the store's write lock,
+    # so listeners see one account's updates in the order they were stored
+    update_listeners: Tuple[Callable[[Account], None], ...] = ()
+
+    def add_update_listener(self, listener: Callable[[Account], None]) -> None:
+        self.update_listeners += (listener,)
+
     @abstractmethod
     def get_account_by_id(self, account_id: UUID) -> Optional[Account]:
         pass
@@ -17,16 +67,242 @@ class AccountRepository(ABC):
     def create_account(self, account: Account) -> None:
         pass
 
+    def create_accounts(self, accounts: Sequence[Account]) -> None:
+        for account in accounts:
+            self.create_account(account)
+
+    @abstractmethod
+    def get_account_version(self, account_id: UUID) -> Optional[int]:
+        pass
+
+    def get_account_with_version(self, account_id: UUID) -> Optional[Tuple[Account, int]]:
+        # The account together with the version it was read at, for callers that tag what they return
+        account = self.get_account_by_id(account_id)
+        version = self.get_account_version(account_id)
+        if account is None or version is None:
+            return None
+        return account, version
+
+    @abstractmethod
+    def list_accounts(self) -> List[Account]:
+        pass
+
+    def get_accounts_changed_since(self, position: int) -> Tuple[int, List[Account]]:
+        # Accounts created or written after position, and the position to pass next time;
+        # stores without a change log return every account
+        return 0, self.list_accounts()
+
+    def find_accounts(self, account_filter: AccountFilter, after: Optional[tuple] = None, limit: int = 100) -> List[Account]:
+        # Full scan; stores with secondary indexes override this
+        matching = sorted(
+            (account for account in self.list_accounts() if account_filter.matches(account)),
+            key=account_filter.sort_key
+        )
+        if after is not None:
+            matching = [account for account in matching if account_filter.sort_key(account) > after]
+        return matching[:limit]
+
+    def top_accounts_by_balance(self, limit: int) -> List[Account]:
+        # Full sort; stores with a balance index override this
+        return sorted(self.list_accounts(), key=lambda account: (account.balance, account.account_id), reverse=True)[:limit]
+
+    def lock_accounts(self, *account_ids: UUID):
+        # Held around read-modify-write of the given accounts; stores without concurrent writers
+        # need no lock
+        return nullcontext()
+
+IndexKey = Tuple[AccountType, AccountStatus, bool]
+
+class _Partition:
+    # Ids are indexed as plain ints so every comparison stays in C; UUID.__lt__ is Python code
+    __slots__ = ("ids", "balances", "minimum_balance")
+
+    def __init__(self, ids: SortedIndex, balances: SortedIndex, minimum_balance: Cents = 0):
+        self.ids = ids
+        self.balances = balances
+        # The highest minimum balance of any account indexed here, which bounds the balance
+        # range a below-minimum query reads
+        self.minimum_balance = minimum_balance
+
 class InMemoryAccountRepository(AccountRepository):
     def __init__(self):
         self.accounts: dict[UUID, Account] = {}
+        # Bumped on every write so readers can detect change without comparing state
+        self.versions: dict[UUID, int] = {}
+        self.epoch = time.time_ns()
+        # Secondary indexes, partitioned by (account_type, status, is_locked): each partition keeps
+        # its ids and its (balance, id) pairs sorted, so any filter on those fields is a lazy merge
+        # of at most eight ordered runs and costs time proportional to the page it returns
+        self._partitions: Dict[IndexKey, _Partition] = {}
+        # Where each account was last indexed; the stored Account may since have been mutated
+        self._indexed: Dict[UUID, Tuple[IndexKey, _Partition, Cents]] = {}
+        # Change log: each account once, at the position of its latest write, in write order
+        self._change_position = 0
+        self._changed_at: "OrderedDict[UUID, int]" = OrderedDict()
+        self._change_lock = threading.Lock()
+        # Schedulers write from their own threads: striped locks serialise read-modify-write of an
+        # account, and the write lock keeps the indexes consistent while they are read or updated.
+        # Both are reentrant, as services nest lock_accounts and batch creates fall back to single ones.
+        self._account_locks = [threading.RLock() for _ in range(64)]
+        self._write_lock = threading.RLock()
+
+    def lock_accounts(self, *account_ids: UUID):
+        # Stripes are always taken in stripe order, so two callers cannot deadlock
+        stack = ExitStack()
+        for stripe in sorted({hash(account_id.int) % len(self._account_locks) for account_id in account_ids}):
+            stack.enter_context(self._account_locks[stripe])
+        return stack
+
+    def _record_changes(self, account_ids, updated: Optional[Account] = None) -> None:
+        with self._change_lock:
+            for account_id in account_ids:
+                self._change_position += 1
+                self._changed_at[account_id] = self._change_position
+                self._changed_at.move_to_end(account_id)
+            if updated is not None:
+                for listener in self.update_listeners:
+                    listener(updated)
+
+    def _index(self, account: Account) -> None:
+        account_id = account.account_id
+        id_int = account_id.int
+        balance = account.balance
+        key = (account.account_type, account.status, account.is_locked)
+        previous = self._indexed.get(account_id)
+        if previous is not None:
+            previous_key, partition, previous_balance = previous
+            if previous_key == key:
+                # The common case: only the balance moved
+                partition.minimum_balance = max(partition.minimum_balance, account.minimum_balance)
+                if previous_balance != balance:
+                    partition.balances.remove((previous_balance, id_int))
+                    partition.balances.add((balance, id_int))
+                    self._indexed[account_id] = (key, partition, balance)
+                return
+            partition.ids.remove(id_int)
+            partition.balances.remove((previous_balance, id_int))
+        partition = self._partitions.get(key)
+        if partition is None:
+            partition = self._partitions[key] = _Partition(SortedIndex(), SortedIndex())
+        partition.ids.add(id_int)
+        partition.balances.add((balance, id_int))
+        partition.minimum_balance = max(partition.minimum_balance, account.minimum_balance)
+        self._indexed[account_id] = (key, partition, balance)
 
     def get_account_by_id(self, account_id: UUID) -> Optional[Account]:
         return self.accounts.get(account_id)
 
     def update_account(self, account: Account) -> None:
-        if account.account_id in self.accounts:
-            self.accounts[account.account_id] = account
+        with self._write_lock:
+            if account.account_id in self.accounts:
+                self.accounts[account.account_id] = account
+                self.versions[account.account_id] += 1
+                self._index(account)
+                self._record_changes((account.account_id,), account)
 
     def create_account(self, account: Account) -> None:
-        self.accounts[account.account_id] = account
\ No newline at end of file
+        with self._write_lock:
+            self.accounts[account.account_id] = account
+            self.versions[account.account_id] = self.versions.get(account.account_id, 0) + 1
+            self._index(account)
+            self._record_changes((account.account_id,))
+
+    def create_accounts(self, accounts: Sequence[Account]) -> None:
+        with self._write_lock:
+            self._create_accounts(accounts)
+
+    def _create_accounts(self, accounts: Sequence[Account]) -> None:
+        # New ids only, so the version of every account in the batch starts at 1
+        new_accounts = {account.account_id: account for account in accounts}
+        if len(new_accounts) != len(accounts) or not self.accounts.keys().isdisjoint(new_accounts):
+            super().create_accounts(accounts)
+            return
+        self.accounts.update(new_accounts)
+        self.versions.update(dict.fromkeys(new_accounts, 1))
+        self._record_changes(new_accounts)
+        members_by_key: Dict[IndexKey, List[Account]] = {}
+        for account in accounts:
+            members_by_key.setdefault((account.account_type, account.status, account.is_locked), []).append(account)
+        for key, members in members_by_key.items():
+            if key in self._partitions:
+                for account in members:
+                    self._index(account)
+                continue
+            # Building an empty partition in one sort is much cheaper than inserting one at a time
+            partition = self._partitions[key] = _Partition(
+                SortedIndex(account.account_id.int for account in members),
+                SortedIndex((account.balance, account.account_id.int) for account in members),
+                max(account.minimum_balance for account in members),
+            )
+            for account in members:
+                self._indexed[account.account_id] = (key, partition, account.balance)
+
+    def get_account_version(self, account_id: UUID) -> Optional[int]:
+        return self.versions.get(account_id)
+
+    def list_accounts(self) -> List[Account]:
+        return list(self.accounts.values())
+
+    def get_accounts_changed_since(self, position: int) -> Tuple[int, List[Account]]:
+        # Walks back from the newest write, so the cost is the number of accounts changed
+        changed = []
+        with self._change_lock:
+            for account_id in reversed(self._changed_at):
+                if self._changed_at[account_id] <= position:
+                    break
+                changed.append(account_id)
+            position = self._change_position
+        return position, [self.accounts[account_id] for account_id in reversed(changed)]
+
+    def _matching_partitions(self, account_filter: AccountFilter) -> List[_Partition]:
+        account_types = [account_filter.account_type] if account_filter.account_type else list(AccountType)
+        statuses = [account_filter.status] if account_filter.status else list(AccountStatus)
+        locked = [account_filter.is_locked] if account_filter.is_locked is not None else [False, True]
+        return [
+            self._partitions[key] for key in product(account_types, statuses, locked) if key in self._partitions
+        ]
+
+    def find_accounts(self, account_filter: AccountFilter, after: Optional[tuple] = None, limit: int = 100) -> List[Account]:
+        with self._write_lock:
+            return self._find_accounts(account_filter, after, limit)
+
+    def _find_accounts(self, account_filter: AccountFilter, after: Optional[tuple], limit: int) -> List[Account]:
+        partitions = self._matching_partitions(account_filter)
+        exclusive = after is not None
+        if account_filter.by_balance:
+            low = (account_filter.min_balance, -1) if account_filter.min_balance is not None else None
+            if after is not None:
+                after_key = (after[0], after[1].int)
+                if low is None or after_key > low:
+                    low = after_key
+            high = (account_filter.max_balance, MAX_ID) if account_filter.max_balance is not None else None
+            runs = []
+            for partition in partitions:
+                partition_high = high
+                if account_filter.below_minimum_balance:
+                    below = (partition.minimum_balance - 1, MAX_ID)
+                    if partition_high is None or below < partition_high:
+                        partition_high = below
+                runs.append(partition.balances.irange(low, partition_high, exclusive_minimum=exclusive))
+            ids: Iterator[int] = (id_int for _, id_int in merge(*runs))
+        else:
+            low = after[0].int if after is not None else None
+            ids = merge(*(partition.ids.irange(low, exclusive_minimum=exclusive) for partition in partitions))
+
+        page = []
+        for id_int in ids:
+            account = self.accounts[UUID(int=id_int)]
+            # Re-checked in full: a partition's minimum only bounds its accounts' minimums, and a
+            # caller may have mutated the account without saving it yet
+            if not account_filter.matches(account):
+                continue
+            page.append(account)
+            if len(page) >= limit:
+                break
+        return page
+
+    def top_accounts_by_balance(self, limit: int) -> List[Account]:
+        # Walk each partition's balance index from the top; only the first `limit` pairs are touched
+        with self._write_lock:
+            runs = [reversed(partition.balances) for partition in self._partitions.values()]
+            return [self.accounts[UUID(int=id_int)] for _, id_int in islice(merge(*runs, reverse=True), limit)]
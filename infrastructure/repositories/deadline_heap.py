@@ -0,0 +1,48 @@
+import heapq
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+class DeadlineHeap:
+    # Min-heap of (deadline, sequence, key). Rescheduling pushes a fresh entry and cancelling
+    # pushes nothing: an entry whose sequence no longer matches _current is stale and is
+    # dropped when it reaches the top, so no operation ever searches the heap.
+
+    def __init__(self):
+        self._heap: List[Tuple[Any, int, Hashable]] = []
+        self._current: Dict[Hashable, int] = {}
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        return len(self._current)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._current
+
+    def schedule(self, key: Hashable, deadline: Any) -> None:
+        self._sequence += 1
+        self._current[key] = self._sequence
+        heapq.heappush(self._heap, (deadline, self._sequence, key))
+
+    def unschedule(self, key: Hashable) -> None:
+        self._current.pop(key, None)
+
+    def _drop_stale(self) -> None:
+        heap = self._heap
+        while heap and self._current.get(heap[0][2]) != heap[0][1]:
+            heapq.heappop(heap)
+
+    def next_deadline(self) -> Optional[Any]:
+        self._drop_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: Any, limit: int) -> List[Hashable]:
+        # Keys whose deadline is at or before now, earliest first
+        heap = self._heap
+        due = []
+        while len(due) < limit:
+            self._drop_stale()
+            if not heap or heap[0][0] > now:
+                break
+            _, _, key = heapq.heappop(heap)
+            del self._current[key]
+            due.append(key)
+        return due
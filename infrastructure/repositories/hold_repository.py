@@ -0,0 +1,64 @@
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from domain.entities.hold import Hold
+from infrastructure.repositories.deadline_heap import DeadlineHeap
+
+class HoldRepository(ABC):
+    @abstractmethod
+    def save_hold(self, hold: Hold) -> None:
+        pass
+
+    @abstractmethod
+    def get_hold(self, hold_id: UUID) -> Optional[Hold]:
+        pass
+
+    @abstractmethod
+    def get_holds_for_account(self, account_id: UUID) -> List[Hold]:
+        pass
+
+    @abstractmethod
+    def pop_expired(self, now: datetime, limit: int) -> List[Hold]:
+        # Pending holds whose expiry is at or before now, earliest first; they are no longer
+        # tracked for expiry once returned
+        pass
+
+    @abstractmethod
+    def next_expiry(self) -> Optional[datetime]:
+        pass
+
+class InMemoryHoldRepository(HoldRepository):
+    def __init__(self):
+        self.holds: Dict[UUID, Hold] = {}
+        self._by_account: Dict[UUID, List[UUID]] = {}
+        # Only pending holds are in the expiry heap; capture and release unschedule in O(1)
+        self._expiries = DeadlineHeap()
+        self._lock = threading.Lock()
+
+    def save_hold(self, hold: Hold) -> None:
+        with self._lock:
+            if hold.hold_id not in self.holds:
+                self._by_account.setdefault(hold.account_id, []).append(hold.hold_id)
+            self.holds[hold.hold_id] = hold
+            if hold.is_pending:
+                if hold.hold_id not in self._expiries:
+                    self._expiries.schedule(hold.hold_id, hold.expires_at)
+            else:
+                self._expiries.unschedule(hold.hold_id)
+
+    def get_hold(self, hold_id: UUID) -> Optional[Hold]:
+        return self.holds.get(hold_id)
+
+    def get_holds_for_account(self, account_id: UUID) -> List[Hold]:
+        return [self.holds[hold_id] for hold_id in self._by_account.get(account_id, [])]
+
+    def pop_expired(self, now: datetime, limit: int) -> List[Hold]:
+        with self._lock:
+            return [self.holds[hold_id] for hold_id in self._expiries.pop_due(now, limit)]
+
+    def next_expiry(self) -> Optional[datetime]:
+        with self._lock:
+            return self._expiries.next_deadline()
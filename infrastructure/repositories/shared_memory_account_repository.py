@@ -0,0 +1,336 @@
+import fcntl
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from multiprocessing import shared_memory, resource_tracker
+from typing import Iterator, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+import numpy as np
+
+from domain.entities.account import Account, AccountType, AccountStatus
+from domain.services.interest_strategy import (
+    InterestStrategy,
+    CheckingInterestStrategy,
+    SavingsInterestStrategy,
+)
+from domain.services.limit_constraint import LimitConstraint
+from infrastructure.repositories.account_repository import AccountRepository
+
+# Every account occupies one fixed-size record of int64 fields in the segment
+(
+    F_ID_HIGH, F_ID_LOW, F_STATE, F_ACCOUNT_TYPE, F_STATUS, F_BALANCE, F_DAILY_SPENT, F_MONTHLY_SPENT,
+    F_MINIMUM_BALANCE, F_OVERDRAFT_LIMIT, F_TRANSACTION_COUNT, F_MAX_DAILY_TRANSACTIONS,
+    F_FAILED_ATTEMPTS, F_IS_LOCKED, F_DAILY_LIMIT, F_MONTHLY_LIMIT, F_CREATION_DATE,
+    F_LAST_RESET_DATE, F_LAST_INTEREST_POSTING_DATE, F_LAST_STATEMENT_DATE, F_VERSION, F_INTEREST,
+    F_HELD_AMOUNT, F_OPENING_BALANCE, F_WRITE_SEQUENCE,
+) = range(25)
+RECORD_FIELDS = 25
+HEADER_FIELDS = 8
+H_CAPACITY, H_COUNT, H_EPOCH = 0, 1, 2
+
+SLOT_EMPTY, SLOT_OCCUPIED = 0, 1
+NONE = -1
+MASK_64 = (1 << 64) - 1
+
+ACCOUNT_TYPES: List[AccountType] = list(AccountType)
+ACCOUNT_STATUSES: List[AccountStatus] = list(AccountStatus)
+INTEREST_NONE, INTEREST_CHECKING, INTEREST_SAVINGS = 0, 1, 2
+EPOCH = datetime(1970, 1, 1)
+
+def _to_micros(value: Optional[datetime]) -> int:
+    if value is None:
+        return NONE
+    return (value.replace(tzinfo=None) - EPOCH) // timedelta(microseconds=1)
+
+def _from_micros(value: int) -> Optional[datetime]:
+    if value == NONE:
+        return None
+    return EPOCH + timedelta(microseconds=value)
+
+def _signed(value: int) -> int:
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+def _interest_code(strategy: Optional[InterestStrategy]) -> int:
+    if isinstance(strategy, SavingsInterestStrategy):
+        return INTEREST_SAVINGS
+    if isinstance(strategy, CheckingInterestStrategy):
+        return INTEREST_CHECKING
+    return INTEREST_NONE
+
+class RepositoryFullError(Exception):
+    pass
+
+class SharedMemoryAccountRepository(AccountRepository):
+    # Account state lives in a shared memory segment so every worker process on the host sees
+    # the same balances. Slots are found by open addressing on the account id, and writers
+    # serialise per slot with a byte-range file lock (across processes) plus a striped
+    # RLock (across threads of one process, which fcntl locks do not separate).
+
+    def __init__(self, name: str, capacity: int = 1 << 20, lock_dir: Optional[str] = None):
+        if capacity & (capacity - 1):
+            raise ValueError("capacity must be a power of two")
+        size = (HEADER_FIELDS + capacity * RECORD_FIELDS) * 8
+        try:
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+            self.created = True
+        except FileExistsError:
+            self._shm = shared_memory.SharedMemory(name=name)
+            self.created = False
+        # Attaching processes must not let the resource tracker unlink the segment on exit
+        resource_tracker.unregister(self._shm._name, "shared_memory")
+
+        self._data = self._shm.buf.cast("q")
+        if self.created:
+            self._data[H_CAPACITY] = capacity
+            # Set once per segment, so every worker attached to it reports the same epoch
+            self._data[H_EPOCH] = time.time_ns()
+        self.capacity = self._data[H_CAPACITY]
+        self.epoch = self._data[H_EPOCH]
+        self.name = name
+
+        lock_path = os.path.join(lock_dir or tempfile.gettempdir(), f"{name}.lock")
+        self._lock_fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        self._lock_path = lock_path
+        self._thread_locks = [threading.RLock() for _ in range(64)]
+        # Slots the current thread already holds, so a nested lock (update_account inside
+        # lock_accounts) neither re-locks nor, on exit, releases the caller's file locks
+        self._held = threading.local()
+        # The byte just past the last slot guards slot allocation
+        self._table_lock = self.capacity
+
+    def close(self, unlink: bool = False) -> None:
+        self._data.release()
+        self._shm.close()
+        os.close(self._lock_fd)
+        if unlink:
+            # unlink() unregisters the segment again, so hand it back to the tracker first
+            resource_tracker.register(self._shm._name, "shared_memory")
+            self._shm.unlink()
+            try:
+                os.unlink(self._lock_path)
+            except FileNotFoundError:
+                pass
+
+    def _base(self, slot: int) -> int:
+        return HEADER_FIELDS + slot * RECORD_FIELDS
+
+    def _find_slot(self, account_id: UUID, for_insert: bool = False) -> Optional[int]:
+        high = _signed(account_id.int >> 64)
+        low = _signed(account_id.int & MASK_64)
+        data = self._data
+        mask = self.capacity - 1
+        slot = hash(account_id.int) & mask
+        for _ in range(self.capacity):
+            base = self._base(slot)
+            state = data[base + F_STATE]
+            if state == SLOT_EMPTY:
+                return slot if for_insert else None
+            if data[base + F_ID_HIGH] == high and data[base + F_ID_LOW] == low:
+                return slot
+            slot = (slot + 1) & mask
+        if for_insert:
+            raise RepositoryFullError(f"Shared account store {self.name} is full")
+        return None
+
+    @contextmanager
+    def _slot_locks(self, slots: List[int]) -> Iterator[None]:
+        held = self._held.__dict__.setdefault("slots", set())
+        new_slots = sorted(set(slots) - held)
+        # Stripes are taken in stripe order and file locks in slot order; slots 1 and 66 share a
+        # stripe with 2 and 65 in the opposite order, so sorting slots alone could deadlock
+        stripes = sorted({slot % len(self._thread_locks) for slot in new_slots})
+        acquired_stripes = []
+        acquired_slots = []
+        try:
+            for stripe in stripes:
+                thread_lock = self._thread_locks[stripe]
+                thread_lock.acquire()
+                acquired_stripes.append(thread_lock)
+            for slot in new_slots:
+                fcntl.lockf(self._lock_fd, fcntl.LOCK_EX, 1, slot)
+                acquired_slots.append(slot)
+                held.add(slot)
+            yield
+        finally:
+            for slot in reversed(acquired_slots):
+                fcntl.lockf(self._lock_fd, fcntl.LOCK_UN, 1, slot)
+                held.discard(slot)
+            for thread_lock in reversed(acquired_stripes):
+                thread_lock.release()
+
+    def lock_accounts(self, *account_ids: UUID):
+        slots = [slot for slot in (self._find_slot(account_id) for account_id in account_ids) if slot is not None]
+        return self._slot_locks(slots)
+
+    def _write(self, base: int, account: Account, version: int) -> None:
+        data = self._data
+        limit = account.limit_constraint
+        # Odd while the record is being written: lock-free readers retry instead of mixing old
+        # and new fields
+        data[base + F_WRITE_SEQUENCE] += 1
+        data[base + F_ACCOUNT_TYPE] = ACCOUNT_TYPES.index(account.account_type)
+        data[base + F_STATUS] = ACCOUNT_STATUSES.index(account.status)
+        data[base + F_BALANCE] = account.balance
+        data[base + F_DAILY_SPENT] = account.daily_spent
+        data[base + F_MONTHLY_SPENT] = account.monthly_spent
+        data[base + F_MINIMUM_BALANCE] = account.minimum_balance
+        data[base + F_OVERDRAFT_LIMIT] = account.overdraft_limit
+        data[base + F_TRANSACTION_COUNT] = account.transaction_count
+        data[base + F_MAX_DAILY_TRANSACTIONS] = account.max_daily_transactions
+        data[base + F_FAILED_ATTEMPTS] = account.failed_attempts
+        data[base + F_IS_LOCKED] = int(account.is_locked)
+        data[base + F_DAILY_LIMIT] = limit.daily_limit if limit else NONE
+        data[base + F_MONTHLY_LIMIT] = limit.monthly_limit if limit else NONE
+        data[base + F_CREATION_DATE] = _to_micros(account.creation_date)
+        data[base + F_LAST_RESET_DATE] = _to_micros(account.last_reset_date)
+        data[base + F_LAST_INTEREST_POSTING_DATE] = _to_micros(account.last_interest_posting_date)
+        data[base + F_LAST_STATEMENT_DATE] = _to_micros(account.last_statement_date)
+        data[base + F_INTEREST] = _interest_code(account.interest_strategy)
+        data[base + F_HELD_AMOUNT] = account.held_amount
+        data[base + F_OPENING_BALANCE] = account.opening_balance
+        data[base + F_VERSION] = version
+        data[base + F_WRITE_SEQUENCE] += 1
+
+    def _read(self, base: int, account_id: UUID) -> Account:
+        data = self._data
+        daily_limit = data[base + F_DAILY_LIMIT]
+        interest = data[base + F_INTEREST]
+        return Account(
+            account_id=account_id,
+            account_type=ACCOUNT_TYPES[data[base + F_ACCOUNT_TYPE]],
+            balance=data[base + F_BALANCE],
+            status=ACCOUNT_STATUSES[data[base + F_STATUS]],
+            creation_date=_from_micros(data[base + F_CREATION_DATE]),
+            interest_strategy=(
+                SavingsInterestStrategy() if interest == INTEREST_SAVINGS
+                else CheckingInterestStrategy() if interest == INTEREST_CHECKING
+                else None
+            ),
+            limit_constraint=(
+                LimitConstraint(daily_limit=daily_limit, monthly_limit=data[base + F_MONTHLY_LIMIT])
+                if daily_limit != NONE else None
+            ),
+            daily_spent=data[base + F_DAILY_SPENT],
+            monthly_spent=data[base + F_MONTHLY_SPENT],
+            last_reset_date=_from_micros(data[base + F_LAST_RESET_DATE]),
+            minimum_balance=data[base + F_MINIMUM_BALANCE],
+            last_interest_posting_date=_from_micros(data[base + F_LAST_INTEREST_POSTING_DATE]),
+            failed_attempts=data[base + F_FAILED_ATTEMPTS],
+            is_locked=bool(data[base + F_IS_LOCKED]),
+            overdraft_limit=data[base + F_OVERDRAFT_LIMIT],
+            transaction_count=data[base + F_TRANSACTION_COUNT],
+            max_daily_transactions=data[base + F_MAX_DAILY_TRANSACTIONS],
+            last_statement_date=_from_micros(data[base + F_LAST_STATEMENT_DATE]),
+            held_amount=data[base + F_HELD_AMOUNT],
+            opening_balance=data[base + F_OPENING_BALANCE],
+        )
+
+    def _read_stable(self, base: int, account_id: UUID) -> Tuple[Account, int]:
+        # Seqlock read: readers never block writers, and only retry if a write overlapped
+        data = self._data
+        while True:
+            sequence = data[base + F_WRITE_SEQUENCE]
+            if not sequence & 1:
+                account = self._read(base, account_id)
+                version = data[base + F_VERSION]
+                if data[base + F_WRITE_SEQUENCE] == sequence:
+                    return account, version
+            time.sleep(0)
+
+    def get_account_by_id(self, account_id: UUID) -> Optional[Account]:
+        slot = self._find_slot(account_id)
+        if slot is None:
+            return None
+        return self._read_stable(self._base(slot), account_id)[0]
+
+    def get_account_with_version(self, account_id: UUID) -> Optional[Tuple[Account, int]]:
+        slot = self._find_slot(account_id)
+        if slot is None:
+            return None
+        return self._read_stable(self._base(slot), account_id)
+
+    def update_account(self, account: Account) -> None:
+        slot = self._find_slot(account.account_id)
+        if slot is None:
+            return
+        base = self._base(slot)
+        with self._slot_locks([slot]):
+            self._write(base, account, self._data[base + F_VERSION] + 1)
+            for listener in self.update_listeners:
+                listener(account)
+
+    def _insert(self, account: Account) -> None:
+        # Caller holds the table lock
+        slot = self._find_slot(account.account_id, for_insert=True)
+        base = self._base(slot)
+        with self._slot_locks([slot]):
+            is_new = self._data[base + F_STATE] == SLOT_EMPTY
+            version = 1 if is_new else self._data[base + F_VERSION] + 1
+            self._write(base, account, version)
+            self._data[base + F_ID_HIGH] = _signed(account.account_id.int >> 64)
+            self._data[base + F_ID_LOW] = _signed(account.account_id.int & MASK_64)
+            # Publish the slot last so lock-free readers never see a half-written record
+            self._data[base + F_STATE] = SLOT_OCCUPIED
+            if is_new:
+                self._data[H_COUNT] += 1
+
+    def create_account(self, account: Account) -> None:
+        with self._slot_locks([self._table_lock]):
+            self._insert(account)
+
+    def create_accounts(self, accounts: Sequence[Account]) -> None:
+        with self._slot_locks([self._table_lock]):
+            if self._data[H_COUNT] + len(accounts) > self.capacity:
+                raise RepositoryFullError(f"Shared account store {self.name} has no room for {len(accounts)} accounts")
+            for account in accounts:
+                self._insert(account)
+
+    def get_account_version(self, account_id: UUID) -> Optional[int]:
+        slot = self._find_slot(account_id)
+        if slot is None:
+            return None
+        return self._data[self._base(slot) + F_VERSION]
+
+    def list_accounts(self) -> List[Account]:
+        data = self._data
+        accounts = []
+        for slot in range(self.capacity):
+            base = self._base(slot)
+            if data[base + F_STATE] == SLOT_OCCUPIED:
+                account_id = UUID(int=((data[base + F_ID_HIGH] & MASK_64) << 64) | (data[base + F_ID_LOW] & MASK_64))
+                accounts.append(self._read_stable(base, account_id)[0])
+        return accounts
+
+    def top_accounts_by_balance(self, limit: int) -> List[Account]:
+        # Any worker may move any balance, so no one process can keep a ranking current. The
+        # balance column is selected in C instead: O(capacity) with no sort and no Account per
+        # slot, then only the winners are read.
+        view = np.frombuffer(self._shm.buf, dtype=np.int64, count=HEADER_FIELDS + self.capacity * RECORD_FIELDS)
+        records = view[HEADER_FIELDS:].reshape(self.capacity, RECORD_FIELDS)
+        slots = np.flatnonzero(records[:, F_STATE] == SLOT_OCCUPIED)
+        balances = records[slots, F_BALANCE]
+        highs = records[slots, F_ID_HIGH].view(np.uint64)
+        lows = records[slots, F_ID_LOW].view(np.uint64)
+        # Fancy indexing copied the columns; the view must go before the segment can be closed
+        del view, records
+
+        if len(slots) > limit:
+            cutoff = np.partition(balances, len(balances) - limit)[len(balances) - limit]
+            above = np.flatnonzero(balances > cutoff)
+            # Ties at the cutoff are broken by id, as in the in-memory ranking
+            ties = np.flatnonzero(balances == cutoff)
+            ties = ties[np.lexsort((lows[ties], highs[ties]))][len(ties) - (limit - len(above)):]
+            chosen = np.concatenate((above, ties))
+            slots, balances, highs, lows = slots[chosen], balances[chosen], highs[chosen], lows[chosen]
+        order = np.lexsort((lows, highs, balances))[::-1]
+        return [
+            self._read_stable(self._base(int(slot)), UUID(int=(int(high) << 64) | int(low)))[0]
+            for slot, high, low in zip(slots[order], highs[order], lows[order])
+        ]
+
+    def __len__(self) -> int:
+        return self._data[H_COUNT]
@@ -0,0 +1,243 @@
+import fcntl
+import os
+import tempfile
+import threading
+from array import array
+from contextlib import contextmanager
+from datetime import datetime
+from multiprocessing import shared_memory, resource_tracker
+from typing import Iterator, List, Optional
+from uuid import UUID
+
+from domain.entities.hold import Hold, HoldStatus
+from infrastructure.repositories.hold_repository import HoldRepository
+from infrastructure.repositories.shared_memory_account_repository import (
+    MASK_64,
+    RepositoryFullError,
+    _from_micros,
+    _signed,
+    _to_micros,
+)
+
+# Every hold occupies one fixed-size record of int64 fields in the segment; a transaction id
+# of all zero bits means none
+(
+    F_ID_HIGH, F_ID_LOW, F_STATE, F_ACCOUNT_HIGH, F_ACCOUNT_LOW, F_AMOUNT, F_CREATED_AT, F_EXPIRES_AT,
+    F_STATUS, F_CAPTURED_AMOUNT, F_TRANSACTION_HIGH, F_TRANSACTION_LOW, F_EXPIRY_TRACKED,
+) = range(13)
+RECORD_FIELDS = 13
+HEADER_FIELDS = 8
+H_CAPACITY, H_COUNT, H_SETTLED = 0, 1, 2
+
+# A settled (captured, released or expired) hold stays readable in its slot until an insert
+# reuses the slot or a compaction clears it
+SLOT_EMPTY, SLOT_OCCUPIED, SLOT_SETTLED = 0, 1, 2
+HOLD_STATUSES: List[HoldStatus] = list(HoldStatus)
+
+def _uuid(high: int, low: int) -> UUID:
+    return UUID(int=((high & MASK_64) << 64) | (low & MASK_64))
+
+class SharedMemoryHoldRepository(HoldRepository):
+    # Holds in a shared memory segment beside the shared account store, so a hold placed by one
+    # worker can be captured, released or expired by any other, and outlives a worker restart
+    # just as the held_amount it reserves does. Holds are few next to accounts, so one table
+    # lock (file lock plus thread lock) serialises every access, and the expiry queries scan
+    # the table's expiry column instead of keeping a heap that every process would have to share.
+    # Only pending holds are guaranteed a slot: settled holds give theirs up to new holds, so
+    # the table bounds holds open at once rather than holds ever placed.
+
+    def __init__(self, name: str, capacity: int = 1 << 16, lock_dir: Optional[str] = None):
+        if capacity & (capacity - 1):
+            raise ValueError("capacity must be a power of two")
+        size = (HEADER_FIELDS + capacity * RECORD_FIELDS) * 8
+        try:
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+            self.created = True
+        except FileExistsError:
+            self._shm = shared_memory.SharedMemory(name=name)
+            self.created = False
+        # Attaching processes must not let the resource tracker unlink the segment on exit
+        resource_tracker.unregister(self._shm._name, "shared_memory")
+
+        self._data = self._shm.buf.cast("q")
+        if self.created:
+            self._data[H_CAPACITY] = capacity
+        self.capacity = self._data[H_CAPACITY]
+        self.name = name
+
+        lock_path = os.path.join(lock_dir or tempfile.gettempdir(), f"{name}.lock")
+        self._lock_fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        self._lock_path = lock_path
+        self._thread_lock = threading.Lock()
+
+    def close(self, unlink: bool = False) -> None:
+        self._data.release()
+        self._shm.close()
+        os.close(self._lock_fd)
+        if unlink:
+            # unlink() unregisters the segment again, so hand it back to the tracker first
+            resource_tracker.register(self._shm._name, "shared_memory")
+            self._shm.unlink()
+            try:
+                os.unlink(self._lock_path)
+            except FileNotFoundError:
+                pass
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        with self._thread_lock:
+            fcntl.lockf(self._lock_fd, fcntl.LOCK_EX, 1, 0)
+            try:
+                yield
+            finally:
+                fcntl.lockf(self._lock_fd, fcntl.LOCK_UN, 1, 0)
+
+    def _base(self, slot: int) -> int:
+        return HEADER_FIELDS + slot * RECORD_FIELDS
+
+    def _find_slot(self, hold_id: UUID, for_insert: bool = False) -> Optional[int]:
+        high = _signed(hold_id.int >> 64)
+        low = _signed(hold_id.int & MASK_64)
+        data = self._data
+        mask = self.capacity - 1
+        slot = hash(hold_id.int) & mask
+        # A new hold takes the first settled slot on its probe path, once the rest of the path
+        # has shown the id is not already stored further on
+        reusable = None
+        for _ in range(self.capacity):
+            base = self._base(slot)
+            state = data[base + F_STATE]
+            if state == SLOT_EMPTY:
+                if not for_insert:
+                    return None
+                return slot if reusable is None else reusable
+            if data[base + F_ID_HIGH] == high and data[base + F_ID_LOW] == low:
+                return slot
+            if state == SLOT_SETTLED and reusable is None:
+                reusable = slot
+            slot = (slot + 1) & mask
+        if for_insert and reusable is not None:
+            return reusable
+        if for_insert:
+            raise RepositoryFullError(f"Shared hold store {self.name} is full")
+        return None
+
+    def _compact(self) -> None:
+        # Caller holds the table lock. Drops every settled hold and reinserts the pending ones,
+        # so probe paths stay short however many holds have come and gone
+        data = self._data
+        pending = []
+        for slot in range(self.capacity):
+            base = self._base(slot)
+            if data[base + F_STATE] == SLOT_OCCUPIED:
+                pending.append(data[base:base + RECORD_FIELDS].tolist())
+        start = self._base(0)
+        data[start:start + self.capacity * RECORD_FIELDS] = array("q", bytes(self.capacity * RECORD_FIELDS * 8))
+        mask = self.capacity - 1
+        for record in pending:
+            slot = hash(_uuid(record[F_ID_HIGH], record[F_ID_LOW]).int) & mask
+            while data[self._base(slot) + F_STATE] != SLOT_EMPTY:
+                slot = (slot + 1) & mask
+            base = self._base(slot)
+            data[base:base + RECORD_FIELDS] = array("q", record)
+        data[H_COUNT] = len(pending)
+        data[H_SETTLED] = 0
+
+    def _column(self, field: int) -> List[int]:
+        # One field of every slot, copied out in C
+        return self._data[HEADER_FIELDS + field::RECORD_FIELDS].tolist()
+
+    def _read(self, base: int) -> Hold:
+        data = self._data
+        transaction_id = _uuid(data[base + F_TRANSACTION_HIGH], data[base + F_TRANSACTION_LOW])
+        return Hold(
+            hold_id=_uuid(data[base + F_ID_HIGH], data[base + F_ID_LOW]),
+            account_id=_uuid(data[base + F_ACCOUNT_HIGH], data[base + F_ACCOUNT_LOW]),
+            amount=data[base + F_AMOUNT],
+            created_at=_from_micros(data[base + F_CREATED_AT]),
+            expires_at=_from_micros(data[base + F_EXPIRES_AT]),
+            status=HOLD_STATUSES[data[base + F_STATUS]],
+            captured_amount=data[base + F_CAPTURED_AMOUNT],
+            transaction_id=transaction_id if transaction_id.int else None,
+        )
+
+    def save_hold(self, hold: Hold) -> None:
+        transaction_id = hold.transaction_id.int if hold.transaction_id is not None else 0
+        with self._locked():
+            data = self._data
+            # Settled slots lengthen every probe path; once they hold an eighth of the table
+            # and it is three quarters used, they are cleared out in one pass
+            if data[H_COUNT] >= self.capacity * 3 // 4 and data[H_SETTLED] >= self.capacity // 8:
+                self._compact()
+            slot = self._find_slot(hold.hold_id, for_insert=True)
+            base = self._base(slot)
+            state = data[base + F_STATE]
+            data[base + F_ACCOUNT_HIGH] = _signed(hold.account_id.int >> 64)
+            data[base + F_ACCOUNT_LOW] = _signed(hold.account_id.int & MASK_64)
+            data[base + F_AMOUNT] = hold.amount
+            data[base + F_CREATED_AT] = _to_micros(hold.created_at)
+            data[base + F_EXPIRES_AT] = _to_micros(hold.expires_at)
+            data[base + F_STATUS] = HOLD_STATUSES.index(hold.status)
+            data[base + F_CAPTURED_AMOUNT] = hold.captured_amount
+            data[base + F_TRANSACTION_HIGH] = _signed(transaction_id >> 64)
+            data[base + F_TRANSACTION_LOW] = _signed(transaction_id & MASK_64)
+            # Only pending holds are tracked for expiry, as in the in-memory heap
+            data[base + F_EXPIRY_TRACKED] = int(hold.is_pending)
+            data[base + F_ID_HIGH] = _signed(hold.hold_id.int >> 64)
+            data[base + F_ID_LOW] = _signed(hold.hold_id.int & MASK_64)
+            if state == SLOT_EMPTY:
+                data[H_COUNT] += 1
+            elif state == SLOT_SETTLED:
+                data[H_SETTLED] -= 1
+            data[base + F_STATE] = SLOT_OCCUPIED if hold.is_pending else SLOT_SETTLED
+            if not hold.is_pending:
+                data[H_SETTLED] += 1
+
+    def get_hold(self, hold_id: UUID) -> Optional[Hold]:
+        with self._locked():
+            slot = self._find_slot(hold_id)
+            if slot is None:
+                return None
+            return self._read(self._base(slot))
+
+    def get_holds_for_account(self, account_id: UUID) -> List[Hold]:
+        high = _signed(account_id.int >> 64)
+        low = _signed(account_id.int & MASK_64)
+        with self._locked():
+            states = self._column(F_STATE)
+            account_highs = self._column(F_ACCOUNT_HIGH)
+            holds = [
+                self._read(self._base(slot))
+                for slot, (state, account_high) in enumerate(zip(states, account_highs))
+                if state != SLOT_EMPTY and account_high == high
+                and self._data[self._base(slot) + F_ACCOUNT_LOW] == low
+            ]
+        # Ids are UUIDv7, so id order is the order the holds were placed in
+        return sorted(holds, key=lambda hold: hold.hold_id)
+
+    def pop_expired(self, now: datetime, limit: int) -> List[Hold]:
+        # Claimed under the table lock, so of several workers sweeping at once only one gets each hold
+        cutoff = _to_micros(now)
+        with self._locked():
+            tracked = self._column(F_EXPIRY_TRACKED)
+            expiries = self._column(F_EXPIRES_AT)
+            due = sorted(
+                (expires_at, slot) for slot, (is_tracked, expires_at) in enumerate(zip(tracked, expiries))
+                if is_tracked and expires_at <= cutoff
+            )[:limit]
+            holds = []
+            for _, slot in due:
+                base = self._base(slot)
+                self._data[base + F_EXPIRY_TRACKED] = 0
+                holds.append(self._read(base))
+        return holds
+
+    def next_expiry(self) -> Optional[datetime]:
+        with self._locked():
+            tracked = self._column(F_EXPIRY_TRACKED)
+            expiries = self._column(F_EXPIRES_AT)
+        pending = [expires_at for is_tracked, expires_at in zip(tracked, expiries) if is_tracked]
+        return _from_micros(min(pending)) if pending else None
+
+    def __len__(self) -> int:
+        return self._data[H_COUNT]
@@ -1,6 +1,39 @@
-from infrastructure.repositories.account_repository import InMemoryAccountRepository
+import os
+
+from infrastructure.repositories.account_repository import AccountRepository, InMemoryAccountRepository
 from infrastructure.repositories.transaction_repository import InMemoryTransactionRepository
+from infrastructure.repositories.transaction_archive import TransactionArchive
+from infrastructure.repositories.standing_order_repository import InMemoryStandingOrderRepository
+from infrastructure.repositories.hold_repository import HoldRepository, InMemoryHoldRepository
+from infrastructure.adapters.change_feed_adapter import change_broadcaster
+
+def _create_account_repository() -> AccountRepository:
+    # ACCOUNT_STORE=shared_memory lets several uvicorn workers on one host share balances
+    if os.environ.get("ACCOUNT_STORE") == "shared_memory":
+        from infrastructure.repositories.shared_memory_account_repository import SharedMemoryAccountRepository
+        return SharedMemoryAccountRepository(
+            name=os.environ.get("ACCOUNT_STORE_NAME", "bank_accounts"),
+            capacity=int(os.environ.get("ACCOUNT_STORE_CAPACITY", 1 << 20))
+        )
+    return InMemoryAccountRepository()
+
+def _create_hold_repository() -> HoldRepository:
+    # Holds follow the accounts: a shared held_amount needs holds every worker can capture,
+    # release and expire
+    if os.environ.get("ACCOUNT_STORE") == "shared_memory":
+        from infrastructure.repositories.shared_memory_hold_repository import SharedMemoryHoldRepository
+        return SharedMemoryHoldRepository(
+            name=f"{os.environ.get('ACCOUNT_STORE_NAME', 'bank_accounts')}_holds",
+            capacity=int(os.environ.get("HOLD_STORE_CAPACITY", 1 << 16))
+        )
+    return InMemoryHoldRepository()
 
 # Create single instances to be shared across the application
-account_repo = InMemoryAccountRepository()
-transaction_repo = InMemoryTransactionRepository() 
\ No newline at end of file
+account_repo = _create_account_repository()
+# Aged transactions move to segment files here; a private temporary directory by default
+transaction_repo = InMemoryTransactionRepository(archive=TransactionArchive(os.environ.get("TRANSACTION_ARCHIVE_DIR")))
+standing_order_repo = InMemoryStandingOrderRepository()
+hold_repo = _create_hold_repository()
+
+# Committed transactions and account writes feed the /changes event stream
+change_broadcaster.attach(account_repo, transaction_repo) 
\ No newline at end of file
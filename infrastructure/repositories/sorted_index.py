@@ -0,0 +1,74 @@
+from bisect import bisect_left, bisect_right, insort
+from typing import Any, Iterable, Iterator, List, Optional
+
+class SortedIndex:
+    # A sorted list split into bounded chunks: an insert or delete shifts at most one chunk,
+    # so maintaining the index on every balance change costs O(log n) plus a small memmove,
+    # instead of moving the whole list.
+    CHUNK_SIZE = 512
+
+    def __init__(self, values: Iterable[Any] = ()):
+        values = sorted(values)
+        self._chunks: List[List[Any]] = [
+            values[i:i + self.CHUNK_SIZE] for i in range(0, len(values), self.CHUNK_SIZE)
+        ]
+        self._maxes: List[Any] = [chunk[-1] for chunk in self._chunks]
+        self._len = len(values)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[Any]:
+        for chunk in self._chunks:
+            yield from chunk
+
+    def __reversed__(self) -> Iterator[Any]:
+        for chunk in reversed(self._chunks):
+            yield from reversed(chunk)
+
+    def add(self, value: Any) -> None:
+        if not self._chunks:
+            self._chunks.append([value])
+            self._maxes.append(value)
+        else:
+            position = min(bisect_left(self._maxes, value), len(self._maxes) - 1)
+            chunk = self._chunks[position]
+            insort(chunk, value)
+            self._maxes[position] = chunk[-1]
+            if len(chunk) > 2 * self.CHUNK_SIZE:
+                self._chunks[position:position + 1] = [chunk[:self.CHUNK_SIZE], chunk[self.CHUNK_SIZE:]]
+                self._maxes[position:position + 1] = [chunk[self.CHUNK_SIZE - 1], chunk[-1]]
+        self._len += 1
+
+    def remove(self, value: Any) -> None:
+        position = bisect_left(self._maxes, value)
+        if position == len(self._maxes):
+            raise ValueError(f"{value!r} not in index")
+        chunk = self._chunks[position]
+        index = bisect_left(chunk, value)
+        if index == len(chunk) or chunk[index] != value:
+            raise ValueError(f"{value!r} not in index")
+        del chunk[index]
+        self._len -= 1
+        if chunk:
+            self._maxes[position] = chunk[-1]
+        else:
+            del self._chunks[position]
+            del self._maxes[position]
+
+    def irange(self, minimum: Optional[Any] = None, maximum: Optional[Any] = None, exclusive_minimum: bool = False) -> Iterator[Any]:
+        # Lazily yields values in [minimum, maximum] (or (minimum, maximum]) in order
+        if minimum is None:
+            position, index = 0, 0
+        else:
+            find = bisect_right if exclusive_minimum else bisect_left
+            position = find(self._maxes, minimum)
+            if position == len(self._chunks):
+                return
+            index = find(self._chunks[position], minimum)
+        for chunk in self._chunks[position:]:
+            for value in chunk[index:]:
+                if maximum is not None and value > maximum:
+                    return
+                yield value
+            index = 0
@@ -0,0 +1,64 @@
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from domain.entities.standing_order import StandingOrder
+from infrastructure.repositories.deadline_heap import DeadlineHeap
+
+class StandingOrderRepository(ABC):
+    @abstractmethod
+    def save_order(self, order: StandingOrder) -> None:
+        pass
+
+    @abstractmethod
+    def get_order(self, order_id: UUID) -> Optional[StandingOrder]:
+        pass
+
+    @abstractmethod
+    def get_orders_for_account(self, account_id: UUID) -> List[StandingOrder]:
+        pass
+
+    @abstractmethod
+    def pop_due(self, now: datetime, limit: int) -> List[StandingOrder]:
+        # Active orders due at or before now, earliest first; they stay stored but are
+        # unscheduled until saved again
+        pass
+
+    @abstractmethod
+    def next_due_time(self) -> Optional[datetime]:
+        pass
+
+class InMemoryStandingOrderRepository(StandingOrderRepository):
+    def __init__(self):
+        self.orders: Dict[UUID, StandingOrder] = {}
+        self._by_account: Dict[UUID, List[UUID]] = {}
+        # Active orders keyed by next run time; every operation is O(log n) however many
+        # orders are stored
+        self._schedule = DeadlineHeap()
+        self._lock = threading.Lock()
+
+    def save_order(self, order: StandingOrder) -> None:
+        with self._lock:
+            if order.order_id not in self.orders:
+                self._by_account.setdefault(order.source_account_id, []).append(order.order_id)
+            self.orders[order.order_id] = order
+            if order.is_active:
+                self._schedule.schedule(order.order_id, order.next_run_at)
+            else:
+                self._schedule.unschedule(order.order_id)
+
+    def get_order(self, order_id: UUID) -> Optional[StandingOrder]:
+        return self.orders.get(order_id)
+
+    def get_orders_for_account(self, account_id: UUID) -> List[StandingOrder]:
+        return [self.orders[order_id] for order_id in self._by_account.get(account_id, [])]
+
+    def pop_due(self, now: datetime, limit: int) -> List[StandingOrder]:
+        with self._lock:
+            return [self.orders[order_id] for order_id in self._schedule.pop_due(now, limit)]
+
+    def next_due_time(self) -> Optional[datetime]:
+        with self._lock:
+            return self._schedule.next_deadline()
@@ -0,0 +1,212 @@
+import os
+import shutil
+import struct
+import tempfile
+import threading
+import zlib
+from bisect import bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from domain.entities.transaction import Transaction, TransactionType
+
+# One fixed-width record per transaction: ledger position, transaction id, account id,
+# destination id (all zero bytes for none), type, amount in cents, timestamp in microseconds
+RECORD = struct.Struct("<q16s16s16sBqq")
+NO_DESTINATION = bytes(16)
+TRANSACTION_TYPES: List[TransactionType] = list(TransactionType)
+EPOCH = datetime(1970, 1, 1)
+ONE_MICROSECOND = timedelta(microseconds=1)
+
+@dataclass(frozen=True)
+class ArchivedBlock:
+    # One account's transactions within one segment file
+    segment: int
+    offset: int
+    length: int
+    first_timestamp: datetime
+    last_timestamp: datetime
+
+@dataclass(frozen=True)
+class _Segment:
+    path: str
+    first_position: int
+    end_position: int
+    blocks: Tuple[Tuple[int, int], ...]
+
+def _encode(position: int, transaction: Transaction) -> bytes:
+    destination = transaction.destination_account_id
+    return RECORD.pack(
+        position,
+        transaction.transaction_id.bytes,
+        transaction.account_id.bytes,
+        destination.bytes if destination is not None else NO_DESTINATION,
+        TRANSACTION_TYPES.index(transaction.transaction_type),
+        transaction.amount,
+        (transaction.timestamp - EPOCH) // ONE_MICROSECOND,
+    )
+
+def _decode(data: bytes) -> List[Tuple[int, Transaction]]:
+    return [
+        (position, Transaction(
+            transaction_id=UUID(bytes=transaction_id),
+            account_id=UUID(bytes=account_id),
+            transaction_type=TRANSACTION_TYPES[transaction_type],
+            amount=amount,
+            timestamp=EPOCH + timedelta(microseconds=micros),
+            destination_account_id=UUID(bytes=destination) if destination != NO_DESTINATION else None,
+        ))
+        for position, transaction_id, account_id, destination, transaction_type, amount, micros in RECORD.iter_unpack(data)
+    ]
+
+class TransactionArchive:
+    # Cold tier: each archive run writes one immutable segment file holding a contiguous range
+    # of ledger positions, stored as one zlib block per account the rows post to (a transfer
+    # goes in both sides' blocks). The index (account -> blocks with their time range) stays
+    # in memory and costs one small entry per account per run, so reading an account's
+    # history or postings decompresses only that account's blocks.
+
+    def __init__(self, root: Optional[str] = None, cached_segments: int = 2):
+        self._root = root
+        self._directory: Optional[str] = None
+        self._segments: List[_Segment] = []
+        self._segment_starts: List[int] = []
+        self._blocks: Dict[UUID, List[ArchivedBlock]] = {}
+        # Whole decoded segments, for ledger range reads that page through one segment at a time
+        self._decoded: "OrderedDict[int, Dict[int, Transaction]]" = OrderedDict()
+        self._cached_segments = cached_segments
+        self._lock = threading.Lock()
+
+    @property
+    def directory(self) -> str:
+        # A fresh directory per instance: ledger positions are per process, so two workers
+        # sharing a root must not share segment names
+        if self._directory is None:
+            if self._root is not None:
+                os.makedirs(self._root, exist_ok=True)
+            self._directory = tempfile.mkdtemp(prefix="bank_transaction_archive_", dir=self._root)
+        return self._directory
+
+    def close(self) -> None:
+        # The index lives in memory, so segments are unreachable once the process exits; they
+        # are removed rather than left behind under the root after every restart
+        with self._lock:
+            directory, self._directory = self._directory, None
+            self._decoded.clear()
+        if directory is not None:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    def write_segment(self, first_position: int, transactions: Sequence[Transaction]) -> None:
+        # Positions first_position .. first_position + len(transactions) - 1, in ledger order
+        by_account: Dict[UUID, List[Tuple[int, Transaction]]] = {}
+        for offset, transaction in enumerate(transactions):
+            row = (first_position + offset, transaction)
+            by_account.setdefault(transaction.account_id, []).append(row)
+            destination = transaction.destination_account_id
+            if destination is not None and destination != transaction.account_id:
+                by_account.setdefault(destination, []).append(row)
+
+        end_position = first_position + len(transactions)
+        path = os.path.join(self.directory, f"transactions-{first_position:012d}-{end_position:012d}.seg")
+        segment = len(self._segments)
+        index: List[Tuple[UUID, ArchivedBlock]] = []
+        extents = []
+        offset = 0
+        # Written under a temporary name and renamed, so a crash never leaves half a segment
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            for account_id, rows in by_account.items():
+                block = zlib.compress(b"".join(_encode(position, transaction) for position, transaction in rows))
+                f.write(block)
+                timestamps = [transaction.timestamp for _, transaction in rows]
+                index.append((account_id, ArchivedBlock(segment, offset, len(block), min(timestamps), max(timestamps))))
+                extents.append((offset, len(block)))
+                offset += len(block)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._segments.append(_Segment(path, first_position, end_position, tuple(extents)))
+            self._segment_starts.append(first_position)
+            for account_id, block in index:
+                self._blocks.setdefault(account_id, []).append(block)
+
+    def _read_block(self, segment: _Segment, offset: int, length: int) -> List[Tuple[int, Transaction]]:
+        with open(segment.path, "rb") as f:
+            f.seek(offset)
+            return _decode(zlib.decompress(f.read(length)))
+
+    def _decoded_segment(self, segment_number: int) -> Dict[int, Transaction]:
+        with self._lock:
+            decoded = self._decoded.get(segment_number)
+            if decoded is not None:
+                self._decoded.move_to_end(segment_number)
+                return decoded
+        segment = self._segments[segment_number]
+        decoded = {}
+        with open(segment.path, "rb") as f:
+            data = f.read()
+        for offset, length in segment.blocks:
+            decoded.update(_decode(zlib.decompress(data[offset:offset + length])))
+        with self._lock:
+            self._decoded[segment_number] = decoded
+            while len(self._decoded) > self._cached_segments:
+                self._decoded.popitem(last=False)
+        return decoded
+
+    def _account_rows(
+        self,
+        account_id: UUID,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        segments: Optional[int],
+    ) -> Iterator[Transaction]:
+        # segments limits the read to the first n segments, those a caller has already
+        # dropped from its hot tier
+        for block in self._blocks.get(account_id, ()):
+            if segments is not None and block.segment >= segments:
+                break
+            # The time-range index lets a statement skip blocks it cannot need
+            if (start is not None and block.last_timestamp < start) or (end is not None and block.first_timestamp > end):
+                continue
+            for _, transaction in self._read_block(self._segments[block.segment], block.offset, block.length):
+                yield transaction
+
+    def get_transactions_for_account(
+        self,
+        account_id: UUID,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        segments: Optional[int] = None,
+    ) -> List[Transaction]:
+        # Transactions are listed under their source account, as in the hot tier
+        return [
+            transaction for transaction in self._account_rows(account_id, start, end, segments)
+            if transaction.account_id == account_id
+            and (start is None or transaction.timestamp >= start) and (end is None or transaction.timestamp <= end)
+        ]
+
+    def get_postings_for_account(self, account_id: UUID, segments: Optional[int] = None) -> List[Tuple[Transaction, bool]]:
+        # Every archived posting to the account in ledger order, with whether it was the paying
+        # side; a transfer to itself posts twice, paying side first
+        result = []
+        for transaction in self._account_rows(account_id, None, None, segments):
+            if transaction.account_id == account_id:
+                result.append((transaction, True))
+            if transaction.destination_account_id == account_id:
+                result.append((transaction, False))
+        return result
+
+    def get_ledger_range(self, start_position: int, end_position: int) -> List[Transaction]:
+        result = []
+        first = max(0, bisect_right(self._segment_starts, start_position) - 1)
+        for segment_number in range(first, len(self._segments)):
+            if self._segments[segment_number].first_position >= end_position:
+                break
+            decoded = self._decoded_segment(segment_number)
+            result.extend(decoded[p] for p in sorted(decoded) if start_position <= p < end_position)
+        return result
@@ -1,26 +1,328 @@
+import threading
 from abc import ABC, abstractmethod
-from typing import List
+from collections import Counter
+from dataclasses import dataclass
+from datetime import date, datetime
+from itertools import islice
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 from uuid import UUID
 
+from domain.entities.money import Cents
 from domain.entities.transaction import Transaction
+from domain.services.ledger_checksum import MASK_64, posting_checksum, postings
+from infrastructure.repositories.sorted_index import SortedIndex
+from infrastructure.repositories.transaction_archive import TransactionArchive
+
+# Postings per ledger segment: the unit a reconciliation replays
+SEGMENT_SIZE = 4096
+
+@dataclass
+class AccountActivity:
+    account_id: UUID
+    volume: Cents
+    count: int
+
+@dataclass(frozen=True)
+class SegmentDigest:
+    count: int
+    net: Cents
+    checksum: int
 
 class TransactionRepository(ABC):
+    # Called with every batch of saved transactions while the save still holds the write lock,
+    # so listeners see saves in ledger order
+    save_listeners: Tuple[Callable[[Sequence[Transaction]], None], ...] = ()
+
+    def add_save_listener(self, listener: Callable[[Sequence[Transaction]], None]) -> None:
+        self.save_listeners += (listener,)
+
     @abstractmethod
-    def get_transactions_for_account(self, account_id: UUID) -> List[Transaction]:
+    def get_transactions_for_account(
+        self, account_id: UUID, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> List[Transaction]:
+        # Inclusive time range; either end may be left open
         pass
 
     @abstractmethod
     def save_transaction(self, transaction: Transaction) -> None:
         pass
 
-class InMemoryTransactionRepository(TransactionRepository):
+    def save_transactions(self, transactions: Sequence[Transaction]) -> None:
+        for transaction in transactions:
+            self.save_transaction(transaction)
+
+    @abstractmethod
+    def get_transactions_since(self, position: int, limit: Optional[int] = None) -> List[Transaction]:
+        pass
+
+    @abstractmethod
+    def get_ledger_position(self) -> int:
+        # The position the next saved transaction will take
+        pass
+
+    @abstractmethod
+    def top_accounts_by_volume(self, day: date, limit: int) -> List[AccountActivity]:
+        pass
+
+    @abstractmethod
+    def get_ledger_digest(self, account_id: UUID) -> Tuple[Cents, int]:
+        # (net balance change, posting count) over the account's whole history
+        pass
+
+    @abstractmethod
+    def get_segment_digests(self, account_id: UUID, first_segment: int = 0) -> List[SegmentDigest]:
+        pass
+
+    @abstractmethod
+    def get_segment_postings(self, account_id: UUID, segment: int) -> List[Tuple[Transaction, bool]]:
+        # The segment's transactions, each with whether the account was the paying side
+        pass
+
+    def get_postings_by_segment(
+        self, account_id: UUID, first_segment: int, segment_count: int
+    ) -> List[List[Tuple[Transaction, bool]]]:
+        # segment_count consecutive segments at once, for callers replaying many of them
+        return [self.get_segment_postings(account_id, segment) for segment in range(first_segment, first_segment + segment_count)]
+
+    def archive_before(self, cutoff: datetime, limit: Optional[int] = None) -> int:
+        # Moves up to limit transactions older than cutoff to cold storage; returns how many moved
+        return 0
+
+class DailyActivityRanking:
+    # Per-account volume for one UTC day plus a sorted (volume, id) index, so the top k is read
+    # straight off the end of the index. Volume counts both sides of a transfer.
+
     def __init__(self):
+        self.day: Optional[date] = None
+        self._volumes: Dict[int, Cents] = {}
+        self._counts: Dict[int, int] = {}
+        self._ranking = SortedIndex()
+
+    def _add(self, id_int: int, amount: Cents) -> None:
+        volume = self._volumes.get(id_int)
+        if volume is not None:
+            self._ranking.remove((volume, id_int))
+        else:
+            volume = 0
+        volume += amount
+        self._volumes[id_int] = volume
+        self._counts[id_int] = self._counts.get(id_int, 0) + 1
+        self._ranking.add((volume, id_int))
+
+    def record(self, transaction: Transaction) -> None:
+        day = transaction.timestamp.date()
+        if self.day is None or day > self.day:
+            self.day = day
+            self._volumes = {}
+            self._counts = {}
+            self._ranking = SortedIndex()
+        elif day < self.day:
+            # Late or backfilled rows for an earlier day do not count towards today
+            return
+        self._add(transaction.account_id.int, transaction.amount)
+        if transaction.destination_account_id is not None:
+            self._add(transaction.destination_account_id.int, transaction.amount)
+
+    def top(self, day: date, limit: int) -> List[AccountActivity]:
+        if day != self.day:
+            return []
+        return [
+            AccountActivity(account_id=UUID(int=id_int), volume=volume, count=self._counts[id_int])
+            for volume, id_int in islice(reversed(self._ranking), limit)
+        ]
+
+class _AccountLedger:
+    # Running digest of every posting to one account, kept per SEGMENT_SIZE postings so a
+    # reconciliation can check the totals in O(1) and replay only the segments in question
+    __slots__ = ("postings", "archived", "net", "segment_nets", "segment_checksums")
+
+    def __init__(self):
+        # ledger position * 2 + 1 for the receiving side of a transfer, so a transfer between
+        # an account and itself still posts twice. Only hot postings are kept; the first
+        # `archived` have moved to the archive, which is read for them instead.
+        self.postings: List[int] = []
+        self.archived = 0
+        self.net: Cents = 0
+        self.segment_nets: List[Cents] = []
+        self.segment_checksums: List[int] = []
+
+    @property
+    def count(self) -> int:
+        return self.archived + len(self.postings)
+
+    def add(self, posting: int, transaction_id: int, effect: Cents) -> None:
+        segment = self.count // SEGMENT_SIZE
+        if segment == len(self.segment_nets):
+            self.segment_nets.append(0)
+            self.segment_checksums.append(0)
+        self.postings.append(posting)
+        self.net += effect
+        self.segment_nets[segment] += effect
+        self.segment_checksums[segment] = (self.segment_checksums[segment] + posting_checksum(transaction_id, effect)) & MASK_64
+
+def _in_range(transactions: List[Transaction], start: Optional[datetime], end: Optional[datetime]) -> List[Transaction]:
+    if start is None and end is None:
+        return transactions
+    return [
+        t for t in transactions
+        if (start is None or t.timestamp >= start) and (end is None or t.timestamp <= end)
+    ]
+
+class InMemoryTransactionRepository(TransactionRepository):
+    # Hot tier: recent transactions as live objects. With an archive, archive_before moves the
+    # oldest stretch of the ledger to compressed segment files, so memory tracks recent activity
+    # rather than total history; reads merge both tiers. Ledger positions stay absolute, with
+    # self.ledger[0] at position self._base.
+
+    def __init__(self, archive: Optional[TransactionArchive] = None):
         self.transactions: dict[UUID, List[Transaction]] = {}
+        # Every hot transaction in save order, so readers can pick up only what is new since their last position
+        self.ledger: List[Transaction] = []
+        self.activity = DailyActivityRanking()
+        self.archive = archive
+        self._ledgers: Dict[UUID, _AccountLedger] = {}
+        self._base = 0
+        # Archive segments whose transactions have left the hot tier
+        self._archived_segments = 0
+        self._lock = threading.Lock()
+        self._archive_lock = threading.Lock()
 
-    def get_transactions_for_account(self, account_id: UUID) -> List[Transaction]:
-        return self.transactions.get(account_id, [])
+    def get_transactions_for_account(
+        self, account_id: UUID, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> List[Transaction]:
+        if not self._archived_segments:
+            return _in_range(self.transactions.get(account_id, []), start, end)
+        # Snapshot both tiers together so a concurrent archive run neither hides nor repeats rows
+        with self._lock:
+            hot = list(self.transactions.get(account_id, []))
+            segments = self._archived_segments
+        cold = self.archive.get_transactions_for_account(account_id, start, end, segments)
+        return cold + _in_range(hot, start, end)
 
     def save_transaction(self, transaction: Transaction) -> None:
-        if transaction.account_id not in self.transactions:
-            self.transactions[transaction.account_id] = []
-        self.transactions[transaction.account_id].append(transaction)
\ No newline at end of file
+        with self._lock:
+            if transaction.account_id not in self.transactions:
+                self.transactions[transaction.account_id] = []
+            self.transactions[transaction.account_id].append(transaction)
+            self._post(self._base + len(self.ledger), transaction)
+            self.ledger.append(transaction)
+            self.activity.record(transaction)
+            for listener in self.save_listeners:
+                listener((transaction,))
+
+    def save_transactions(self, transactions: Sequence[Transaction]) -> None:
+        with self._lock:
+            position = self._base + len(self.ledger)
+            self.ledger.extend(transactions)
+            for offset, transaction in enumerate(transactions):
+                self.transactions.setdefault(transaction.account_id, []).append(transaction)
+                self._post(position + offset, transaction)
+                self.activity.record(transaction)
+            for listener in self.save_listeners:
+                listener(transactions)
+
+    def archive_before(self, cutoff: datetime, limit: Optional[int] = None) -> int:
+        if self.archive is None:
+            return 0
+        with self._archive_lock:
+            # Only a prefix of the ledger moves, so positions and per-account order stay intact;
+            # a late row with an old timestamp waits until everything before it has aged too
+            with self._lock:
+                count = 0
+                for transaction in islice(self.ledger, limit):
+                    if transaction.timestamp >= cutoff:
+                        break
+                    count += 1
+                batch = self.ledger[:count]
+                first_position = self._base
+            if not batch:
+                return 0
+            # The slow part runs unlocked; the rows stay readable from the hot tier meanwhile
+            self.archive.write_segment(first_position, batch)
+            per_account = Counter(transaction.account_id for transaction in batch)
+            per_posting_account = Counter(account_id for transaction in batch for account_id, _ in postings(transaction))
+            with self._lock:
+                del self.ledger[:count]
+                self._base += count
+                self._archived_segments += 1
+                for account_id, archived in per_account.items():
+                    del self.transactions[account_id][:archived]
+                for account_id, archived in per_posting_account.items():
+                    account_ledger = self._ledgers[account_id]
+                    del account_ledger.postings[:archived]
+                    account_ledger.archived += archived
+        return count
+
+    def _post(self, position: int, transaction: Transaction) -> None:
+        transaction_id = transaction.transaction_id.int
+        for side, (account_id, effect) in enumerate(postings(transaction)):
+            account_ledger = self._ledgers.get(account_id)
+            if account_ledger is None:
+                account_ledger = self._ledgers[account_id] = _AccountLedger()
+            account_ledger.add(position * 2 + side, transaction_id, effect)
+
+    def get_transactions_since(self, position: int, limit: Optional[int] = None) -> List[Transaction]:
+        with self._lock:
+            base = self._base
+            stop = None if limit is None else max(0, position + limit - base)
+            hot = self.ledger[max(0, position - base):stop]
+        if position >= base:
+            return hot
+        cold_end = base if limit is None else min(base, position + limit)
+        return self.archive.get_ledger_range(position, cold_end) + hot
+
+    def get_ledger_position(self) -> int:
+        with self._lock:
+            return self._base + len(self.ledger)
+
+    def top_accounts_by_volume(self, day: date, limit: int) -> List[AccountActivity]:
+        return self.activity.top(day, limit)
+
+    def get_ledger_digest(self, account_id: UUID) -> Tuple[Cents, int]:
+        account_ledger = self._ledgers.get(account_id)
+        if account_ledger is None:
+            return 0, 0
+        return account_ledger.net, account_ledger.count
+
+    def get_segment_digests(self, account_id: UUID, first_segment: int = 0) -> List[SegmentDigest]:
+        account_ledger = self._ledgers.get(account_id)
+        if account_ledger is None:
+            return []
+        count = account_ledger.count
+        return [
+            SegmentDigest(
+                count=min(SEGMENT_SIZE, count - segment * SEGMENT_SIZE),
+                net=account_ledger.segment_nets[segment],
+                checksum=account_ledger.segment_checksums[segment],
+            )
+            for segment in range(first_segment, len(account_ledger.segment_nets))
+        ]
+
+    def _postings(self, account_id: UUID, start: int, end: int) -> List[Tuple[Transaction, bool]]:
+        # The account's postings start..end-1 across both tiers; the archived part is read from
+        # the account's own blocks in one pass, however many segments it spans
+        account_ledger = self._ledgers.get(account_id)
+        if account_ledger is None:
+            return []
+        with self._lock:
+            archived = account_ledger.archived
+            base = self._base
+            segments = self._archived_segments
+            hot = [
+                (self.ledger[(posting >> 1) - base], not posting & 1)
+                for posting in account_ledger.postings[max(0, start - archived):max(0, end - archived)]
+            ]
+        if start >= archived:
+            return hot
+        cold = self.archive.get_postings_for_account(account_id, segments)
+        return cold[start:min(end, archived)] + hot
+
+    def get_segment_postings(self, account_id: UUID, segment: int) -> List[Tuple[Transaction, bool]]:
+        return self._postings(account_id, segment * SEGMENT_SIZE, (segment + 1) * SEGMENT_SIZE)
+
+    def get_postings_by_segment(
+        self, account_id: UUID, first_segment: int, segment_count: int
+    ) -> List[List[Tuple[Transaction, bool]]]:
+        start = first_segment * SEGMENT_SIZE
+        rows = self._postings(account_id, start, start + segment_count * SEGMENT_SIZE)
+        return [rows[offset:offset + SEGMENT_SIZE] for offset in range(0, segment_count * SEGMENT_SIZE, SEGMENT_SIZE)]
@@ -1,17 +1,76 @@
-from fastapi import FastAPI
+import math
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, PlainTextResponse
 from presentation.api.accounts import router as accounts_router
 from presentation.api.notifications import router as notifications_router
 from presentation.api.statements import router as statements_router
 from presentation.api.transfers import router as transfers_router
+from presentation.api.admin import router as admin_router
+from presentation.api.analytics import router as analytics_router
+from presentation.api.rankings import router as rankings_router
+from presentation.api.standing_orders import router as standing_orders_router
+from presentation.api.holds import router as holds_router
+from presentation.api.exports import router as exports_router
+from presentation.api.changes import router as changes_router
 from infrastructure.repositories.shared_repositories import account_repo, transaction_repo
+from infrastructure.adapters.metrics_adapter import banking_metrics, metrics_registry
+from infrastructure.adapters.profiling_adapter import profiling_adapter
+from infrastructure.adapters.idempotency_adapter import idempotency_cache
+from presentation.container import services
+from presentation.middleware.metrics_middleware import MetricsMiddleware
+from presentation.middleware.profiling_middleware import ProfilingMiddleware
+from presentation.middleware.idempotency_middleware import IdempotencyMiddleware
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    services.standing_order_scheduler.start()
+    services.hold_expiry_scheduler.start()
+    services.archival_scheduler.start()
+    yield
+    services.archival_scheduler.stop(timeout=5)
+    services.hold_expiry_scheduler.stop(timeout=5)
+    services.standing_order_scheduler.stop(timeout=5)
+    if transaction_repo.archive is not None:
+        transaction_repo.archive.close()
 
-app = FastAPI(title="Simple Banking Application")
+app = FastAPI(title="Simple Banking Application", lifespan=lifespan)
+app.add_middleware(
+    IdempotencyMiddleware,
+    cache=idempotency_cache,
+    paths=[r"/accounts/bulk", r"/accounts/[^/]+/deposit", r"/accounts/[^/]+/withdraw", r"/accounts/transfer", r"/transfers/?", r"/transfers/netted", r"/standing-orders/?", r"/holds/?", r"/holds/[^/]+/capture"]
+)
+app.add_middleware(ProfilingMiddleware, profiler=profiling_adapter, excluded_paths=[r"/changes.*"])
+app.add_middleware(MetricsMiddleware, metrics=banking_metrics)
+
+@app.exception_handler(RequestValidationError)
+async def validation_error(request: Request, exc: RequestValidationError):
+    # Errors echo the offending input, and NaN or Infinity would make the 422 body unencodable
+    detail = jsonable_encoder(exc.errors(), custom_encoder={float: lambda value: value if math.isfinite(value) else str(value)})
+    return JSONResponse(status_code=422, content={"detail": detail})
 
 app.include_router(accounts_router, prefix="/accounts", tags=["Accounts"])
 app.include_router(notifications_router, prefix="/notifications", tags=["Notifications"])
 app.include_router(statements_router, prefix="/statements", tags=["Statements"])
 app.include_router(transfers_router, prefix="/transfers", tags=["Transfers"])
+app.include_router(admin_router, prefix="/admin", tags=["Admin"])
+app.include_router(analytics_router, prefix="/analytics", tags=["Analytics"])
+app.include_router(rankings_router, prefix="/rankings", tags=["Rankings"])
+app.include_router(standing_orders_router, prefix="/standing-orders", tags=["Standing Orders"])
+app.include_router(holds_router, prefix="/holds", tags=["Holds"])
+app.include_router(exports_router, prefix="/exports", tags=["Exports"])
+app.include_router(changes_router, prefix="/changes", tags=["Changes"])
 
 @app.get("/health", tags=["Health"])
 async def health_check():
-    return {"status": "ok"}
\ No newline at end of file
+    return {"status": "ok"}
+
+@app.get("/metrics", tags=["Health"], response_class=PlainTextResponse)
+async def metrics():
+    return PlainTextResponse(
+        metrics_registry.expose(),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
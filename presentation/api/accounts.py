@@ -1,46 +1,36 @@
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, status, Depends, Header, Response, Query
 from pydantic import BaseModel, Field
 from uuid import UUID
-from typing import Literal
+from typing import List, Literal, Optional
 from datetime import date, datetime
 
 from domain.entities.account import Account, AccountType, AccountStatus
-from application.services.account_creation_service import AccountCreationService
-from application.services.transaction_service import TransactionService
-from application.services.fund_transfer_service import FundTransferService
-from application.services.interest_service import InterestService
-from application.services.limit_enforcement_service import LimitEnforcementService
-from application.services.notification_service import NotificationService
+from domain.entities.money import to_cents, from_cents
 from domain.exceptions.domain_exceptions import (
+    AccountLockedError,
+    BulkValidationError,
     InsufficientFundsError,
     InvalidAmountError,
     InvalidAccountStatusError,
     AccountNotFoundError,
     TransactionLimitExceededError,
+    RiskCheckFailedError,
 )
+from infrastructure.repositories.account_repository import AccountFilter
 from infrastructure.repositories.shared_repositories import account_repo, transaction_repo
-from infrastructure.adapters.notification_adapter import MockNotificationAdapter
-from infrastructure.adapters.logging_adapter import LoggingAdapter
+from presentation.container import services
+from presentation.api.json_encoding import RawJSONResponse, encode_transactions
 
 router = APIRouter()
 
-# Dependency injection setup
-notification_adapter = MockNotificationAdapter()
-logging_adapter = LoggingAdapter()
-
-# Service initialization
-notification_service = NotificationService(notification_adapter)
-account_creation_service = AccountCreationService(account_repo)
-transaction_service = TransactionService(account_repo, transaction_repo, notification_service)
-fund_transfer_service = logging_adapter.log_method(FundTransferService(account_repo, transaction_repo, notification_service))
-interest_service = InterestService(account_repo, notification_service)
-limit_enforcement_service = logging_adapter.log_method(LimitEnforcementService(account_repo))
-
 # Pydantic models
 class CreateAccountRequest(BaseModel):
     account_type: str
     initial_deposit: float
 
+class BulkCreateAccountsRequest(BaseModel):
+    accounts: List[CreateAccountRequest] = Field(min_length=1, max_length=50_000)
+
 class TransactionRequest(BaseModel):
     amount: float
 
@@ -62,6 +52,7 @@ class AccountResponse(BaseModel):
     balance: float
     status: str
     creation_date: str
+    held_amount: float = 0.0
 
 class TransactionResponse(BaseModel):
     transaction_id: UUID
@@ -71,9 +62,13 @@ class TransactionResponse(BaseModel):
     timestamp: str
     destination_account_id: UUID | None = None
 
+class AccountListResponse(BaseModel):
+    accounts: List[AccountResponse]
+    next_cursor: Optional[str] = None
+
 class LimitResponse(BaseModel):
-    daily_limit: float
-    monthly_limit: float
+    daily_limit: Optional[float] = None
+    monthly_limit: Optional[float] = None
     daily_spent: float
     monthly_spent: float
 
@@ -81,9 +76,9 @@ class LimitResponse(BaseModel):
 async def create_account(request: CreateAccountRequest):
     try:
         # Use the service to create the account
-        account_id = account_creation_service.create_account(
+        account_id = services.account_creation_service.create_account(
             request.account_type,
-            request.initial_deposit
+            to_cents(request.initial_deposit)
         )
         
         # Get the created account
@@ -93,122 +88,210 @@ async def create_account(request: CreateAccountRequest):
         return AccountResponse(
             account_id=account.account_id,
             account_type=account.account_type.value,
-            balance=account.balance,
+            balance=from_cents(account.balance),
+            held_amount=from_cents(account.held_amount),
             status=account.status.value,
             creation_date=account.creation_date.isoformat()
         )
     except (ValueError, InvalidAmountError) as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+def _bulk_errors(errors: dict) -> HTTPException:
+    return HTTPException(
+        status_code=400,
+        detail={"errors": [{"index": index, "detail": detail} for index, detail in sorted(errors.items())]}
+    )
+
+@router.post("/bulk", status_code=status.HTTP_201_CREATED)
+async def create_accounts(request: BulkCreateAccountsRequest):
+    rows = []
+    errors = {}
+    for index, row in enumerate(request.accounts):
+        try:
+            rows.append((row.account_type, to_cents(row.initial_deposit)))
+        except ValueError as e:
+            errors[index] = str(e)
+    if errors:
+        raise _bulk_errors(errors)
+
+    try:
+        account_ids = services.account_creation_service.create_accounts(rows)
+    except BulkValidationError as e:
+        raise _bulk_errors(e.errors)
+    # Ids are rendered directly; tens of thousands of UUIDs are not worth a response model
+    body = '{"account_ids":["' + '","'.join(map(str, account_ids)) + '"]}'
+    return RawJSONResponse(body.encode(), status_code=status.HTTP_201_CREATED)
+
 @router.post("/{account_id}/deposit", response_model=TransactionResponse)
 async def deposit(account_id: UUID, request: TransactionRequest):
     try:
-        transaction = transaction_service.deposit(account_id, request.amount)
+        transaction = services.transaction_service.deposit(account_id, to_cents(request.amount))
         return TransactionResponse(
             transaction_id=transaction.transaction_id,
             account_id=transaction.account_id,
             transaction_type=transaction.transaction_type.value,
-            amount=transaction.amount,
+            amount=from_cents(transaction.amount),
             timestamp=transaction.timestamp.isoformat(),
             destination_account_id=transaction.destination_account_id,
         )
-    except (AccountNotFoundError, InvalidAmountError, InvalidAccountStatusError, TransactionLimitExceededError) as e:
+    except (AccountNotFoundError, InvalidAmountError, InvalidAccountStatusError, TransactionLimitExceededError, ValueError) as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.post("/{account_id}/withdraw", response_model=TransactionResponse)
 async def withdraw(account_id: UUID, request: TransactionRequest):
     try:
-        transaction = transaction_service.withdraw(account_id, request.amount)
+        transaction = services.transaction_service.withdraw(account_id, to_cents(request.amount))
         return TransactionResponse(
             transaction_id=transaction.transaction_id,
             account_id=transaction.account_id,
             transaction_type=transaction.transaction_type.value,
-            amount=transaction.amount,
+            amount=from_cents(transaction.amount),
             timestamp=transaction.timestamp.isoformat(),
             destination_account_id=transaction.destination_account_id,
         )
-    except (AccountNotFoundError, InvalidAmountError, InvalidAccountStatusError) as e:
+    except (AccountNotFoundError, InvalidAmountError, InvalidAccountStatusError, InsufficientFundsError, TransactionLimitExceededError, ValueError) as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except (RiskCheckFailedError, AccountLockedError) as e:
+        raise HTTPException(status_code=403, detail=str(e))
 
 @router.post("/transfer", response_model=TransactionResponse)
 async def transfer(request: TransferRequest):
     try:
-        transaction = fund_transfer_service.transfer_funds(
+        transaction = services.fund_transfer_service.transfer_funds(
             request.source_account_id,
             request.destination_account_id,
-            request.amount
+            to_cents(request.amount)
         )
         return TransactionResponse(
             transaction_id=transaction.transaction_id,
             account_id=transaction.account_id,
             transaction_type=transaction.transaction_type.value,
-            amount=transaction.amount,
+            amount=from_cents(transaction.amount),
             timestamp=transaction.timestamp.isoformat(),
             destination_account_id=transaction.destination_account_id,
         )
-    except (AccountNotFoundError, InvalidAmountError, InsufficientFundsError, TransactionLimitExceededError) as e:
+    except (AccountNotFoundError, InvalidAmountError, InsufficientFundsError, TransactionLimitExceededError, ValueError) as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except (RiskCheckFailedError, AccountLockedError) as e:
+        raise HTTPException(status_code=403, detail=str(e))
 
 @router.post("/{account_id}/interest/calculate")
 async def calculate_interest(account_id: UUID, request: InterestRequest):
     try:
-        interest = interest_service.apply_interest_to_account(account_id)
-        return {"interest_applied": interest}
+        interest = services.interest_service.apply_interest_to_account(account_id)
+        return {"interest_applied": from_cents(interest)}
     except AccountNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
 @router.patch("/{account_id}/limits")
 async def update_limits(account_id: UUID, request: LimitRequest):
     try:
-        limit_enforcement_service.set_limits(
+        services.limit_enforcement_service.set_limits(
             account_id=account_id,
-            daily_limit=request.daily_limit,
-            monthly_limit=request.monthly_limit
+            daily_limit=to_cents(request.daily_limit),
+            monthly_limit=to_cents(request.monthly_limit)
         )
         return {"message": "Limits updated successfully"}
     except AccountNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+def _etag(version: int) -> str:
+    # The store's epoch keeps a tag from before a restart from matching a reset counter
+    return f'"{account_repo.epoch:x}-{version}"'
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if if_none_match is None:
+        return False
+    if if_none_match == etag or if_none_match.strip() == "*":
+        return True
+    return etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+
+@router.get("/", response_model=AccountListResponse)
+async def list_accounts(
+    account_type: Optional[AccountType] = None,
+    account_status: Optional[AccountStatus] = Query(None, alias="status"),
+    is_locked: Optional[bool] = None,
+    min_balance: Optional[float] = None,
+    max_balance: Optional[float] = None,
+    below_minimum_balance: bool = False,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+):
+    try:
+        account_filter = AccountFilter(
+            account_type=account_type,
+            status=account_status,
+            is_locked=is_locked,
+            min_balance=to_cents(min_balance) if min_balance is not None else None,
+            max_balance=to_cents(max_balance) if max_balance is not None else None,
+            below_minimum_balance=below_minimum_balance,
+        )
+        accounts, next_cursor = services.account_listing_service.list_accounts(account_filter, cursor, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return AccountListResponse(
+        accounts=[
+            AccountResponse(
+                account_id=account.account_id,
+                account_type=account.account_type.value,
+                balance=from_cents(account.balance),
+                held_amount=from_cents(account.held_amount),
+                status=account.status.value,
+                creation_date=account.creation_date.isoformat()
+            )
+            for account in accounts
+        ],
+        next_cursor=next_cursor
+    )
+
 @router.get("/{account_id}", response_model=AccountResponse)
-async def get_account(account_id: UUID):
-    account = account_repo.get_account_by_id(account_id)
-    if not account:
+async def get_account(account_id: UUID, response: Response, if_none_match: Optional[str] = Header(None)):
+    # Answer conditional polls from the version counter alone, before touching the account
+    version = account_repo.get_account_version(account_id)
+    if version is None:
         raise HTTPException(status_code=404, detail=f"Account {account_id} not found")
+    etag = _etag(version)
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    # Tagged with the version the body was read at, which a concurrent write may have moved on
+    account, version = account_repo.get_account_with_version(account_id)
+    response.headers["ETag"] = _etag(version)
     return AccountResponse(
         account_id=account.account_id,
         account_type=account.account_type.value,
-        balance=account.balance,
+        balance=from_cents(account.balance),
+        held_amount=from_cents(account.held_amount),
         status=account.status.value,
         creation_date=account.creation_date.isoformat()
     )
 
 @router.get("/{account_id}/transactions", response_model=list[TransactionResponse])
-async def get_transactions(account_id: UUID):
+def get_transactions(account_id: UUID):
+    # Sync so the threadpool absorbs reads of archived segments
     transactions = transaction_repo.get_transactions_for_account(account_id)
-    return [
-        TransactionResponse(
-            transaction_id=tx.transaction_id,
-            account_id=tx.account_id,
-            transaction_type=tx.transaction_type.value,
-            amount=tx.amount,
-            timestamp=tx.timestamp.isoformat(),
-            destination_account_id=tx.destination_account_id,
-        )
-        for tx in transactions
-    ]
+    # Bypass per-row model construction and validation; the shape still matches TransactionResponse
+    return RawJSONResponse(encode_transactions(transactions))
 
 @router.get("/{account_id}/limits", response_model=LimitResponse)
-async def get_limits(account_id: UUID):
-    account = account_repo.get_account_by_id(account_id)
-    if not account:
+async def get_limits(account_id: UUID, response: Response, if_none_match: Optional[str] = Header(None)):
+    version = account_repo.get_account_version(account_id)
+    if version is None:
         raise HTTPException(status_code=404, detail="Account not found")
-    daily_limit = account.limit_constraint.daily_limit if account.limit_constraint else float('inf')
-    monthly_limit = account.limit_constraint.monthly_limit if account.limit_constraint else float('inf')
+    etag = _etag(version)
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    account, version = account_repo.get_account_with_version(account_id)
+    response.headers["ETag"] = _etag(version)
+    # No limit configured is reported as null; infinity is not representable in JSON
+    daily_limit = from_cents(account.limit_constraint.daily_limit) if account.limit_constraint else None
+    monthly_limit = from_cents(account.limit_constraint.monthly_limit) if account.limit_constraint else None
     return LimitResponse(
         daily_limit=daily_limit,
         monthly_limit=monthly_limit,
-        daily_spent=account.daily_spent,
-        monthly_spent=account.monthly_spent
+        daily_spent=from_cents(account.daily_spent),
+        monthly_spent=from_cents(account.monthly_spent)
     )
\ No newline at end of file
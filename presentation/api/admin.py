@@ -0,0 +1,72 @@
+from fastapi import APIRouter, HTTPException, Header
+from pydantic import BaseModel, Field
+from uuid import UUID
+from typing import Optional
+
+from domain.entities.money import from_cents
+from infrastructure.adapters.profiling_adapter import profiling_adapter, ProfileRecord
+from presentation.container import services
+
+router = APIRouter()
+
+class ProfilingConfigRequest(BaseModel):
+    enabled: bool
+    sample_rate: float = Field(ge=0.0, le=1.0)
+
+def _require_admin(token: Optional[str]) -> None:
+    if not profiling_adapter.is_authorized(token):
+        raise HTTPException(status_code=403, detail="Invalid or missing admin token")
+
+def _profile_summary(record: ProfileRecord) -> dict:
+    return {
+        "profile_id": str(record.profile_id),
+        "method": record.method,
+        "route": record.route,
+        "duration": record.duration,
+        "captured_at": record.captured_at.isoformat(),
+        "file_path": record.file_path
+    }
+
+@router.get("/profiling")
+async def get_profiling_config(x_admin_token: Optional[str] = Header(None)):
+    _require_admin(x_admin_token)
+    return {"enabled": profiling_adapter.enabled, "sample_rate": profiling_adapter.sample_rate}
+
+@router.put("/profiling")
+async def update_profiling_config(request: ProfilingConfigRequest, x_admin_token: Optional[str] = Header(None)):
+    _require_admin(x_admin_token)
+    profiling_adapter.configure(request.enabled, request.sample_rate)
+    return {"enabled": profiling_adapter.enabled, "sample_rate": profiling_adapter.sample_rate}
+
+@router.get("/profiling/profiles")
+async def list_profiles(x_admin_token: Optional[str] = Header(None)):
+    _require_admin(x_admin_token)
+    return [_profile_summary(record) for record in profiling_adapter.list_profiles()]
+
+@router.get("/profiling/profiles/{profile_id}")
+async def get_profile(profile_id: UUID, x_admin_token: Optional[str] = Header(None)):
+    _require_admin(x_admin_token)
+    record = profiling_adapter.get_profile(profile_id)
+    if not record:
+        raise HTTPException(status_code=404, detail=f"Profile {profile_id} not found")
+    return {**_profile_summary(record), "hot_spots": record.hot_spots}
+
+@router.post("/reconciliation")
+# A plain def: the replay blocks for seconds, so it runs in the threadpool, not on the event loop
+def run_reconciliation(full: bool = False, x_admin_token: Optional[str] = Header(None)):
+    _require_admin(x_admin_token)
+    report = services.reconciliation_service.reconcile(full=full)
+    return {
+        "accounts_checked": report.accounts_checked,
+        "segments_replayed": report.segments_replayed,
+        "discrepancies": [
+            {
+                "account_id": str(discrepancy.account_id),
+                "balance": from_cents(discrepancy.balance),
+                "expected_balance": from_cents(discrepancy.expected_balance),
+                "replayed_balance": from_cents(discrepancy.replayed_balance),
+                "corrupt_segments": discrepancy.corrupt_segments,
+            }
+            for discrepancy in report.discrepancies
+        ],
+    }
\ No newline at end of file
@@ -0,0 +1,42 @@
+from fastapi import APIRouter, HTTPException, Query
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from domain.entities.money import from_cents
+from presentation.container import services
+
+router = APIRouter()
+
+def _naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+def _row(row) -> dict:
+    key = {
+        dimension: value.isoformat() if isinstance(value, datetime) else value
+        for dimension, value in row.key.items()
+    }
+    return {**key, "count": row.count, "total": from_cents(row.total)}
+
+@router.get("/transactions")
+async def aggregate_transactions(
+    group_by: List[str] = Query([], description="Any of transaction_type, account_type, account_status, hour, day"),
+    start: Optional[datetime] = Query(None),
+    end: Optional[datetime] = Query(None),
+):
+    try:
+        rows = services.analytics_service.aggregate_transactions(group_by, _naive_utc(start), _naive_utc(end))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"group_by": group_by, "rows": [_row(row) for row in rows]}
+
+@router.get("/accounts")
+async def aggregate_accounts(
+    group_by: List[str] = Query([], description="Any of account_type, account_status"),
+):
+    try:
+        rows = services.analytics_service.aggregate_accounts(group_by)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"group_by": group_by, "rows": [_row(row) for row in rows]}
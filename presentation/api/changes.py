@@ -0,0 +1,64 @@
+from typing import AsyncIterator, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Header, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+
+from infrastructure.adapters.change_feed_adapter import (
+    TRANSACTION,
+    ChangeEvent,
+    CursorExpiredError,
+    Subscription,
+    change_broadcaster,
+)
+from presentation.api.json_encoding import encode_account_change, encode_transaction
+
+router = APIRouter()
+
+# Idle streams send a comment this often, which is also how a closed client gets noticed
+HEARTBEAT_SECONDS = 15.0
+
+def _format(event: ChangeEvent) -> str:
+    data = encode_transaction(event.data) if event.kind == TRANSACTION else encode_account_change(event.data)
+    return f"id: {event.sequence}\nevent: {event.kind}\ndata: {data}\n\n"
+
+async def _stream(request: Request, subscription: Subscription) -> AsyncIterator[str]:
+    try:
+        yield "retry: 3000\n\n"
+        while True:
+            events = await subscription.next_events(HEARTBEAT_SECONDS)
+            if events:
+                yield "".join(map(_format, events))
+            if subscription.dropped:
+                # The client reconnects with Last-Event-ID and replays whatever history still covers
+                yield 'event: dropped\ndata: {"reason":"subscriber fell too far behind"}\n\n'
+                return
+            if not events:
+                if await request.is_disconnected():
+                    return
+                yield ": keepalive\n\n"
+    finally:
+        change_broadcaster.unsubscribe(subscription)
+
+@router.get("")
+async def stream_changes(
+    request: Request,
+    account_id: Optional[UUID] = Query(None, description="Only changes touching this account"),
+    cursor: Optional[int] = Query(None, ge=0, description="Resume after this event id"),
+    last_event_id: Optional[str] = Header(None),
+):
+    # EventSource sends Last-Event-ID by itself when it reconnects
+    if cursor is None and last_event_id:
+        try:
+            cursor = int(last_event_id)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Last-Event-ID must be an event id")
+    try:
+        subscription = change_broadcaster.subscribe(account_id, cursor)
+    except CursorExpiredError as e:
+        raise HTTPException(status_code=410, detail=str(e))
+    return StreamingResponse(
+        _stream(request, subscription),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
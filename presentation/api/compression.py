@@ -0,0 +1,36 @@
+import zlib
+from typing import Iterable, Iterator, Optional
+
+# gzip framing for zlib; level 6 is the usual balance of ratio against CPU
+GZIP_WBITS = 31
+GZIP_LEVEL = 6
+
+def accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    if not accept_encoding:
+        return False
+    qualities = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        qualities[coding.strip().lower()] = quality
+    return qualities.get("gzip", qualities.get("x-gzip", qualities.get("*", 0.0))) > 0
+
+def gzip_bytes(body: bytes) -> bytes:
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, GZIP_WBITS)
+    return compressor.compress(body) + compressor.flush()
+
+def gzip_chunks(chunks: Iterable[str]) -> Iterator[bytes]:
+    # Each chunk is flushed as it arrives, so the client receives compressed data while the
+    # rest is still being generated rather than after the whole body is buffered
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, GZIP_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode()) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        if data:
+            yield data
+    yield compressor.flush()
@@ -0,0 +1,46 @@
+from typing import Iterable, Iterator, Optional, Tuple
+
+from fastapi import APIRouter, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from domain.entities.transaction import Transaction
+from presentation.container import services
+from presentation.api.compression import accepts_gzip, gzip_chunks
+from presentation.api.json_encoding import encode_transaction
+
+router = APIRouter()
+
+# Rows per chunk handed to the response; also the unit each gzip flush covers
+CHUNK_ROWS = 1000
+
+def _ndjson(rows: Iterable[Tuple[int, Transaction]]) -> Iterator[str]:
+    lines = []
+    for position, transaction in rows:
+        # Each row carries its position, so a consumer cut off mid-stream resumes from the last one + 1
+        lines.append(f'{{"position":{position},{encode_transaction(transaction)[1:]}\n')
+        if len(lines) == CHUNK_ROWS:
+            yield "".join(lines)
+            lines = []
+    if lines:
+        yield "".join(lines)
+
+@router.get("/transactions")
+def export_transactions(
+    watermark: int = Query(0, ge=0, description="Ledger position to export from; the previous export's cursor"),
+    limit: Optional[int] = Query(None, ge=1, description="Most rows to return; the cursor then points at the next one"),
+    accept_encoding: Optional[str] = Header(None),
+):
+    try:
+        export = services.export_service.export_since(watermark, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    headers = {
+        "X-Export-Watermark": str(export.watermark),
+        "X-Export-Cursor": str(export.cursor),
+        "Vary": "Accept-Encoding",
+    }
+    chunks = _ndjson(export.rows)
+    if accepts_gzip(accept_encoding):
+        headers["Content-Encoding"] = "gzip"
+        return StreamingResponse(gzip_chunks(chunks), media_type="application/x-ndjson", headers=headers)
+    return StreamingResponse(chunks, media_type="application/x-ndjson", headers=headers)
@@ -0,0 +1,104 @@
+from datetime import timedelta
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, HTTPException, status
+from pydantic import BaseModel, Field
+
+from domain.entities.hold import Hold, DEFAULT_HOLD_TTL
+from domain.entities.money import to_cents, from_cents
+from domain.exceptions.domain_exceptions import (
+    AccountLockedError,
+    AccountNotFoundError,
+    HoldNotFoundError,
+    HoldNotPendingError,
+    InsufficientFundsError,
+    InvalidAmountError,
+    InvalidAccountStatusError,
+    RiskCheckFailedError,
+    TransactionLimitError,
+    TransactionLimitExceededError,
+)
+from presentation.container import services
+
+router = APIRouter()
+
+class PlaceHoldRequest(BaseModel):
+    account_id: UUID
+    amount: float = Field(gt=0.0)
+    ttl_seconds: int = Field(default=int(DEFAULT_HOLD_TTL.total_seconds()), gt=0)
+
+class CaptureHoldRequest(BaseModel):
+    amount: Optional[float] = Field(default=None, gt=0.0)
+
+class HoldResponse(BaseModel):
+    hold_id: UUID
+    account_id: UUID
+    amount: float
+    status: str
+    created_at: str
+    expires_at: str
+    captured_amount: float
+    transaction_id: Optional[UUID] = None
+
+def _to_response(hold: Hold) -> HoldResponse:
+    return HoldResponse(
+        hold_id=hold.hold_id,
+        account_id=hold.account_id,
+        amount=from_cents(hold.amount),
+        status=hold.status.value,
+        created_at=hold.created_at.isoformat(),
+        expires_at=hold.expires_at.isoformat(),
+        captured_amount=from_cents(hold.captured_amount),
+        transaction_id=hold.transaction_id,
+    )
+
+@router.post("/", response_model=HoldResponse, status_code=status.HTTP_201_CREATED)
+async def place_hold(request: PlaceHoldRequest):
+    try:
+        hold = services.hold_service.place_hold(
+            request.account_id, to_cents(request.amount), timedelta(seconds=request.ttl_seconds)
+        )
+    except AccountNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except (InsufficientFundsError, InvalidAmountError, InvalidAccountStatusError, TransactionLimitError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except (RiskCheckFailedError, AccountLockedError) as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    return _to_response(hold)
+
+@router.get("/{hold_id}", response_model=HoldResponse)
+async def get_hold(hold_id: UUID):
+    try:
+        return _to_response(services.hold_service.get_hold(hold_id))
+    except HoldNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+@router.get("/account/{account_id}", response_model=List[HoldResponse])
+async def get_account_holds(account_id: UUID):
+    return [_to_response(hold) for hold in services.hold_service.get_holds_for_account(account_id)]
+
+@router.post("/{hold_id}/capture", response_model=HoldResponse)
+async def capture_hold(hold_id: UUID, request: CaptureHoldRequest):
+    try:
+        services.hold_service.capture_hold(
+            hold_id, to_cents(request.amount) if request.amount is not None else None
+        )
+        return _to_response(services.hold_service.get_hold(hold_id))
+    except (HoldNotFoundError, AccountNotFoundError) as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except HoldNotPendingError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except (InsufficientFundsError, InvalidAmountError, InvalidAccountStatusError, TransactionLimitError, TransactionLimitExceededError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except AccountLockedError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+
+@router.post("/{hold_id}/release", response_model=HoldResponse)
+async def release_hold(hold_id: UUID):
+    try:
+        return _to_response(services.hold_service.release_hold(hold_id))
+    except HoldNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except HoldNotPendingError as e:
+        raise HTTPException(status_code=409, detail=str(e))
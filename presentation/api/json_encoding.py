@@ -0,0 +1,65 @@
+import json
+from typing import Iterable, List
+
+from fastapi import Response
+
+from domain.entities.account import Account
+from domain.entities.money import from_cents
+from domain.entities.transaction import Transaction
+from infrastructure.adapters.statement_adapter import Statement
+
+# Rows are rendered straight to JSON text: UUIDs, enum values and ISO timestamps never need
+# escaping, so there is no need to build pydantic models or run the generic encoder per row.
+
+class RawJSONResponse(Response):
+    media_type = "application/json"
+
+def _optional_uuid(value) -> str:
+    return "null" if value is None else f'"{value}"'
+
+def encode_transaction(transaction: Transaction) -> str:
+    return (
+        f'{{"transaction_id":"{transaction.transaction_id}",'
+        f'"account_id":"{transaction.account_id}",'
+        f'"transaction_type":"{transaction.transaction_type.value}",'
+        f'"amount":{from_cents(transaction.amount)!r},'
+        f'"timestamp":"{transaction.timestamp.isoformat()}",'
+        f'"destination_account_id":{_optional_uuid(transaction.destination_account_id)}}}'
+    )
+
+def encode_account_change(account: Account) -> str:
+    return (
+        f'{{"account_id":"{account.account_id}",'
+        f'"account_type":"{account.account_type.value}",'
+        f'"balance":{from_cents(account.balance)!r},'
+        f'"held_amount":{from_cents(account.held_amount)!r},'
+        f'"status":"{account.status.value}",'
+        f'"is_locked":{"true" if account.is_locked else "false"}}}'
+    )
+
+def encode_transactions(transactions: Iterable[Transaction]) -> bytes:
+    return ("[" + ",".join(map(encode_transaction, transactions)) + "]").encode()
+
+def _encode_statement_row(transaction: Transaction) -> str:
+    return (
+        f'{{"transaction_id":"{transaction.transaction_id}",'
+        f'"type":"{transaction.transaction_type.value}",'
+        f'"amount":{from_cents(transaction.amount)!r},'
+        f'"timestamp":"{transaction.timestamp.isoformat()}"}}'
+    )
+
+def encode_statement(statement: Statement, include_csv: bool = True) -> bytes:
+    parts: List[str] = [
+        f'{{"account_id":"{statement.account.account_id}",'
+        f'"account_type":"{statement.account.account_type.value}",'
+        f'"balance":{from_cents(statement.account.balance)!r},'
+        '"transactions":[',
+        ",".join(map(_encode_statement_row, statement.transactions)),
+        f'],"start_date":"{statement.start_date.isoformat()}",'
+        f'"end_date":"{statement.end_date.isoformat()}"',
+    ]
+    if include_csv:
+        # Free-form text is the only field that needs real JSON escaping
+        parts.append(f',"csv_content":{json.dumps(statement.csv_content)}')
+    parts.append("}")
+    return "".join(parts).encode()
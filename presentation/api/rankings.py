@@ -0,0 +1,38 @@
+from fastapi import APIRouter, HTTPException, Query
+
+from domain.entities.money import from_cents
+from presentation.container import services
+
+router = APIRouter()
+
+@router.get("/balance")
+async def top_by_balance(limit: int = Query(100, ge=1, le=1000)):
+    try:
+        accounts = services.ranking_service.top_by_balance(limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return [
+        {
+            "rank": rank,
+            "account_id": str(account.account_id),
+            "account_type": account.account_type.value,
+            "balance": from_cents(account.balance),
+        }
+        for rank, account in enumerate(accounts, start=1)
+    ]
+
+@router.get("/volume")
+async def top_by_volume_today(limit: int = Query(100, ge=1, le=1000)):
+    try:
+        activity = services.ranking_service.top_by_volume_today(limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return [
+        {
+            "rank": rank,
+            "account_id": str(entry.account_id),
+            "volume": from_cents(entry.volume),
+            "transaction_count": entry.count,
+        }
+        for rank, entry in enumerate(activity, start=1)
+    ]
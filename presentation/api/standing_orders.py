@@ -0,0 +1,104 @@
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, HTTPException, status
+from pydantic import BaseModel, Field
+
+from domain.entities.money import to_cents, from_cents
+from domain.entities.standing_order import StandingOrder
+from domain.exceptions.domain_exceptions import (
+    AccountLockedError,
+    AccountNotFoundError,
+    InvalidAmountError,
+    RiskCheckFailedError,
+    StandingOrderNotFoundError,
+)
+from presentation.container import services
+
+router = APIRouter()
+
+class CreateStandingOrderRequest(BaseModel):
+    source_account_id: UUID
+    destination_account_id: UUID
+    amount: float = Field(gt=0.0)
+    frequency: str
+    start_at: Optional[datetime] = None
+    end_at: Optional[datetime] = None
+
+class StandingOrderResponse(BaseModel):
+    order_id: UUID
+    source_account_id: UUID
+    destination_account_id: UUID
+    amount: float
+    frequency: str
+    status: str
+    next_run_at: str
+    end_at: Optional[str] = None
+    last_run_at: Optional[str] = None
+    last_transaction_id: Optional[UUID] = None
+    last_error: Optional[str] = None
+    failure_count: int
+
+def _to_response(order: StandingOrder) -> StandingOrderResponse:
+    return StandingOrderResponse(
+        order_id=order.order_id,
+        source_account_id=order.source_account_id,
+        destination_account_id=order.destination_account_id,
+        amount=from_cents(order.amount),
+        frequency=order.frequency.value,
+        status=order.status.value,
+        next_run_at=order.next_run_at.isoformat(),
+        end_at=order.end_at.isoformat() if order.end_at else None,
+        last_run_at=order.last_run_at.isoformat() if order.last_run_at else None,
+        last_transaction_id=order.last_transaction_id,
+        last_error=order.last_error,
+        failure_count=order.failure_count,
+    )
+
+def _naive_utc(moment: Optional[datetime]) -> Optional[datetime]:
+    # Scheduling runs on naive UTC like the rest of the domain
+    if moment is None or moment.tzinfo is None:
+        return moment
+    return datetime.utcfromtimestamp(moment.timestamp())
+
+@router.post("/", response_model=StandingOrderResponse, status_code=status.HTTP_201_CREATED)
+async def create_standing_order(request: CreateStandingOrderRequest):
+    if not services.account_repository.get_account_by_id(request.source_account_id):
+        raise HTTPException(status_code=404, detail=f"Source account {request.source_account_id} not found")
+    if not services.account_repository.get_account_by_id(request.destination_account_id):
+        raise HTTPException(status_code=404, detail=f"Destination account {request.destination_account_id} not found")
+    try:
+        order = services.standing_order_service.create_order(
+            request.source_account_id,
+            request.destination_account_id,
+            to_cents(request.amount),
+            request.frequency,
+            _naive_utc(request.start_at),
+            _naive_utc(request.end_at),
+        )
+    except AccountNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except (InvalidAmountError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except (RiskCheckFailedError, AccountLockedError) as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    return _to_response(order)
+
+@router.get("/{order_id}", response_model=StandingOrderResponse)
+async def get_standing_order(order_id: UUID):
+    try:
+        return _to_response(services.standing_order_service.get_order(order_id))
+    except StandingOrderNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+@router.get("/account/{account_id}", response_model=List[StandingOrderResponse])
+async def get_account_standing_orders(account_id: UUID):
+    return [_to_response(order) for order in services.standing_order_service.get_orders_for_account(account_id)]
+
+@router.delete("/{order_id}", response_model=StandingOrderResponse)
+async def cancel_standing_order(order_id: UUID):
+    try:
+        return _to_response(services.standing_order_service.cancel_order(order_id))
+    except StandingOrderNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
@@ -1,24 +1,19 @@
-from fastapi import APIRouter, HTTPException, Depends, Response, Query
+from fastapi import APIRouter, HTTPException, Depends, Header, Response, Query
 from fastapi.responses import StreamingResponse
 from uuid import UUID
 from datetime import datetime
-import io
 import os
 from typing import Optional
 from tempfile import NamedTemporaryFile
 from pydantic import BaseModel, validator
-from application.services.statement_service import StatementService
-from infrastructure.repositories.account_repository import InMemoryAccountRepository
-from infrastructure.repositories.transaction_repository import InMemoryTransactionRepository
-from infrastructure.adapters.statement_adapter import CSVStatementAdapter
 from domain.exceptions.domain_exceptions import AccountNotFoundError
 from infrastructure.repositories.shared_repositories import account_repo, transaction_repo
+from presentation.container import services
+from presentation.api.json_encoding import RawJSONResponse, encode_statement
+from presentation.api.compression import accepts_gzip, gzip_bytes, gzip_chunks
 
 router = APIRouter()
 
-statement_adapter = CSVStatementAdapter()
-statement_service = StatementService(account_repo, transaction_repo, statement_adapter)
-
 class StatementRequest(BaseModel):
     start_date: datetime
     end_date: datetime
@@ -41,6 +36,8 @@ async def get_statement(
     account_id: UUID,
     start_date: str = Query(..., description="Start date for the statement period (format: YYYY-MM-DDTHH:MM:SS)"),
     end_date: str = Query(..., description="End date for the statement period (format: YYYY-MM-DDTHH:MM:SS)"),
+    include_csv: bool = Query(True, description="Include csv_content; the same rows are already in transactions"),
+    accept_encoding: Optional[str] = Header(None),
 ):
     try:
         # Convert string dates to datetime objects
@@ -64,25 +61,15 @@ async def get_statement(
             raise AccountNotFoundError(f"Account {account_id} not found")
 
         # Generate statement
-        statement = statement_service.generate_statement(account_id, start_date_dt, end_date_dt)
+        statement = services.statement_service.generate_statement(
+            account_id, start_date_dt, end_date_dt, include_content=include_csv
+        )
         
         # Return JSON response
-        return {
-            "account_id": str(statement.account.account_id),
-            "account_type": statement.account.account_type.value,
-            "balance": statement.account.balance,
-            "transactions": [
-                {
-                    "transaction_id": str(t.transaction_id),
-                    "type": t.transaction_type.value,
-                    "amount": t.amount,
-                    "timestamp": t.timestamp.isoformat()
-                } for t in statement.transactions
-            ],
-            "start_date": statement.start_date.isoformat(),
-            "end_date": statement.end_date.isoformat(),
-            "csv_content": statement.csv_content
-        }
+        body = encode_statement(statement, include_csv=include_csv)
+        if accepts_gzip(accept_encoding):
+            return RawJSONResponse(gzip_bytes(body), headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"})
+        return RawJSONResponse(body, headers={"Vary": "Accept-Encoding"})
     except AccountNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except ValueError as e:
@@ -97,6 +84,7 @@ async def get_statement_csv(
     account_id: UUID,
     start_date: str = Query(..., description="Start date for the statement period (format: YYYY-MM-DDTHH:MM:SS)"),
     end_date: str = Query(..., description="End date for the statement period (format: YYYY-MM-DDTHH:MM:SS)"),
+    accept_encoding: Optional[str] = Header(None),
 ):
     try:
         # Convert string dates to datetime objects
@@ -119,18 +107,19 @@ async def get_statement_csv(
         if not account:
             raise AccountNotFoundError(f"Account {account_id} not found")
 
-        # Generate statement
-        statement = statement_service.generate_statement(account_id, start_date_dt, end_date_dt)
+        # Rows are rendered as the response is sent, not collected into one string first
+        chunks = services.statement_service.stream_csv(account_id, start_date_dt, end_date_dt)
         
         # Return CSV file
         filename = f"statement_{account_id}_{start_date.split('T')[0]}_{end_date.split('T')[0]}.csv"
-        return StreamingResponse(
-            io.StringIO(statement.csv_content),
-            media_type="text/csv",
-            headers={
-                "Content-Disposition": f'attachment; filename="{filename}"'
-            }
-        )
+        headers = {
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Vary": "Accept-Encoding"
+        }
+        if accepts_gzip(accept_encoding):
+            headers["Content-Encoding"] = "gzip"
+            return StreamingResponse(gzip_chunks(chunks), media_type="text/csv", headers=headers)
+        return StreamingResponse(chunks, media_type="text/csv", headers=headers)
     except AccountNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except ValueError as e:
@@ -1,21 +1,19 @@
 from fastapi import APIRouter, Depends, HTTPException
 from uuid import UUID
 from pydantic import BaseModel
-from application.services.fund_transfer_service import FundTransferService
-from infrastructure.repositories.account_repository import InMemoryAccountRepository
-from infrastructure.repositories.transaction_repository import InMemoryTransactionRepository
-from infrastructure.adapters.notification_adapter import MockNotificationAdapter
-from application.services.notification_service import NotificationService
-from domain.exceptions.domain_exceptions import AccountNotFoundError, InsufficientFundsError, TransactionLimitExceededError
+from domain.entities.money import to_cents, from_cents
+from presentation.container import services
+from domain.exceptions.domain_exceptions import (
+    AccountLockedError,
+    AccountNotFoundError,
+    InsufficientFundsError,
+    InvalidAmountError,
+    RiskCheckFailedError,
+    TransactionLimitExceededError,
+)
 
 router = APIRouter()
 
-# Initialize repositories and services
-account_repository = InMemoryAccountRepository()
-transaction_repository = InMemoryTransactionRepository()
-notification_service = NotificationService(MockNotificationAdapter())
-fund_transfer_service = FundTransferService(account_repository, transaction_repository, notification_service)
-
 class TransferRequest(BaseModel):
     source_account_id: UUID
     destination_account_id: UUID
@@ -24,13 +22,45 @@ class TransferRequest(BaseModel):
 @router.post("/", response_model=dict)
 async def transfer_funds(transfer: TransferRequest):
     try:
-        transaction = fund_transfer_service.transfer_funds(
+        transaction = services.fund_transfer_service.transfer_funds(
             transfer.source_account_id,
             transfer.destination_account_id,
-            transfer.amount
+            to_cents(transfer.amount)
         )
         return {"transaction_id": transaction.transaction_id}
     except AccountNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
-    except (InsufficientFundsError, TransactionLimitExceededError) as e:
-        raise HTTPException(status_code=400, detail=str(e))
\ No newline at end of file
+    except (InsufficientFundsError, InvalidAmountError, TransactionLimitExceededError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except (RiskCheckFailedError, AccountLockedError) as e:
+        raise HTTPException(status_code=403, detail=str(e))
+
+@router.post("/netted", status_code=202, response_model=dict)
+async def queue_netted_transfer(transfer: TransferRequest):
+    try:
+        queued = services.settlement_service.queue_transfer(
+            transfer.source_account_id,
+            transfer.destination_account_id,
+            to_cents(transfer.amount)
+        )
+    except (InvalidAmountError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    # The transaction id is only assigned when the transfer settles
+    return {"transfer_id": queued.transfer_id, "status": "QUEUED"}
+
+@router.post("/settlements", response_model=dict)
+async def settle_netted_transfers():
+    result = services.settlement_service.settle()
+    return {
+        "settled": [
+            {"transfer_id": transfer_id, "transaction_id": transaction_id}
+            for transfer_id, transaction_id in result.settled.items()
+        ],
+        "rejected": [
+            {"transfer_id": transfer_id, "reason": reason}
+            for transfer_id, reason in result.rejected.items()
+        ],
+        "net_positions": {
+            str(account_id): from_cents(net) for account_id, net in result.net_positions.items()
+        },
+    }
\ No newline at end of file
@@ -0,0 +1,168 @@
+import os
+from datetime import timedelta
+from functools import cached_property
+
+from infrastructure.repositories.shared_repositories import (
+    account_repo,
+    transaction_repo,
+    standing_order_repo,
+    hold_repo,
+)
+
+class ServiceContainer:
+    # Services and their adapters are imported and built on first use, so importing the
+    # routers stays cheap and a cold worker only pays for the endpoints it actually serves.
+
+    def __init__(
+        self,
+        account_repository=account_repo,
+        transaction_repository=transaction_repo,
+        standing_order_repository=standing_order_repo,
+        hold_repository=hold_repo,
+    ):
+        self.account_repository = account_repository
+        self.transaction_repository = transaction_repository
+        self.standing_order_repository = standing_order_repository
+        self.hold_repository = hold_repository
+
+    @cached_property
+    def logging_adapter(self):
+        from infrastructure.adapters.logging_adapter import LoggingAdapter
+        return LoggingAdapter()
+
+    @cached_property
+    def notification_service(self):
+        from infrastructure.adapters.notification_adapter import MockNotificationAdapter
+        from application.services.notification_service import NotificationService
+        return NotificationService(MockNotificationAdapter())
+
+    @cached_property
+    def account_creation_service(self):
+        from application.services.account_creation_service import AccountCreationService
+        return AccountCreationService(self.account_repository)
+
+    @cached_property
+    def account_listing_service(self):
+        from application.services.account_listing_service import AccountListingService
+        return AccountListingService(self.account_repository)
+
+    @cached_property
+    def risk_check(self):
+        # One instance so withdrawals and transfers feed the same per-account profile
+        from domain.services.risk_check import VelocityRiskCheck
+        return VelocityRiskCheck()
+
+    @cached_property
+    def transaction_service(self):
+        from application.services.transaction_service import TransactionService
+        return TransactionService(
+            self.account_repository, self.transaction_repository, self.notification_service, self.risk_check
+        )
+
+    @cached_property
+    def fund_transfer_service(self):
+        from application.services.fund_transfer_service import FundTransferService
+        service = FundTransferService(
+            self.account_repository, self.transaction_repository, self.notification_service, self.risk_check
+        )
+        service.transfer_funds = self.logging_adapter.log_method(service.transfer_funds)
+        return service
+
+    @cached_property
+    def settlement_service(self):
+        # One queue per process: transfers queued here are settled by the next window
+        from application.services.settlement_service import SettlementService
+        return SettlementService(
+            self.account_repository, self.transaction_repository, self.notification_service, self.risk_check
+        )
+
+    @cached_property
+    def standing_order_service(self):
+        from application.services.standing_order_service import StandingOrderService
+        from application.services.fund_transfer_service import FundTransferService
+        # The velocity check judges each order when it is created; judging every run again would
+        # let one payer's batch of due orders trip the check and lock the account
+        fund_transfer_service = FundTransferService(
+            self.account_repository, self.transaction_repository, self.notification_service
+        )
+        fund_transfer_service.transfer_funds = self.logging_adapter.log_method(fund_transfer_service.transfer_funds)
+        return StandingOrderService(
+            self.standing_order_repository, self.account_repository, fund_transfer_service, self.risk_check
+        )
+
+    @cached_property
+    def standing_order_scheduler(self):
+        from application.services.deadline_scheduler import DeadlineScheduler
+        return DeadlineScheduler(self.standing_order_service, "standing-order-scheduler")
+
+    @cached_property
+    def hold_service(self):
+        from application.services.hold_service import HoldService
+        return HoldService(
+            self.account_repository,
+            self.hold_repository,
+            self.transaction_repository,
+            self.notification_service,
+            self.risk_check,
+        )
+
+    @cached_property
+    def hold_expiry_scheduler(self):
+        from application.services.deadline_scheduler import DeadlineScheduler
+        return DeadlineScheduler(self.hold_service, "hold-expiry-scheduler")
+
+    @cached_property
+    def archival_service(self):
+        from application.services.archival_service import ArchivalService
+        return ArchivalService(
+            self.transaction_repository,
+            archive_after=timedelta(days=int(os.environ.get("TRANSACTION_ARCHIVE_AFTER_DAYS", 90))),
+        )
+
+    @cached_property
+    def archival_scheduler(self):
+        from application.services.deadline_scheduler import DeadlineScheduler
+        # Each batch becomes one segment file, so batches are far larger than other jobs'
+        return DeadlineScheduler(self.archival_service, "transaction-archiver", batch_size=100_000)
+
+    @cached_property
+    def interest_service(self):
+        from application.services.interest_service import InterestService
+        return InterestService(self.account_repository, self.notification_service, self.transaction_repository)
+
+    @cached_property
+    def limit_enforcement_service(self):
+        from application.services.limit_enforcement_service import LimitEnforcementService
+        service = LimitEnforcementService(self.account_repository)
+        service.set_limits = self.logging_adapter.log_method(service.set_limits)
+        return service
+
+    @cached_property
+    def analytics_service(self):
+        from application.services.analytics_service import AnalyticsService
+        return AnalyticsService(self.account_repository, self.transaction_repository)
+
+    @cached_property
+    def reconciliation_service(self):
+        # Holds the per-account checkpoints, so one instance lives for the whole process
+        from application.services.reconciliation_service import ReconciliationService
+        return ReconciliationService(self.account_repository, self.transaction_repository)
+
+    @cached_property
+    def export_service(self):
+        from application.services.export_service import ExportService
+        return ExportService(self.transaction_repository)
+
+    @cached_property
+    def ranking_service(self):
+        from application.services.ranking_service import RankingService
+        return RankingService(self.account_repository, self.transaction_repository)
+
+    @cached_property
+    def statement_service(self):
+        from infrastructure.adapters.statement_adapter import CSVStatementAdapter
+        from application.services.statement_service import StatementService
+        return StatementService(self.account_repository, self.transaction_repository, CSVStatementAdapter())
+
+# Single container shared by all routers
+services = ServiceContainer()
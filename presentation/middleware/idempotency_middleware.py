@@ -0,0 +1,103 @@
+import hashlib
+import json
+import re
+from typing import List, Pattern, Sequence
+
+from infrastructure.adapters.idempotency_adapter import (
+    IdempotencyCache,
+    IdempotencyKeyReusedError,
+    StoredResponse,
+)
+
+IDEMPOTENCY_HEADER = b"idempotency-key"
+REPLAY_HEADER = (b"idempotent-replayed", b"true")
+
+async def _send_json(send, status: int, detail: str) -> None:
+    body = json.dumps({"detail": detail}).encode()
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+async def _replay(send, response: StoredResponse) -> None:
+    await send({"type": "http.response.start", "status": response.status, "headers": response.headers + [REPLAY_HEADER]})
+    await send({"type": "http.response.body", "body": response.body})
+
+class IdempotencyMiddleware:
+    def __init__(self, app, cache: IdempotencyCache, paths: Sequence[str]):
+        self.app = app
+        self.cache = cache
+        self.paths: List[Pattern] = [re.compile(path) for path in paths]
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "POST":
+            await self.app(scope, receive, send)
+            return
+
+        key = None
+        for name, value in scope["headers"]:
+            if name == IDEMPOTENCY_HEADER:
+                key = value.decode("latin-1")
+                break
+        if key is None or not any(pattern.fullmatch(scope["path"]) for pattern in self.paths):
+            await self.app(scope, receive, send)
+            return
+
+        # Buffer the body so it can be fingerprinted and then handed to the app unchanged
+        chunks = []
+        more_body = True
+        while more_body:
+            message = await receive()
+            chunks.append(message.get("body", b""))
+            more_body = message.get("more_body", False)
+        body = b"".join(chunks)
+        fingerprint = hashlib.sha256(scope["path"].encode() + b"\0" + body).hexdigest()
+        cache_key = f"{scope['path']}:{key}"
+
+        while True:
+            try:
+                entry, is_owner = self.cache.begin(cache_key, fingerprint)
+            except IdempotencyKeyReusedError as e:
+                await _send_json(send, 422, str(e))
+                return
+            if is_owner:
+                break
+            # A duplicate: wait for the in-flight attempt instead of running the work again
+            await entry.done.wait()
+            if entry.response is not None:
+                await _replay(send, entry.response)
+                return
+
+        replayed = False
+
+        async def replay_receive():
+            nonlocal replayed
+            if replayed:
+                return await receive()
+            replayed = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        status = 500
+        headers = []
+        response_chunks = []
+
+        async def send_wrapper(message):
+            nonlocal status, headers
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = list(message.get("headers", []))
+            elif message["type"] == "http.response.body":
+                response_chunks.append(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, replay_receive, send_wrapper)
+        except Exception:
+            self.cache.abandon(cache_key, entry)
+            raise
+        if status >= 500:
+            self.cache.abandon(cache_key, entry)
+        else:
+            self.cache.complete(cache_key, entry, StoredResponse(status, headers, b"".join(response_chunks)))
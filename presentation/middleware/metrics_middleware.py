@@ -0,0 +1,35 @@
+from time import perf_counter
+
+from infrastructure.adapters.metrics_adapter import BankingMetrics
+
+class MetricsMiddleware:
+    def __init__(self, app, metrics: BankingMetrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        in_flight = self.metrics.requests_in_flight.labels(method)
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_flight.inc()
+        start = perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = perf_counter() - start
+            in_flight.dec()
+            # Use the route template so path parameters don't explode label cardinality
+            route = scope.get("route")
+            route_path = route.path if route is not None else "unmatched"
+            self.metrics.request_latency.labels(method, route_path, str(status_code)).observe(elapsed)
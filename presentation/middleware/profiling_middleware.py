@@ -0,0 +1,40 @@
+import re
+from time import perf_counter
+from typing import List, Pattern, Sequence
+
+from infrastructure.adapters.profiling_adapter import ProfilingAdapter
+
+PROFILE_HEADER = b"x-profile-token"
+
+class ProfilingMiddleware:
+    def __init__(self, app, profiler: ProfilingAdapter, excluded_paths: Sequence[str] = ()):
+        self.app = app
+        self.profiler = profiler
+        # Streaming responses would keep a profile running for as long as the client listens
+        self.excluded_paths: List[Pattern] = [re.compile(path) for path in excluded_paths]
+
+    async def __call__(self, scope, receive, send):
+        if not self.profiler.armed or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = None
+        for name, value in scope["headers"]:
+            if name == PROFILE_HEADER:
+                token = value.decode("latin-1")
+                break
+        if not self.profiler.should_profile(token) or any(pattern.fullmatch(scope["path"]) for pattern in self.excluded_paths):
+            await self.app(scope, receive, send)
+            return
+
+        profile = self.profiler.start()
+        if profile is None:
+            await self.app(scope, receive, send)
+            return
+        start = perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            route = scope.get("route")
+            route_path = route.path if route is not None else scope["path"]
+            self.profiler.finish(profile, scope["method"], route_path, perf_counter() - start)
@@ -3,7 +3,7 @@ from uuid import UUID
 
 from application.services.account_creation_service import AccountCreationService
 from infrastructure.repositories.account_repository import InMemoryAccountRepository
-from domain.exceptions.domain_exceptions import InvalidAmountError
+from domain.exceptions.domain_exceptions import InvalidAmountError, BulkValidationError
 from domain.services.interest_strategy import SavingsInterestStrategy
 
 @pytest.fixture
@@ -15,15 +15,15 @@ def account_creation_service(account_repository):
     return AccountCreationService(account_repository)
 
 def test_create_checking_account(account_creation_service, account_repository):
-    account_id = account_creation_service.create_account("CHECKING", initial_deposit=100.0)
+    account_id = account_creation_service.create_account("CHECKING", initial_deposit=10000)
     account = account_repository.get_account_by_id(account_id)
     assert isinstance(account_id, UUID)
     assert account.account_type.value == "CHECKING"
-    assert account.balance == 100.0
+    assert account.balance == 10000
     assert account.interest_strategy is not None
 
 def test_create_savings_account(account_creation_service, account_repository):
-    account_id = account_creation_service.create_account("SAVINGS", initial_deposit=100.0)
+    account_id = account_creation_service.create_account("SAVINGS", initial_deposit=10000)
     account = account_repository.get_account_by_id(account_id)
     assert isinstance(account_id, UUID)
     assert account.account_type.value == "SAVINGS"
@@ -31,8 +31,25 @@ def test_create_savings_account(account_creation_service, account_repository):
 
 def test_create_account_with_negative_deposit(account_creation_service):
     with pytest.raises(InvalidAmountError):
-        account_creation_service.create_account("SAVINGS", initial_deposit=-50.0)
+        account_creation_service.create_account("SAVINGS", initial_deposit=-5000)
 
 def test_create_account_invalid_type(account_creation_service):
     with pytest.raises(ValueError):
-        account_creation_service.create_account("INVALID")
\ No newline at end of file
+        account_creation_service.create_account("INVALID")
+
+def test_create_accounts_in_request_order(account_creation_service, account_repository):
+    rows = [("CHECKING", 0), ("SAVINGS", 20000), ("checking", 500)]
+    account_ids = account_creation_service.create_accounts(rows)
+    accounts = [account_repository.get_account_by_id(account_id) for account_id in account_ids]
+    assert [(a.account_type.value, a.balance) for a in accounts] == [("CHECKING", 0), ("SAVINGS", 20000), ("CHECKING", 500)]
+    assert all(account_repository.get_account_version(account_id) == 1 for account_id in account_ids)
+
+def test_create_accounts_share_interest_strategies(account_creation_service, account_repository):
+    first, second = account_creation_service.create_accounts([("SAVINGS", 10000), ("SAVINGS", 10000)])
+    assert account_repository.get_account_by_id(first).interest_strategy is account_repository.get_account_by_id(second).interest_strategy
+
+def test_create_accounts_reports_every_invalid_row(account_creation_service, account_repository):
+    with pytest.raises(BulkValidationError) as e:
+        account_creation_service.create_accounts([("CHECKING", 100), ("INVALID", 0), ("SAVINGS", 100), ("CHECKING", -1)])
+    assert sorted(e.value.errors) == [1, 2, 3]
+    assert account_repository.accounts == {}
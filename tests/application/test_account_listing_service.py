@@ -0,0 +1,46 @@
+import pytest
+
+from domain.entities.account import Account, AccountType
+from infrastructure.repositories.account_repository import InMemoryAccountRepository, AccountFilter
+from application.services.account_listing_service import AccountListingService
+
+@pytest.fixture
+def account_repository():
+    repository = InMemoryAccountRepository()
+    repository.create_accounts([Account.create(AccountType.CHECKING, initial_deposit=100 * i) for i in range(25)])
+    return repository
+
+@pytest.fixture
+def account_listing_service(account_repository):
+    return AccountListingService(account_repository)
+
+def collect_pages(service, account_filter, limit):
+    pages = []
+    cursor = None
+    while True:
+        accounts, cursor = service.list_accounts(account_filter, cursor, limit)
+        pages.append(accounts)
+        if cursor is None:
+            return pages
+
+def test_pages_cover_every_account_once(account_listing_service, account_repository):
+    pages = collect_pages(account_listing_service, AccountFilter(), limit=10)
+    assert [len(page) for page in pages] == [10, 10, 5]
+    assert sorted(a.account_id for page in pages for a in page) == sorted(account_repository.accounts)
+
+def test_balance_pages(account_listing_service):
+    pages = collect_pages(account_listing_service, AccountFilter(min_balance=500, max_balance=1400), limit=4)
+    assert [[a.balance for a in page] for page in pages] == [[500, 600, 700, 800], [900, 1000, 1100, 1200], [1300, 1400]]
+
+def test_exact_final_page_has_no_cursor(account_listing_service):
+    accounts, cursor = account_listing_service.list_accounts(AccountFilter(), limit=25)
+    assert len(accounts) == 25
+    assert cursor is None
+
+def test_invalid_cursor_and_limit(account_listing_service):
+    with pytest.raises(ValueError):
+        account_listing_service.list_accounts(AccountFilter(), cursor="not-a-cursor")
+    with pytest.raises(ValueError):
+        account_listing_service.list_accounts(AccountFilter(min_balance=0), cursor="12:nope")
+    with pytest.raises(ValueError):
+        account_listing_service.list_accounts(AccountFilter(), limit=0)
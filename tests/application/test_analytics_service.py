@@ -0,0 +1,132 @@
+import pytest
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from domain.entities.account import Account, AccountType, AccountStatus
+from domain.entities.transaction import Transaction, TransactionType
+from infrastructure.repositories.account_repository import InMemoryAccountRepository
+from infrastructure.repositories.transaction_repository import InMemoryTransactionRepository
+from application.services.analytics_service import AnalyticsService
+
+START = datetime(2026, 1, 1, 9, 0)
+
+@pytest.fixture
+def account_repository():
+    return InMemoryAccountRepository()
+
+@pytest.fixture
+def transaction_repository():
+    return InMemoryTransactionRepository()
+
+@pytest.fixture
+def analytics_service(account_repository, transaction_repository):
+    return AnalyticsService(account_repository, transaction_repository, account_refresh_interval=0)
+
+@pytest.fixture
+def accounts(account_repository):
+    checking = Account.create(AccountType.CHECKING, initial_deposit=10000)
+    savings = Account.create(AccountType.SAVINGS, initial_deposit=50000)
+    account_repository.create_account(checking)
+    account_repository.create_account(savings)
+    return checking, savings
+
+def save(transaction_repository, account, transaction_type, amount, minutes):
+    transaction_repository.save_transaction(Transaction(
+        transaction_id=uuid4(),
+        account_id=account.account_id,
+        transaction_type=transaction_type,
+        amount=amount,
+        timestamp=START + timedelta(minutes=minutes),
+    ))
+
+def totals(rows):
+    return {tuple(row.key.values()): (row.count, row.total) for row in rows}
+
+def test_group_by_transaction_type(analytics_service, transaction_repository, accounts):
+    checking, savings = accounts
+    save(transaction_repository, checking, TransactionType.DEPOSIT, 100, 0)
+    save(transaction_repository, checking, TransactionType.DEPOSIT, 250, 1)
+    save(transaction_repository, savings, TransactionType.WITHDRAW, 40, 2)
+
+    rows = analytics_service.aggregate_transactions(["transaction_type"])
+    assert totals(rows) == {("DEPOSIT",): (2, 350), ("WITHDRAW",): (1, 40)}
+
+def test_group_by_account_type_and_hour(analytics_service, transaction_repository, accounts):
+    checking, savings = accounts
+    save(transaction_repository, checking, TransactionType.DEPOSIT, 100, 5)
+    save(transaction_repository, checking, TransactionType.DEPOSIT, 200, 65)
+    save(transaction_repository, savings, TransactionType.DEPOSIT, 300, 10)
+
+    rows = analytics_service.aggregate_transactions(["account_type", "hour"])
+    assert totals(rows) == {
+        ("CHECKING", START): (1, 100),
+        ("CHECKING", START + timedelta(hours=1)): (1, 200),
+        ("SAVINGS", START): (1, 300),
+    }
+
+def test_refresh_is_incremental(analytics_service, transaction_repository, accounts):
+    checking, _ = accounts
+    save(transaction_repository, checking, TransactionType.DEPOSIT, 100, 0)
+    analytics_service.aggregate_transactions([])
+    assert analytics_service.position == 1
+
+    save(transaction_repository, checking, TransactionType.DEPOSIT, 100, 1)
+    rows = analytics_service.aggregate_transactions([])
+    assert analytics_service.position == 2
+    assert totals(rows) == {(): (2, 200)}
+
+def test_time_range_filter(analytics_service, transaction_repository, accounts):
+    checking, _ = accounts
+    for minutes in range(10):
+        save(transaction_repository, checking, TransactionType.DEPOSIT, 1, minutes)
+
+    rows = analytics_service.aggregate_transactions(
+        [], start=START + timedelta(minutes=2), end=START + timedelta(minutes=5)
+    )
+    assert totals(rows) == {(): (4, 4)}
+
+def test_status_changes_are_picked_up(analytics_service, account_repository, transaction_repository, accounts):
+    checking, _ = accounts
+    save(transaction_repository, checking, TransactionType.DEPOSIT, 100, 0)
+    analytics_service.aggregate_transactions(["account_status"])
+
+    checking.status = AccountStatus.CLOSED
+    account_repository.update_account(checking)
+    rows = analytics_service.aggregate_transactions(["account_status"])
+    assert totals(rows) == {("CLOSED",): (1, 100)}
+
+def test_aggregate_accounts(analytics_service, accounts):
+    rows = analytics_service.aggregate_accounts(["account_type"])
+    assert totals(rows) == {("CHECKING",): (1, 10000), ("SAVINGS",): (1, 50000)}
+
+def test_unknown_dimension(analytics_service):
+    with pytest.raises(ValueError):
+        analytics_service.aggregate_transactions(["branch"])
+    with pytest.raises(ValueError):
+        analytics_service.aggregate_accounts(["transaction_type"])
+
+def test_account_aggregates_read_only_changed_accounts(analytics_service, account_repository, accounts, monkeypatch):
+    checking, _ = accounts
+    analytics_service.aggregate_accounts([])
+    monkeypatch.setattr(account_repository, "list_accounts", lambda: pytest.fail("full scan"))
+
+    checking.deposit(500)
+    account_repository.update_account(checking)
+    added = Account.create(AccountType.CHECKING, initial_deposit=7000)
+    account_repository.create_account(added)
+    rows = analytics_service.aggregate_accounts(["account_type"])
+    assert totals(rows) == {("CHECKING",): (2, 17500), ("SAVINGS",): (1, 50000)}
+    assert account_repository.get_accounts_changed_since(analytics_service._account_position) == (
+        analytics_service._account_position, []
+    )
+
+def test_aware_bounds_are_converted_to_utc(analytics_service, transaction_repository, accounts):
+    from datetime import timezone
+    checking, _ = accounts
+    for minutes in range(10):
+        save(transaction_repository, checking, TransactionType.DEPOSIT, 1, minutes)
+    plus_two = timezone(timedelta(hours=2))
+    rows = analytics_service.aggregate_transactions(
+        [], start=(START + timedelta(hours=2, minutes=2)).replace(tzinfo=plus_two)
+    )
+    assert totals(rows) == {(): (8, 8)}
@@ -0,0 +1,48 @@
+import pytest
+from uuid import uuid4
+
+from domain.entities.transaction import Transaction
+from infrastructure.repositories.transaction_repository import InMemoryTransactionRepository
+from application.services.export_service import ExportService
+
+@pytest.fixture
+def transaction_repository():
+    return InMemoryTransactionRepository()
+
+@pytest.fixture
+def transactions(transaction_repository):
+    account_id = uuid4()
+    created = [Transaction.create_deposit(account_id, 100 + i) for i in range(7)]
+    transaction_repository.save_transactions(created)
+    return created
+
+@pytest.fixture
+def export_service(transaction_repository):
+    return ExportService(transaction_repository, page_size=3)
+
+def test_export_streams_every_row_in_commit_order(export_service, transactions):
+    export = export_service.export_since()
+    assert export.cursor == 7
+    assert list(export.rows) == list(enumerate(transactions))
+
+def test_export_resumes_from_watermark(export_service, transactions):
+    export = export_service.export_since(5)
+    assert [position for position, _ in export.rows] == [5, 6]
+    assert list(export_service.export_since(export.cursor).rows) == []
+
+def test_export_limit_moves_cursor_only_past_returned_rows(export_service, transactions):
+    export = export_service.export_since(2, limit=4)
+    assert export.cursor == 6
+    assert [transaction for _, transaction in export.rows] == transactions[2:6]
+
+def test_rows_committed_during_export_go_to_the_next_one(export_service, transaction_repository, transactions):
+    export = export_service.export_since()
+    late = Transaction.create_deposit(uuid4(), 1)
+    transaction_repository.save_transaction(late)
+    assert len(list(export.rows)) == 7
+    assert list(export_service.export_since(export.cursor).rows) == [(7, late)]
+
+@pytest.mark.parametrize("watermark, limit", [(-1, None), (8, None), (0, 0)])
+def test_invalid_export_window(export_service, transactions, watermark, limit):
+    with pytest.raises(ValueError):
+        export_service.export_since(watermark, limit)
@@ -26,7 +26,7 @@ def source_account(account_repository):
     account = Account(
         account_id=UUID("123e4567-e89b-12d3-a456-426614174000"),
         account_type=AccountType.CHECKING,
-        balance=200.0,
+        balance=20000,
         status=AccountStatus.ACTIVE,
         creation_date=datetime.utcnow(),
     )
@@ -38,7 +38,7 @@ def destination_account(account_repository):
     account = Account(
         account_id=UUID("123e4567-e89b-12d3-a456-426614174001"),
         account_type=AccountType.CHECKING,
-        balance=100.0,
+        balance=10000,
         status=AccountStatus.ACTIVE,
         creation_date=datetime.utcnow(),
     )
@@ -54,7 +54,7 @@ def fund_transfer_service(account_repository, transaction_repository):
     return FundTransferService(account_repository, transaction_repository, notification_service)
 
 def test_transfer_success(fund_transfer_service, source_account, destination_account, transaction_repository, account_repository):
-    amount = 50.0
+    amount = 5000
     transaction = fund_transfer_service.transfer_funds(
         source_account.account_id,
         destination_account.account_id,
@@ -63,8 +63,8 @@ def test_transfer_success(fund_transfer_service, source_account, destination_acc
     updated_source = account_repository.get_account_by_id(source_account.account_id)
     updated_destination = account_repository.get_account_by_id(destination_account.account_id)
     transactions = transaction_repository.get_transactions_for_account(source_account.account_id)
-    assert updated_source.balance == 150.0
-    assert updated_destination.balance == 150.0
+    assert updated_source.balance == 15000
+    assert updated_destination.balance == 15000
     assert len(transactions) == 1
     assert transactions[0].amount == amount
     assert transaction.transaction_id == transactions[0].transaction_id
@@ -74,16 +74,16 @@ def test_transfer_insufficient_funds(fund_transfer_service, source_account, dest
         fund_transfer_service.transfer_funds(
             source_account.account_id,
             destination_account.account_id,
-            300.0
+            30000
         )
 
 def test_transfer_with_limits(fund_transfer_service, source_account, destination_account, account_repository):
-    source_account.limit_constraint = LimitConstraint(daily_limit=100.0, monthly_limit=500.0)
-    source_account.daily_spent = 80.0
+    source_account.limit_constraint = LimitConstraint(daily_limit=10000, monthly_limit=50000)
+    source_account.daily_spent = 8000
     account_repository.update_account(source_account)
     with pytest.raises(TransactionLimitExceededError):
         fund_transfer_service.transfer_funds(
             source_account.account_id,
             destination_account.account_id,
-            50.0
+            5000
         )
\ No newline at end of file
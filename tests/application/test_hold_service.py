@@ -0,0 +1,105 @@
+import pytest
+from uuid import uuid4
+from datetime import datetime, timedelta
+
+from domain.entities.account import Account, AccountType
+from domain.entities.hold import HoldStatus
+from domain.exceptions.domain_exceptions import (
+    AccountNotFoundError,
+    HoldNotPendingError,
+    InsufficientFundsError,
+)
+from infrastructure.repositories.account_repository import InMemoryAccountRepository
+from infrastructure.repositories.transaction_repository import InMemoryTransactionRepository
+from infrastructure.repositories.hold_repository import InMemoryHoldRepository
+
+@pytest.fixture
+def account_repository():
+    return InMemoryAccountRepository()
+
+@pytest.fixture
+def transaction_repository():
+    return InMemoryTransactionRepository()
+
+@pytest.fixture
+def hold_repository():
+    return InMemoryHoldRepository()
+
+@pytest.fixture
+def hold_service(account_repository, hold_repository, transaction_repository):
+    from infrastructure.adapters.notification_adapter import MockNotificationAdapter
+    from application.services.notification_service import NotificationService
+    from application.services.hold_service import HoldService
+    return HoldService(
+        account_repository, hold_repository, transaction_repository, NotificationService(MockNotificationAdapter())
+    )
+
+@pytest.fixture
+def account(account_repository):
+    account = Account.create(AccountType.SAVINGS, initial_deposit=50000)
+    account_repository.create_account(account)
+    return account
+
+def test_place_and_capture(hold_service, account, account_repository, transaction_repository):
+    hold = hold_service.place_hold(account.account_id, 20000)
+    assert account_repository.get_account_by_id(account.account_id).available_balance == 30000
+    assert transaction_repository.get_transactions_for_account(account.account_id) == []
+
+    transaction = hold_service.capture_hold(hold.hold_id, 15000)
+    stored = account_repository.get_account_by_id(account.account_id)
+    assert (stored.balance, stored.held_amount) == (35000, 0)
+    assert hold.status == HoldStatus.CAPTURED
+    assert hold.transaction_id == transaction.transaction_id
+    # One transaction for the whole authorize-then-capture flow
+    assert transaction_repository.get_transactions_for_account(account.account_id) == [transaction]
+    with pytest.raises(HoldNotPendingError):
+        hold_service.release_hold(hold.hold_id)
+
+def test_holds_block_overspending(hold_service, account):
+    hold_service.place_hold(account.account_id, 30000)
+    with pytest.raises(InsufficientFundsError):
+        hold_service.place_hold(account.account_id, 15000)
+    with pytest.raises(AccountNotFoundError):
+        hold_service.place_hold(uuid4(), 100)
+    with pytest.raises(ValueError):
+        hold_service.place_hold(account.account_id, 100, ttl=timedelta(days=31))
+
+def test_release(hold_service, account, account_repository):
+    hold = hold_service.place_hold(account.account_id, 30000)
+    hold_service.release_hold(hold.hold_id)
+    assert account_repository.get_account_by_id(account.account_id).held_amount == 0
+    assert hold.status == HoldStatus.RELEASED
+    assert hold_service.next_due_time() is None
+
+def test_expiry_sweep_releases_in_batches(hold_service, account, account_repository):
+    holds = [hold_service.place_hold(account.account_id, 1000, ttl=timedelta(minutes=minutes)) for minutes in range(1, 6)]
+    hold_service.capture_hold(holds[1].hold_id)
+    later = datetime.utcnow() + timedelta(minutes=10)
+
+    assert hold_service.run_due(later, batch_size=2) == 2
+    assert hold_service.run_due(later, batch_size=2) == 2
+    assert hold_service.run_due(later, batch_size=2) == 0
+    assert [hold.status for hold in holds] == [
+        HoldStatus.EXPIRED, HoldStatus.CAPTURED, HoldStatus.EXPIRED, HoldStatus.EXPIRED, HoldStatus.EXPIRED
+    ]
+    assert account_repository.get_account_by_id(account.account_id).held_amount == 0
+
+def test_unfunded_hold_is_not_judged_by_the_risk_check(account_repository, hold_repository, transaction_repository, account):
+    from infrastructure.adapters.notification_adapter import MockNotificationAdapter
+    from application.services.notification_service import NotificationService
+    from application.services.hold_service import HoldService
+    from domain.services.risk_check import RiskCheck, RiskDecision
+
+    class BlockingRiskCheck(RiskCheck):
+        def assess(self, account_id, amount, counterparty_id=None):
+            return RiskDecision.BLOCK
+
+    hold_service = HoldService(
+        account_repository, hold_repository, transaction_repository,
+        NotificationService(MockNotificationAdapter()), BlockingRiskCheck(),
+    )
+    for _ in range(3):
+        with pytest.raises(InsufficientFundsError):
+            hold_service.place_hold(account.account_id, 10_000_000)
+    stored = account_repository.get_account_by_id(account.account_id)
+    assert (stored.failed_attempts, stored.is_locked, stored.held_amount) == (0, False, 0)
@@ -22,7 +22,7 @@ def account(account_repository):
     account = Account(
         account_id=UUID("123e4567-e89b-12d3-a456-426614174000"),
         account_type=AccountType.SAVINGS,
-        balance=1000.0,
+        balance=100000,
         status=AccountStatus.ACTIVE,
         creation_date=datetime.utcnow(),
         interest_strategy=SavingsInterestStrategy()
@@ -38,8 +38,8 @@ def interest_service(account_repository, notification_service):
 def test_apply_interest_success(interest_service, account_repository, account):
     interest = interest_service.apply_interest_to_account(account.account_id)
     updated_account = account_repository.get_account_by_id(account.account_id)
-    assert interest == 30.0
-    assert updated_account.balance == 1030.0
+    assert interest == 3000
+    assert updated_account.balance == 103000
 
 def test_apply_interest_account_not_found(interest_service):
     with pytest.raises(AccountNotFoundError):
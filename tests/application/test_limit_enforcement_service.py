@@ -12,7 +12,7 @@ def account_repository():
 
 @pytest.fixture
 def account(account_repository):
-    account = Account.create(AccountType.CHECKING, initial_deposit=1000.0)
+    account = Account.create(AccountType.CHECKING, initial_deposit=100000)
     account_repository.create_account(account)
     return account
 
@@ -22,24 +22,24 @@ def limit_enforcement_service(account_repository):
     return LimitEnforcementService(account_repository)
 
 def test_set_limits_success(limit_enforcement_service, account_repository, account):
-    limit_enforcement_service.set_limits(account.account_id, daily_limit=100.0, monthly_limit=500.0)
+    limit_enforcement_service.set_limits(account.account_id, daily_limit=10000, monthly_limit=50000)
     updated_account = account_repository.get_account_by_id(account.account_id)
-    assert updated_account.limit_constraint.daily_limit == 100.0
-    assert updated_account.limit_constraint.monthly_limit == 500.0
+    assert updated_account.limit_constraint.daily_limit == 10000
+    assert updated_account.limit_constraint.monthly_limit == 50000
 
 def test_set_limits_account_not_found(limit_enforcement_service):
     with pytest.raises(Exception):  
-        limit_enforcement_service.set_limits(uuid4(), 100.0, 500.0)
+        limit_enforcement_service.set_limits(uuid4(), 10000, 50000)
 
 def test_reset_limits(limit_enforcement_service, account_repository, account):
-    account.daily_spent = 50.0
-    account.monthly_spent = 200.0
+    account.daily_spent = 5000
+    account.monthly_spent = 20000
     account_repository.update_account(account)
     next_day = datetime.utcnow() + timedelta(days=1)
     limit_enforcement_service.reset_limits(account.account_id)
     updated_account = account_repository.get_account_by_id(account.account_id)
-    assert updated_account.daily_spent == 0.0  # Reset for next day
-    assert updated_account.monthly_spent == 0.0  # Reset for next month
+    assert updated_account.daily_spent == 0  # Reset for next day
+    assert updated_account.monthly_spent == 0  # Reset for next month
 
 def reset_limits(self, account_id: UUID) -> None:
     account = self.account_repository.get_account_by_id(account_id)
@@ -47,8 +47,8 @@ def reset_limits(self, account_id: UUID) -> None:
         raise AccountNotFoundError(f"Account {account_id} not found")
 
     # Reset limits
-    account.daily_spent = 0.0
-    account.monthly_spent = 0.0
+    account.daily_spent = 0
+    account.monthly_spent = 0
     account.transaction_count = 0
 
     account.reset_limits(datetime.utcnow() + timedelta(days=1))
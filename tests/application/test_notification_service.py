@@ -19,7 +19,7 @@ def test_notify_deposit(notification_service):
         transaction_id=uuid4(),
         account_id=uuid4(),
         transaction_type=TransactionType.DEPOSIT,
-        amount=100.0,
+        amount=10000,
         timestamp=datetime.utcnow()
     )
     notification_service.notify(transaction)
@@ -30,7 +30,7 @@ def test_notify_transfer(notification_service):
         transaction_id=uuid4(),
         account_id=uuid4(),
         transaction_type=TransactionType.TRANSFER,
-        amount=50.0,
+        amount=5000,
         timestamp=datetime.utcnow(),
         destination_account_id=uuid4()
     )
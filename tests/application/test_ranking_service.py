@@ -0,0 +1,66 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from domain.entities.account import Account, AccountType, AccountStatus
+from domain.entities.transaction import Transaction
+from infrastructure.repositories.account_repository import InMemoryAccountRepository
+from infrastructure.repositories.transaction_repository import InMemoryTransactionRepository
+from application.services.ranking_service import RankingService
+
+@pytest.fixture
+def account_repository():
+    repository = InMemoryAccountRepository()
+    repository.create_accounts([Account.create(AccountType.CHECKING, initial_deposit=10000 + 100 * i) for i in range(20)])
+    repository.create_accounts([Account.create(AccountType.SAVINGS, initial_deposit=10050 + 100 * i) for i in range(20)])
+    return repository
+
+@pytest.fixture
+def transaction_repository():
+    return InMemoryTransactionRepository()
+
+@pytest.fixture
+def ranking_service(account_repository, transaction_repository):
+    return RankingService(account_repository, transaction_repository)
+
+def test_top_by_balance_merges_partitions(ranking_service, account_repository):
+    top = ranking_service.top_by_balance(5)
+    assert [a.balance for a in top] == [11950, 11900, 11850, 11800, 11750]
+
+    account = top[0]
+    account.status = AccountStatus.CLOSED
+    account.balance = 0
+    account_repository.update_account(account)
+    assert [a.balance for a in ranking_service.top_by_balance(2)] == [11900, 11850]
+
+def test_top_by_volume_counts_both_sides_of_a_transfer(ranking_service, transaction_repository):
+    a, b, c = uuid4(), uuid4(), uuid4()
+    transaction_repository.save_transaction(Transaction.create_deposit(a, 500))
+    transaction_repository.save_transaction(Transaction.create_transfer(b, c, 300))
+    transaction_repository.save_transaction(Transaction.create_withdrawal(b, 100))
+
+    top = ranking_service.top_by_volume_today(3)
+    assert [(entry.account_id, entry.volume, entry.count) for entry in top] == [(a, 500, 1), (b, 400, 2), (c, 300, 1)]
+    assert len(ranking_service.top_by_volume_today(1)) == 1
+
+def test_volume_ranking_rolls_over_at_midnight(transaction_repository):
+    a, b = uuid4(), uuid4()
+    yesterday = Transaction.create_deposit(a, 900)
+    yesterday.timestamp -= timedelta(days=1)
+    transaction_repository.save_transaction(yesterday)
+    transaction_repository.save_transaction(Transaction.create_deposit(b, 100))
+
+    late = Transaction.create_deposit(a, 900)
+    late.timestamp -= timedelta(days=1)
+    transaction_repository.save_transaction(late)
+
+    today = datetime.utcnow().date()
+    assert [entry.account_id for entry in transaction_repository.top_accounts_by_volume(today, 10)] == [b]
+    assert transaction_repository.top_accounts_by_volume(today - timedelta(days=1), 10) == []
+
+def test_limit_is_bounded(ranking_service):
+    with pytest.raises(ValueError):
+        ranking_service.top_by_balance(0)
+    with pytest.raises(ValueError):
+        ranking_service.top_by_volume_today(1001)
@@ -0,0 +1,111 @@
+import pytest
+from uuid import uuid4
+from datetime import datetime
+
+import application.services.reconciliation_service as reconciliation_module
+import infrastructure.repositories.transaction_repository as transaction_module
+from domain.entities.account import Account, AccountType
+from domain.entities.transaction import Transaction
+from infrastructure.repositories.account_repository import InMemoryAccountRepository
+from infrastructure.repositories.transaction_repository import InMemoryTransactionRepository
+from application.services.reconciliation_service import ReconciliationService
+
+@pytest.fixture
+def account_repository():
+    return InMemoryAccountRepository()
+
+@pytest.fixture
+def transaction_repository():
+    return InMemoryTransactionRepository()
+
+@pytest.fixture
+def small_segments(monkeypatch):
+    monkeypatch.setattr(transaction_module, "SEGMENT_SIZE", 4)
+    monkeypatch.setattr(reconciliation_module, "SEGMENT_SIZE", 4)
+
+@pytest.fixture
+def accounts(account_repository, transaction_repository):
+    from infrastructure.adapters.notification_adapter import MockNotificationAdapter
+    from application.services.notification_service import NotificationService
+    from application.services.transaction_service import TransactionService
+    from application.services.fund_transfer_service import FundTransferService
+    notification_service = NotificationService(MockNotificationAdapter())
+    transaction_service = TransactionService(account_repository, transaction_repository, notification_service)
+    transfer_service = FundTransferService(account_repository, transaction_repository, notification_service)
+    created = [Account.create(AccountType.CHECKING, initial_deposit=100000) for _ in range(3)]
+    account_repository.create_accounts(created)
+    a, b, c = (account.account_id for account in created)
+    for _ in range(3):
+        transaction_service.deposit(a, 500)
+        transaction_service.withdraw(b, 200)
+        transfer_service.transfer_funds(a, c, 300)
+        transfer_service.transfer_funds(c, b, 100)
+    return a, b, c
+
+def test_clean_ledger_reconciles(account_repository, transaction_repository, accounts):
+    service = ReconciliationService(account_repository, transaction_repository)
+    report = service.reconcile()
+    assert report.accounts_checked == 3
+    assert report.discrepancies == []
+
+def test_second_run_replays_only_new_segments(small_segments, account_repository, transaction_repository, accounts):
+    a, b, c = accounts
+    service = ReconciliationService(account_repository, transaction_repository)
+    first = service.reconcile()
+    # Six postings on each account: two segments apiece
+    assert first.segments_replayed == 6
+
+    assert service.reconcile().segments_replayed == 0
+    for _ in range(4):
+        account = account_repository.get_account_by_id(a)
+        account.deposit(100)
+        account_repository.update_account(account)
+        transaction_repository.save_transaction(Transaction.create_deposit(a, 100))
+    # a's partial second segment filled and a third began; only those two are replayed
+    report = service.reconcile()
+    assert report.segments_replayed == 2
+    assert report.discrepancies == []
+    assert service.reconcile(full=True).segments_replayed == 7
+
+def test_balance_drift_is_reported(account_repository, transaction_repository, accounts):
+    a, _, _ = accounts
+    service = ReconciliationService(account_repository, transaction_repository)
+    service.reconcile()
+    account = account_repository.get_account_by_id(a)
+    account.balance += 1
+    account_repository.update_account(account)
+
+    [discrepancy] = service.reconcile().discrepancies
+    assert discrepancy.account_id == a
+    assert discrepancy.balance == discrepancy.expected_balance + 1
+    assert discrepancy.replayed_balance == discrepancy.expected_balance
+    assert discrepancy.corrupt_segments == []
+
+def test_drift_before_the_first_run_is_reported(account_repository, transaction_repository, accounts):
+    _, b, _ = accounts
+    account = account_repository.get_account_by_id(b)
+    account.balance -= 7
+    account_repository.update_account(account)
+    # A fresh service, as after a restart, still checks the balance from the opening deposit
+    [discrepancy] = ReconciliationService(account_repository, transaction_repository).reconcile().discrepancies
+    assert discrepancy.account_id == b
+    assert discrepancy.balance == discrepancy.expected_balance - 7
+
+def test_tampered_history_is_located(small_segments, account_repository, transaction_repository, accounts):
+    _, b, _ = accounts
+    service = ReconciliationService(account_repository, transaction_repository)
+    service.reconcile()
+    # Rewrite an already-saved withdrawal from b's first segment
+    transaction_repository.get_segment_postings(b, 0)[0][0].amount += 50
+
+    assert service.reconcile().discrepancies == []
+    [discrepancy] = service.reconcile(full=True).discrepancies
+    assert discrepancy.account_id == b
+    assert discrepancy.corrupt_segments == [0]
+    assert discrepancy.replayed_balance == discrepancy.expected_balance - 50
+
+def test_parallel_replay_matches_in_process(small_segments, account_repository, transaction_repository, accounts):
+    in_process = ReconciliationService(account_repository, transaction_repository).reconcile()
+    pooled = ReconciliationService(account_repository, transaction_repository, max_workers=2, parallel_threshold=1).reconcile()
+    assert pooled.segments_replayed == in_process.segments_replayed == 6
+    assert pooled.discrepancies == in_process.discrepancies == []
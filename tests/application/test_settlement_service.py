@@ -0,0 +1,172 @@
+import pytest
+from uuid import uuid4
+from datetime import datetime
+
+from domain.entities.account import Account, AccountType, AccountStatus
+from domain.entities.transaction import Transaction
+from domain.services.risk_check import RiskCheck, RiskDecision
+from domain.services.limit_constraint import LimitConstraint
+from domain.exceptions.domain_exceptions import InvalidAmountError
+from infrastructure.repositories.account_repository import InMemoryAccountRepository
+from infrastructure.repositories.transaction_repository import InMemoryTransactionRepository
+
+@pytest.fixture
+def account_repository():
+    return InMemoryAccountRepository()
+
+@pytest.fixture
+def transaction_repository():
+    return InMemoryTransactionRepository()
+
+@pytest.fixture
+def settlement_service(account_repository, transaction_repository):
+    from infrastructure.adapters.notification_adapter import MockNotificationAdapter
+    from application.services.notification_service import NotificationService
+    from application.services.settlement_service import SettlementService
+    return SettlementService(account_repository, transaction_repository, NotificationService(MockNotificationAdapter()))
+
+def open_account(account_repository, balance):
+    account = Account(
+        account_id=uuid4(),
+        account_type=AccountType.CHECKING,
+        balance=balance,
+        status=AccountStatus.ACTIVE,
+        creation_date=datetime.utcnow(),
+    )
+    account_repository.create_account(account)
+    return account.account_id
+
+def balances(account_repository, *account_ids):
+    return [account_repository.get_account_by_id(account_id).balance for account_id in account_ids]
+
+def test_cycle_settles_without_funds(settlement_service, account_repository, transaction_repository):
+    a, b, c = (open_account(account_repository, 0) for _ in range(3))
+    queued = [
+        settlement_service.queue_transfer(a, b, 5000),
+        settlement_service.queue_transfer(b, c, 5000),
+        settlement_service.queue_transfer(c, a, 5000),
+    ]
+    result = settlement_service.settle()
+
+    assert result.rejected == {}
+    assert result.net_positions == {a: 0, b: 0, c: 0}
+    assert balances(account_repository, a, b, c) == [0, 0, 0]
+    # Every gross transfer is still recorded and counted
+    assert list(result.settled) == [t.transfer_id for t in queued]
+    assert list(result.settled.values()) == [t.transaction_id for t in result.transactions]
+    assert len(transaction_repository.get_transactions_for_account(a)) == 1
+    assert account_repository.get_account_by_id(a).daily_spent == 5000
+    assert settlement_service.pending_count() == 0
+
+def test_only_net_moves(settlement_service, account_repository):
+    a, b = open_account(account_repository, 1000), open_account(account_repository, 0)
+    settlement_service.queue_transfer(a, b, 8000)
+    settlement_service.queue_transfer(b, a, 7500)
+    result = settlement_service.settle()
+    assert result.net_positions == {a: -500, b: 500}
+    assert balances(account_repository, a, b) == [500, 500]
+
+def test_unfunded_net_debit_drops_latest_transfers_and_cascades(settlement_service, account_repository):
+    a, b, c = open_account(account_repository, 1000), open_account(account_repository, 0), open_account(account_repository, 0)
+    first = settlement_service.queue_transfer(a, b, 1000)
+    second = settlement_service.queue_transfer(a, b, 1000)
+    # b can only pass this on if both of a's transfers settle
+    onward = settlement_service.queue_transfer(b, c, 2000)
+    result = settlement_service.settle()
+
+    assert set(result.rejected) == {second.transfer_id, onward.transfer_id}
+    assert list(result.settled) == [first.transfer_id]
+    assert balances(account_repository, a, b, c) == [0, 1000, 0]
+    assert account_repository.get_account_by_id(b).daily_spent == 0
+
+def test_limits_apply_to_gross_amounts(settlement_service, account_repository):
+    a, b = open_account(account_repository, 0), open_account(account_repository, 0)
+    account = account_repository.get_account_by_id(a)
+    account.limit_constraint = LimitConstraint(daily_limit=10000, monthly_limit=50000)
+    account_repository.update_account(account)
+
+    settlement_service.queue_transfer(a, b, 6000)
+    settlement_service.queue_transfer(b, a, 6000)
+    over = settlement_service.queue_transfer(a, b, 6000)
+    result = settlement_service.settle()
+
+    # Net debit of a is zero, but its gross outflow would be 12000
+    assert list(result.rejected) == [over.transfer_id]
+    assert "Daily withdrawal limit" in result.rejected[over.transfer_id]
+    assert balances(account_repository, a, b) == [0, 0]
+
+def test_missing_accounts_and_bad_amounts(settlement_service, account_repository):
+    a = open_account(account_repository, 1000)
+    missing = settlement_service.queue_transfer(a, uuid4(), 100)
+    result = settlement_service.settle()
+    assert "not found" in result.rejected[missing.transfer_id]
+    assert balances(account_repository, a) == [1000]
+    with pytest.raises(InvalidAmountError):
+        settlement_service.queue_transfer(a, a, 0)
+    assert settlement_service.settle().transactions == []
+
+def test_transactions_are_created_in_ledger_order(settlement_service, account_repository, transaction_repository):
+    a, b = open_account(account_repository, 1000), open_account(account_repository, 0)
+    settlement_service.queue_transfer(a, b, 100)
+    # Saved after the transfer was queued but before it settled
+    deposit = Transaction.create_deposit(a, 100)
+    transaction_repository.save_transaction(deposit)
+    result = settlement_service.settle()
+    ledger = transaction_repository.get_transactions_since(0)
+    assert ledger == [deposit] + result.transactions
+    assert sorted(ledger, key=lambda t: t.transaction_id) == ledger
+    assert sorted(ledger, key=lambda t: t.timestamp) == ledger
+
+class RecordingRiskCheck(RiskCheck):
+    def __init__(self, blocked=()):
+        self.blocked = set(blocked)
+        self.assessed = []
+
+    def assess(self, account_id, amount, counterparty_id=None):
+        self.assessed.append((account_id, counterparty_id))
+        return RiskDecision.BLOCK if account_id in self.blocked else RiskDecision.ALLOW
+
+def risk_checked_service(account_repository, transaction_repository, risk_check):
+    from infrastructure.adapters.notification_adapter import MockNotificationAdapter
+    from application.services.notification_service import NotificationService
+    from application.services.settlement_service import SettlementService
+    return SettlementService(account_repository, transaction_repository, NotificationService(MockNotificationAdapter()), risk_check)
+
+def test_unfunded_transfers_are_not_risk_assessed(account_repository, transaction_repository):
+    a, b = open_account(account_repository, 1000), open_account(account_repository, 0)
+    risk_check = RecordingRiskCheck()
+    service = risk_checked_service(account_repository, transaction_repository, risk_check)
+    service.queue_transfer(a, b, 1000)
+    unfunded = service.queue_transfer(a, b, 1000)
+    result = service.settle()
+    assert list(result.rejected) == [unfunded.transfer_id]
+    assert risk_check.assessed == [(a, b)]
+
+def test_risk_refusal_drops_transfers_it_leaves_unfunded_before_judging_them(account_repository, transaction_repository):
+    a, b, c = open_account(account_repository, 1000), open_account(account_repository, 0), open_account(account_repository, 0)
+    risk_check = RecordingRiskCheck(blocked={a, b})
+    service = risk_checked_service(account_repository, transaction_repository, risk_check)
+    blocked = service.queue_transfer(a, b, 1000)
+    onward = service.queue_transfer(b, c, 1000)
+    result = service.settle()
+    assert "risk" in result.rejected[blocked.transfer_id]
+    assert "Insufficient funds" in result.rejected[onward.transfer_id]
+    assert risk_check.assessed == [(a, b)]
+    assert account_repository.get_account_by_id(a).failed_attempts == 1
+    # b is not held to account for a transfer it could never have funded
+    assert account_repository.get_account_by_id(b).failed_attempts == 0
+    assert balances(account_repository, a, b, c) == [1000, 0, 0]
+
+def test_batch_spends_the_same_velocity_allowance_as_single_transfers(account_repository, transaction_repository):
+    from domain.services.risk_check import VelocityRiskCheck
+    a, b = open_account(account_repository, 1000000), open_account(account_repository, 0)
+    risk_check = VelocityRiskCheck(clock=lambda: 0.0)
+    service = risk_checked_service(account_repository, transaction_repository, risk_check)
+    transfers = [service.queue_transfer(a, b, 100) for _ in range(200)]
+    result = service.settle()
+    burst = risk_check.config.burst
+    assert list(result.settled) == [t.transfer_id for t in transfers[:burst]]
+    assert all("risk" in result.rejected[t.transfer_id] for t in transfers[burst:])
+    assert balances(account_repository, a, b) == [1000000 - burst * 100, burst * 100]
+    assert risk_check.assess(a, 100, b) == RiskDecision.THROTTLE
+    assert account_repository.get_account_by_id(a).failed_attempts == 0
@@ -0,0 +1,161 @@
+import time
+import pytest
+from uuid import uuid4
+from datetime import datetime, timedelta
+
+from domain.entities.account import Account, AccountType, AccountStatus
+from domain.entities.standing_order import StandingOrderStatus
+from domain.exceptions.domain_exceptions import RiskCheckFailedError, StandingOrderNotFoundError
+from domain.services.risk_check import RiskCheck, RiskDecision
+from infrastructure.repositories.account_repository import InMemoryAccountRepository
+from infrastructure.repositories.transaction_repository import InMemoryTransactionRepository
+from infrastructure.repositories.standing_order_repository import InMemoryStandingOrderRepository
+from application.services.standing_order_service import StandingOrderService
+from application.services.deadline_scheduler import DeadlineScheduler
+
+START = datetime(2024, 1, 1, 9)
+
+@pytest.fixture
+def account_repository():
+    return InMemoryAccountRepository()
+
+@pytest.fixture
+def transaction_repository():
+    return InMemoryTransactionRepository()
+
+@pytest.fixture
+def standing_order_repository():
+    return InMemoryStandingOrderRepository()
+
+@pytest.fixture
+def standing_order_service(account_repository, transaction_repository, standing_order_repository):
+    from infrastructure.adapters.notification_adapter import MockNotificationAdapter
+    from application.services.notification_service import NotificationService
+    from application.services.fund_transfer_service import FundTransferService
+    fund_transfer_service = FundTransferService(
+        account_repository, transaction_repository, NotificationService(MockNotificationAdapter())
+    )
+    return StandingOrderService(standing_order_repository, account_repository, fund_transfer_service)
+
+def open_account(account_repository, balance):
+    account = Account(
+        account_id=uuid4(),
+        account_type=AccountType.CHECKING,
+        balance=balance,
+        status=AccountStatus.ACTIVE,
+        creation_date=datetime.utcnow(),
+    )
+    account_repository.create_account(account)
+    return account.account_id
+
+def test_runs_due_orders_and_reschedules(standing_order_service, account_repository):
+    source, destination = open_account(account_repository, 10000), open_account(account_repository, 0)
+    order = standing_order_service.create_order(source, destination, 2500, "daily", start_at=START)
+
+    assert standing_order_service.run_due(START - timedelta(seconds=1)) == 0
+    assert standing_order_service.run_due(START) == 1
+    assert standing_order_service.run_due(START) == 0
+    assert standing_order_service.next_due_time() == START + timedelta(days=1)
+    assert standing_order_service.run_due(START + timedelta(days=1)) == 1
+
+    assert account_repository.get_account_by_id(destination).balance == 5000
+    assert order.last_transaction_id is not None
+    assert order.occurrence == 2
+
+def test_failed_run_is_recorded_and_retried_next_time(standing_order_service, account_repository):
+    source, destination = open_account(account_repository, 1000), open_account(account_repository, 0)
+    order = standing_order_service.create_order(source, destination, 2500, "WEEKLY", start_at=START)
+    standing_order_service.run_due(START)
+    assert order.failure_count == 1
+    assert "Insufficient funds" in order.last_error
+    assert order.status == StandingOrderStatus.ACTIVE
+    assert standing_order_service.next_due_time() == START + timedelta(weeks=1)
+
+def test_cancelled_orders_never_run(standing_order_service, account_repository):
+    source, destination = open_account(account_repository, 10000), open_account(account_repository, 0)
+    order = standing_order_service.create_order(source, destination, 2500, "MONTHLY", start_at=START)
+    standing_order_service.cancel_order(order.order_id)
+    assert standing_order_service.next_due_time() is None
+    assert standing_order_service.run_due(START + timedelta(days=365)) == 0
+    with pytest.raises(StandingOrderNotFoundError):
+        standing_order_service.cancel_order(uuid4())
+
+def test_batches_come_out_earliest_first(standing_order_repository, standing_order_service):
+    orders = [
+        standing_order_service.create_order(uuid4(), uuid4(), 100, "DAILY", start_at=START + timedelta(minutes=minute))
+        for minute in (30, 10, 20, 0, 40)
+    ]
+    due = standing_order_repository.pop_due(START + timedelta(minutes=25), limit=2)
+    assert [order.next_run_at for order in due] == [START, START + timedelta(minutes=10)]
+    due = standing_order_repository.pop_due(START + timedelta(minutes=25), limit=10)
+    assert [order.next_run_at for order in due] == [START + timedelta(minutes=20)]
+    assert len(standing_order_repository.get_orders_for_account(orders[0].source_account_id)) == 1
+
+def test_scheduler_sleeps_until_woken_by_a_new_order(standing_order_service, account_repository):
+    source, destination = open_account(account_repository, 10000), open_account(account_repository, 0)
+    scheduler = DeadlineScheduler(standing_order_service, "standing-order-scheduler")
+    scheduler.start()
+    try:
+        standing_order_service.create_order(source, destination, 1000, "DAILY", start_at=datetime.utcnow())
+        deadline = time.monotonic() + 5
+        while account_repository.get_account_by_id(destination).balance == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert account_repository.get_account_by_id(destination).balance == 1000
+    finally:
+        scheduler.stop(timeout=5)
+
+def test_unexpected_error_leaves_the_batch_scheduled(standing_order_service, account_repository, monkeypatch):
+    source, destination = open_account(account_repository, 10000), open_account(account_repository, 0)
+    orders = [standing_order_service.create_order(source, destination, 100, "DAILY", start_at=START) for _ in range(3)]
+    monkeypatch.setattr(
+        standing_order_service.fund_transfer_service, "transfer_funds", lambda *args: (_ for _ in ()).throw(RuntimeError("boom"))
+    )
+    with pytest.raises(RuntimeError):
+        standing_order_service.run_due(START)
+    assert orders[0].next_run_at == START + timedelta(days=1)
+    assert standing_order_service.next_due_time() == START
+    monkeypatch.undo()
+    assert standing_order_service.run_due(START) == 2
+
+class BlockingRiskCheck(RiskCheck):
+    def __init__(self):
+        self.recorded = []
+
+    def assess(self, account_id, amount, counterparty_id=None):
+        return RiskDecision.BLOCK if amount > 1000 else RiskDecision.ALLOW
+
+    def record(self, account_id, amount, counterparty_id=None):
+        self.recorded.append(amount)
+
+def test_orders_are_risk_assessed_when_created(standing_order_service, standing_order_repository, account_repository):
+    risk_check = standing_order_service.risk_check = BlockingRiskCheck()
+    source, destination = open_account(account_repository, 10000), open_account(account_repository, 0)
+    standing_order_service.create_order(source, destination, 1000, "DAILY", start_at=START)
+    with pytest.raises(RiskCheckFailedError):
+        standing_order_service.create_order(source, destination, 5000, "DAILY", start_at=START)
+    assert risk_check.recorded == [1000]
+    assert len(standing_order_repository.get_orders_for_account(source)) == 1
+    assert account_repository.get_account_by_id(source).failed_attempts == 1
+
+def test_container_throttles_order_creation_not_runs(
+    account_repository, transaction_repository, standing_order_repository
+):
+    from presentation.container import ServiceContainer
+    container = ServiceContainer(account_repository, transaction_repository, standing_order_repository)
+    service = container.standing_order_service
+    source = open_account(account_repository, 1_000_000)
+    created = 0
+    for _ in range(60):
+        try:
+            service.create_order(source, open_account(account_repository, 0), 100, "DAILY", start_at=START)
+            created += 1
+        except RiskCheckFailedError:
+            pass
+    burst = container.risk_check.config.burst
+    assert burst <= created < 60
+    # Every order that was allowed runs, even though the payer's bucket is empty
+    assert service.run_due(START, batch_size=100) == created
+    account = account_repository.get_account_by_id(source)
+    assert account.balance == 1_000_000 - created * 100
+    assert account.failed_attempts == 0
+    assert not account.is_locked
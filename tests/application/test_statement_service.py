@@ -25,7 +25,7 @@ def account(account_repository):
     account = Account(
         account_id=UUID("123e4567-e89b-12d3-a456-426614174000"),
         account_type=AccountType.CHECKING,
-        balance=1000.0,
+        balance=100000,
         status=AccountStatus.ACTIVE,
         creation_date=datetime.utcnow(),
     )
@@ -42,7 +42,7 @@ def test_generate_statement_success(statement_service, account, transaction_repo
         transaction_id=uuid4(),
         account_id=account.account_id,
         transaction_type=TransactionType.DEPOSIT,
-        amount=100.0,
+        amount=10000,
         timestamp=datetime.utcnow(),
         destination_account_id=None
     )
@@ -51,10 +51,28 @@ def test_generate_statement_success(statement_service, account, transaction_repo
     end_date = datetime.utcnow()
     statement = statement_service.generate_statement(account.account_id, start_date, end_date)
     assert len(statement.transactions) == 1
-    assert statement.transactions[0].amount == 100.0
+    assert statement.transactions[0].amount == 10000
 
 def test_generate_statement_account_not_found(statement_service):
     start_date = datetime.utcnow() - timedelta(days=30)
     end_date = datetime.utcnow()
     with pytest.raises(Exception):  # Replace with specific exception if defined
-        statement_service.generate_statement(uuid4(), start_date, end_date)
\ No newline at end of file
+        statement_service.generate_statement(uuid4(), start_date, end_date)
+def test_generate_statement_reads_archived_transactions(account_repository, statement_adapter, account, tmp_path):
+    from infrastructure.repositories.transaction_archive import TransactionArchive
+    from application.services.statement_service import StatementService
+    transaction_repository = InMemoryTransactionRepository(archive=TransactionArchive(str(tmp_path)))
+    now = datetime.utcnow()
+    for days_ago in (200, 100, 10):
+        transaction_repository.save_transaction(Transaction(
+            transaction_id=uuid4(),
+            account_id=account.account_id,
+            transaction_type=TransactionType.DEPOSIT,
+            amount=days_ago,
+            timestamp=now - timedelta(days=days_ago),
+            destination_account_id=None
+        ))
+    assert transaction_repository.archive_before(now - timedelta(days=90)) == 2
+    service = StatementService(account_repository, transaction_repository, statement_adapter)
+    statement = service.generate_statement(account.account_id, now - timedelta(days=150), now)
+    assert [t.amount for t in statement.transactions] == [100, 10]
@@ -1,6 +1,6 @@
 import pytest
 from uuid import UUID, uuid4
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from domain.entities.account import Account, AccountType, AccountStatus
 from domain.entities.transaction import Transaction, TransactionType
@@ -8,7 +8,10 @@ from domain.exceptions.domain_exceptions import (
     InsufficientFundsError,
     InvalidAmountError,
     AccountNotFoundError,
+    AccountLockedError,
+    RiskCheckFailedError,
 )
+from domain.services.risk_check import RiskCheck, RiskDecision
 from infrastructure.repositories.account_repository import InMemoryAccountRepository
 from infrastructure.repositories.transaction_repository import InMemoryTransactionRepository
 
@@ -31,7 +34,7 @@ def account_id(account_repository):
     account = Account(
         account_id=UUID("123e4567-e89b-12d3-a456-426614174000"),
         account_type=AccountType.CHECKING,
-        balance=100.0,
+        balance=10000,
         status=AccountStatus.ACTIVE,
         creation_date=datetime.utcnow(),
     )
@@ -44,31 +47,98 @@ def transaction_service(account_repository, transaction_repository, notification
     return TransactionService(account_repository, transaction_repository, notification_service)
 
 def test_deposit_success(transaction_service, account_repository, account_id, transaction_repository):
-    amount = 50.0
+    amount = 5000
     transaction = transaction_service.deposit(account_id, amount)
     updated_account = account_repository.get_account_by_id(account_id)
     transactions = transaction_repository.get_transactions_for_account(account_id)
-    assert updated_account.balance == 150.0
+    assert updated_account.balance == 15000
     assert len(transactions) == 1
     assert transactions[0].amount == amount
 
 def test_withdraw_success(transaction_service, account_repository, account_id, transaction_repository):
-    amount = 30.0
+    amount = 3000
     transaction = transaction_service.withdraw(account_id, amount)
     updated_account = account_repository.get_account_by_id(account_id)
     transactions = transaction_repository.get_transactions_for_account(account_id)
-    assert updated_account.balance == 70.0
+    assert updated_account.balance == 7000
     assert len(transactions) == 1
     assert transactions[0].amount == amount
 
 def test_withdraw_insufficient_funds(transaction_service, account_id):
     with pytest.raises(InsufficientFundsError):
-        transaction_service.withdraw(account_id, 200.0)
+        transaction_service.withdraw(account_id, 20000)
 
 def test_withdraw_negative_amount(transaction_service, account_id):
     with pytest.raises(InvalidAmountError):
-        transaction_service.withdraw(account_id, -10.0)
+        transaction_service.withdraw(account_id, -1000)
+
+def test_refused_withdrawal_still_saves_limit_rollover(transaction_service, account_repository, account_id):
+    account = account_repository.get_account_by_id(account_id)
+    account.last_reset_date = datetime.utcnow() - timedelta(days=1)
+    account.daily_spent = 500
+    version = account_repository.get_account_version(account_id)
+    with pytest.raises(InsufficientFundsError):
+        transaction_service.withdraw(account_id, 20000)
+    # The cleared counters reached the store under a new version, so a cached read is stale
+    assert account_repository.get_account_version(account_id) == version + 1
+    assert account_repository.get_account_by_id(account_id).daily_spent == 0
 
 def test_deposit_account_not_found(transaction_service):
     with pytest.raises(AccountNotFoundError):
-        transaction_service.deposit(uuid4(), 50.0)
\ No newline at end of file
+        transaction_service.deposit(uuid4(), 5000)
+
+class FixedRiskCheck(RiskCheck):
+    def __init__(self, decision):
+        self.decision = decision
+
+    def assess(self, account_id, amount, counterparty_id=None):
+        return self.decision
+
+def risky_service(account_repository, transaction_repository, notification_service, decision):
+    from application.services.transaction_service import TransactionService
+    return TransactionService(account_repository, transaction_repository, notification_service, FixedRiskCheck(decision))
+
+def test_withdraw_blocked_by_risk_check(account_repository, transaction_repository, notification_service, account_id):
+    service = risky_service(account_repository, transaction_repository, notification_service, RiskDecision.BLOCK)
+    for _ in range(2):
+        with pytest.raises(RiskCheckFailedError):
+            service.withdraw(account_id, 1000)
+    # The third block trips the failed-attempt lock
+    with pytest.raises(AccountLockedError):
+        service.withdraw(account_id, 1000)
+
+    account = account_repository.get_account_by_id(account_id)
+    assert account.balance == 10000
+    assert account.is_locked
+    assert transaction_repository.get_transactions_for_account(account_id) == []
+
+def test_withdraw_locked_by_risk_check(account_repository, transaction_repository, notification_service, account_id):
+    service = risky_service(account_repository, transaction_repository, notification_service, RiskDecision.LOCK)
+    with pytest.raises(AccountLockedError):
+        service.withdraw(account_id, 1000)
+    assert account_repository.get_account_by_id(account_id).is_locked
+    assert account_repository.get_account_version(account_id) == 2
+
+def test_throttled_withdrawals_never_lock(account_repository, transaction_repository, notification_service, account_id):
+    service = risky_service(account_repository, transaction_repository, notification_service, RiskDecision.THROTTLE)
+    for _ in range(5):
+        with pytest.raises(RiskCheckFailedError):
+            service.withdraw(account_id, 1000)
+    account = account_repository.get_account_by_id(account_id)
+    assert account.failed_attempts == 0
+    assert not account.is_locked
+
+def test_only_completed_withdrawals_are_recorded(account_repository, transaction_repository, notification_service, account_id):
+    from application.services.transaction_service import TransactionService
+    from domain.services.risk_check import VelocityRiskCheck, VelocityConfig
+    risk_check = VelocityRiskCheck(VelocityConfig(burst=3, rate_per_second=0.0))
+    service = TransactionService(account_repository, transaction_repository, notification_service, risk_check)
+    for _ in range(10):
+        with pytest.raises(InsufficientFundsError):
+            service.withdraw(account_id, 1_000_000)
+    # Failed debits spent no tokens, so the whole burst is still available
+    for _ in range(3):
+        service.withdraw(account_id, 100)
+    with pytest.raises(RiskCheckFailedError):
+        service.withdraw(account_id, 100)
+    assert account_repository.get_account_by_id(account_id).failed_attempts == 0
@@ -0,0 +1,58 @@
+import pytest
+
+from domain.entities.account import AccountType
+from domain.entities.transaction import TransactionType
+from benchmarks.fixtures import PopulationSpec, generate_population, load_population, build_repositories
+
+@pytest.fixture
+def spec():
+    return PopulationSpec(num_accounts=200, num_transactions=2000, seed=7)
+
+def replayed_balances(population):
+    balances = {}
+    for account_id, transactions in population.transactions.items():
+        for t in transactions:
+            sign = 1 if t.transaction_type == TransactionType.DEPOSIT else -1
+            balances[account_id] = balances.get(account_id, 0) + sign * t.amount
+            if t.transaction_type == TransactionType.TRANSFER:
+                balances[t.destination_account_id] = balances.get(t.destination_account_id, 0) + t.amount
+    return balances
+
+def test_generation_is_deterministic(spec):
+    first = generate_population(spec)
+    second = generate_population(spec)
+    assert list(first.accounts) == list(second.accounts)
+    assert [a.balance for a in first.accounts.values()] == [a.balance for a in second.accounts.values()]
+
+def test_population_mix(spec):
+    population = generate_population(spec)
+    types = {account.account_type for account in population.accounts.values()}
+    assert types == {AccountType.CHECKING, AccountType.SAVINGS}
+    assert any(account.limit_constraint for account in population.accounts.values())
+    assert sum(len(t) for t in population.transactions.values()) == spec.num_transactions
+
+def test_activity_is_skewed(spec):
+    population = generate_population(spec)
+    counts = sorted((len(t) for t in population.transactions.values()), reverse=True)
+    top_decile = sum(counts[:len(counts) // 10])
+    assert top_decile > spec.num_transactions * 0.3
+
+def test_balances_match_history(spec):
+    population = generate_population(spec)
+    fresh = generate_population(PopulationSpec(num_accounts=200, num_transactions=0, seed=7))
+    deltas = replayed_balances(population)
+    for account_id, account in population.accounts.items():
+        expected = fresh.accounts[account_id].balance + deltas.get(account_id, 0)
+        assert account.balance == expected
+
+def test_snapshot_cache_round_trip(spec, tmp_path):
+    generated = load_population(spec, str(tmp_path))
+    assert len(list(tmp_path.iterdir())) == 1
+    cached = load_population(spec, str(tmp_path))
+    assert list(cached.accounts) == list(generated.accounts)
+
+def test_build_repositories(spec, tmp_path):
+    account_repository, transaction_repository, population = build_repositories(spec, str(tmp_path))
+    account_id = next(iter(population.accounts))
+    assert account_repository.get_account_by_id(account_id) is not None
+    assert transaction_repository.get_transactions_for_account(account_id) == population.transactions[account_id]
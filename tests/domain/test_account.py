@@ -13,71 +13,104 @@ from domain.services.interest_strategy import SavingsInterestStrategy
 from domain.services.limit_constraint import LimitConstraint
 
 def test_account_creation():
-    account = Account.create(AccountType.CHECKING, initial_deposit=100.0)
+    account = Account.create(AccountType.CHECKING, initial_deposit=10000)
     assert account.account_type == AccountType.CHECKING
-    assert account.balance == 100.0
+    assert account.balance == 10000
     assert account.status == AccountStatus.ACTIVE
     assert isinstance(account.account_id, UUID)
     assert isinstance(account.creation_date, datetime)
 
 def test_deposit_valid_amount():
-    account = Account.create(AccountType.SAVINGS, initial_deposit=100.0)  # Add minimum deposit
-    account.deposit(50.0)
-    assert account.balance == 150.0
+    account = Account.create(AccountType.SAVINGS, initial_deposit=10000)  # Add minimum deposit
+    account.deposit(5000)
+    assert account.balance == 15000
 
 def test_deposit_negative_amount():
-    account = Account.create(AccountType.SAVINGS, initial_deposit=100.0)  # Add minimum deposit
+    account = Account.create(AccountType.SAVINGS, initial_deposit=10000)  # Add minimum deposit
     with pytest.raises(InvalidAmountError):
-        account.deposit(-10.0)
+        account.deposit(-1000)
 
 def test_withdraw_valid_amount():
-    account = Account.create(AccountType.CHECKING, initial_deposit=100.0)
-    account.withdraw(30.0)
-    assert account.balance == 70.0
-    assert account.daily_spent == 30.0
-    assert account.monthly_spent == 30.0
+    account = Account.create(AccountType.CHECKING, initial_deposit=10000)
+    account.withdraw(3000)
+    assert account.balance == 7000
+    assert account.daily_spent == 3000
+    assert account.monthly_spent == 3000
 
 def test_withdraw_insufficient_funds():
-    account = Account.create(AccountType.CHECKING, initial_deposit=20.0)
+    account = Account.create(AccountType.CHECKING, initial_deposit=2000)
     #check if withdrawal is processed correctly with overdraft
-    account.withdraw(30.0)
-    assert account.balance == -10.0
-    assert account.daily_spent == 30.0
+    account.withdraw(3000)
+    assert account.balance == -1000
+    assert account.daily_spent == 3000
 
 def test_withdraw_from_closed_account():
     account = Account(
         account_id=uuid4(),
         account_type=AccountType.CHECKING,
-        balance=100.0,
+        balance=10000,
         status=AccountStatus.CLOSED,
         creation_date=datetime.utcnow(),
     )
     with pytest.raises(InvalidAccountStatusError):
-        account.withdraw(20.0)
+        account.withdraw(2000)
 
 def test_apply_interest():
-    account = Account.create(AccountType.SAVINGS, initial_deposit=1000.0)
+    account = Account.create(AccountType.SAVINGS, initial_deposit=100000)
     account.interest_strategy = SavingsInterestStrategy()
     interest = account.apply_interest()
-    assert interest == 30.0  # 3% of 1000
-    assert account.balance == 1030.0
+    assert interest == 3000  # 3% of $1000
+    assert account.balance == 103000
 
 def test_withdraw_with_limits():
-    account = Account.create(AccountType.CHECKING, initial_deposit=1000.0)
-    account.limit_constraint = LimitConstraint(daily_limit=100.0, monthly_limit=500.0)
-    account.withdraw(50.0)
-    assert account.daily_spent == 50.0
+    account = Account.create(AccountType.CHECKING, initial_deposit=100000)
+    account.limit_constraint = LimitConstraint(daily_limit=10000, monthly_limit=50000)
+    account.withdraw(5000)
+    assert account.daily_spent == 5000
     with pytest.raises(TransactionLimitExceededError):
-        account.withdraw(60.0)  # Exceeds daily limit
+        account.withdraw(6000)  # Exceeds daily limit
 
 def test_reset_limits():
-    account = Account.create(AccountType.CHECKING, initial_deposit=1000.0)
-    account.limit_constraint = LimitConstraint(daily_limit=100.0, monthly_limit=500.0)
-    account.withdraw(50.0)
-    assert account.daily_spent == 50.0
+    account = Account.create(AccountType.CHECKING, initial_deposit=100000)
+    account.limit_constraint = LimitConstraint(daily_limit=10000, monthly_limit=50000)
+    account.withdraw(5000)
+    assert account.daily_spent == 5000
     
     next_day = account.last_reset_date + timedelta(days=1)
     next_month = account.last_reset_date.replace(month=account.last_reset_date.month + 1)
-    account.reset_limits(next_month)  # Use next_month instead of next_day
+    assert account.reset_limits(next_month)  # Use next_month instead of next_day
     
-    assert account.daily_spent == 0.0
+    assert account.daily_spent == 0
+    assert not account.reset_limits(next_month)
+
+def test_holds_reduce_available_balance():
+    account = Account.create(AccountType.SAVINGS, initial_deposit=30000)
+    account.place_hold(15000)
+    assert account.available_balance == 15000
+    # The savings minimum applies to what is left after holds
+    with pytest.raises(InsufficientFundsError):
+        account.withdraw(6000)
+    with pytest.raises(InsufficientFundsError):
+        account.place_hold(6000)
+    account.release_hold(15000)
+    account.withdraw(6000)
+    assert account.balance == 24000
+
+def test_capture_hold():
+    account = Account.create(AccountType.CHECKING, initial_deposit=10000)
+    account.place_hold(8000)
+    with pytest.raises(InvalidAmountError):
+        account.capture_hold(8000, 9000)
+    account.capture_hold(8000, 6000)
+    assert account.balance == 4000
+    assert account.held_amount == 0
+    assert account.daily_spent == 6000
+
+def test_failed_capture_keeps_hold():
+    account = Account.create(AccountType.CHECKING, initial_deposit=10000)
+    account.limit_constraint = LimitConstraint(daily_limit=5000, monthly_limit=50000)
+    account.place_hold(8000)
+    with pytest.raises(TransactionLimitExceededError):
+        account.capture_hold(8000, 8000)
+    assert account.held_amount == 8000
+    assert account.balance == 10000
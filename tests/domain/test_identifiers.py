@@ -0,0 +1,65 @@
+import pytest
+import threading
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from domain.entities import identifiers
+from domain.entities.identifiers import uuid7, uuid7_time, uuid7_floor
+from domain.entities.account import Account, AccountType
+from domain.entities.transaction import Transaction
+
+@pytest.fixture(autouse=True)
+def fresh_generator(monkeypatch):
+    # Tests that fake the clock must not leave a future timestamp behind for later ids
+    monkeypatch.setattr(identifiers, "_last_ms", 0)
+    monkeypatch.setattr(identifiers, "_counter", 0)
+
+def test_version_and_variant():
+    value = uuid7()
+    assert value.version == 7
+    assert value.variant == "specified in RFC 4122"
+
+def test_ids_are_monotonic_within_a_millisecond():
+    with patch("domain.entities.identifiers.time.time_ns", return_value=1_700_000_000_000_000_000):
+        ids = [uuid7() for _ in range(10_000)]
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
+
+def test_ids_stay_monotonic_when_the_clock_steps_back():
+    with patch("domain.entities.identifiers.time.time_ns", return_value=1_800_000_000_000_000_000):
+        first = uuid7()
+    with patch("domain.entities.identifiers.time.time_ns", return_value=1_799_999_999_000_000_000):
+        second = uuid7()
+    assert second > first
+
+def test_ids_are_unique_across_threads():
+    ids = []
+
+    def generate():
+        ids.extend(uuid7() for _ in range(5_000))
+
+    threads = [threading.Thread(target=generate) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(set(ids)) == len(ids)
+
+def test_time_round_trip_and_cursor():
+    before = datetime.utcnow() - timedelta(milliseconds=1)
+    value = uuid7()
+    assert abs(uuid7_time(value) - datetime.utcnow()) < timedelta(seconds=1)
+    assert uuid7_floor(before) < value
+    assert uuid7_floor(datetime.utcnow() + timedelta(seconds=1)) > value
+
+def test_new_accounts_and_transactions_use_time_ordered_ids():
+    account = Account.create(AccountType.CHECKING)
+    deposit = Transaction.create_deposit(account.account_id, 100)
+    withdrawal = Transaction.create_withdrawal(account.account_id, 100)
+    assert account.account_id.version == 7
+    assert account.account_id < deposit.transaction_id < withdrawal.transaction_id
+
+def test_floor_converts_aware_moments_to_utc():
+    naive = datetime(2026, 3, 1, 9, 30)
+    aware = datetime(2026, 3, 1, 11, 30, tzinfo=timezone(timedelta(hours=2)))
+    assert uuid7_floor(aware) == uuid7_floor(naive)
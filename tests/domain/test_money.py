@@ -0,0 +1,53 @@
+import pytest
+from fractions import Fraction
+
+from domain.entities.money import to_cents, from_cents, format_cents, format_currency, apply_rate, apply_compound_rate, cents_array
+
+def test_to_cents_is_exact():
+    assert to_cents(0.1) == 10
+    assert to_cents(19.99) == 1999
+    assert to_cents("1234.565") == 123457
+    assert to_cents(100) == 10000
+
+def test_to_cents_out_of_range():
+    with pytest.raises(ValueError):
+        to_cents(1e20)
+    with pytest.raises(ValueError):
+        to_cents(1e30)
+    with pytest.raises(ValueError):
+        to_cents(float("nan"))
+
+def test_from_cents():
+    assert from_cents(1999) == 19.99
+    assert from_cents(-50) == -0.5
+
+def test_format():
+    assert format_cents(5) == "0.05"
+    assert format_cents(-1050) == "-10.50"
+    assert format_currency(123456) == "$1234.56"
+    assert format_currency(-1000) == "-$10.00"
+
+def test_apply_rate_rounds_half_away_from_zero():
+    assert apply_rate(100000, 300) == 3000  # 3% of $1000
+    assert apply_rate(50, 100) == 1  # 0.5 cents rounds up
+    assert apply_rate(-50, 100) == -1
+
+def test_compound_rate_is_exact_for_large_balances():
+    balance = 900_000_000_000_000_000
+    exact = balance * ((1 + Fraction(300, 10_000 * 365)) ** 365 - 1)
+    assert apply_compound_rate(balance, 300, 365, 365) == int(exact + Fraction(1, 2))
+    # A float computation is off by thousands of cents here
+    assert abs(round(balance * ((1 + 0.03 / 365) ** 365 - 1)) - int(exact)) > 1
+    assert apply_compound_rate(100000, 300, 1, 365) == 8  # 8.22 cents
+    assert apply_compound_rate(100000, 300, 0, 365) == 0
+
+def test_repeated_additions_do_not_drift():
+    balance = 0
+    for _ in range(1000):
+        balance += to_cents(0.1)
+    assert balance == 10000
+
+def test_cents_array_is_int64():
+    values = cents_array([1, 2, 3])
+    assert values.itemsize == 8
+    assert sum(values) == 6
@@ -0,0 +1,86 @@
+import pytest
+from uuid import uuid4
+
+from domain.services.risk_check import VelocityRiskCheck, VelocityConfig, RiskDecision
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+@pytest.fixture
+def risk_check(clock):
+    return VelocityRiskCheck(VelocityConfig(burst=5, rate_per_second=1.0, warmup_transactions=5), clock=clock)
+
+def debit(risk_check, account_id, amount, counterparty_id=None):
+    # A debit that goes through: assessed, then recorded
+    decision = risk_check.assess(account_id, amount, counterparty_id)
+    if decision == RiskDecision.ALLOW:
+        risk_check.record(account_id, amount, counterparty_id)
+    return decision
+
+def warm_up(risk_check, clock, account_id, counterparty_id=None, amount=1000, count=5):
+    for _ in range(count):
+        clock.now += 10
+        assert debit(risk_check, account_id, amount, counterparty_id) == RiskDecision.ALLOW
+
+def test_burst_is_throttled_then_recovers(risk_check, clock):
+    account_id = uuid4()
+    for _ in range(5):
+        assert debit(risk_check, account_id, 1000) == RiskDecision.ALLOW
+    assert debit(risk_check, account_id, 1000) == RiskDecision.THROTTLE
+
+    clock.now += 1
+    assert debit(risk_check, account_id, 1000) == RiskDecision.ALLOW
+
+def test_assessments_alone_change_nothing(risk_check, clock):
+    account_id = uuid4()
+    warm_up(risk_check, clock, account_id)
+    # Debits that fail after being assessed (say for lack of funds) spend no tokens
+    for _ in range(50):
+        assert risk_check.assess(account_id, 1000) == RiskDecision.ALLOW
+    # and do not teach the profile new amounts or counterparties
+    counterparty_id = uuid4()
+    for _ in range(50):
+        risk_check.assess(account_id, 500000, counterparty_id)
+    assert risk_check.assess(account_id, 500000, counterparty_id) == RiskDecision.BLOCK
+
+def test_outlier_to_known_counterparty_is_allowed(risk_check, clock):
+    account_id, counterparty_id = uuid4(), uuid4()
+    warm_up(risk_check, clock, account_id, counterparty_id)
+    clock.now += 10
+    assert risk_check.assess(account_id, 500000, counterparty_id) == RiskDecision.ALLOW
+
+def test_outlier_to_new_counterparty_is_blocked(risk_check, clock):
+    account_id = uuid4()
+    warm_up(risk_check, clock, account_id, uuid4())
+    clock.now += 10
+    assert debit(risk_check, account_id, 500000, uuid4()) == RiskDecision.BLOCK
+    # An ordinary amount to the same new counterparty goes through
+    assert debit(risk_check, account_id, 1000, uuid4()) == RiskDecision.ALLOW
+
+def test_no_outliers_during_warmup(risk_check, clock):
+    account_id = uuid4()
+    warm_up(risk_check, clock, account_id, count=2)
+    clock.now += 10
+    assert risk_check.assess(account_id, 500000, uuid4()) == RiskDecision.ALLOW
+
+def test_outlier_burst_locks(risk_check, clock):
+    account_id = uuid4()
+    warm_up(risk_check, clock, account_id)
+    for _ in range(5):
+        debit(risk_check, account_id, 1000)
+    assert risk_check.assess(account_id, 500000) == RiskDecision.LOCK
+
+def test_accounts_are_independent(risk_check):
+    first, second = uuid4(), uuid4()
+    for _ in range(5):
+        debit(risk_check, first, 1000)
+    assert risk_check.assess(first, 1000) == RiskDecision.THROTTLE
+    assert risk_check.assess(second, 1000) == RiskDecision.ALLOW
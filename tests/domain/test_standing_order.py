@@ -0,0 +1,43 @@
+import pytest
+from uuid import uuid4
+from datetime import datetime
+
+from domain.entities.standing_order import StandingOrder, Frequency, StandingOrderStatus, add_months
+from domain.exceptions.domain_exceptions import InvalidAmountError
+
+def test_add_months_clamps_to_month_end():
+    assert add_months(datetime(2024, 1, 31), 1) == datetime(2024, 2, 29)
+    assert add_months(datetime(2024, 1, 31), 3) == datetime(2024, 4, 30)
+    assert add_months(datetime(2024, 11, 15), 2) == datetime(2025, 1, 15)
+
+def test_monthly_runs_stay_anchored_to_start_day():
+    order = StandingOrder.create(uuid4(), uuid4(), 1000, Frequency.MONTHLY, start_at=datetime(2024, 1, 31, 9))
+    runs = []
+    for _ in range(3):
+        order.advance(order.next_run_at)
+        runs.append(order.next_run_at)
+    assert runs == [datetime(2024, 2, 29, 9), datetime(2024, 3, 31, 9), datetime(2024, 4, 30, 9)]
+
+def test_advance_skips_missed_runs():
+    order = StandingOrder.create(uuid4(), uuid4(), 1000, Frequency.DAILY, start_at=datetime(2024, 1, 1))
+    order.advance(datetime(2024, 1, 10, 12))
+    assert order.next_run_at == datetime(2024, 1, 11)
+    assert order.occurrence == 10
+
+def test_completes_after_end():
+    order = StandingOrder.create(
+        uuid4(), uuid4(), 1000, Frequency.WEEKLY, start_at=datetime(2024, 1, 1), end_at=datetime(2024, 1, 10)
+    )
+    order.advance(datetime(2024, 1, 1))
+    assert order.status == StandingOrderStatus.ACTIVE
+    order.advance(datetime(2024, 1, 8))
+    assert order.status == StandingOrderStatus.COMPLETED
+
+def test_create_validation():
+    account_id = uuid4()
+    with pytest.raises(InvalidAmountError):
+        StandingOrder.create(account_id, uuid4(), 0, Frequency.DAILY)
+    with pytest.raises(ValueError):
+        StandingOrder.create(account_id, account_id, 100, Frequency.DAILY)
+    with pytest.raises(ValueError):
+        StandingOrder.create(uuid4(), uuid4(), 100, Frequency.DAILY, datetime(2024, 2, 1), datetime(2024, 1, 1))
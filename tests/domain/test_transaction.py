@@ -6,29 +6,29 @@ from domain.entities.transaction import Transaction, TransactionType
 
 def test_create_deposit_transaction():
     account_id = uuid4()
-    transaction = Transaction.create_deposit(account_id, 100.0)
+    transaction = Transaction.create_deposit(account_id, 10000)
     assert transaction.account_id == account_id
     assert transaction.transaction_type == TransactionType.DEPOSIT
-    assert transaction.amount == 100.0
+    assert transaction.amount == 10000
     assert isinstance(transaction.transaction_id, UUID)
     assert isinstance(transaction.timestamp, datetime)
 
 def test_create_withdrawal_transaction():
     account_id = uuid4()
-    transaction = Transaction.create_withdrawal(account_id, 50.0)
+    transaction = Transaction.create_withdrawal(account_id, 5000)
     assert transaction.account_id == account_id
     assert transaction.transaction_type == TransactionType.WITHDRAW
-    assert transaction.amount == 50.0
+    assert transaction.amount == 5000
     assert isinstance(transaction.transaction_id, UUID)
     assert isinstance(transaction.timestamp, datetime)
 
 def test_create_transfer_transaction():
     source_id = uuid4()
     dest_id = uuid4()
-    transaction = Transaction.create_transfer(source_id, dest_id, 75.0)
+    transaction = Transaction.create_transfer(source_id, dest_id, 7500)
     assert transaction.account_id == source_id
     assert transaction.transaction_type == TransactionType.TRANSFER
-    assert transaction.amount == 75.0
+    assert transaction.amount == 7500
     assert transaction.destination_account_id == dest_id
     assert isinstance(transaction.transaction_id, UUID)
     assert isinstance(transaction.timestamp, datetime)
\ No newline at end of file
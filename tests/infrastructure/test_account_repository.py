@@ -0,0 +1,146 @@
+import threading
+import pytest
+from uuid import uuid4
+
+from domain.entities.account import Account, AccountType, AccountStatus
+from domain.exceptions.domain_exceptions import InsufficientFundsError
+from infrastructure.repositories.account_repository import InMemoryAccountRepository, AccountFilter
+
+@pytest.fixture
+def account_repository():
+    return InMemoryAccountRepository()
+
+@pytest.fixture
+def account(account_repository):
+    account = Account.create(AccountType.CHECKING, initial_deposit=10000)
+    account_repository.create_account(account)
+    return account
+
+def test_version_starts_at_one(account_repository, account):
+    assert account_repository.get_account_version(account.account_id) == 1
+
+def test_version_bumped_on_update(account_repository, account):
+    account.deposit(100)
+    account_repository.update_account(account)
+    account_repository.update_account(account)
+    assert account_repository.get_account_version(account.account_id) == 3
+
+def test_epoch_differs_between_store_lifetimes(account_repository):
+    assert InMemoryAccountRepository().epoch != account_repository.epoch
+
+def test_version_unknown_account(account_repository):
+    assert account_repository.get_account_version(uuid4()) is None
+
+def test_update_of_unknown_account_is_ignored(account_repository):
+    account = Account.create(AccountType.CHECKING, initial_deposit=10000)
+    account_repository.update_account(account)
+    assert account_repository.get_account_version(account.account_id) is None
+
+@pytest.fixture
+def accounts(account_repository):
+    accounts = [
+        Account.create(AccountType.SAVINGS if i % 2 else AccountType.CHECKING, initial_deposit=20000 + i)
+        for i in range(20)
+    ]
+    account_repository.create_accounts(accounts)
+    return accounts
+
+def test_find_by_type_in_id_order(account_repository, accounts):
+    found = account_repository.find_accounts(AccountFilter(account_type=AccountType.SAVINGS))
+    assert found == sorted((a for a in accounts if a.account_type == AccountType.SAVINGS), key=lambda a: a.account_id)
+
+def test_find_pages_by_cursor(account_repository, accounts):
+    first = account_repository.find_accounts(AccountFilter(), limit=15)
+    rest = account_repository.find_accounts(AccountFilter(), after=(first[-1].account_id,), limit=15)
+    assert [a.account_id for a in first + rest] == sorted(a.account_id for a in accounts)
+
+def test_find_by_balance_range_in_balance_order(account_repository, accounts):
+    found = account_repository.find_accounts(AccountFilter(min_balance=20005, max_balance=20010), limit=3)
+    assert [a.balance for a in found] == [20005, 20006, 20007]
+    rest = account_repository.find_accounts(
+        AccountFilter(min_balance=20005, max_balance=20010), after=(found[-1].balance, found[-1].account_id)
+    )
+    assert [a.balance for a in rest] == [20008, 20009, 20010]
+
+def test_indexes_follow_updates(account_repository, accounts):
+    account = accounts[0]
+    account.is_locked = True
+    account.balance = 100
+    account_repository.update_account(account)
+    assert account_repository.find_accounts(AccountFilter(is_locked=True)) == [account]
+    assert account_repository.find_accounts(AccountFilter(max_balance=1000)) == [account]
+
+    account.status = AccountStatus.CLOSED
+    account_repository.update_account(account)
+    assert account_repository.find_accounts(AccountFilter(status=AccountStatus.CLOSED, is_locked=True)) == [account]
+    assert account not in account_repository.find_accounts(AccountFilter(status=AccountStatus.ACTIVE), limit=100)
+
+def test_find_below_minimum_balance(account_repository, accounts):
+    account = accounts[1]
+    account.balance = account.minimum_balance - 1
+    account_repository.update_account(account)
+    found = account_repository.find_accounts(AccountFilter(account_type=AccountType.SAVINGS, below_minimum_balance=True))
+    assert found == [account]
+
+def test_below_minimum_reads_only_the_range_under_the_minimum(account_repository, accounts):
+    low = []
+    for account in accounts[:6]:
+        account.balance = account.minimum_balance - 1 - len(low)
+        account_repository.update_account(account)
+        low.append(account)
+    account_filter = AccountFilter(below_minimum_balance=True)
+    found = account_repository.find_accounts(account_filter, limit=4)
+    assert found == sorted(low, key=account_filter.sort_key)[:4]
+    rest = account_repository.find_accounts(account_filter, after=account_filter.sort_key(found[-1]))
+    assert found + rest == sorted(low, key=account_filter.sort_key)
+    # Accounts above the minimum are never read, let alone re-checked
+    account_filter.matches = lambda account: account.balance < account.minimum_balance or pytest.fail(account)
+    assert len(account_repository.find_accounts(account_filter)) == 6
+
+def test_lock_accounts_excludes_other_threads(account_repository, account):
+    other = Account.create(AccountType.CHECKING, initial_deposit=0)
+    account_repository.create_account(other)
+    entered = threading.Event()
+
+    def worker():
+        with account_repository.lock_accounts(other.account_id, account.account_id):
+            entered.set()
+
+    with account_repository.lock_accounts(account.account_id):
+        # Reentrant for the holder
+        with account_repository.lock_accounts(account.account_id):
+            pass
+        thread = threading.Thread(target=worker)
+        thread.start()
+        assert not entered.wait(0.1)
+    assert entered.wait(5)
+    thread.join()
+
+def test_concurrent_withdrawals_never_overdraw(account_repository, account):
+    withdrawn = []
+
+    def worker():
+        for _ in range(50):
+            with account_repository.lock_accounts(account.account_id):
+                stored = account_repository.get_account_by_id(account.account_id)
+                try:
+                    stored.check_funds(100)
+                except InsufficientFundsError:
+                    return
+                # Widens the window between the check and the write
+                threading.Event().wait(0.0001)
+                stored.balance -= 100
+                account_repository.update_account(stored)
+                withdrawn.append(100)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # No write was lost and no check passed against a balance another thread had already spent
+    assert account.balance == 10000 - sum(withdrawn)
+    with pytest.raises(InsufficientFundsError):
+        account.check_funds(100)
+    account.check_funds(0)
+    assert account_repository.find_accounts(AccountFilter(max_balance=account.balance)) == [account]
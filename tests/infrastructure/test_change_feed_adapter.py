@@ -0,0 +1,135 @@
+import asyncio
+import threading
+from uuid import uuid4
+
+import pytest
+
+from domain.entities.account import Account, AccountType
+from domain.entities.transaction import Transaction
+from infrastructure.adapters.change_feed_adapter import ACCOUNT, TRANSACTION, ChangeBroadcaster, CursorExpiredError
+from infrastructure.repositories.account_repository import InMemoryAccountRepository
+from infrastructure.repositories.transaction_repository import InMemoryTransactionRepository
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+def test_subscribers_receive_only_their_accounts():
+    async def scenario():
+        broadcaster = ChangeBroadcaster()
+        a, b, c = uuid4(), uuid4(), uuid4()
+        everything = broadcaster.subscribe()
+        only_b = broadcaster.subscribe(b)
+        deposit = Transaction.create_deposit(a, 100)
+        transfer = Transaction.create_transfer(a, b, 50)
+        broadcaster.publish_transaction(deposit)
+        broadcaster.publish_transaction(transfer)
+        broadcaster.publish_transaction(Transaction.create_deposit(c, 1))
+        assert [event.data for event in await everything.next_events(0.1)][:2] == [deposit, transfer]
+        assert [event.data for event in await only_b.next_events(0.1)] == [transfer]
+    run(scenario())
+
+def test_next_events_wakes_on_publish_from_another_thread():
+    async def scenario():
+        broadcaster = ChangeBroadcaster()
+        subscription = broadcaster.subscribe()
+        account_id = uuid4()
+        threading.Timer(0.05, broadcaster.publish_transaction, [Transaction.create_deposit(account_id, 1)]).start()
+        events = await subscription.next_events(5)
+        assert [event.sequence for event in events] == [1]
+        assert await subscription.next_events(0.01) == []
+    run(scenario())
+
+def test_resume_replays_history_after_cursor():
+    async def scenario():
+        broadcaster = ChangeBroadcaster(history_size=3)
+        a = uuid4()
+        broadcaster.subscribe()
+        for _ in range(5):
+            broadcaster.publish_transaction(Transaction.create_deposit(a, 1))
+        resumed = broadcaster.subscribe(a, after=3)
+        assert [event.sequence for event in await resumed.next_events(0.1)] == [4, 5]
+        assert [event.sequence for event in await broadcaster.subscribe(after=2).next_events(0.1)] == [3, 4, 5]
+        with pytest.raises(CursorExpiredError):
+            broadcaster.subscribe(after=1)
+        with pytest.raises(CursorExpiredError):
+            broadcaster.subscribe(after=6)
+    run(scenario())
+
+def test_changes_with_nobody_subscribed_are_skipped_and_break_resume():
+    async def scenario():
+        broadcaster = ChangeBroadcaster()
+        a = uuid4()
+        first = broadcaster.subscribe()
+        broadcaster.publish_transaction(Transaction.create_deposit(a, 1))
+        broadcaster.unsubscribe(first)
+        account = Account.create(AccountType.CHECKING, initial_deposit=1000)
+        broadcaster.publish_account(account)
+        broadcaster.publish_transaction(Transaction.create_deposit(a, 1))
+        assert broadcaster.sequence == 1
+        # Resuming from before the unrecorded changes would miss them silently
+        with pytest.raises(CursorExpiredError):
+            broadcaster.subscribe(after=1)
+        assert broadcaster.subscriber_count() == 0
+        live = broadcaster.subscribe()
+        broadcaster.publish_transaction(Transaction.create_deposit(a, 1))
+        assert [event.sequence for event in await live.next_events(0.1)] == [3]
+        assert [event.sequence for event in await broadcaster.subscribe(after=2).next_events(0.1)] == [3]
+    run(scenario())
+
+def test_slow_subscriber_is_dropped_without_blocking_writers():
+    async def scenario():
+        broadcaster = ChangeBroadcaster(buffer_size=2)
+        slow = broadcaster.subscribe()
+        fast = broadcaster.subscribe()
+        for _ in range(2):
+            broadcaster.publish_transaction(Transaction.create_deposit(uuid4(), 1))
+        assert len(await fast.next_events(0.1)) == 2
+        broadcaster.publish_transaction(Transaction.create_deposit(uuid4(), 1))
+        assert slow.dropped and not fast.dropped
+        assert broadcaster.subscriber_count() == 1
+        # What was buffered before the drop is still delivered
+        assert len(await slow.next_events(0.1)) == 2
+    run(scenario())
+
+def test_attach_publishes_repository_writes():
+    async def scenario():
+        broadcaster = ChangeBroadcaster()
+        account_repository = InMemoryAccountRepository()
+        transaction_repository = InMemoryTransactionRepository()
+        broadcaster.attach(account_repository, transaction_repository)
+        subscription = broadcaster.subscribe()
+        account = Account.create(AccountType.CHECKING, initial_deposit=1000)
+        account_repository.create_account(account)
+        account.deposit(500)
+        account_repository.update_account(account)
+        account.deposit(1)
+        transaction_repository.save_transaction(Transaction.create_deposit(account.account_id, 500))
+        transaction_repository.save_transactions([Transaction.create_deposit(account.account_id, 1)])
+        events = await subscription.next_events(0.1)
+        assert [event.kind for event in events] == [ACCOUNT, TRANSACTION, TRANSACTION]
+        # The account event is a snapshot of the write, not the live object
+        assert events[0].data.balance == 1500
+        assert len(transaction_repository.get_transactions_for_account(account.account_id)) == 2
+    run(scenario())
+
+def test_attach_publishes_while_the_repository_holds_its_lock():
+    async def scenario():
+        broadcaster = ChangeBroadcaster()
+        account_repository = InMemoryAccountRepository()
+        transaction_repository = InMemoryTransactionRepository()
+        broadcaster.attach(account_repository, transaction_repository)
+        subscription = broadcaster.subscribe()
+        held = []
+        publish = broadcaster.publish
+        def recording_publish(*args):
+            held.append(transaction_repository._lock.locked() or account_repository._change_lock.locked())
+            return publish(*args)
+        broadcaster.publish = recording_publish
+        account = Account.create(AccountType.CHECKING, initial_deposit=1000)
+        account_repository.create_account(account)
+        account_repository.update_account(account)
+        transaction_repository.save_transaction(Transaction.create_deposit(account.account_id, 1))
+        transaction_repository.save_transactions([Transaction.create_deposit(account.account_id, 1)])
+        assert held == [True, True, True]
+        assert [event.sequence for event in await subscription.next_events(0.1)] == [1, 2, 3]
+    run(scenario())
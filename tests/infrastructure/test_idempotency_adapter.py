@@ -0,0 +1,61 @@
+import pytest
+
+from infrastructure.adapters.idempotency_adapter import (
+    IdempotencyCache,
+    IdempotencyKeyReusedError,
+    StoredResponse,
+)
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+@pytest.fixture
+def cache(clock):
+    return IdempotencyCache(max_entries=3, ttl_seconds=60, clock=clock)
+
+def test_first_request_owns_entry(cache):
+    entry, is_owner = cache.begin("k1", "fp")
+    assert is_owner is True
+    duplicate, is_owner = cache.begin("k1", "fp")
+    assert is_owner is False
+    assert duplicate is entry
+
+def test_completed_response_is_stored(cache):
+    entry, _ = cache.begin("k1", "fp")
+    cache.complete("k1", entry, StoredResponse(200, [], b"{}"))
+    duplicate, is_owner = cache.begin("k1", "fp")
+    assert is_owner is False
+    assert duplicate.response.body == b"{}"
+    assert duplicate.done.is_set()
+
+def test_reused_key_with_different_request(cache):
+    cache.begin("k1", "fp")
+    with pytest.raises(IdempotencyKeyReusedError):
+        cache.begin("k1", "other")
+
+def test_abandon_allows_retry(cache):
+    entry, _ = cache.begin("k1", "fp")
+    cache.abandon("k1", entry)
+    _, is_owner = cache.begin("k1", "fp")
+    assert is_owner is True
+
+def test_ttl_expiry(cache, clock):
+    cache.begin("k1", "fp")
+    clock.now = 61
+    _, is_owner = cache.begin("k1", "fp")
+    assert is_owner is True
+
+def test_bounded_size(cache):
+    for i in range(5):
+        cache.begin(f"k{i}", "fp")
+    assert len(cache) == 3
+    _, is_owner = cache.begin("k0", "fp")
+    assert is_owner is True
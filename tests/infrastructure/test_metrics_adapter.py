@@ -0,0 +1,48 @@
+import pytest
+
+from infrastructure.adapters.metrics_adapter import BankingMetrics, Histogram, MetricsRegistry
+from domain.exceptions.domain_exceptions import InsufficientFundsError, TransactionLimitExceededError
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry()
+
+def test_histogram_buckets_are_preallocated():
+    histogram = Histogram(buckets=(0.1, 1.0))
+    histogram.observe(0.05)
+    histogram.observe(0.5)
+    histogram.observe(5.0)
+    counts, total, count = histogram.snapshot()
+    assert counts == [1, 1, 1]
+    assert total == 5.55
+    assert count == 3
+
+def test_histogram_exposition_is_cumulative(registry):
+    latency = registry.histogram("latency_seconds", "Latency", ("route",), buckets=(0.1, 1.0))
+    latency.labels("/a").observe(0.05)
+    latency.labels("/a").observe(0.5)
+    output = registry.expose()
+    assert '# TYPE latency_seconds histogram' in output
+    assert 'latency_seconds_bucket{route="/a",le="0.1"} 1' in output
+    assert 'latency_seconds_bucket{route="/a",le="1"} 2' in output
+    assert 'latency_seconds_bucket{route="/a",le="+Inf"} 2' in output
+    assert 'latency_seconds_count{route="/a"} 2' in output
+
+def test_counter_exposition(registry):
+    deposits = registry.counter("deposits_total", "Deposits")
+    deposits.inc()
+    deposits.inc()
+    assert "deposits_total 2" in registry.expose()
+
+def test_duplicate_metric_name_rejected(registry):
+    registry.counter("deposits_total", "Deposits")
+    with pytest.raises(ValueError):
+        registry.counter("deposits_total", "Deposits")
+
+def test_record_withdrawal_rejection(registry):
+    metrics = BankingMetrics(registry)
+    metrics.record_withdrawal_rejection(InsufficientFundsError("no funds"))
+    metrics.record_withdrawal_rejection(TransactionLimitExceededError("limit"))
+    metrics.record_withdrawal_rejection(TransactionLimitExceededError("limit"))
+    assert metrics.insufficient_funds.value == 1
+    assert metrics.limit_rejections.value == 2
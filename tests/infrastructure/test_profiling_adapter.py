@@ -0,0 +1,59 @@
+import os
+
+import pytest
+
+from infrastructure.adapters.profiling_adapter import ProfilingAdapter
+
+def busy_work():
+    return sum(i * i for i in range(1000))
+
+def test_disabled_by_default():
+    adapter = ProfilingAdapter()
+    assert adapter.armed is False
+    assert adapter.should_profile(None) is False
+
+def test_token_arms_profiler():
+    adapter = ProfilingAdapter(token="secret")
+    assert adapter.armed is True
+    assert adapter.should_profile("secret") is True
+    assert adapter.should_profile("wrong") is False
+
+def test_sampling_toggle():
+    adapter = ProfilingAdapter()
+    adapter.configure(enabled=True, sample_rate=1.0)
+    assert adapter.armed is True
+    assert adapter.should_profile(None) is True
+    adapter.configure(enabled=False, sample_rate=1.0)
+    assert adapter.armed is False
+
+def test_invalid_sample_rate():
+    adapter = ProfilingAdapter()
+    with pytest.raises(ValueError):
+        adapter.configure(enabled=True, sample_rate=1.5)
+
+def test_finish_records_hot_spots(tmp_path):
+    adapter = ProfilingAdapter(output_dir=str(tmp_path), top_n=5)
+    profiler = adapter.start()
+    busy_work()
+    record = adapter.finish(profiler, "GET", "/accounts/{account_id}", 0.01)
+    assert (tmp_path / f"{record.profile_id}.prof").exists()
+    assert 0 < len(record.hot_spots) <= 5
+    assert adapter.get_profile(record.profile_id) is record
+    assert adapter.list_profiles() == [record]
+
+def test_only_one_profile_runs_at_a_time():
+    adapter = ProfilingAdapter()
+    first = adapter.start()
+    assert adapter.start() is None
+    adapter.finish(first, "GET", "/health", 0.01)
+    second = adapter.start()
+    assert second is not None
+    adapter.finish(second, "GET", "/health", 0.01)
+
+def test_evicted_profiles_lose_their_files(tmp_path):
+    adapter = ProfilingAdapter(output_dir=str(tmp_path), max_profiles=2)
+    records = []
+    for _ in range(3):
+        records.append(adapter.finish(adapter.start(), "GET", "/health", 0.01))
+    assert sorted(os.listdir(tmp_path)) == sorted(f"{record.profile_id}.prof" for record in records[1:])
+    assert adapter.get_profile(records[0].profile_id) is None
@@ -0,0 +1,180 @@
+import multiprocessing
+import os
+import threading
+import pytest
+from uuid import uuid4
+
+from domain.entities.account import Account, AccountType, AccountStatus
+from domain.services.interest_strategy import SavingsInterestStrategy
+from domain.services.limit_constraint import LimitConstraint
+from infrastructure.repositories.shared_memory_account_repository import (
+    F_BALANCE,
+    F_WRITE_SEQUENCE,
+    SharedMemoryAccountRepository,
+    RepositoryFullError,
+)
+from infrastructure.repositories.transaction_repository import InMemoryTransactionRepository
+
+@pytest.fixture
+def store_name():
+    return f"test_accounts_{os.getpid()}_{uuid4().hex[:8]}"
+
+@pytest.fixture
+def account_repository(store_name, tmp_path):
+    repository = SharedMemoryAccountRepository(store_name, capacity=64, lock_dir=str(tmp_path))
+    yield repository
+    repository.close(unlink=True)
+
+def test_round_trip(account_repository):
+    account = Account.create(AccountType.SAVINGS, initial_deposit=12345)
+    account.limit_constraint = LimitConstraint(daily_limit=50000, monthly_limit=200000)
+    account.interest_strategy = SavingsInterestStrategy()
+    account.daily_spent = 700
+    account.held_amount = 2500
+    account.status = AccountStatus.CLOSED
+    account_repository.create_account(account)
+
+    loaded = account_repository.get_account_by_id(account.account_id)
+    assert loaded.balance == 12345
+    assert loaded.account_type == AccountType.SAVINGS
+    assert loaded.status == AccountStatus.CLOSED
+    assert loaded.daily_spent == 700
+    assert loaded.held_amount == 2500
+    assert loaded.limit_constraint.daily_limit == 50000
+    assert loaded.limit_constraint.monthly_limit == 200000
+    assert isinstance(loaded.interest_strategy, SavingsInterestStrategy)
+    assert loaded.creation_date == account.creation_date.replace(tzinfo=None)
+    assert len(account_repository) == 1
+
+def test_versions(account_repository):
+    account = Account.create(AccountType.CHECKING, initial_deposit=10000)
+    account_repository.create_account(account)
+    account_repository.update_account(account)
+    assert account_repository.get_account_version(account.account_id) == 2
+    assert account_repository.get_account_version(uuid4()) is None
+    assert account_repository.get_account_by_id(uuid4()) is None
+
+def test_second_handle_sees_same_accounts(account_repository, store_name, tmp_path):
+    account = Account.create(AccountType.CHECKING, initial_deposit=10000)
+    account_repository.create_account(account)
+    other = SharedMemoryAccountRepository(store_name, lock_dir=str(tmp_path))
+    try:
+        assert not other.created
+        assert other.capacity == 64
+        assert other.epoch == account_repository.epoch != 0
+        assert other.get_account_by_id(account.account_id).balance == 10000
+    finally:
+        other.close()
+
+def test_full_store_rejects_new_accounts(store_name, tmp_path):
+    repository = SharedMemoryAccountRepository(store_name, capacity=2, lock_dir=str(tmp_path))
+    try:
+        for _ in range(2):
+            repository.create_account(Account.create(AccountType.CHECKING))
+        with pytest.raises(RepositoryFullError):
+            repository.create_account(Account.create(AccountType.CHECKING))
+    finally:
+        repository.close(unlink=True)
+
+def test_create_accounts_in_one_batch(account_repository):
+    accounts = [Account.create(AccountType.CHECKING, initial_deposit=100 * i) for i in range(10)]
+    account_repository.create_accounts(accounts)
+    assert len(account_repository) == 10
+    assert [account_repository.get_account_by_id(a.account_id).balance for a in accounts] == [100 * i for i in range(10)]
+    with pytest.raises(RepositoryFullError):
+        account_repository.create_accounts([Account.create(AccountType.CHECKING) for _ in range(60)])
+
+def _deposit_worker(store_name, lock_dir, account_id, deposits):
+    from infrastructure.adapters.notification_adapter import MockNotificationAdapter
+    from application.services.notification_service import NotificationService
+    from application.services.transaction_service import TransactionService
+
+    repository = SharedMemoryAccountRepository(store_name, lock_dir=lock_dir)
+    service = TransactionService(repository, InMemoryTransactionRepository(), NotificationService(MockNotificationAdapter()))
+    for _ in range(deposits):
+        service.deposit(account_id, 100)
+    repository.close()
+
+def test_concurrent_deposits_from_several_processes(account_repository, store_name, tmp_path):
+    account = Account.create(AccountType.CHECKING, initial_deposit=0)
+    account.max_daily_transactions = 10_000
+    account_repository.create_account(account)
+
+    context = multiprocessing.get_context("fork")
+    workers = [
+        context.Process(target=_deposit_worker, args=(store_name, str(tmp_path), account.account_id, 200))
+        for _ in range(4)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert all(worker.exitcode == 0 for worker in workers)
+    assert account_repository.get_account_by_id(account.account_id).balance == 4 * 200 * 100
+
+def test_stripe_order_does_not_deadlock(account_repository):
+    import threading
+    done = []
+
+    def lock_repeatedly(slots):
+        for _ in range(2000):
+            with account_repository._slot_locks(slots):
+                pass
+        done.append(slots)
+
+    # 1 and 65 share a stripe, as do 2 and 66, in the opposite slot order
+    threads = [threading.Thread(target=lock_repeatedly, args=(slots,), daemon=True) for slots in ([1, 66], [2, 65])]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+    assert len(done) == 2
+
+def _try_lock(store_name, lock_dir, account_id, result):
+    import fcntl
+    repository = SharedMemoryAccountRepository(store_name, lock_dir=lock_dir)
+    slot = repository._find_slot(account_id)
+    try:
+        fcntl.lockf(repository._lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB, 1, slot)
+        result.value = 1
+    except OSError:
+        result.value = 0
+    repository.close()
+
+def test_update_inside_lock_accounts_keeps_the_lock(account_repository, store_name, tmp_path):
+    account = Account.create(AccountType.CHECKING, initial_deposit=10000)
+    account_repository.create_account(account)
+    context = multiprocessing.get_context("fork")
+    acquired = context.Value("i", -1)
+    with account_repository.lock_accounts(account.account_id):
+        account_repository.update_account(account)
+        probe = context.Process(target=_try_lock, args=(store_name, str(tmp_path), account.account_id, acquired))
+        probe.start()
+        probe.join()
+    assert acquired.value == 0
+
+def test_reads_wait_out_a_write_in_progress(account_repository):
+    account = Account.create(AccountType.CHECKING, initial_deposit=10000)
+    account_repository.create_account(account)
+    base = account_repository._base(account_repository._find_slot(account.account_id))
+    data = account_repository._data
+    # Half way through another process's write: the balance is new, the version still old
+    data[base + F_WRITE_SEQUENCE] += 1
+    data[base + F_BALANCE] = 20000
+    def finish():
+        data[base + F_WRITE_SEQUENCE] += 1
+    threading.Timer(0.05, finish).start()
+    read, version = account_repository.get_account_with_version(account.account_id)
+    assert data[base + F_WRITE_SEQUENCE] % 2 == 0
+    assert (read.balance, version) == (20000, 1)
+
+def test_top_accounts_by_balance_matches_in_memory_ranking(account_repository):
+    from infrastructure.repositories.account_repository import InMemoryAccountRepository
+    in_memory = InMemoryAccountRepository()
+    accounts = [Account.create(AccountType.CHECKING, initial_deposit=balance) for balance in (500, 900, 900, 900, 100, 0, 700)]
+    account_repository.create_accounts(accounts)
+    in_memory.create_accounts(accounts)
+    for limit in (1, 2, 3, 5, 7, 20):
+        expected = [account.account_id for account in in_memory.top_accounts_by_balance(limit)]
+        assert [account.account_id for account in account_repository.top_accounts_by_balance(limit)] == expected
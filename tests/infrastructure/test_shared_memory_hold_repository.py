@@ -0,0 +1,126 @@
+import os
+import pytest
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from domain.entities.account import Account, AccountType
+from domain.entities.hold import Hold, HoldStatus
+from domain.exceptions.domain_exceptions import HoldNotPendingError
+from infrastructure.repositories.shared_memory_account_repository import RepositoryFullError, SharedMemoryAccountRepository
+from infrastructure.repositories.shared_memory_hold_repository import SharedMemoryHoldRepository
+from infrastructure.repositories.transaction_repository import InMemoryTransactionRepository
+
+NOW = datetime(2026, 3, 1, 12, 0)
+
+@pytest.fixture
+def store_name():
+    return f"test_holds_{os.getpid()}_{uuid4().hex[:8]}"
+
+@pytest.fixture
+def hold_repository(store_name, tmp_path):
+    repository = SharedMemoryHoldRepository(store_name, capacity=64, lock_dir=str(tmp_path))
+    yield repository
+    repository.close(unlink=True)
+
+@pytest.fixture
+def other_worker(hold_repository, store_name, tmp_path):
+    # A second attachment stands in for another worker process
+    repository = SharedMemoryHoldRepository(store_name, lock_dir=str(tmp_path))
+    yield repository
+    repository.close()
+
+def test_round_trip(hold_repository, other_worker):
+    hold = Hold.create(uuid4(), 2500, timedelta(hours=1), NOW)
+    hold_repository.save_hold(hold)
+    assert other_worker.get_hold(hold.hold_id) == hold
+
+    hold.status = HoldStatus.CAPTURED
+    hold.captured_amount = 2000
+    hold.transaction_id = uuid4()
+    other_worker.save_hold(hold)
+    assert hold_repository.get_hold(hold.hold_id) == hold
+    assert len(hold_repository) == 1
+    assert hold_repository.get_hold(uuid4()) is None
+
+def test_holds_for_account_in_placement_order(hold_repository):
+    account_id = uuid4()
+    holds = [Hold.create(account_id, amount, timedelta(hours=1), NOW) for amount in (100, 200, 300)]
+    for hold in reversed(holds):
+        hold_repository.save_hold(hold)
+    hold_repository.save_hold(Hold.create(uuid4(), 999, timedelta(hours=1), NOW))
+    assert hold_repository.get_holds_for_account(account_id) == holds
+
+def test_each_expired_hold_is_claimed_by_one_worker(hold_repository, other_worker):
+    holds = [Hold.create(uuid4(), 100, timedelta(minutes=minutes), NOW) for minutes in (30, 10, 20, 90)]
+    for hold in holds:
+        hold_repository.save_hold(hold)
+    assert other_worker.next_expiry() == NOW + timedelta(minutes=10)
+
+    first = other_worker.pop_expired(NOW + timedelta(minutes=45), limit=2)
+    second = hold_repository.pop_expired(NOW + timedelta(minutes=45), limit=10)
+    assert [hold.amount for hold in first] == [100, 100]
+    assert [hold.expires_at for hold in first + second] == [NOW + timedelta(minutes=m) for m in (10, 20, 30)]
+    assert hold_repository.next_expiry() == NOW + timedelta(minutes=90)
+
+    settled = holds[3]
+    settled.status = HoldStatus.RELEASED
+    other_worker.save_hold(settled)
+    assert hold_repository.next_expiry() is None
+
+def test_hold_placed_in_one_worker_is_captured_in_another(hold_repository, other_worker, store_name, tmp_path):
+    from infrastructure.adapters.notification_adapter import MockNotificationAdapter
+    from application.services.notification_service import NotificationService
+    from application.services.hold_service import HoldService
+
+    accounts = SharedMemoryAccountRepository(f"{store_name}_accounts", capacity=64, lock_dir=str(tmp_path))
+    try:
+        account = Account.create(AccountType.CHECKING, initial_deposit=50000)
+        accounts.create_account(account)
+        services = [
+            HoldService(accounts, repository, InMemoryTransactionRepository(), NotificationService(MockNotificationAdapter()))
+            for repository in (hold_repository, other_worker)
+        ]
+        hold = services[0].place_hold(account.account_id, 20000)
+        services[1].capture_hold(hold.hold_id, 15000)
+        with pytest.raises(HoldNotPendingError):
+            services[0].release_hold(hold.hold_id)
+        stored = accounts.get_account_by_id(account.account_id)
+        assert (stored.balance, stored.held_amount) == (35000, 0)
+    finally:
+        accounts.close(unlink=True)
+
+def settle(hold_repository, hold):
+    hold.status = HoldStatus.RELEASED
+    hold_repository.save_hold(hold)
+
+def test_settled_slots_are_reused(store_name, tmp_path):
+    repository = SharedMemoryHoldRepository(f"{store_name}_small", capacity=4, lock_dir=str(tmp_path))
+    try:
+        pending = Hold.create(uuid4(), 100, timedelta(hours=1), NOW)
+        repository.save_hold(pending)
+        for _ in range(20):
+            hold = Hold.create(uuid4(), 100, timedelta(hours=1), NOW)
+            repository.save_hold(hold)
+            settle(repository, hold)
+        assert repository.get_hold(pending.hold_id) == pending
+        # Three more pending holds fill the table; only then is it full
+        for _ in range(3):
+            repository.save_hold(Hold.create(uuid4(), 100, timedelta(hours=1), NOW))
+        with pytest.raises(RepositoryFullError):
+            repository.save_hold(Hold.create(uuid4(), 100, timedelta(hours=1), NOW))
+    finally:
+        repository.close(unlink=True)
+
+def test_more_holds_than_capacity_over_time(hold_repository):
+    account_id = uuid4()
+    for _ in range(hold_repository.capacity * 4):
+        hold = Hold.create(account_id, 100, timedelta(hours=1), NOW)
+        hold_repository.save_hold(hold)
+        assert hold_repository.get_hold(hold.hold_id) == hold
+        settle(hold_repository, hold)
+    live = Hold.create(account_id, 100, timedelta(hours=1), NOW)
+    hold_repository.save_hold(live)
+    assert hold_repository.pop_expired(NOW + timedelta(hours=2), limit=10) == [live]
+    # Settled holds stay readable until their slots are needed
+    assert live in hold_repository.get_holds_for_account(account_id)
+    assert len(hold_repository) < hold_repository.capacity
@@ -0,0 +1,41 @@
+import random
+import pytest
+
+from infrastructure.repositories.sorted_index import SortedIndex
+
+@pytest.fixture
+def values():
+    rng = random.Random(7)
+    return rng.sample(range(100_000), 5_000)
+
+def test_matches_sorted_list_through_adds_and_removes(values):
+    index = SortedIndex()
+    for value in values:
+        index.add(value)
+    for value in values[::3]:
+        index.remove(value)
+    expected = sorted(set(values) - set(values[::3]))
+    assert list(index) == expected
+    assert len(index) == len(expected)
+
+def test_bulk_build(values):
+    assert list(SortedIndex(values)) == sorted(values)
+
+def test_irange(values):
+    index = SortedIndex(values)
+    ordered = sorted(values)
+    low, high = ordered[100], ordered[200]
+    assert list(index.irange(low, high)) == ordered[100:201]
+    assert list(index.irange(low, high, exclusive_minimum=True)) == ordered[101:201]
+    assert list(index.irange(ordered[-1] + 1)) == []
+    assert list(index.irange(maximum=ordered[2])) == ordered[:3]
+
+def test_remove_missing_value():
+    index = SortedIndex([1, 2, 3])
+    with pytest.raises(ValueError):
+        index.remove(5)
+    with pytest.raises(ValueError):
+        index.remove(0)
+
+def test_reversed(values):
+    assert list(reversed(SortedIndex(values))) == sorted(values, reverse=True)
@@ -0,0 +1,150 @@
+import os
+from uuid import uuid4
+from datetime import datetime, timedelta
+
+import pytest
+
+from domain.entities.transaction import Transaction, TransactionType
+from domain.entities.identifiers import uuid7
+from infrastructure.repositories.transaction_archive import TransactionArchive
+from infrastructure.repositories.transaction_repository import InMemoryTransactionRepository
+from application.services.archival_service import ArchivalService
+
+NOW = datetime(2024, 6, 1, 12, 0)
+
+def make(account_id, days_ago, amount=100, destination=None):
+    return Transaction(
+        transaction_id=uuid7(),
+        account_id=account_id,
+        transaction_type=TransactionType.TRANSFER if destination else TransactionType.DEPOSIT,
+        amount=amount,
+        timestamp=NOW - timedelta(days=days_ago),
+        destination_account_id=destination,
+    )
+
+@pytest.fixture
+def repository(tmp_path):
+    return InMemoryTransactionRepository(archive=TransactionArchive(str(tmp_path)))
+
+@pytest.fixture
+def history(repository):
+    a, b = uuid4(), uuid4()
+    transactions = [
+        make(a, 200), make(b, 150, destination=a), make(a, 120, amount=250),
+        make(a, 30), make(b, 10, destination=a), make(a, 1),
+    ]
+    repository.save_transactions(transactions)
+    return a, b, transactions
+
+def test_archive_moves_aged_prefix_to_segment_files(repository, history, tmp_path):
+    a, b, transactions = history
+    assert repository.archive_before(NOW - timedelta(days=90)) == 3
+    assert repository.ledger == transactions[3:]
+    assert repository.transactions[a] == [transactions[3], transactions[5]]
+    segments = [name for _, _, names in os.walk(tmp_path) for name in names]
+    assert len(segments) == 1 and segments[0].endswith(".seg")
+    # Nothing else has aged, so a second run writes nothing
+    assert repository.archive_before(NOW - timedelta(days=90)) == 0
+
+def test_reads_span_hot_and_cold_tiers(repository, history):
+    a, b, transactions = history
+    repository.archive_before(NOW - timedelta(days=90))
+    assert repository.get_transactions_for_account(a) == [transactions[0], transactions[2], transactions[3], transactions[5]]
+    assert repository.get_transactions_for_account(b) == [transactions[1], transactions[4]]
+    assert repository.get_transactions_for_account(a, NOW - timedelta(days=130), NOW - timedelta(days=20)) == [
+        transactions[2], transactions[3]
+    ]
+    assert repository.get_transactions_since(1) == transactions[1:]
+    assert repository.get_transactions_since(4) == transactions[4:]
+
+def test_limit_bounds_each_segment(repository, history):
+    a, _, transactions = history
+    assert repository.archive_before(NOW - timedelta(days=90), limit=2) == 2
+    assert repository.archive_before(NOW - timedelta(days=90), limit=2) == 1
+    assert repository.get_transactions_for_account(a) == [transactions[0], transactions[2], transactions[3], transactions[5]]
+
+def test_late_row_with_old_timestamp_waits_for_its_prefix(repository):
+    a = uuid4()
+    transactions = [make(a, 100), make(a, 5), make(a, 120)]
+    repository.save_transactions(transactions)
+    assert repository.archive_before(NOW - timedelta(days=90)) == 1
+    assert repository.get_transactions_for_account(a) == transactions
+
+def test_archived_segments_still_reconcile(repository, history):
+    a, _, transactions = history
+    before = repository.get_segment_postings(a, 0)
+    repository.archive_before(NOW - timedelta(days=90))
+    assert repository.get_segment_postings(a, 0) == before
+
+def test_saves_after_archiving_keep_absolute_positions(repository, history):
+    a, _, transactions = history
+    repository.archive_before(NOW - timedelta(days=90))
+    late = make(a, 0)
+    repository.save_transaction(late)
+    assert repository.get_transactions_since(6) == [late]
+    assert repository.get_segment_postings(a, 0)[-1] == (late, True)
+
+def test_without_archive_nothing_moves():
+    repository = InMemoryTransactionRepository()
+    a = uuid4()
+    repository.save_transaction(make(a, 365))
+    assert repository.archive_before(NOW) == 0
+    assert len(repository.get_transactions_for_account(a)) == 1
+
+def test_archival_service_archives_past_retention_then_waits(repository, history):
+    service = ArchivalService(repository, archive_after=timedelta(days=90), interval=timedelta(hours=1))
+    assert service.run_due(NOW, batch_size=100) == 3
+    assert service.next_due_time() == NOW + timedelta(hours=1)
+    assert service.run_due(NOW, batch_size=2) == 0
+
+def test_archival_service_stays_due_while_batches_fill(repository, history):
+    service = ArchivalService(repository, archive_after=timedelta(days=90))
+    before = service.next_due_time()
+    assert service.run_due(NOW, batch_size=2) == 2
+    assert service.next_due_time() == before
+
+def test_limited_reads_cross_the_tier_boundary(repository, history):
+    _, _, transactions = history
+    repository.archive_before(NOW - timedelta(days=90))
+    assert repository.get_ledger_position() == 6
+    assert repository.get_transactions_since(1, limit=3) == transactions[1:4]
+    assert repository.get_transactions_since(0, limit=2) == transactions[:2]
+    assert repository.get_transactions_since(4, limit=10) == transactions[4:]
+
+def test_archiving_compacts_account_postings(repository, history):
+    a, b, _ = history
+    digest = repository.get_ledger_digest(a)
+    repository.archive_before(NOW - timedelta(days=90))
+    assert repository._ledgers[a].postings == [3 * 2, 4 * 2 + 1, 5 * 2]
+    assert repository._ledgers[b].postings == [4 * 2]
+    assert repository.get_ledger_digest(a) == digest
+    assert repository.get_segment_digests(a)[0].count == 6
+
+def test_receiving_side_reads_back_from_archive(repository, history):
+    a, b, transactions = history
+    repository.archive_before(NOW - timedelta(days=90))
+    assert repository.get_segment_postings(a, 0)[:3] == [(transactions[0], True), (transactions[1], False), (transactions[2], True)]
+    assert repository.get_segment_postings(b, 0) == [(transactions[1], True), (transactions[4], True)]
+
+def test_reconciliation_reads_each_archived_block_once(repository, monkeypatch):
+    from infrastructure.repositories import transaction_repository as module
+    monkeypatch.setattr(module, "SEGMENT_SIZE", 2)
+    a, b = uuid4(), uuid4()
+    repository.save_transactions([make(a, 200 - day) for day in range(6)] + [make(b, 150, destination=a)])
+    repository.archive_before(NOW - timedelta(days=90), limit=4)
+    repository.archive_before(NOW - timedelta(days=90))
+    reads = []
+    read_block = repository.archive._read_block
+    monkeypatch.setattr(repository.archive, "_read_block", lambda *args: reads.append(args) or read_block(*args))
+    segments = repository.get_postings_by_segment(a, 0, 4)
+    assert [len(rows) for rows in segments] == [2, 2, 2, 1]
+    assert [outgoing for rows in segments for _, outgoing in rows] == [True] * 6 + [False]
+    assert len(reads) == 2
+
+def test_close_removes_the_segment_directory(repository, history, tmp_path):
+    repository.archive_before(NOW - timedelta(days=90))
+    directory = repository.archive.directory
+    assert os.listdir(directory)
+    repository.archive.close()
+    assert not os.path.exists(directory)
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,36 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+
+# Not entered as a context manager, so the background schedulers stay stopped
+client = TestClient(app)
+
+def open_account():
+    response = client.post("/accounts/", json={"account_type": "CHECKING", "initial_deposit": 100})
+    return response.json()["account_id"]
+
+def post(path, body):
+    return client.request(
+        "PATCH" if path.endswith("/limits") else "POST", path, content=body, headers={"Content-Type": "application/json"}
+    )
+
+@pytest.mark.parametrize("amount", ["1e300", "-1e300", "NaN", "Infinity"])
+def test_unrepresentable_amounts_are_client_errors(amount):
+    source, destination = open_account(), open_account()
+    transfer = f'"source_account_id": "{source}", "destination_account_id": "{destination}", "amount": {amount}'
+    requests = [
+        (f"/accounts/{source}/deposit", f'{{"amount": {amount}}}'),
+        (f"/accounts/{source}/withdraw", f'{{"amount": {amount}}}'),
+        ("/accounts/transfer", f"{{{transfer}}}"),
+        ("/transfers/", f"{{{transfer}}}"),
+        (f"/accounts/{source}/limits", f'{{"daily_limit": {amount}, "monthly_limit": 100}}'),
+    ]
+    for path, body in requests:
+        assert post(path, body).status_code in (400, 422), path
+
+def test_out_of_range_amount_is_a_400():
+    source = open_account()
+    response = post(f"/accounts/{source}/deposit", '{"amount": 1e300}')
+    assert response.status_code == 400
+    assert "out of range" in response.json()["detail"]
@@ -0,0 +1,27 @@
+import gzip
+import zlib
+
+from presentation.api.compression import accepts_gzip, gzip_bytes, gzip_chunks
+
+def test_accepts_gzip_negotiation():
+    assert accepts_gzip("gzip, deflate, br")
+    assert accepts_gzip("br;q=1.0, gzip;q=0.8")
+    assert accepts_gzip("*")
+    assert not accepts_gzip(None)
+    assert not accepts_gzip("identity")
+    assert not accepts_gzip("gzip;q=0, *;q=1")
+    assert not accepts_gzip("br, *;q=0")
+
+def test_gzip_bytes_round_trip():
+    body = b'{"transactions":[]}' * 100
+    assert gzip.decompress(gzip_bytes(body)) == body
+
+def test_gzip_chunks_are_decodable_as_they_arrive():
+    chunks = ["header\n", "row 1\n" * 50, "row 2\n" * 50]
+    decompressor = zlib.decompressobj(31)
+    received = []
+    for data in gzip_chunks(iter(chunks)):
+        received.append(decompressor.decompress(data))
+    # Every input chunk is fully decodable from the bytes sent for it, before the stream ends
+    assert [part.decode() for part in received[:3]] == chunks
+    assert gzip.decompress(b"".join(gzip_chunks(iter(chunks)))).decode() == "".join(chunks)
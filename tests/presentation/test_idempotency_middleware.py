@@ -0,0 +1,93 @@
+import asyncio
+import json
+
+from infrastructure.adapters.idempotency_adapter import IdempotencyCache
+from presentation.middleware.idempotency_middleware import IdempotencyMiddleware
+
+class CountingApp:
+    def __init__(self, status=200):
+        self.calls = 0
+        self.status = status
+
+    async def __call__(self, scope, receive, send):
+        self.calls += 1
+        message = await receive()
+        await asyncio.sleep(0.01)
+        body = json.dumps({"call": self.calls, "echo": message["body"].decode()}).encode()
+        await send({"type": "http.response.start", "status": self.status, "headers": [(b"content-type", b"application/json")]})
+        await send({"type": "http.response.body", "body": body})
+
+async def call(app, path, body, key=None):
+    headers = [(b"idempotency-key", key.encode())] if key else []
+    scope = {"type": "http", "method": "POST", "path": path, "headers": headers}
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    await app(scope, receive, send)
+    return messages[0]["status"], dict(messages[0]["headers"]), messages[1]["body"]
+
+def make_app(inner):
+    return IdempotencyMiddleware(inner, IdempotencyCache(), paths=[r"/accounts/[^/]+/deposit"])
+
+def test_duplicate_returns_first_response():
+    inner = CountingApp()
+    app = make_app(inner)
+
+    async def scenario():
+        first = await call(app, "/accounts/a/deposit", b'{"amount": 1}', "k1")
+        second = await call(app, "/accounts/a/deposit", b'{"amount": 1}', "k1")
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert inner.calls == 1
+    assert first[2] == second[2]
+    assert second[1][b"idempotent-replayed"] == b"true"
+
+def test_concurrent_duplicates_wait_for_in_flight():
+    inner = CountingApp()
+    app = make_app(inner)
+
+    async def scenario():
+        return await asyncio.gather(*(call(app, "/accounts/a/deposit", b"{}", "k1") for _ in range(5)))
+
+    results = asyncio.run(scenario())
+    assert inner.calls == 1
+    assert len({body for _, _, body in results}) == 1
+
+def test_requests_without_key_pass_through():
+    inner = CountingApp()
+    app = make_app(inner)
+
+    async def scenario():
+        await call(app, "/accounts/a/deposit", b"{}")
+        await call(app, "/accounts/a/deposit", b"{}")
+
+    asyncio.run(scenario())
+    assert inner.calls == 2
+
+def test_key_reused_with_different_body():
+    app = make_app(CountingApp())
+
+    async def scenario():
+        await call(app, "/accounts/a/deposit", b'{"amount": 1}', "k1")
+        return await call(app, "/accounts/a/deposit", b'{"amount": 2}', "k1")
+
+    status, _, _ = asyncio.run(scenario())
+    assert status == 422
+
+def test_server_errors_are_not_cached():
+    inner = CountingApp(status=500)
+    app = make_app(inner)
+
+    async def scenario():
+        await call(app, "/accounts/a/deposit", b"{}", "k1")
+        await call(app, "/accounts/a/deposit", b"{}", "k1")
+
+    asyncio.run(scenario())
+    assert inner.calls == 2
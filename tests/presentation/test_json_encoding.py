@@ -0,0 +1,64 @@
+import json
+import pytest
+from uuid import uuid4
+from datetime import datetime, timedelta
+
+from domain.entities.account import Account, AccountType
+from domain.entities.transaction import Transaction
+from infrastructure.adapters.statement_adapter import CSVStatementAdapter
+from presentation.api.json_encoding import encode_transactions, encode_statement
+
+@pytest.fixture
+def account():
+    return Account.create(AccountType.CHECKING, initial_deposit=123456)
+
+@pytest.fixture
+def transactions(account):
+    return [
+        Transaction.create_deposit(account.account_id, 1999),
+        Transaction.create_withdrawal(account.account_id, 5),
+        Transaction.create_transfer(account.account_id, uuid4(), 100000),
+    ]
+
+def test_encode_transactions_matches_response_shape(transactions):
+    decoded = json.loads(encode_transactions(transactions))
+    assert len(decoded) == 3
+    assert decoded[0] == {
+        "transaction_id": str(transactions[0].transaction_id),
+        "account_id": str(transactions[0].account_id),
+        "transaction_type": "DEPOSIT",
+        "amount": 19.99,
+        "timestamp": transactions[0].timestamp.isoformat(),
+        "destination_account_id": None,
+    }
+    assert decoded[1]["amount"] == 0.05
+    assert decoded[2]["destination_account_id"] == str(transactions[2].destination_account_id)
+
+def test_encode_empty_transactions():
+    assert json.loads(encode_transactions([])) == []
+
+def test_encode_statement(account, transactions):
+    start_date = datetime.utcnow() - timedelta(days=1)
+    end_date = datetime.utcnow()
+    statement = CSVStatementAdapter().generate(account, transactions, start_date, end_date)
+    decoded = json.loads(encode_statement(statement))
+    assert decoded["account_id"] == str(account.account_id)
+    assert decoded["balance"] == 1234.56
+    assert [t["type"] for t in decoded["transactions"]] == ["DEPOSIT", "WITHDRAW", "TRANSFER"]
+    assert decoded["csv_content"] == statement.csv_content
+    assert decoded["start_date"] == start_date.isoformat()
+
+def test_encode_statement_without_csv(account, transactions):
+    start_date = datetime.utcnow() - timedelta(days=1)
+    statement = CSVStatementAdapter().generate(account, transactions, start_date, datetime.utcnow())
+    decoded = json.loads(encode_statement(statement, include_csv=False))
+    assert "csv_content" not in decoded
+    assert len(decoded["transactions"]) == 3
+
+def test_stream_csv_chunks_join_to_full_content(account, transactions):
+    adapter = CSVStatementAdapter(chunk_rows=2)
+    start_date = datetime.utcnow() - timedelta(days=1)
+    end_date = datetime.utcnow()
+    chunks = list(adapter.stream_csv(account, transactions, start_date, end_date))
+    assert len(chunks) == 2
+    assert "".join(chunks) == adapter.generate(account, transactions, start_date, end_date).csv_content
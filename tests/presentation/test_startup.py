@@ -0,0 +1,21 @@
+import subprocess
+import sys
+
+def imported_modules_after(statement):
+    result = subprocess.run(
+        [sys.executable, "-c", f"{statement}; import sys; print(' '.join(sys.modules))"],
+        capture_output=True, text=True, check=True
+    )
+    return set(result.stdout.split())
+
+def test_importing_app_does_not_load_heavy_adapters():
+    modules = imported_modules_after("import main")
+    assert "fpdf" not in modules
+    assert "numpy" not in modules
+    assert "application.services.statement_service" not in modules
+    assert "application.services.transaction_service" not in modules
+
+def test_services_are_built_on_first_use():
+    modules = imported_modules_after("from presentation.container import services; services.statement_service")
+    assert "application.services.statement_service" in modules
+    assert "fpdf" not in modules